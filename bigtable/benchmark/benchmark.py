@@ -0,0 +1,391 @@
+# Copyright 2017 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput benchmark for the Bigtable data client.
+
+Measures the hot paths of the data client:
+
+* decode: parsing ``ReadRowsResponse`` streams held in memory with
+  ``PartialRowsData`` (default and fast decode, and into columns), in rows/s,
+  cells/s and CPU time per MB of responses;
+* mutate: writing rows with a ``MutationsBatcher``, for several batch sizes;
+* read: scanning the table with ``Table.read_rows``, end to end.
+
+The mutate and read benchmarks run against the Bigtable emulator (when
+``BIGTABLE_EMULATOR_HOST`` is set), or against an in-process fake server
+(with ``--fake``) which replays the ``ReadRowsResponse`` stream, and measures
+the client library alone.
+
+The responses are generated, or replayed from a file recorded from a real
+scan with ``--record`` (see the README).
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import os
+import resource
+import struct
+import threading
+import time
+
+from concurrent import futures
+import grpc
+import six
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.bigtable import Client
+from google.cloud.bigtable._generated import bigtable_pb2
+from google.cloud.bigtable.batcher import MutationsBatcher
+from google.cloud.bigtable.column_family import ColumnFamily
+from google.cloud.bigtable.row_data import PartialRowsData
+from google.cloud.bigtable.row_filters import CellsColumnLimitFilter
+from google.cloud.environment_vars import BIGTABLE_EMULATOR
+from google.rpc import status_pb2
+
+
+# The prefix of the size of each message in a recorded stream.
+_SIZE_PREFIX = struct.Struct('>I')
+
+
+def make_responses(args):
+    """Generate the responses of a ``ReadRows`` stream.
+
+    Each row has ``args.cells`` cells of ``args.value_size`` bytes, spread
+    over ``args.columns`` columns of one family; values larger than
+    ``args.chunk_size`` are split over several chunks.
+
+    Returns:
+        List[bigtable_pb2.ReadRowsResponse]: The responses.
+    """
+    value = b'x' * args.value_size
+    responses = []
+    response = bigtable_pb2.ReadRowsResponse()
+    for row_index in range(args.rows):
+        row_key = row_key_for(row_index)
+        for cell_index in range(args.cells):
+            for offset in range(0, max(len(value), 1), args.chunk_size):
+                chunk = response.chunks.add()
+                if offset == 0:
+                    if cell_index == 0:
+                        chunk.row_key = row_key
+                        chunk.family_name.value = args.family
+                    chunk.qualifier.value = qualifier_for(
+                        cell_index % args.columns)
+                    chunk.timestamp_micros = 1000 * (
+                        args.cells - cell_index)
+                chunk.value = value[offset:offset + args.chunk_size]
+                remaining = len(value) - offset - args.chunk_size
+                if remaining > 0:
+                    chunk.value_size = len(value)
+            if cell_index == args.cells - 1:
+                chunk.commit_row = True
+            if len(response.chunks) >= args.chunks_per_response:
+                responses.append(response)
+                response = bigtable_pb2.ReadRowsResponse()
+    if response.chunks:
+        responses.append(response)
+    return responses
+
+
+def row_key_for(index):
+    return ('row%010d' % (index,)).encode('ascii')
+
+
+def qualifier_for(index):
+    return ('col%04d' % (index,)).encode('ascii')
+
+
+def save_responses(path, responses):
+    """Record the responses of a stream, each prefixed with its size."""
+    with open(path, 'wb') as file_obj:
+        for response in responses:
+            data = response.SerializeToString()
+            file_obj.write(_SIZE_PREFIX.pack(len(data)))
+            file_obj.write(data)
+
+
+def load_responses(path):
+    """Load the responses of a stream recorded with :func:`save_responses`.
+
+    Returns:
+        List[bigtable_pb2.ReadRowsResponse]: The responses.
+    """
+    responses = []
+    with open(path, 'rb') as file_obj:
+        while True:
+            prefix = file_obj.read(_SIZE_PREFIX.size)
+            if not prefix:
+                break
+            size, = _SIZE_PREFIX.unpack(prefix)
+            responses.append(
+                bigtable_pb2.ReadRowsResponse.FromString(file_obj.read(size)))
+    return responses
+
+
+class FakeBigtable(bigtable_pb2.BigtableServicer):
+    """An in-process Bigtable data server.
+
+    Every ``ReadRows`` request is answered with the same stream of
+    responses, whatever its row set, limit and filter. Mutations are
+    counted, and always succeed.
+    """
+    def __init__(self, responses):
+        self._responses = responses
+        self._lock = threading.Lock()
+        self.mutations = 0
+
+    def ReadRows(self, request, context):
+        for response in self._responses:
+            yield response
+
+    def SampleRowKeys(self, request, context):
+        yield bigtable_pb2.SampleRowKeysResponse(row_key=b'', offset_bytes=0)
+
+    def MutateRow(self, request, context):
+        with self._lock:
+            self.mutations += 1
+        return bigtable_pb2.MutateRowResponse()
+
+    def MutateRows(self, request, context):
+        with self._lock:
+            self.mutations += len(request.entries)
+        ok = status_pb2.Status(code=0)
+        yield bigtable_pb2.MutateRowsResponse(entries=[
+            bigtable_pb2.MutateRowsResponse.Entry(index=index, status=ok)
+            for index in range(len(request.entries))
+        ])
+
+
+def start_fake_server(responses):
+    """Start a fake server, and point the client at it.
+
+    Returns:
+        Tuple[grpc.Server, FakeBigtable]: The server and its servicer.
+    """
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+    servicer = FakeBigtable(responses)
+    bigtable_pb2.add_BigtableServicer_to_server(servicer, server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+    os.environ[BIGTABLE_EMULATOR] = 'localhost:{}'.format(port)
+    return server, servicer
+
+
+def cpu_time():
+    """Return the CPU time (user and system) used by the process so far."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def count_cells(row):
+    return sum(len(cells) for columns in six.itervalues(row._cells)
+               for cells in six.itervalues(columns))
+
+
+def print_result(name, rows, cells, size, elapsed, cpu):
+    print('{:<28} {:>10.0f} rows/s {:>11.0f} cells/s {:>8.1f} MB/s '
+          '{:>8.3f} CPU s/MB'.format(
+              name, rows / elapsed, cells / elapsed,
+              size / elapsed / 2 ** 20, cpu / max(size / 2 ** 20, 1e-9)))
+
+
+def benchmark_decode(args, responses):
+    """Decode the responses in memory, in each decode mode."""
+    size = sum(response.ByteSize() for response in responses)
+    print('Decode: {} responses, {:.1f} MB, best of {}'.format(
+        len(responses), size / 2 ** 20, args.repeat))
+
+    def read_rows(fast_decode):
+        rows = cells = 0
+        for row in PartialRowsData(iter(responses), fast_decode=fast_decode):
+            rows += 1
+            cells += count_cells(row)
+        return rows, cells
+
+    columns = set()
+    family = None
+    for response in responses:
+        for chunk in response.chunks:
+            if chunk.HasField('family_name'):
+                family = chunk.family_name.value
+            if chunk.HasField('qualifier'):
+                columns.add((family, chunk.qualifier.value))
+
+    def read_columns():
+        row_keys, _ = PartialRowsData(iter(responses)).to_columns(
+            [(column, index) for index, column in enumerate(columns)])
+        return len(row_keys), len(row_keys) * len(columns)
+
+    modes = (
+        ('default', lambda: read_rows(False)),
+        ('fast_decode', lambda: read_rows(True)),
+        ('to_columns (latest cells)', read_columns),
+    )
+    for name, decode in modes:
+        best = None
+        for _ in range(args.repeat):
+            cpu_start = cpu_time()
+            start = time.time()
+            rows, cells = decode()
+            elapsed = time.time() - start
+            cpu = cpu_time() - cpu_start
+            if best is None or elapsed < best[2]:
+                best = (rows, cells, elapsed, cpu)
+        rows, cells, elapsed, cpu = best
+        print_result(name, rows, cells, size, elapsed, cpu)
+
+
+def benchmark_mutate(args, table):
+    """Write the rows with a batcher, for each batch size."""
+    value = b'x' * args.value_size
+    size = args.rows * args.cells * args.value_size
+    print('Mutate: {} rows of {} cells, {} bytes each'.format(
+        args.rows, args.cells, args.value_size))
+    for batch_size in args.batch_sizes:
+        cpu_start = cpu_time()
+        start = time.time()
+        with MutationsBatcher(table, flush_count=batch_size,
+                              max_inflight=args.max_inflight) as batcher:
+            for row_index in range(args.rows):
+                row = table.row(row_key_for(row_index))
+                for cell_index in range(args.cells):
+                    row.set_cell(
+                        args.family, qualifier_for(cell_index % args.columns),
+                        value)
+                batcher.mutate(row)
+        elapsed = time.time() - start
+        cpu = cpu_time() - cpu_start
+        print_result('batch size {}'.format(batch_size), args.rows,
+                     args.rows * args.cells, size, elapsed, cpu)
+
+
+def benchmark_read(args, table):
+    """Scan the table end to end, in each decode mode."""
+    filter_ = CellsColumnLimitFilter(1) if args.latest_only else None
+    print('Read: full table scan{}'.format(
+        ', latest cells only' if args.latest_only else ''))
+    for fast_decode in (False, True):
+        rows = cells = 0
+        cpu_start = cpu_time()
+        start = time.time()
+        for row in table.read_rows(filter_=filter_, fast_decode=fast_decode):
+            rows += 1
+            cells += count_cells(row)
+        elapsed = time.time() - start
+        cpu = cpu_time() - cpu_start
+        size = cells * args.value_size
+        print_result('fast_decode' if fast_decode else 'default',
+                     rows, cells, size, elapsed, cpu)
+
+
+def ensure_table(table, family):
+    """Create the table and its column family, if they do not exist yet."""
+    try:
+        table.create(column_families=[ColumnFamily(family, table)])
+    except grpc.RpcError as exc:
+        if exc.code() != grpc.StatusCode.ALREADY_EXISTS:
+            raise
+
+
+def record(table, path):
+    """Record the responses of a scan of the table to a file."""
+    request = bigtable_pb2.ReadRowsRequest(table_name=table.name)
+    client = table._instance._client
+    responses = list(client._data_stub.ReadRows(request))
+    save_responses(path, responses)
+    print('Recorded {} responses to {}'.format(len(responses), path))
+
+
+def run(args):
+    if args.replay:
+        responses = load_responses(args.replay)
+    else:
+        responses = make_responses(args)
+    if 'decode' in args.benchmarks:
+        benchmark_decode(args, responses)
+    if not set(args.benchmarks) & {'mutate', 'read'} and not args.record:
+        return
+
+    server = None
+    if args.fake:
+        server, servicer = start_fake_server(responses)
+    elif not os.environ.get(BIGTABLE_EMULATOR):
+        raise SystemExit(
+            'Set {}, or use --fake for a fake server.'.format(
+                BIGTABLE_EMULATOR))
+
+    client = Client(project=args.project, credentials=AnonymousCredentials(),
+                    admin=not args.fake,
+                    channel_pool_size=args.channel_pool_size)
+    table = client.instance(args.instance).table(args.table)
+    if not args.fake:
+        ensure_table(table, args.family)
+
+    try:
+        if 'mutate' in args.benchmarks:
+            benchmark_mutate(args, table)
+        if 'read' in args.benchmarks:
+            benchmark_read(args, table)
+        if args.record:
+            record(table, args.record)
+    finally:
+        if server is not None:
+            server.stop(0)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fake', action='store_true',
+                        help='Run against an in-process fake server.')
+    parser.add_argument('--benchmarks', nargs='+',
+                        choices=('decode', 'mutate', 'read'),
+                        default=['decode', 'mutate', 'read'])
+    parser.add_argument('--project', default='benchmark')
+    parser.add_argument('--instance', default='benchmark')
+    parser.add_argument('--table', default='benchmark')
+    parser.add_argument('--family', default='cf')
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='The number of rows to write and read.')
+    parser.add_argument('--cells', type=int, default=10,
+                        help='The number of cells per row.')
+    parser.add_argument('--columns', type=int, default=10,
+                        help='The number of columns the cells are spread '
+                             'over (fewer than cells: several versions).')
+    parser.add_argument('--value-size', type=int, default=100,
+                        help='The size of the cell values, in bytes.')
+    parser.add_argument('--chunk-size', type=int, default=1024 * 1024,
+                        help='Generated values larger than this are split '
+                             'over several chunks.')
+    parser.add_argument('--chunks-per-response', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Decode benchmark repetitions (best is shown).')
+    parser.add_argument('--batch-sizes', type=int, nargs='+',
+                        default=[10, 100, 1000],
+                        help='Mutation batch sizes (rows per request).')
+    parser.add_argument('--max-inflight', type=int, default=4,
+                        help='Mutation batches sent concurrently.')
+    parser.add_argument('--channel-pool-size', type=int, default=1)
+    parser.add_argument('--latest-only', action='store_true',
+                        help='Read the latest cell of each column only.')
+    parser.add_argument('--replay', metavar='PATH',
+                        help='Decode and serve a recorded stream rather '
+                             'than generated responses.')
+    parser.add_argument('--record', metavar='PATH',
+                        help='Record a scan of the table to a file.')
+    return parser
+
+
+if __name__ == '__main__':
+    run(get_parser().parse_args())
@@ -0,0 +1,343 @@
+# Copyright 2017 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""User-friendly container for batching mutations to a Bigtable table."""
+
+
+import threading
+
+from concurrent import futures
+import grpc
+from grpc import StatusCode
+
+from google.cloud.bigtable.table import _check_row_table_name
+from google.cloud.bigtable.table import _check_row_type
+from google.cloud.bigtable.table import _MAX_BULK_MUTATIONS
+from google.cloud.bigtable.table import _RetryableMutateRowsWorker
+from google.cloud.bigtable.table import DEFAULT_RETRY
+from google.cloud.bigtable.table import TooManyMutationsError
+from google.rpc import status_pb2
+
+
+FLUSH_COUNT = 1000
+"""Default maximum number of rows in a batch."""
+
+MAX_ROW_BYTES = 5 * 1024 * 1024  # 5MB
+"""Default maximum size of the mutations in a batch."""
+
+MAX_INFLIGHT = 4
+"""Default maximum number of ``MutateRows`` requests in flight at once."""
+
+
+class MutationsBatchError(RuntimeError):
+    """Some rows could not be mutated.
+
+    :type failures: list
+    :param failures: Pairs of the :class:`.DirectRow` which failed and its
+                     :class:`~google.rpc.status_pb2.Status`.
+    """
+
+    def __init__(self, failures):
+        super(MutationsBatchError, self).__init__(
+            '%d rows could not be mutated' % (len(failures),))
+        self.failures = failures
+
+
+class MutationsBatcher(object):
+    """Batch rows, and mutate them in bulk with ``MutateRows`` requests.
+
+    Rows are accumulated into a batch, which is sent when it reaches
+    ``flush_count`` rows, ``max_row_bytes`` bytes of mutations (or the
+    maximum number of mutations per request), or when ``flush_interval``
+    seconds have passed since its first row was added. Up to
+    ``max_inflight`` batches are sent concurrently; once that many are in
+    flight, :meth:`mutate` blocks until one of them is done.
+
+    Within each batch, only the rows which failed with a transient error are
+    retried. The rows which still failed in the end are passed to
+    ``error_callback`` or, without one, raised from :meth:`flush` as a
+    :exc:`MutationsBatchError`.
+
+    .. note::
+
+        Batches are sent concurrently, so the mutations of a row which is
+        added to several batches may be applied in any order.
+
+    The batcher can be used as a context manager, which closes it on exit::
+
+        with MutationsBatcher(table) as batcher:
+            for row in rows:
+                batcher.mutate(row)
+
+    :type table: :class:`~google.cloud.bigtable.table.Table`
+    :param table: The table to mutate.
+
+    :type flush_count: int
+    :param flush_count: (Optional) The maximum number of rows in a batch.
+                        Defaults to :data:`FLUSH_COUNT`.
+
+    :type max_row_bytes: int
+    :param max_row_bytes: (Optional) The maximum size of the mutations in a
+                          batch, in bytes. Defaults to :data:`MAX_ROW_BYTES`.
+
+    :type flush_interval: float
+    :param flush_interval: (Optional) The maximum number of seconds a row
+                           waits before its batch is sent. By default, a
+                           batch waits until it is full or flushed.
+
+    :type max_inflight: int
+    :param max_inflight: (Optional) The maximum number of batches being sent
+                         at once. Defaults to :data:`MAX_INFLIGHT`.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) Retry delay and deadline arguments for the rows
+                  which fail with transient errors. Defaults to
+                  :data:`~google.cloud.bigtable.table.DEFAULT_RETRY`.
+
+    :type error_callback: callable
+    :param error_callback: (Optional) Called (from a worker thread) with
+                           each row which could not be mutated and its
+                           :class:`~google.rpc.status_pb2.Status`. It may
+                           call :meth:`mutate` to retry the row (unless the
+                           batcher is being closed), but must not call
+                           :meth:`flush` or :meth:`close`.
+
+    :raises: :class:`ValueError <exceptions.ValueError>` if ``flush_count``,
+             ``max_row_bytes`` or ``max_inflight`` is less than 1.
+    """
+
+    def __init__(self, table, flush_count=FLUSH_COUNT,
+                 max_row_bytes=MAX_ROW_BYTES, flush_interval=None,
+                 max_inflight=MAX_INFLIGHT, retry=DEFAULT_RETRY,
+                 error_callback=None):
+        if flush_count < 1 or max_row_bytes < 1 or max_inflight < 1:
+            raise ValueError(
+                'flush_count, max_row_bytes and max_inflight must be at '
+                'least 1.')
+        self.table = table
+        self.flush_count = flush_count
+        self.max_row_bytes = max_row_bytes
+        self.flush_interval = flush_interval
+        self.retry = retry
+        self.error_callback = error_callback
+
+        # The batch being filled, guarded by ``_lock``.
+        self._lock = threading.Lock()
+        self._rows = []
+        self._mutations_count = 0
+        self._rows_bytes = 0
+        self._timer = None
+        self._closed = False
+
+        # The batches in flight, guarded by ``_inflight_lock``.
+        self._inflight_lock = threading.Lock()
+        self._inflight = threading.BoundedSemaphore(max_inflight)
+        self._futures = set()
+        self._failures = []
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_inflight)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def mutate(self, row):
+        """Add a row to the batch.
+
+        :type row: :class:`~google.cloud.bigtable.row.DirectRow`
+        :param row: The row to mutate.
+
+        :raises: One of the following:
+
+                 * :exc:`~.table.TableMismatchError` if the row does not
+                   belong to the table.
+                 * :class:`TypeError <exceptions.TypeError>` if the row is
+                   not a :class:`~google.cloud.bigtable.row.DirectRow`.
+                 * :exc:`~.table.TooManyMutationsError` if the row has more
+                   mutations than a single request allows.
+                 * :class:`ValueError <exceptions.ValueError>` if the
+                   batcher is closed.
+        """
+        _check_row_table_name(self.table.name, row)
+        _check_row_type(row)
+        mutations = row._get_mutations(None)
+        if len(mutations) > _MAX_BULK_MUTATIONS:
+            raise TooManyMutationsError('Maximum number of mutations is %s' %
+                                        (_MAX_BULK_MUTATIONS,))
+        row_bytes = len(row.row_key) + sum(
+            mutation.ByteSize() for mutation in mutations)
+
+        with self._lock:
+            if self._closed:
+                raise ValueError('The batcher is closed.')
+            full = self._rows and (
+                self._mutations_count + len(mutations) > _MAX_BULK_MUTATIONS or
+                self._rows_bytes + row_bytes > self.max_row_bytes)
+            previous_rows = self._take_rows() if full else None
+
+            self._rows.append(row)
+            self._mutations_count += len(mutations)
+            self._rows_bytes += row_bytes
+            if len(self._rows) >= self.flush_count:
+                rows = self._take_rows()
+            else:
+                rows = None
+                if self._timer is None and self.flush_interval is not None:
+                    self._timer = threading.Timer(
+                        self.flush_interval, self._flush_on_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if previous_rows:
+            self._send(previous_rows)
+        if rows:
+            self._send(rows)
+
+    def mutate_rows(self, rows):
+        """Add several rows to the batch.
+
+        :type rows: list
+        :param rows: List or other iterable of
+                     :class:`~google.cloud.bigtable.row.DirectRow` instances.
+        """
+        for row in rows:
+            self.mutate(row)
+
+    def flush(self):
+        """Send the current batch, and wait until every batch is done.
+
+        Rows added by ``error_callback`` while waiting are sent and waited
+        for as well.
+
+        :raises: :exc:`MutationsBatchError` if some rows could not be
+                 mutated, and there is no ``error_callback``.
+        """
+        while True:
+            with self._lock:
+                rows = self._take_rows()
+            if rows:
+                self._send(rows)
+
+            with self._inflight_lock:
+                pending = [
+                    future for future in self._futures if not future.done()]
+            if not pending and not rows:
+                break
+            futures.wait(pending)
+
+        with self._inflight_lock:
+            failures, self._failures = self._failures, []
+        if failures:
+            raise MutationsBatchError(failures)
+
+    def close(self):
+        """Flush the batcher, and release its worker threads.
+
+        :raises: :exc:`MutationsBatchError` if some rows could not be
+                 mutated, and there is no ``error_callback``.
+        """
+        with self._lock:
+            self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def _take_rows(self):
+        """Empty the current batch; must be called with ``_lock`` held.
+
+        :rtype: list
+        :returns: The rows of the batch.
+        """
+        rows = self._rows
+        self._rows = []
+        self._mutations_count = 0
+        self._rows_bytes = 0
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return rows
+
+    def _flush_on_timer(self):
+        """Send the current batch, once ``flush_interval`` has passed."""
+        with self._lock:
+            rows = self._take_rows()
+        if rows:
+            self._send(rows)
+
+    def _send(self, rows):
+        """Send a batch on a worker thread.
+
+        Blocks while ``max_inflight`` batches are being sent already.
+
+        :type rows: list
+        :param rows: The rows of the batch.
+        """
+        self._inflight.acquire()
+        future = self._executor.submit(self._mutate_batch, rows)
+        with self._inflight_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._batch_done)
+
+    def _batch_done(self, future):
+        """Helper for :meth:`_send`, called once a batch is done."""
+        with self._inflight_lock:
+            self._futures.discard(future)
+
+    def _mutate_batch(self, rows):
+        """Mutate a batch of rows, and report the rows which failed.
+
+        :type rows: list
+        :param rows: The rows of the batch.
+        """
+        client = self.table._instance._client
+        worker = _RetryableMutateRowsWorker(client, self.table.name, rows)
+        try:
+            statuses = worker(retry=self.retry)
+        except Exception as exc:
+            statuses = [_status_from_exception(exc)] * len(rows)
+        finally:
+            # Free the slot before calling ``error_callback``: it may send
+            # the rows again, which would block forever with every slot
+            # held.
+            self._inflight.release()
+
+        failures = [
+            (row, status) for row, status in zip(rows, statuses)
+            if status is None or status.code != StatusCode.OK.value[0]
+        ]
+        if not failures:
+            return
+        if self.error_callback is None:
+            with self._inflight_lock:
+                self._failures.extend(failures)
+            return
+        for row, status in failures:
+            self.error_callback(row, status)
+
+
+def _status_from_exception(exc):
+    """Convert an exception raised by a ``MutateRows`` request to a status.
+
+    :type exc: :class:`Exception`
+    :param exc: The exception raised by the request.
+
+    :rtype: :class:`~google.rpc.status_pb2.Status`
+    :returns: The status of the request.
+    """
+    code = StatusCode.UNKNOWN
+    if isinstance(exc, grpc.RpcError) and hasattr(exc, 'code'):
+        code = exc.code()
+    return status_pb2.Status(code=code.value[0], message=str(exc))
@@ -30,6 +30,7 @@ In the hierarchy of API concepts
 
 
 import os
+import threading
 
 from google.gax.utils import metrics
 from google.longrunning import operations_grpc
@@ -81,21 +82,37 @@ _GRPC_MAX_LENGTH_OPTIONS = _GRPC_EXTRA_OPTIONS + (
     ('grpc.max_message_length', _MAX_MSG_LENGTH_100MB),
     ('grpc.max_receive_message_length', _MAX_MSG_LENGTH_100MB),
 )
+# NOTE: Channels with the same target and options share their connections,
+#       unless each of them has its own subchannel pool.
+_GRPC_CHANNEL_POOL_OPTIONS = (
+    ('grpc.use_local_subchannel_pool', 1),
+)
+
+ROUND_ROBIN = 'round_robin'
+"""Channel selection sending each request on the next channel in turn."""
 
+LEAST_LOADED = 'least_loaded'
+"""Channel selection sending each request on the least busy channel."""
 
-def _make_data_stub(client):
+
+def _make_data_stub(client, extra_options=()):
     """Creates gRPC stub to make requests to the Data API.
 
     :type client: :class:`Client`
     :param client: The client that will hold the stub.
 
+    :type extra_options: tuple
+    :param extra_options: (Optional) Extra gRPC options for the channel of
+                          the stub, when not using the emulator.
+
     :rtype: :class:`._generated.bigtable_pb2.BigtableStub`
     :returns: A gRPC stub object.
     """
     if client.emulator_host is None:
-        return make_secure_stub(client.credentials, client.user_agent,
-                                bigtable_pb2.BigtableStub, DATA_API_HOST,
-                                extra_options=_GRPC_MAX_LENGTH_OPTIONS)
+        return make_secure_stub(
+            client.credentials, client.user_agent,
+            bigtable_pb2.BigtableStub, DATA_API_HOST,
+            extra_options=_GRPC_MAX_LENGTH_OPTIONS + extra_options)
     else:
         return make_insecure_stub(bigtable_pb2.BigtableStub,
                                   client.emulator_host)
@@ -163,6 +180,213 @@ def _make_table_stub(client):
             client.emulator_host)
 
 
+class DataChannelPool(object):
+    """A pool of Data API stubs, each on its own gRPC channel.
+
+    The pool can be used in place of a single
+    :class:`._generated.bigtable_pb2.BigtableStub`: each request is sent on
+    one of the stubs, picked in turn (:data:`ROUND_ROBIN`) or as the one with
+    the fewest requests in flight (:data:`LEAST_LOADED`). A streaming request
+    is in flight until its responses are exhausted, it fails or it is
+    cancelled.
+
+    :type stubs: list
+    :param stubs: The :class:`._generated.bigtable_pb2.BigtableStub`
+                  instances to send requests on.
+
+    :type selection: str
+    :param selection: (Optional) How to pick the stub for each request,
+                      either :data:`ROUND_ROBIN` (the default) or
+                      :data:`LEAST_LOADED`.
+
+    :raises: :class:`ValueError <exceptions.ValueError>` if ``stubs`` is
+             empty or ``selection`` is unknown.
+    """
+
+    def __init__(self, stubs, selection=ROUND_ROBIN):
+        if not stubs:
+            raise ValueError('A channel pool needs at least one stub.')
+        if selection not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError('Unknown channel selection: %r' % (selection,))
+        self._stubs = list(stubs)
+        self.selection = selection
+        self._lock = threading.Lock()
+        self._in_flight = [0] * len(self._stubs)
+        self._next_index = 0
+
+    def __len__(self):
+        return len(self._stubs)
+
+    @property
+    def in_flight(self):
+        """The number of requests in flight on each channel.
+
+        :rtype: list
+        :returns: The counts, in the order of the stubs of the pool.
+        """
+        with self._lock:
+            return list(self._in_flight)
+
+    def ReadRows(self, request, *args, **kwargs):
+        """Send a ``ReadRows`` request on one of the channels."""
+        return self._call_streaming('ReadRows', request, *args, **kwargs)
+
+    def SampleRowKeys(self, request, *args, **kwargs):
+        """Send a ``SampleRowKeys`` request on one of the channels."""
+        return self._call_streaming(
+            'SampleRowKeys', request, *args, **kwargs)
+
+    def MutateRows(self, request, *args, **kwargs):
+        """Send a ``MutateRows`` request on one of the channels."""
+        return self._call_streaming('MutateRows', request, *args, **kwargs)
+
+    def MutateRow(self, request, *args, **kwargs):
+        """Send a ``MutateRow`` request on one of the channels."""
+        return self._call_unary('MutateRow', request, *args, **kwargs)
+
+    def CheckAndMutateRow(self, request, *args, **kwargs):
+        """Send a ``CheckAndMutateRow`` request on one of the channels."""
+        return self._call_unary(
+            'CheckAndMutateRow', request, *args, **kwargs)
+
+    def ReadModifyWriteRow(self, request, *args, **kwargs):
+        """Send a ``ReadModifyWriteRow`` request on one of the channels."""
+        return self._call_unary(
+            'ReadModifyWriteRow', request, *args, **kwargs)
+
+    def _acquire(self):
+        """Pick the channel for a request, and count the request in flight.
+
+        :rtype: int
+        :returns: The index of the picked channel.
+        """
+        with self._lock:
+            count = len(self._stubs)
+            start = self._next_index
+            self._next_index = (start + 1) % count
+            if self.selection == LEAST_LOADED:
+                # Ties go to the channel after the last one picked, so that
+                # idle channels are used in turn.
+                index = min(
+                    ((start + offset) % count for offset in range(count)),
+                    key=self._in_flight.__getitem__)
+                self._next_index = (index + 1) % count
+            else:
+                index = start
+            self._in_flight[index] += 1
+        return index
+
+    def _release(self, index):
+        """Count a request on a channel as done.
+
+        :type index: int
+        :param index: The index of the channel of the request.
+        """
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def _call_unary(self, method_name, request, *args, **kwargs):
+        """Send a unary request on the picked channel.
+
+        :type method_name: str
+        :param method_name: The name of the stub method to call.
+
+        :type request: :class:`~google.protobuf.message.Message`
+        :param request: The request to send.
+
+        :returns: The response to the request.
+        """
+        index = self._acquire()
+        try:
+            method = getattr(self._stubs[index], method_name)
+            return method(request, *args, **kwargs)
+        finally:
+            self._release(index)
+
+    def _call_streaming(self, method_name, request, *args, **kwargs):
+        """Send a request with streamed responses on the picked channel.
+
+        :type method_name: str
+        :param method_name: The name of the stub method to call.
+
+        :type request: :class:`~google.protobuf.message.Message`
+        :param request: The request to send.
+
+        :rtype: :class:`_InFlightResponses`
+        :returns: The responses to the request.
+        """
+        index = self._acquire()
+        try:
+            method = getattr(self._stubs[index], method_name)
+            return _InFlightResponses(
+                method(request, *args, **kwargs),
+                lambda: self._release(index))
+        except Exception:
+            self._release(index)
+            raise
+
+
+class _InFlightResponses(object):
+    """Streamed responses of a request sent by a :class:`DataChannelPool`.
+
+    Wraps the response iterator returned by the stub, and reports the
+    request as done once, when the responses are exhausted, fail, or are
+    cancelled. Other attributes (e.g. ``cancel``) are those of the wrapped
+    iterator.
+
+    :type responses: iterable
+    :param responses: The responses returned by the stub.
+
+    :type on_done: callable
+    :param on_done: Called without arguments once the request is done.
+    """
+
+    _on_done = None
+
+    def __init__(self, responses, on_done):
+        self._responses = responses
+        self._iterator = iter(responses)
+        self._on_done = on_done
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._iterator)
+        except BaseException:
+            self._done()
+            raise
+
+    next = __next__  # Python 2
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._responses, name)
+
+    def __del__(self):
+        self._done()
+
+    def cancel(self):
+        """Cancel the request, and report it as done.
+
+        :rtype: bool
+        :returns: The result of cancelling the wrapped responses, or
+                  :data:`False` if they cannot be cancelled.
+        """
+        cancel = getattr(self._responses, 'cancel', None)
+        cancelled = cancel() if cancel is not None else False
+        self._done()
+        return cancelled
+
+    def _done(self):
+        """Report the request as done, unless it already was."""
+        on_done, self._on_done = self._on_done, None
+        if on_done is not None:
+            on_done()
+
+
 class Client(ClientWithProject):
     """Client for interacting with Google Cloud Bigtable API.
 
@@ -195,8 +419,20 @@ class Client(ClientWithProject):
     :param user_agent: (Optional) The user agent to be used with API request.
                        Defaults to :const:`DEFAULT_USER_AGENT`.
 
+    :type channel_pool_size: int
+    :param channel_pool_size: (Optional) The number of gRPC channels to send
+                              Data API requests on. With more than one, the
+                              requests are spread across the channels of a
+                              :class:`DataChannelPool`. Defaults to 1.
+
+    :type channel_selection: str
+    :param channel_selection: (Optional) How a channel of the pool is picked
+                              for each request: :data:`ROUND_ROBIN` (the
+                              default) or :data:`LEAST_LOADED`.
+
     :raises: :class:`ValueError <exceptions.ValueError>` if both ``read_only``
-             and ``admin`` are :data:`True`
+             and ``admin`` are :data:`True`, if ``channel_pool_size`` is
+             less than 1 or if ``channel_selection`` is unknown.
     """
 
     _instance_stub_internal = None
@@ -205,10 +441,16 @@ class Client(ClientWithProject):
     _SET_PROJECT = True  # Used by from_service_account_json()
 
     def __init__(self, project=None, credentials=None,
-                 read_only=False, admin=False, user_agent=DEFAULT_USER_AGENT):
+                 read_only=False, admin=False, user_agent=DEFAULT_USER_AGENT,
+                 channel_pool_size=1, channel_selection=ROUND_ROBIN):
         if read_only and admin:
             raise ValueError('A read-only client cannot also perform'
                              'administrative actions.')
+        if channel_pool_size < 1:
+            raise ValueError('channel_pool_size must be at least 1.')
+        if channel_selection not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(
+                'Unknown channel selection: %r' % (channel_selection,))
 
         # NOTE: We set the scopes **before** calling the parent constructor.
         #       It **may** use those scopes in ``with_scopes_if_required``.
@@ -223,9 +465,17 @@ class Client(ClientWithProject):
             project=project, credentials=credentials, _http=None)
         self.user_agent = user_agent
         self.emulator_host = os.getenv(BIGTABLE_EMULATOR)
+        self.channel_pool_size = channel_pool_size
+        self.channel_selection = channel_selection
 
         # Create gRPC stubs for making requests.
-        self._data_stub = _make_data_stub(self)
+        if channel_pool_size == 1:
+            self._data_stub = _make_data_stub(self)
+        else:
+            self._data_stub = DataChannelPool(
+                [_make_data_stub(self, _GRPC_CHANNEL_POOL_OPTIONS)
+                 for _ in range(channel_pool_size)],
+                selection=channel_selection)
         if self._admin:
             self._instance_stub_internal = _make_instance_stub(self)
             self._operations_stub_internal = _make_operations_stub(self)
@@ -262,6 +512,8 @@ class Client(ClientWithProject):
             self._read_only,
             self._admin,
             self.user_agent,
+            self.channel_pool_size,
+            self.channel_selection,
         )
 
     @property
@@ -274,6 +526,19 @@ class Client(ClientWithProject):
         """
         return self._credentials
 
+    @property
+    def in_flight_requests(self):
+        """The number of Data API requests in flight on each channel.
+
+        :rtype: list
+        :returns: The counts for each channel of the pool, or :data:`None`
+                  if the client has a single channel (``channel_pool_size``
+                  of 1), whose requests are not counted.
+        """
+        if isinstance(self._data_stub, DataChannelPool):
+            return self._data_stub.in_flight
+        return None
+
     @property
     def project_name(self):
         """Project name to be used with Instance Admin API.
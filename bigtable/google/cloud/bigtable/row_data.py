@@ -16,10 +16,76 @@
 
 
 import copy
+import struct
+
+import grpc
 import six
 
+from google.api_core import exceptions
+from google.api_core.retry import Retry
 from google.cloud._helpers import _datetime_from_microseconds
+from google.cloud._helpers import _microseconds_from_datetime
 from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable._generated import (
+    bigtable_pb2 as data_messages_v2_pb2)
+
+
+def _retry_read_rows_exception(exc):
+    """Whether a ``ReadRows`` stream failing with ``exc`` can be resumed."""
+    if isinstance(exc, grpc.RpcError):
+        exc = exceptions.from_grpc_error(exc)
+    return isinstance(exc, (exceptions.ServiceUnavailable,
+                            exceptions.DeadlineExceeded,
+                            exceptions.Aborted))
+
+
+DEFAULT_RETRY_READ_ROWS = Retry(
+    predicate=_retry_read_rows_exception,
+    initial=1.0,
+    maximum=15.0,
+    multiplier=2.0,
+    deadline=60.0,  # 60 seconds
+)
+"""The default retry strategy to be used on retry-able errors.
+
+Used by :class:`PartialRowsData` to resume a ``ReadRows`` stream which
+failed part way.
+"""
+
+
+_INT64 = struct.Struct('>q')
+_FLOAT64 = struct.Struct('>d')
+
+
+def _decode_int64(value):
+    """Decode a 64-bit big-endian signed integer (e.g. from a counter)."""
+    return _INT64.unpack(value)[0]
+
+
+def _decode_float64(value):
+    """Decode a 64-bit big-endian IEEE 754 floating point number."""
+    return _FLOAT64.unpack(value)[0]
+
+
+def _decode_utf8(value):
+    """Decode a UTF-8 encoded string."""
+    return value.decode('utf-8')
+
+
+DECODERS = {
+    'bytes': None,
+    'int64': _decode_int64,
+    'float64': _decode_float64,
+    'utf-8': _decode_utf8,
+}
+"""Decoders for cell values, by name, for :meth:`PartialRowsData.to_columns`.
+
+* ``'bytes'``: the raw value (the default).
+* ``'int64'``: a 64-bit big-endian signed integer, as written by
+  :meth:`~google.cloud.bigtable.row.AppendRow.increment_cell_value`.
+* ``'float64'``: a 64-bit big-endian IEEE 754 floating point number.
+* ``'utf-8'``: a UTF-8 encoded string.
+"""
 
 
 class Cell(object):
@@ -29,15 +95,25 @@ class Cell(object):
     :param value: The value stored in the cell.
 
     :type timestamp: :class:`datetime.datetime`
-    :param timestamp: The timestamp when the cell was stored.
+    :param timestamp: The timestamp when the cell was stored. May be
+                      :data:`None` if ``timestamp_micros`` is passed.
 
     :type labels: list
     :param labels: (Optional) List of strings. Labels applied to the cell.
+
+    :type timestamp_micros: int
+    :param timestamp_micros: (Optional) The timestamp when the cell was
+                             stored, in microseconds since the epoch. It is
+                             only converted to a datetime when
+                             :attr:`timestamp` is accessed.
     """
 
-    def __init__(self, value, timestamp, labels=()):
+    __slots__ = ('value', 'labels', '_timestamp', '_timestamp_micros')
+
+    def __init__(self, value, timestamp, labels=(), timestamp_micros=None):
         self.value = value
-        self.timestamp = timestamp
+        self._timestamp = timestamp
+        self._timestamp_micros = timestamp_micros
         self.labels = list(labels)
 
     @classmethod
@@ -50,11 +126,37 @@ class Cell(object):
         :rtype: :class:`Cell`
         :returns: The cell corresponding to the protobuf.
         """
-        timestamp = _datetime_from_microseconds(cell_pb.timestamp_micros)
-        if cell_pb.labels:
-            return cls(cell_pb.value, timestamp, labels=cell_pb.labels)
-        else:
-            return cls(cell_pb.value, timestamp)
+        return cls(cell_pb.value, None, labels=cell_pb.labels,
+                   timestamp_micros=cell_pb.timestamp_micros)
+
+    @property
+    def timestamp(self):
+        """The timestamp when the cell was stored.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: The timestamp of the cell.
+        """
+        if self._timestamp is None and self._timestamp_micros is not None:
+            self._timestamp = _datetime_from_microseconds(
+                self._timestamp_micros)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = value
+        self._timestamp_micros = None
+
+    @property
+    def timestamp_micros(self):
+        """The timestamp when the cell was stored, in microseconds.
+
+        :rtype: int
+        :returns: The timestamp of the cell, in microseconds since the epoch.
+        """
+        if self._timestamp_micros is None and self._timestamp is not None:
+            self._timestamp_micros = _microseconds_from_datetime(
+                self._timestamp)
+        return self._timestamp_micros
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -172,6 +274,24 @@ class PartialRowData(object):
         return self._row_key
 
 
+class _ProjectedRow(object):
+    """The projected cells of a row, for :meth:`PartialRowsData.to_columns`.
+
+    :type row_key: bytes
+    :param row_key: The key of the row.
+
+    :type num_columns: int
+    :param num_columns: The number of projected columns.
+    """
+
+    __slots__ = ('row_key', 'values')
+
+    def __init__(self, row_key, num_columns):
+        self.row_key = row_key
+        # The value of the latest cell of each projected column, or None.
+        self.values = [None] * num_columns
+
+
 class InvalidReadRowsResponse(RuntimeError):
     """Exception raised to to invalid response data from back-end."""
 
@@ -183,19 +303,63 @@ class InvalidChunk(RuntimeError):
 class PartialRowsData(object):
     """Convenience wrapper for consuming a ``ReadRows`` streaming response.
 
+    Iterating over an instance yields each row as soon as it is committed,
+    without accumulating the rows in :attr:`rows`; this is the way to scan
+    tables which do not fit in memory::
+
+        for row in table.read_rows():
+            process(row)
+
+    If ``read_method`` and ``request`` are passed, a stream which fails with
+    a retry-able error is resumed transparently: ``ReadRows`` is issued again
+    for the rows after the last row key read, and with the remaining rows
+    limit.
+
     :type response_iterator: :class:`~google.cloud.exceptions.GrpcRendezvous`
     :param response_iterator: A streaming iterator returned from a
                               ``ReadRows`` request.
+
+    :type read_method: callable
+    :param read_method: (Optional) The ``ReadRows`` method which returned
+                        ``response_iterator``, used to resume the stream.
+
+    :type request: :class:`data_messages_v2_pb2.ReadRowsRequest`
+    :param request: (Optional) The request which returned
+                    ``response_iterator``, used to resume the stream.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) Retry delay and deadline arguments for resuming
+                  the stream. Defaults to :data:`DEFAULT_RETRY_READ_ROWS`.
+
+    :type fast_decode: bool
+    :param fast_decode: (Optional) Whether to decode the chunks with a single,
+                        low-allocation state machine (see
+                        :meth:`_consume_chunks_fast`), rather than validating
+                        each chunk in turn. The rows are the same either way.
     """
     START = "Start"                         # No responses yet processed.
     NEW_ROW = "New row"                     # No cells yet complete for row
     ROW_IN_PROGRESS = "Row in progress"     # Some cells complete for row
     CELL_IN_PROGRESS = "Cell in progress"   # Incomplete cell for row
 
-    def __init__(self, response_iterator):
+    def __init__(self, response_iterator, read_method=None, request=None,
+                 retry=DEFAULT_RETRY_READ_ROWS, fast_decode=False):
         self._response_iterator = response_iterator
+        self.read_method = read_method
+        self.request = request
+        self.retry = retry
+        self.fast_decode = fast_decode
+        # Index of each projected (family, qualifier) column, when decoding
+        # the rows into columns
+        self._projection = None
         # Fully-processed rows, keyed by `row_key`
         self._rows = {}
+        # Rows committed by the last response, when iterating
+        self._committed_rows = None
+        # Number of rows committed so far, for the remaining rows limit
+        self._rows_read = 0
+        # Key of the last row committed or scanned, to resume the stream
+        self._resume_key = None
         # Counter for responses pulled from iterator
         self._counter = 0
         # Maybe cached from previous response
@@ -252,13 +416,64 @@ class PartialRowsData(object):
         """Cancels the iterator, closing the stream."""
         self._response_iterator.cancel()
 
+    def __iter__(self):
+        """Consume the stream, yielding rows as they are committed.
+
+        The rows are not accumulated in :attr:`rows`.
+
+        :rtype: :class:`PartialRowData`
+        :returns: The rows, in order by row key.
+        :raises: :class:`ValueError <exceptions.ValueError>` if the stream
+                 ends with a row which was not committed.
+        """
+        self._committed_rows = []
+        while True:
+            try:
+                self.consume_next()
+            except StopIteration:
+                break
+            committed, self._committed_rows = self._committed_rows, []
+            for row in committed:
+                yield row
+
+        if self.state not in (self.START, self.NEW_ROW):
+            raise ValueError('The row remains partial / is not committed.')
+
+    def _read_next(self):
+        """Helper for :meth:`_read_next_response`."""
+        return six.next(self._response_iterator)
+
+    def _read_next_response(self):
+        """Read the next response, resuming the stream on retry-able errors.
+
+        :rtype: :class:`data_messages_v2_pb2.ReadRowsResponse`
+        :returns: The next response from the stream.
+        """
+        if self.read_method is None or self.request is None:
+            return self._read_next()
+        return self.retry(self._read_next, on_error=self._on_error)()
+
+    def _on_error(self, exc):
+        """Helper for :meth:`_read_next_response`.
+
+        Discards the partial row, and re-issues ``ReadRows`` for the rows
+        which were not read yet.
+        """
+        self._row = self._cell = self._previous_cell = None
+        request = _create_resume_request(
+            self.request, self._resume_key, self._rows_read)
+        if request is None:  # Every requested row was read already.
+            self._response_iterator = iter(())
+        else:
+            self._response_iterator = self.read_method(request)
+
     def consume_next(self):
         """Consume the next ``ReadRowsResponse`` from the stream.
 
         Parse the response and its chunks into a new/existing row in
         :attr:`_rows`. Rows are returned in order by row key.
         """
-        response = six.next(self._response_iterator)
+        response = self._read_next_response()
         self._counter += 1
 
         if self._last_scanned_row_key is None:  # first response
@@ -266,6 +481,12 @@ class PartialRowsData(object):
                 raise InvalidReadRowsResponse()
 
         self._last_scanned_row_key = response.last_scanned_row_key
+        if response.last_scanned_row_key:
+            self._resume_key = response.last_scanned_row_key
+
+        if self.fast_decode or self._projection is not None:
+            self._consume_chunks_fast(response.chunks)
+            return
 
         row = self._row
         cell = self._cell
@@ -307,6 +528,229 @@ class PartialRowsData(object):
                 self._save_current_cell()
                 cell = None
 
+    def _consume_chunks_fast(self, chunks):
+        """Parse the chunks of a response, in fast decode mode.
+
+        A single state machine both validates the chunks and builds the rows:
+        the family name and qualifier carried over from the previous cell
+        are kept in locals rather than copied into the chunks, no
+        :class:`PartialCellData` is created, the values of split cells are
+        accumulated in a :class:`bytearray`, and the cells keep their raw
+        timestamps until :attr:`Cell.timestamp` is accessed.
+
+        While a row is in progress, ``_cell`` holds the family name,
+        qualifier, timestamp, labels and value buffer of a split cell, and
+        ``_previous_cell`` the family name and qualifier of the last
+        complete cell.
+
+        When decoding the rows into columns (see :meth:`to_columns`), the
+        rows are :class:`_ProjectedRow` instances, keeping the value of the
+        first (i.e. latest) cell of each projected column only.
+
+        :type chunks: list
+        :param chunks: The ``CellChunk`` messages of a ``ReadRowsResponse``.
+        """
+        row = self._row
+        projection = self._projection
+        family = qualifier = timestamp = labels = buffer_ = None
+        if self._cell is not None:
+            family, qualifier, timestamp, labels, buffer_ = self._cell
+        elif self._previous_cell is not None:
+            family, qualifier = self._previous_cell
+        has_previous = self._previous_cell is not None
+        row_key = None if row is None else row.row_key
+        previous_row_key = None
+        if self._previous_row is not None:
+            previous_row_key = self._previous_row.row_key
+
+        for chunk in chunks:
+            value_size = chunk.value_size
+            commit_row = chunk.commit_row
+            if value_size < 0 or (commit_row and value_size):
+                raise InvalidChunk()
+
+            if chunk.reset_row:
+                if (row is None or chunk.row_key or
+                        chunk.HasField('family_name') or
+                        chunk.HasField('qualifier') or
+                        chunk.timestamp_micros or chunk.labels or
+                        value_size or chunk.value):
+                    raise InvalidChunk()
+                row = row_key = buffer_ = None
+                has_previous = False
+                continue
+
+            if buffer_ is None:  # A new cell.
+                chunk_row_key = chunk.row_key
+                has_family = chunk.HasField('family_name')
+                has_qualifier = chunk.HasField('qualifier')
+                if row is None:  # A new row.
+                    if (not chunk_row_key or not has_family or
+                            not has_qualifier or
+                            (previous_row_key is not None and
+                             chunk_row_key <= previous_row_key)):
+                        raise InvalidChunk()
+                    row_key = chunk_row_key
+                    if projection is None:
+                        row = PartialRowData(row_key)
+                    else:
+                        row = _ProjectedRow(row_key, len(projection))
+                elif chunk_row_key and chunk_row_key != row_key:
+                    raise InvalidChunk()
+                if has_family:
+                    if not has_qualifier:
+                        raise InvalidChunk()
+                    family = chunk.family_name.value
+                if has_qualifier:
+                    qualifier = chunk.qualifier.value
+                timestamp = chunk.timestamp_micros
+                labels = chunk.labels
+                if value_size:
+                    buffer_ = bytearray(chunk.value)
+                    continue
+                value = chunk.value
+            else:  # The rest of a split cell.
+                if (chunk.row_key or chunk.HasField('family_name') or
+                        chunk.HasField('qualifier') or
+                        chunk.timestamp_micros or chunk.labels):
+                    raise InvalidChunk()
+                buffer_.extend(chunk.value)
+                if value_size:
+                    continue
+                value = bytes(buffer_)
+                buffer_ = None
+
+            if projection is None:
+                columns = row._cells.get(family)
+                if columns is None:
+                    columns = row._cells[family] = {}
+                cells = columns.get(qualifier)
+                if cells is None:
+                    cells = columns[qualifier] = []
+                cells.append(
+                    Cell(value, None, labels, timestamp_micros=timestamp))
+            else:
+                # The cells of a column are sent newest first.
+                index = projection.get((family, qualifier))
+                if index is not None and row.values[index] is None:
+                    row.values[index] = value
+            has_previous = True
+
+            if commit_row:
+                self._row, self._cell = row, None
+                self._save_current_row()
+                previous_row_key = row_key
+                row = row_key = None
+                has_previous = False
+
+        self._row = row
+        if buffer_ is not None:
+            self._cell = (family, qualifier, timestamp, labels, buffer_)
+        else:
+            self._cell = None
+        if row is not None and has_previous:
+            self._previous_cell = (family, qualifier)
+        else:
+            self._previous_cell = None
+
+    def to_columns(self, columns, decoders=None):
+        """Consume the stream into one list of values per column.
+
+        Only the latest cell of each requested column is kept, and no
+        :class:`Cell` is created: the chunks are decoded in a single pass,
+        straight into the lists of values. Rows without any cell in a column
+        have a :data:`None` value in it.
+
+        :type columns: dict
+        :param columns: The name of each column to build, keyed by the
+                        column of the table it is read from, either as a
+                        ``'family:qualifier'`` string or a
+                        ``(family, qualifier)`` tuple. A list of such pairs
+                        can be passed instead, to preserve the order of the
+                        columns.
+
+        :type decoders: dict
+        :param decoders: (Optional) The decoder of the values of some of the
+                         columns, keyed by column name: either the name of
+                         one of the :data:`DECODERS`, or a callable taking
+                         the value of a cell as :class:`bytes`. By default,
+                         the values are left as :class:`bytes`.
+
+        :rtype: tuple
+        :returns: The list of row keys, and a dictionary of the list of
+                  values of each column, keyed by column name.
+        :raises: :class:`ValueError <exceptions.ValueError>` if a decoder is
+                 unknown, or if the stream ends with a row which was not
+                 committed.
+        """
+        projection, names = _make_projection(columns)
+        decoders = decoders or {}
+        decode_funcs = []
+        for name in names:
+            decoder = decoders.get(name)
+            if isinstance(decoder, six.string_types):
+                if decoder not in DECODERS:
+                    raise ValueError('Unknown decoder: %r' % (decoder,))
+                decoder = DECODERS[decoder]
+            decode_funcs.append(decoder)
+
+        row_keys = []
+        raw_columns = tuple([] for _ in names)
+        self._projection = projection
+        try:
+            for row in self:
+                row_keys.append(row.row_key)
+                for raw_values, value in zip(raw_columns, row.values):
+                    raw_values.append(value)
+        finally:
+            self._projection = None
+
+        result = {}
+        for name, decode, raw_values in zip(
+                names, decode_funcs, raw_columns):
+            if decode is not None:
+                raw_values = [None if value is None else decode(value)
+                              for value in raw_values]
+            result[name] = raw_values
+        return row_keys, result
+
+    def to_dataframe(self, columns, decoders=None):
+        """Consume the stream into a :mod:`pandas` dataframe.
+
+        The dataframe is built from :meth:`to_columns`, and is indexed by
+        row key.
+
+        .. note::
+
+            Use of this method requires that you have :mod:`pandas`
+            installed.
+
+        :type columns: dict
+        :param columns: The name of each column to build, keyed by the
+                        column of the table it is read from, or an iterable
+                        of such pairs. See :meth:`to_columns`.
+
+        :type decoders: dict
+        :param decoders: (Optional) The decoder of the values of some of the
+                         columns, keyed by column name. See
+                         :meth:`to_columns`.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: A dataframe with a column per requested column, and a row
+                  per row read.
+        """
+        import pandas   # pylint: disable=import-error
+
+        # The columns are iterated twice: they may be any iterable of pairs.
+        if hasattr(columns, 'items'):
+            columns = columns.items()
+        columns = list(columns)
+        row_keys, data = self.to_columns(columns, decoders=decoders)
+        names = _make_projection(columns)[1]
+        return pandas.DataFrame(
+            data, index=pandas.Index(row_keys, name='row_key'),
+            columns=names)
+
     def consume_all(self, max_loops=None):
         """Consume the streamed responses until there are no more.
 
@@ -382,6 +826,12 @@ class PartialRowsData(object):
         """Helper for :meth:`_validate_chunk`"""
         assert self.state == self.CELL_IN_PROGRESS
         self._validate_chunk_status(chunk)
+        # The rest of a split cell carries its value only.
+        _raise_if(chunk.row_key)
+        _raise_if(chunk.HasField('family_name'))
+        _raise_if(chunk.HasField('qualifier'))
+        _raise_if(chunk.timestamp_micros)
+        _raise_if(chunk.labels)
         self._copy_from_current(chunk)
 
     def _validate_chunk(self, chunk):
@@ -433,11 +883,106 @@ class PartialRowsData(object):
         """Helper for :meth:`consume_next`."""
         if self._cell:
             self._save_current_cell()
-        self._rows[self._row.row_key] = self._row
-        self._row, self._previous_row = None, self._row
+        row = self._row
+        if self._committed_rows is None:
+            self._rows[row.row_key] = row
+        else:
+            self._committed_rows.append(row)
+        self._rows_read += 1
+        self._resume_key = row.row_key
+        self._row, self._previous_row = None, row
         self._previous_cell = None
 
 
+def _make_projection(columns):
+    """Index the columns requested from :meth:`PartialRowsData.to_columns`.
+
+    :type columns: dict
+    :param columns: The name of each column to build, keyed by the column of
+                    the table it is read from, or a list of such pairs.
+
+    :rtype: tuple
+    :returns: The index of each ``(family, qualifier)`` column of the table,
+              and the list of column names, in the same order.
+    :raises: :class:`ValueError <exceptions.ValueError>` if a column of the
+             table is not of the form ``family:qualifier``, or is requested
+             twice.
+    """
+    if hasattr(columns, 'items'):
+        columns = columns.items()
+    projection = {}
+    names = []
+    for column, name in columns:
+        if isinstance(column, six.string_types):
+            family, separator, qualifier = column.partition(':')
+            if not separator:
+                raise ValueError(
+                    'Expected a "family:qualifier" column, got %r' % (
+                        column,))
+        else:
+            family, qualifier = column
+        key = (family, _to_bytes(qualifier))
+        if key in projection:
+            raise ValueError('Column %r is requested twice.' % (column,))
+        projection[key] = len(names)
+        names.append(name)
+    return projection, names
+
+
+def _create_resume_request(request, resume_key, rows_read):
+    """Create a request for the rows after ``resume_key``.
+
+    :type request: :class:`data_messages_v2_pb2.ReadRowsRequest`
+    :param request: The original request.
+
+    :type resume_key: bytes
+    :param resume_key: The last row key read, or :data:`None` if no row was
+                       read yet.
+
+    :type rows_read: int
+    :param rows_read: The number of rows read so far.
+
+    :rtype: :class:`data_messages_v2_pb2.ReadRowsRequest`
+    :returns: The request for the remaining rows, or :data:`None` if there
+              are none.
+    """
+    resumed = data_messages_v2_pb2.ReadRowsRequest()
+    resumed.CopyFrom(request)
+    if request.rows_limit:
+        if rows_read >= request.rows_limit:
+            return None
+        resumed.rows_limit = request.rows_limit - rows_read
+    if resume_key is None:
+        return resumed
+
+    rows = request.rows
+    resumed.ClearField('rows')
+    if not rows.row_keys and not rows.row_ranges:  # Full table scan.
+        resumed.rows.row_ranges.add(start_key_open=resume_key)
+        return resumed
+
+    resumed.rows.row_keys.extend(
+        key for key in rows.row_keys if key > resume_key)
+    for row_range in rows.row_ranges:
+        end_key = row_range.WhichOneof('end_key')
+        if end_key == 'end_key_open' and (
+                row_range.end_key_open <= resume_key):
+            continue
+        if end_key == 'end_key_closed' and (
+                row_range.end_key_closed <= resume_key):
+            continue
+        resumed_range = resumed.rows.row_ranges.add()
+        resumed_range.CopyFrom(row_range)
+        start_key = row_range.WhichOneof('start_key')
+        if (start_key is None or
+                getattr(row_range, start_key) <= resume_key):
+            resumed_range.start_key_open = resume_key
+
+    if not resumed.rows.row_keys and not resumed.rows.row_ranges:
+        return None
+    return resumed
+
+
 def _raise_if(predicate, *args):
     """Helper for validation methods."""
     if predicate:
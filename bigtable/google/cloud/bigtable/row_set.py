@@ -0,0 +1,161 @@
+# Copyright 2017 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""User-friendly container for Google Cloud Bigtable RowSet."""
+
+
+from google.cloud._helpers import _to_bytes
+
+
+class RowSet(object):
+    """Set of row keys and row ranges to read from a table.
+
+    A :class:`RowSet` can be passed as the ``row_set`` argument of
+    :meth:`~google.cloud.bigtable.table.Table.read_rows`.
+    """
+
+    def __init__(self):
+        self.row_keys = []
+        self.row_ranges = []
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return (other.row_keys == self.row_keys and
+                other.row_ranges == self.row_ranges)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def add_row_key(self, row_key):
+        """Add a row key to the set.
+
+        :type row_key: bytes
+        :param row_key: The key of a row to read.
+        """
+        self.row_keys.append(_to_bytes(row_key))
+
+    def add_row_range(self, row_range):
+        """Add a row range to the set.
+
+        :type row_range: :class:`RowRange`
+        :param row_range: The range of rows to read.
+        """
+        self.row_ranges.append(row_range)
+
+    def add_row_range_from_keys(self, start_key=None, end_key=None,
+                                start_inclusive=True, end_inclusive=False):
+        """Add a row range to the set, from its start and end keys.
+
+        :type start_key: bytes
+        :param start_key: (Optional) The first key of the range. If left
+                          empty, the range starts at the first row.
+
+        :type end_key: bytes
+        :param end_key: (Optional) The last key of the range. If left
+                        empty, the range ends at the last row.
+
+        :type start_inclusive: bool
+        :param start_inclusive: (Optional) Whether the ``start_key`` is in
+                                the range. The default is True (inclusive).
+
+        :type end_inclusive: bool
+        :param end_inclusive: (Optional) Whether the ``end_key`` is in the
+                              range. The default is False (exclusive).
+        """
+        self.add_row_range(RowRange(
+            start_key, end_key, start_inclusive, end_inclusive))
+
+    def _update_message_request(self, message):
+        """Add the row keys and row ranges to a ``ReadRowsRequest``.
+
+        :type message: :class:`data_messages_v2_pb2.ReadRowsRequest`
+        :param message: The request to update.
+        """
+        message.rows.row_keys.extend(self.row_keys)
+        for row_range in self.row_ranges:
+            message.rows.row_ranges.add(**row_range.get_range_kwargs())
+
+
+class RowRange(object):
+    """A range of row keys.
+
+    :type start_key: bytes
+    :param start_key: (Optional) The first key of the range. If left empty,
+                      the range starts at the first row.
+
+    :type end_key: bytes
+    :param end_key: (Optional) The last key of the range. If left empty,
+                    the range ends at the last row.
+
+    :type start_inclusive: bool
+    :param start_inclusive: (Optional) Whether the ``start_key`` is in the
+                            range. The default is True (inclusive).
+
+    :type end_inclusive: bool
+    :param end_inclusive: (Optional) Whether the ``end_key`` is in the
+                          range. The default is False (exclusive).
+    """
+
+    def __init__(self, start_key=None, end_key=None,
+                 start_inclusive=True, end_inclusive=False):
+        if start_key is not None:
+            start_key = _to_bytes(start_key)
+        if end_key is not None:
+            end_key = _to_bytes(end_key)
+        self.start_key = start_key
+        self.end_key = end_key
+        self.start_inclusive = start_inclusive
+        self.end_inclusive = end_inclusive
+
+    def _key(self):
+        """A tuple key that uniquely describes this range.
+
+        Used to compute this instance's hashcode and evaluate equality.
+
+        :rtype: tuple
+        :returns: The range's keys and whether they are inclusive.
+        """
+        return (self.start_key, self.end_key,
+                self.start_inclusive, self.end_inclusive)
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def get_range_kwargs(self):
+        """Convert the range to the keyword arguments of a ``RowRange``.
+
+        :rtype: dict
+        :returns: The ``start_key_*`` and ``end_key_*`` fields of the range.
+        """
+        range_kwargs = {}
+        if self.start_key is not None:
+            start_key_key = 'start_key_open'
+            if self.start_inclusive:
+                start_key_key = 'start_key_closed'
+            range_kwargs[start_key_key] = self.start_key
+        if self.end_key is not None:
+            end_key_key = 'end_key_open'
+            if self.end_inclusive:
+                end_key_key = 'end_key_closed'
+            range_kwargs[end_key_key] = self.end_key
+        return range_kwargs
@@ -15,6 +15,11 @@
 """User-friendly container for Google Cloud Bigtable Table."""
 
 
+import threading
+
+from concurrent import futures
+from six.moves import queue
+
 from google.api_core.exceptions import RetryError
 from google.api_core.retry import if_exception_type
 from google.api_core.retry import Retry
@@ -30,7 +35,10 @@ from google.cloud.bigtable.column_family import ColumnFamily
 from google.cloud.bigtable.row import AppendRow
 from google.cloud.bigtable.row import ConditionalRow
 from google.cloud.bigtable.row import DirectRow
+from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
 from google.cloud.bigtable.row_data import PartialRowsData
+from google.cloud.bigtable.row_set import RowRange
+from google.cloud.bigtable.row_set import RowSet
 from grpc import StatusCode
 
 
@@ -39,6 +47,20 @@ from grpc import StatusCode
 #  google.bigtable.v2#google.bigtable.v2.MutateRowRequest)
 _MAX_BULK_MUTATIONS = 100000
 
+# Default number of concurrent ``ReadRows`` streams in parallel reads.
+_DEFAULT_MAX_READ_WORKERS = 8
+
+# Maximum number of rows buffered per stream (or in all, when the rows are
+# returned as they arrive) in parallel reads.
+_MAX_BUFFERED_ROWS = 1000
+
+# Marks the end of a stream in the queues of parallel reads.
+_STREAM_DONE = object()
+
+# Default number of row keys read by each ``ReadRows`` request of
+# :meth:`Table.read_rows_multi`.
+_DEFAULT_ROW_KEYS_PER_READ = 500
+
 
 class _BigtableRetryableError(Exception):
     """Retry-able error expected by the default retry strategy."""
@@ -276,7 +298,9 @@ class Table(object):
         return rows_data.rows[row_key]
 
     def read_rows(self, start_key=None, end_key=None, limit=None,
-                  filter_=None, end_inclusive=False):
+                  filter_=None, end_inclusive=False,
+                  retry=DEFAULT_RETRY_READ_ROWS, row_set=None,
+                  fast_decode=False):
         """Read rows from this table.
 
         :type start_key: bytes
@@ -303,17 +327,41 @@ class Table(object):
         :param end_inclusive: (Optional) Whether the ``end_key`` should be
                       considered inclusive. The default is False (exclusive).
 
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) Retry delay and deadline arguments for
+                      resuming the stream after retry-able errors. To
+                      override, the default value
+                      :attr:`~.row_data.DEFAULT_RETRY_READ_ROWS` can be used
+                      and modified with the
+                      :meth:`~google.api_core.retry.Retry.with_delay` method
+                      or the
+                      :meth:`~google.api_core.retry.Retry.with_deadline`
+                      method.
+
+        :type row_set: :class:`.RowSet`
+        :param row_set: (Optional) The row keys and row ranges to read. Can
+                        not be combined with ``start_key`` and ``end_key``,
+                        and must not be empty.
+
+        :type fast_decode: bool
+        :param fast_decode: (Optional) Whether to decode the stream in the
+                            low-allocation mode of :class:`.PartialRowsData`.
+
         :rtype: :class:`.PartialRowsData`
         :returns: A :class:`.PartialRowsData` convenience wrapper for consuming
-                  the streamed results.
+                  the streamed results. Iterate over it to process the rows
+                  as they arrive.
         """
         request_pb = _create_row_request(
             self.name, start_key=start_key, end_key=end_key, filter_=filter_,
-            limit=limit, end_inclusive=end_inclusive)
+            limit=limit, end_inclusive=end_inclusive, row_set=row_set)
         client = self._instance._client
-        response_iterator = client._data_stub.ReadRows(request_pb)
+        read_method = client._data_stub.ReadRows
+        response_iterator = read_method(request_pb)
         # We expect an iterator of `data_messages_v2_pb2.ReadRowsResponse`
-        return PartialRowsData(response_iterator)
+        return PartialRowsData(
+            response_iterator, read_method, request_pb, retry=retry,
+            fast_decode=fast_decode)
 
     def mutate_rows(self, rows, retry=DEFAULT_RETRY):
         """Mutates multiple rows in bulk.
@@ -385,6 +433,249 @@ class Table(object):
         response_iterator = client._data_stub.SampleRowKeys(request_pb)
         return response_iterator
 
+    def read_rows_multi(self, row_keys, filter_=None,
+                        batch_size=_DEFAULT_ROW_KEYS_PER_READ,
+                        max_workers=None, retry=DEFAULT_RETRY_READ_ROWS,
+                        fast_decode=False):
+        """Read many rows from this table, by row key.
+
+        The row keys are deduplicated and sorted, then split into batches of
+        at most ``batch_size`` keys. Each batch is read by its own
+        ``ReadRows`` request, and the requests run concurrently.
+
+        :type row_keys: list
+        :param row_keys: List or other iterable of the keys (bytes) of the
+                         rows to read.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        rows. If unset, reads every column in each row.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of row keys read by
+                           a single ``ReadRows`` request. Defaults to 500.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of concurrent
+                            requests. Defaults to 8.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) Retry delay and deadline arguments for
+                      resuming each request after retry-able errors.
+
+        :type fast_decode: bool
+        :param fast_decode: (Optional) Whether to decode the streams in the
+                            low-allocation mode of :class:`.PartialRowsData`.
+
+        :rtype: dict
+        :returns: The rows which exist, as :class:`.PartialRowData`
+                  instances keyed by row key.
+        :raises: :class:`ValueError <exceptions.ValueError>` if
+                 ``batch_size`` is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1.')
+        row_keys = sorted(set(_to_bytes(row_key) for row_key in row_keys))
+
+        row_sets = []
+        for start in range(0, len(row_keys), batch_size):
+            row_set = RowSet()
+            row_set.row_keys.extend(row_keys[start:start + batch_size])
+            row_sets.append(row_set)
+
+        rows = self._read_row_sets(
+            row_sets, filter_=filter_, ordered=False, max_workers=max_workers,
+            retry=retry, fast_decode=fast_decode)
+        return dict((row.row_key, row) for row in rows)
+
+    def read_rows_parallel(self, start_key=None, end_key=None, filter_=None,
+                           end_inclusive=False, ordered=True,
+                           max_workers=None, retry=DEFAULT_RETRY_READ_ROWS,
+                           fast_decode=False):
+        """Read rows from this table with several concurrent streams.
+
+        The range of rows is split at the row keys returned by
+        :meth:`sample_row_keys` (i.e. roughly at tablet boundaries), and the
+        resulting shards are read concurrently, each with its own
+        ``ReadRows`` stream, on a pool of worker threads.
+
+        :type start_key: bytes
+        :param start_key: (Optional) The beginning of a range of row keys to
+                          read from. The range will include ``start_key``. If
+                          left empty, will be interpreted as the empty string.
+
+        :type end_key: bytes
+        :param end_key: (Optional) The end of a range of row keys to read from.
+                        The range will not include ``end_key``. If left empty,
+                        will be interpreted as an infinite string.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        specified row(s). If unset, reads every column in
+                        each row.
+
+        :type end_inclusive: bool
+        :param end_inclusive: (Optional) Whether the ``end_key`` should be
+                      considered inclusive. The default is False (exclusive).
+
+        :type ordered: bool
+        :param ordered: (Optional) Whether to return the rows in order by row
+                        key (the default), or as soon as they arrive, in no
+                        particular order.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of concurrent
+                            streams. Defaults to 8.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) Retry delay and deadline arguments for
+                      resuming each stream after retry-able errors.
+
+        :type fast_decode: bool
+        :param fast_decode: (Optional) Whether to decode the streams in the
+                            low-allocation mode of :class:`.PartialRowsData`.
+
+        :rtype: iterator
+        :returns: An iterator of :class:`.PartialRowData`. Stopping the
+                  iteration early cancels the streams.
+        """
+        row_sets = self._split_row_range(start_key, end_key, end_inclusive)
+        return self._read_row_sets(
+            row_sets, filter_=filter_, ordered=ordered,
+            max_workers=max_workers, retry=retry, fast_decode=fast_decode)
+
+    def _split_row_range(self, start_key=None, end_key=None,
+                         end_inclusive=False):
+        """Split a range of rows at the sampled row keys.
+
+        :rtype: list
+        :returns: One :class:`.RowSet` per shard of the range, in order by
+                  row key.
+        """
+        if start_key is not None:
+            start_key = _to_bytes(start_key)
+        if end_key is not None:
+            end_key = _to_bytes(end_key)
+
+        boundaries = [start_key]
+        for response in self.sample_row_keys():
+            row_key = response.row_key
+            if not row_key:  # The end of the table.
+                continue
+            if start_key is not None and row_key <= start_key:
+                continue
+            if end_key is not None and row_key >= end_key:
+                break
+            boundaries.append(row_key)
+        boundaries.append(end_key)
+
+        row_sets = []
+        for index in range(len(boundaries) - 1):
+            row_set = RowSet()
+            is_last = index == len(boundaries) - 2
+            row_set.add_row_range(RowRange(
+                boundaries[index], boundaries[index + 1],
+                end_inclusive=end_inclusive and is_last))
+            row_sets.append(row_set)
+        return row_sets
+
+    def _read_row_sets(self, row_sets, filter_=None, ordered=True,
+                       max_workers=None, retry=DEFAULT_RETRY_READ_ROWS,
+                       fast_decode=False):
+        """Read several row sets concurrently.
+
+        Each row set is read by its own ``ReadRows`` stream, on a pool of
+        worker threads. The rows are buffered in bounded queues, so that the
+        streams are throttled when the caller falls behind.
+
+        :type row_sets: list
+        :param row_sets: The :class:`.RowSet` instances to read.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the rows.
+
+        :type ordered: bool
+        :param ordered: (Optional) Whether to return the rows of each row set
+                        in turn (in the order of ``row_sets``), or as soon
+                        as they arrive.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of concurrent
+                            streams. Defaults to 8.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) Retry delay and deadline arguments for
+                      resuming each stream after retry-able errors.
+
+        :type fast_decode: bool
+        :param fast_decode: (Optional) Whether to decode the streams in the
+                            low-allocation mode of :class:`.PartialRowsData`.
+
+        :rtype: iterator
+        :returns: An iterator of :class:`.PartialRowData`.
+        :raises: :class:`ValueError <exceptions.ValueError>` if
+                 ``max_workers`` is less than 1.
+        """
+        if max_workers is None:
+            max_workers = _DEFAULT_MAX_READ_WORKERS
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        return self._generate_rows(row_sets, filter_, ordered, max_workers,
+                                   retry, fast_decode)
+
+    def _generate_rows(self, row_sets, filter_, ordered, max_workers, retry,
+                       fast_decode):
+        """Helper for :meth:`_read_row_sets`, run lazily by the caller."""
+        if not row_sets:
+            return
+
+        if ordered:
+            queues = [queue.Queue(maxsize=_MAX_BUFFERED_ROWS)
+                      for _ in row_sets]
+        else:
+            queues = [queue.Queue(maxsize=_MAX_BUFFERED_ROWS)] * len(row_sets)
+        stopped = threading.Event()
+        executor = futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(row_sets)))
+        try:
+            # The executor starts the streams in order, so the stream the
+            # caller waits on (when ordered) is never starved by the others.
+            for row_set, rows_queue in zip(row_sets, queues):
+                executor.submit(
+                    self._read_row_set, row_set, filter_, retry, fast_decode,
+                    rows_queue, stopped)
+
+            if ordered:
+                for rows_queue in queues:
+                    for row in _drain_rows(rows_queue, 1):
+                        yield row
+            else:
+                for row in _drain_rows(queues[0], len(row_sets)):
+                    yield row
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
+
+    def _read_row_set(self, row_set, filter_, retry, fast_decode, rows_queue,
+                      stopped):
+        """Helper for :meth:`_read_row_sets`, run by the worker threads.
+
+        Puts the rows read, then either :data:`_STREAM_DONE` or the
+        exception which ended the stream, on ``rows_queue``.
+        """
+        try:
+            rows_data = self.read_rows(
+                row_set=row_set, filter_=filter_, retry=retry,
+                fast_decode=fast_decode)
+            for row in rows_data:
+                if not _put_unless_stopped(rows_queue, row, stopped):
+                    rows_data.cancel()
+                    return
+        except Exception as exc:
+            _put_unless_stopped(rows_queue, exc, stopped)
+        else:
+            _put_unless_stopped(rows_queue, _STREAM_DONE, stopped)
+
 
 class _RetryableMutateRowsWorker(object):
     """A callable worker that can retry to mutate rows with transient errors.
@@ -494,8 +785,47 @@ class _RetryableMutateRowsWorker(object):
         return self.responses_statuses
 
 
+def _put_unless_stopped(rows_queue, item, stopped):
+    """Put an item on a bounded queue, unless the read is stopped first.
+
+    :rtype: bool
+    :returns: Whether the item was put on the queue.
+    """
+    while not stopped.is_set():
+        try:
+            rows_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _drain_rows(rows_queue, streams):
+    """Yield the rows put on a queue, until every stream is done.
+
+    :type rows_queue: :class:`~six.moves.queue.Queue`
+    :param rows_queue: The queue the rows are put on.
+
+    :type streams: int
+    :param streams: The number of streams putting rows on the queue.
+
+    :rtype: iterator
+    :returns: An iterator of :class:`.PartialRowData`.
+    :raises: The exception which ended any of the streams.
+    """
+    while streams:
+        item = rows_queue.get()
+        if item is _STREAM_DONE:
+            streams -= 1
+        elif isinstance(item, Exception):
+            raise item
+        else:
+            yield item
+
+
 def _create_row_request(table_name, row_key=None, start_key=None, end_key=None,
-                        filter_=None, limit=None, end_inclusive=False):
+                        filter_=None, limit=None, end_inclusive=False,
+                        row_set=None):
     """Creates a request to read rows in a table.
 
     :type table_name: str
@@ -527,16 +857,30 @@ def _create_row_request(table_name, row_key=None, start_key=None, end_key=None,
     :param end_inclusive: (Optional) Whether the ``end_key`` should be
                   considered inclusive. The default is False (exclusive).
 
+    :type row_set: :class:`.RowSet`
+    :param row_set: (Optional) The row keys and row ranges to read.
+
     :rtype: :class:`data_messages_v2_pb2.ReadRowsRequest`
     :returns: The ``ReadRowsRequest`` protobuf corresponding to the inputs.
     :raises: :class:`ValueError <exceptions.ValueError>` if both
-             ``row_key`` and one of ``start_key`` and ``end_key`` are set
+             ``row_key`` and one of ``start_key`` and ``end_key`` are set,
+             if ``row_set`` is set with any of them, or if ``row_set`` is
+             empty (which the API would take for a full table scan)
     """
     request_kwargs = {'table_name': table_name}
     if (row_key is not None and
             (start_key is not None or end_key is not None)):
         raise ValueError('Row key and row range cannot be '
                          'set simultaneously')
+    if (row_set is not None and
+            (row_key is not None or start_key is not None or
+             end_key is not None)):
+        raise ValueError('Row set and row key or row range cannot be '
+                         'set simultaneously')
+    if (row_set is not None and
+            not row_set.row_keys and not row_set.row_ranges):
+        raise ValueError('Row set must contain at least one row key or '
+                         'row range')
     range_kwargs = {}
     if start_key is not None or end_key is not None:
         if start_key is not None:
@@ -559,6 +903,9 @@ def _create_row_request(table_name, row_key=None, start_key=None, end_key=None,
     if range_kwargs:
         message.rows.row_ranges.add(**range_kwargs)
 
+    if row_set is not None:
+        row_set._update_message_request(message)
+
     return message
 
 
@@ -0,0 +1,324 @@
+# Copyright 2017 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import grpc
+from grpc import StatusCode
+import mock
+
+
+class TestMutationsBatcher(unittest.TestCase):
+
+    INSTANCE_NAME = 'projects/project-id/instances/instance-id'
+    TABLE_ID = 'table-id'
+
+    SUCCESS = StatusCode.OK.value[0]
+    RETRYABLE = StatusCode.UNAVAILABLE.value[0]
+    NON_RETRYABLE = StatusCode.INVALID_ARGUMENT.value[0]
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.batcher import MutationsBatcher
+
+        return MutationsBatcher
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def _make_table(self):
+        from google.cloud.bigtable.table import Table
+
+        client = _Client()
+        client._data_stub = _FakeDataStub()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        return Table(self.TABLE_ID, instance)
+
+    @staticmethod
+    def _make_row(table, row_key, value=b'value'):
+        from google.cloud.bigtable.row import DirectRow
+
+        row = DirectRow(row_key=row_key, table=table)
+        row.set_cell('cf', b'col', value)
+        return row
+
+    def test_constructor_defaults(self):
+        from google.cloud.bigtable.batcher import FLUSH_COUNT
+        from google.cloud.bigtable.batcher import MAX_ROW_BYTES
+        from google.cloud.bigtable.table import DEFAULT_RETRY
+
+        table = self._make_table()
+        batcher = self._make_one(table)
+        self.assertIs(batcher.table, table)
+        self.assertEqual(batcher.flush_count, FLUSH_COUNT)
+        self.assertEqual(batcher.max_row_bytes, MAX_ROW_BYTES)
+        self.assertIsNone(batcher.flush_interval)
+        self.assertIs(batcher.retry, DEFAULT_RETRY)
+        self.assertIsNone(batcher.error_callback)
+
+    def test_constructor_invalid(self):
+        table = self._make_table()
+        with self.assertRaises(ValueError):
+            self._make_one(table, flush_count=0)
+        with self.assertRaises(ValueError):
+            self._make_one(table, max_inflight=0)
+
+    def test_mutate_flushes_on_count(self):
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        batcher = self._make_one(table, flush_count=2)
+
+        batcher.mutate(self._make_row(table, b'row_1'))
+        self.assertEqual(stub.requests, [])
+        batcher.mutate(self._make_row(table, b'row_2'))
+        batcher.mutate(self._make_row(table, b'row_3'))
+        batcher.close()
+
+        self.assertEqual(stub.batches, [[b'row_1', b'row_2'], [b'row_3']])
+
+    def test_mutate_flushes_on_bytes(self):
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        batcher = self._make_one(table, max_row_bytes=100)
+
+        batcher.mutate(self._make_row(table, b'row_1', b'x' * 60))
+        batcher.mutate(self._make_row(table, b'row_2', b'x' * 60))
+        batcher.flush()
+
+        self.assertEqual(stub.batches, [[b'row_1'], [b'row_2']])
+
+    def test_mutate_flushes_on_interval(self):
+        import threading
+
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        sent = threading.Event()
+        stub.on_request = sent.set
+        batcher = self._make_one(table, flush_interval=0.01)
+
+        batcher.mutate(self._make_row(table, b'row_1'))
+        self.assertTrue(sent.wait(5.0))
+        batcher.close()
+
+        self.assertEqual(stub.batches, [[b'row_1']])
+
+    def test_mutate_too_many_mutations(self):
+        from google.cloud.bigtable.table import TooManyMutationsError
+
+        table = self._make_table()
+        batcher = self._make_one(table)
+        row = self._make_row(table, b'row_1')
+        with mock.patch(
+                'google.cloud.bigtable.batcher._MAX_BULK_MUTATIONS', new=0):
+            with self.assertRaises(TooManyMutationsError):
+                batcher.mutate(row)
+
+    def test_mutate_wrong_type(self):
+        from google.cloud.bigtable.row import ConditionalRow
+
+        table = self._make_table()
+        batcher = self._make_one(table)
+        with self.assertRaises(TypeError):
+            batcher.mutate(ConditionalRow(b'row_1', table, None))
+
+    def test_mutate_closed(self):
+        table = self._make_table()
+        batcher = self._make_one(table)
+        batcher.close()
+        with self.assertRaises(ValueError):
+            batcher.mutate(self._make_row(table, b'row_1'))
+
+    def test_mutate_rows_context_manager(self):
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        rows = [self._make_row(table, b'row_1'),
+                self._make_row(table, b'row_2')]
+
+        with self._make_one(table) as batcher:
+            batcher.mutate_rows(rows)
+
+        self.assertEqual(stub.batches, [[b'row_1', b'row_2']])
+
+    def test_flush_retries_failed_entries_only(self):
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        stub.codes = {b'row_2': [self.RETRYABLE, self.SUCCESS]}
+        retry = _make_no_delay_retry()
+        batcher = self._make_one(table, retry=retry)
+
+        batcher.mutate_rows([self._make_row(table, b'row_1'),
+                             self._make_row(table, b'row_2')])
+        batcher.flush()
+
+        self.assertEqual(stub.batches, [[b'row_1', b'row_2'], [b'row_2']])
+
+    def test_flush_reports_failures_to_callback(self):
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        stub.codes = {b'row_2': [self.NON_RETRYABLE]}
+        failures = []
+        batcher = self._make_one(
+            table, error_callback=lambda row, status: failures.append(
+                (row.row_key, status.code)))
+
+        batcher.mutate_rows([self._make_row(table, b'row_1'),
+                             self._make_row(table, b'row_2')])
+        batcher.flush()
+
+        self.assertEqual(failures, [(b'row_2', self.NON_RETRYABLE)])
+
+    def test_flush_callback_retries_rows(self):
+        import threading
+
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        stub.codes = {b'row_1': [self.NON_RETRYABLE, self.NON_RETRYABLE]}
+        failures = []
+
+        def error_callback(row, status):
+            failures.append(row.row_key)
+            if len(failures) == 1:
+                batcher.mutate(row)
+
+        # Every slot is held while the callback re-sends the row.
+        batcher = self._make_one(
+            table, flush_count=1, max_inflight=1,
+            error_callback=error_callback)
+        batcher.mutate(self._make_row(table, b'row_1'))
+        flusher = threading.Thread(target=batcher.flush)
+        flusher.daemon = True
+        flusher.start()
+        flusher.join(timeout=5)
+
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(stub.batches, [[b'row_1'], [b'row_1']])
+        self.assertEqual(failures, [b'row_1', b'row_1'])
+
+    def test_flush_raises_failures(self):
+        from google.cloud.bigtable.batcher import MutationsBatchError
+
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        stub.codes = {b'row_1': [self.NON_RETRYABLE]}
+        batcher = self._make_one(table)
+        row = self._make_row(table, b'row_1')
+
+        batcher.mutate(row)
+        with self.assertRaises(MutationsBatchError) as context:
+            batcher.flush()
+
+        (failed_row, status), = context.exception.failures
+        self.assertIs(failed_row, row)
+        self.assertEqual(status.code, self.NON_RETRYABLE)
+        # The failures are only raised once.
+        batcher.flush()
+
+    def test_flush_request_error(self):
+        table = self._make_table()
+        stub = table._instance._client._data_stub
+        stub.error = _FakeRpcError(StatusCode.PERMISSION_DENIED)
+        failures = []
+        batcher = self._make_one(
+            table, error_callback=lambda row, status: failures.append(
+                (row.row_key, status.code)))
+
+        batcher.mutate(self._make_row(table, b'row_1'))
+        batcher.flush()
+
+        self.assertEqual(
+            failures, [(b'row_1', StatusCode.PERMISSION_DENIED.value[0])])
+
+
+class Test__status_from_exception(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(exc):
+        from google.cloud.bigtable.batcher import _status_from_exception
+
+        return _status_from_exception(exc)
+
+    def test_rpc_error(self):
+        status = self._call_fut(_FakeRpcError(StatusCode.UNAVAILABLE))
+        self.assertEqual(status.code, StatusCode.UNAVAILABLE.value[0])
+
+    def test_other_error(self):
+        status = self._call_fut(RuntimeError('Unexpected'))
+        self.assertEqual(status.code, StatusCode.UNKNOWN.value[0])
+        self.assertEqual(status.message, 'Unexpected')
+
+
+def _make_no_delay_retry():
+    from google.cloud.bigtable.table import DEFAULT_RETRY
+
+    return DEFAULT_RETRY.with_delay(initial=0.0, maximum=0.0, multiplier=1.0)
+
+
+class _FakeRpcError(grpc.RpcError):
+
+    def __init__(self, code):
+        super(_FakeRpcError, self).__init__(code.name)
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class _FakeDataStub(object):
+
+    def __init__(self):
+        import threading
+
+        self.requests = []
+        # Status codes returned for each attempt to mutate a row, by row key.
+        self.codes = {}
+        self.error = None
+        self.on_request = None
+        self._lock = threading.Lock()
+
+    @property
+    def batches(self):
+        return [[entry.row_key for entry in request.entries]
+                for request in self.requests]
+
+    def MutateRows(self, request_pb):
+        from google.cloud.bigtable._generated.bigtable_pb2 import (
+            MutateRowsResponse)
+        from google.rpc.status_pb2 import Status
+
+        with self._lock:
+            self.requests.append(request_pb)
+            entries = []
+            for index, entry in enumerate(request_pb.entries):
+                codes = self.codes.get(entry.row_key)
+                code = codes.pop(0) if codes else 0
+                entries.append(MutateRowsResponse.Entry(
+                    index=index, status=Status(code=code)))
+        if self.on_request is not None:
+            self.on_request()
+        if self.error is not None:
+            raise self.error
+        return [MutateRowsResponse(entries=entries)]
+
+
+class _Client(object):
+
+    data_stub = None
+
+
+class _Instance(object):
+
+    def __init__(self, name, client=None):
+        self.name = name
+        self._client = client
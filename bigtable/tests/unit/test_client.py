@@ -475,6 +475,58 @@ class TestClient(unittest.TestCase):
     def test_copy_read_only(self):
         self._copy_test_helper(read_only=True)
 
+    @mock.patch(
+        'google.cloud.bigtable.client._make_data_stub',
+        side_effect=[mock.sentinel.data_stub1, mock.sentinel.data_stub2],
+    )
+    def test_constructor_with_channel_pool(self, _make_data_stub):
+        from google.cloud.bigtable.client import _GRPC_CHANNEL_POOL_OPTIONS
+        from google.cloud.bigtable.client import DataChannelPool
+        from google.cloud.bigtable.client import LEAST_LOADED
+
+        client = self._make_one(
+            project=self.PROJECT, credentials=_make_credentials(),
+            channel_pool_size=2, channel_selection=LEAST_LOADED)
+
+        self.assertIsInstance(client._data_stub, DataChannelPool)
+        self.assertEqual(client._data_stub._stubs, [
+            mock.sentinel.data_stub1, mock.sentinel.data_stub2])
+        self.assertEqual(client._data_stub.selection, LEAST_LOADED)
+        self.assertEqual(client.in_flight_requests, [0, 0])
+        self.assertEqual(
+            _make_data_stub.mock_calls,
+            [mock.call(client, _GRPC_CHANNEL_POOL_OPTIONS)] * 2)
+
+    def test_constructor_invalid_channel_pool(self):
+        credentials = _make_credentials()
+        with self.assertRaises(ValueError):
+            self._make_one_with_mocks(
+                project=self.PROJECT, credentials=credentials,
+                channel_pool_size=0)
+        with self.assertRaises(ValueError):
+            self._make_one_with_mocks(
+                project=self.PROJECT, credentials=credentials,
+                channel_selection='random')
+
+    def test_in_flight_requests_single_channel(self):
+        client = self._make_one_with_mocks(
+            project=self.PROJECT, credentials=_make_credentials())
+        self.assertIsNone(client.in_flight_requests)
+
+    @mock.patch('google.cloud.bigtable.client._make_data_stub')
+    def test_copy_with_channel_pool(self, _make_data_stub):
+        from google.cloud.bigtable.client import LEAST_LOADED
+
+        credentials = _make_credentials()
+        credentials.requires_scopes = False
+        client = self._make_one(
+            project=self.PROJECT, credentials=credentials,
+            channel_pool_size=3, channel_selection=LEAST_LOADED)
+        new_client = client.copy()
+        self.assertEqual(new_client.channel_pool_size, 3)
+        self.assertEqual(new_client.channel_selection, LEAST_LOADED)
+        self.assertEqual(len(new_client._data_stub), 3)
+
     def test_credentials_getter(self):
         credentials = _make_credentials()
         project = 'PROJECT'
@@ -648,6 +700,147 @@ class TestClient(unittest.TestCase):
         )])
 
 
+class TestDataChannelPool(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.client import DataChannelPool
+
+        return DataChannelPool
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_constructor_invalid(self):
+        with self.assertRaises(ValueError):
+            self._make_one([])
+        with self.assertRaises(ValueError):
+            self._make_one([_FakeDataStub()], selection='random')
+
+    def test_round_robin(self):
+        stubs = [_FakeDataStub(), _FakeDataStub()]
+        pool = self._make_one(stubs)
+
+        for request in range(5):
+            pool.MutateRow(request)
+
+        self.assertEqual(stubs[0].requests, [0, 2, 4])
+        self.assertEqual(stubs[1].requests, [1, 3])
+        self.assertEqual(pool.in_flight, [0, 0])
+
+    def test_unary_error(self):
+        stub = _FakeDataStub()
+        stub.error = RuntimeError('Unexpected')
+        pool = self._make_one([stub])
+
+        with self.assertRaises(RuntimeError):
+            pool.CheckAndMutateRow(object(), timeout=1.0)
+
+        self.assertEqual(pool.in_flight, [0])
+
+    def test_streaming_in_flight_until_exhausted(self):
+        stubs = [_FakeDataStub(), _FakeDataStub()]
+        pool = self._make_one(stubs)
+
+        responses = pool.ReadRows(b'request')
+        self.assertEqual(pool.in_flight, [1, 0])
+        self.assertEqual(list(responses), [b'request'])
+        self.assertEqual(pool.in_flight, [0, 0])
+
+    def test_streaming_error(self):
+        stub = _FakeDataStub()
+        pool = self._make_one([stub])
+
+        responses = pool.SampleRowKeys(b'request')
+        stub.error = RuntimeError('Unexpected')
+        with self.assertRaises(RuntimeError):
+            next(responses)
+        self.assertEqual(pool.in_flight, [0])
+
+    def test_streaming_cancel(self):
+        pool = self._make_one([_FakeDataStub()])
+
+        responses = pool.MutateRows(b'request')
+        self.assertEqual(pool.in_flight, [1])
+        self.assertTrue(responses.cancel())
+        self.assertEqual(pool.in_flight, [0])
+        # A cancelled request is only counted as done once.
+        with self.assertRaises(StopIteration):
+            next(responses)
+        self.assertEqual(pool.in_flight, [0])
+        self.assertTrue(responses.cancelled)
+
+    def test_streaming_released_when_collected(self):
+        pool = self._make_one([_FakeDataStub()])
+
+        responses = pool.ReadRows(b'request')
+        self.assertEqual(pool.in_flight, [1])
+        del responses
+        self.assertEqual(pool.in_flight, [0])
+
+    def test_least_loaded(self):
+        stubs = [_FakeDataStub(), _FakeDataStub(), _FakeDataStub()]
+        pool = self._make_one(stubs, selection='least_loaded')
+
+        first = pool.ReadRows(b'first')
+        second = pool.ReadRows(b'second')
+        self.assertEqual(pool.in_flight, [1, 1, 0])
+        list(first)
+        # The idle channels are picked before the busy one.
+        third = pool.ReadRows(b'third')
+        fourth = pool.ReadRows(b'fourth')
+        self.assertEqual(pool.in_flight, [1, 1, 1])
+        self.assertEqual(stubs[2].requests, [b'third'])
+        self.assertEqual(stubs[0].requests, [b'first', b'fourth'])
+        for responses in (second, third, fourth):
+            list(responses)
+        self.assertEqual(pool.in_flight, [0, 0, 0])
+
+
+class _FakeResponses(object):
+
+    def __init__(self, stub, request):
+        self._stub = stub
+        self._responses = iter([request])
+        self.cancelled = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._stub.error is not None:
+            raise self._stub.error
+        if self.cancelled:
+            raise StopIteration
+        return next(self._responses)
+
+    next = __next__
+
+    def cancel(self):
+        self.cancelled = True
+        return True
+
+
+class _FakeDataStub(object):
+
+    def __init__(self):
+        self.requests = []
+        self.error = None
+
+    def _unary(self, request, timeout=None):
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        return request
+
+    def _streaming(self, request):
+        self.requests.append(request)
+        return _FakeResponses(self, request)
+
+    MutateRow = CheckAndMutateRow = ReadModifyWriteRow = _unary
+    ReadRows = SampleRowKeys = MutateRows = _streaming
+
+
 class _Client(object):
 
     def __init__(self, credentials, user_agent, emulator_host=None):
@@ -12,6 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+try:
+    import pandas
+except ImportError:
+    HAVE_PANDAS = False
+else:
+    HAVE_PANDAS = True  # pragma: NO COVER
 
 import unittest
 
@@ -94,6 +100,38 @@ class TestCell(unittest.TestCase):
         cell2 = self._make_one(value2, timestamp)
         self.assertNotEqual(cell1, cell2)
 
+    def test_timestamp_from_micros(self):
+        import datetime
+        from google.cloud._helpers import _EPOCH
+
+        cell = self._make_one(b'value', None, timestamp_micros=1000)
+        self.assertIsNone(cell._timestamp)
+        self.assertEqual(cell.timestamp_micros, 1000)
+        expected = _EPOCH + datetime.timedelta(microseconds=1000)
+        self.assertEqual(cell.timestamp, expected)
+        # The conversion is cached.
+        self.assertIs(cell.timestamp, cell._timestamp)
+
+    def test_timestamp_micros_from_timestamp(self):
+        import datetime
+        from google.cloud._helpers import _EPOCH
+
+        timestamp = _EPOCH + datetime.timedelta(microseconds=2000)
+        cell = self._make_one(b'value', timestamp)
+        self.assertEqual(cell.timestamp_micros, 2000)
+
+    def test_timestamp_setter(self):
+        cell = self._make_one(b'value', None, timestamp_micros=1000)
+        timestamp = object()
+        cell.timestamp = timestamp
+        self.assertIs(cell.timestamp, timestamp)
+        self.assertIsNone(cell._timestamp_micros)
+
+    def test_slots(self):
+        cell = self._make_one(b'value', None)
+        with self.assertRaises(AttributeError):
+            cell.extra = None
+
 
 class TestPartialRowData(unittest.TestCase):
 
@@ -418,6 +456,320 @@ class TestPartialRowsData(unittest.TestCase):
         with self.assertRaises(InvalidChunk):
             prd.consume_next()
 
+    def test___iter__(self):
+        response1 = _ReadRowsResponseV2(
+            _generate_row_chunks(b'a', b'b') + _generate_cell_chunks([
+                'row_key: "c" family_name: < value: "f" > '
+                'qualifier: < value: "q" > value: "v1" value_size: 4']))
+        response2 = _ReadRowsResponseV2(_generate_cell_chunks([
+            'value: "v2" commit_row: true']))
+        iterator = _MockCancellableIterator(response1, response2)
+        prd = self._make_one(iterator)
+
+        rows = iter(prd)
+        self.assertEqual(next(rows).row_key, b'a')
+        self.assertEqual(prd._counter, 1)
+        self.assertEqual(next(rows).row_key, b'b')
+        row = next(rows)
+        self.assertEqual(prd._counter, 2)
+        self.assertEqual(row.row_key, b'c')
+        self.assertEqual(row.cells[u'f'][b'q'][0].value, b'v1v2')
+        self.assertEqual(list(rows), [])
+        # The rows are not accumulated.
+        self.assertEqual(prd.rows, {})
+
+    def test___iter__fast_decode(self):
+        response1 = _ReadRowsResponseV2(_generate_cell_chunks([
+            'row_key: "a" family_name: < value: "f" > '
+            'qualifier: < value: "q" > value: "v1" value_size: 4']))
+        response2 = _ReadRowsResponseV2(_generate_cell_chunks([
+            'value: "v2" value_size: 4',
+            'value: "v3" commit_row: true']))
+        iterator = _MockCancellableIterator(response1, response2)
+        prd = self._make_one(iterator, fast_decode=True)
+
+        rows = iter(prd)
+        row = next(rows)
+        self.assertEqual(row.row_key, b'a')
+        cell, = row.cells[u'f'][b'q']
+        self.assertEqual(cell.value, b'v1v2v3')
+        self.assertIsInstance(cell.value, bytes)
+        self.assertEqual(cell.timestamp_micros, 0)
+        self.assertEqual(list(rows), [])
+
+    def test___iter__last_row_missing_commit(self):
+        response = _ReadRowsResponseV2(_generate_cell_chunks([
+            'row_key: "a" family_name: < value: "f" > '
+            'qualifier: < value: "q" > value: "v"']))
+        iterator = _MockCancellableIterator(response)
+        prd = self._make_one(iterator)
+        with self.assertRaises(ValueError):
+            list(prd)
+
+    def test___iter__resumes_after_retryable_error(self):
+        from google.api_core import exceptions
+        from google.cloud.bigtable._generated import bigtable_pb2
+
+        request = bigtable_pb2.ReadRowsRequest(
+            table_name=u'table', rows_limit=10)
+        response1 = _ReadRowsResponseV2(
+            _generate_row_chunks(b'a') + _generate_cell_chunks([
+                'row_key: "b" family_name: < value: "f" > '
+                'qualifier: < value: "q" > value: "v" value_size: 2']))
+        failing = _MockCancellableIterator(
+            response1, exceptions.ServiceUnavailable('Try again.'))
+        resumed = _MockCancellableIterator(
+            _ReadRowsResponseV2(_generate_row_chunks(b'b', b'c')))
+        read_method = mock.Mock(return_value=resumed)
+        prd = self._make_one(
+            failing, read_method, request, retry=_make_no_delay_retry())
+
+        row_keys = [row.row_key for row in prd]
+
+        self.assertEqual(row_keys, [b'a', b'b', b'c'])
+        expected = bigtable_pb2.ReadRowsRequest(
+            table_name=u'table', rows_limit=9)
+        expected.rows.row_ranges.add(start_key_open=b'a')
+        read_method.assert_called_once_with(expected)
+
+    def test___iter__resume_reads_everything_already(self):
+        from google.api_core import exceptions
+        from google.cloud.bigtable._generated import bigtable_pb2
+
+        request = bigtable_pb2.ReadRowsRequest(rows_limit=1)
+        failing = _MockCancellableIterator(
+            _ReadRowsResponseV2(_generate_row_chunks(b'a')),
+            exceptions.DeadlineExceeded('Too slow.'))
+        read_method = mock.Mock()
+        prd = self._make_one(
+            failing, read_method, request, retry=_make_no_delay_retry())
+
+        self.assertEqual([row.row_key for row in prd], [b'a'])
+        read_method.assert_not_called()
+
+    def test_consume_next_non_retryable_error(self):
+        from google.api_core import exceptions
+        from google.cloud.bigtable._generated import bigtable_pb2
+
+        request = bigtable_pb2.ReadRowsRequest()
+        failing = _MockCancellableIterator(
+            exceptions.InvalidArgument('Bad request.'))
+        read_method = mock.Mock()
+        prd = self._make_one(
+            failing, read_method, request, retry=_make_no_delay_retry())
+
+        with self.assertRaises(exceptions.InvalidArgument):
+            prd.consume_next()
+        read_method.assert_not_called()
+
+    def test_consume_next_without_read_method(self):
+        from google.api_core import exceptions
+
+        failing = _MockCancellableIterator(
+            exceptions.ServiceUnavailable('Try again.'))
+        prd = self._make_one(failing)
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            prd.consume_next()
+
+    def _make_columnar_stream(self):
+        import struct
+
+        response1 = _ReadRowsResponseV2(_generate_cell_chunks([
+            # Two versions of f:count, newest first.
+            'row_key: "a" family_name: < value: "f" > '
+            'qualifier: < value: "count" > timestamp_micros: 2000 '
+            'value: "%s"' % (_escape(struct.pack('>q', 7)),),
+            'timestamp_micros: 1000 value: "%s"' % (
+                _escape(struct.pack('>q', 3)),),
+            'qualifier: < value: "name" > value: "caf" value_size: 4',
+            'value: "\\303\\251"',
+            # A column which is not requested.
+            'qualifier: < value: "other" > value: "x" commit_row: true',
+        ]))
+        response2 = _ReadRowsResponseV2(_generate_cell_chunks([
+            'row_key: "b" family_name: < value: "g" > '
+            'qualifier: < value: "score" > value: "%s"' % (
+                _escape(struct.pack('>d', 1.5)),),
+            'family_name: < value: "f" > qualifier: < value: "name" > '
+            'value: "bob" commit_row: true',
+            # A row which is reset, then sent again.
+            'row_key: "c" family_name: < value: "f" > '
+            'qualifier: < value: "name" > value: "old"',
+            'reset_row: true',
+            'row_key: "c" family_name: < value: "f" > '
+            'qualifier: < value: "name" > value: "new" commit_row: true',
+        ]))
+        return self._make_one(
+            _MockCancellableIterator(response1, response2))
+
+    def test_to_columns(self):
+        prd = self._make_columnar_stream()
+
+        row_keys, columns = prd.to_columns(
+            [('f:count', 'count'), ((u'f', b'name'), 'name'),
+             ('g:score', 'score')],
+            decoders={'count': 'int64', 'name': 'utf-8',
+                      'score': 'float64'})
+
+        self.assertEqual(row_keys, [b'a', b'b', b'c'])
+        self.assertEqual(columns, {
+            'count': [7, None, None],
+            'name': [u'caf\u00e9', u'bob', u'new'],
+            'score': [None, 1.5, None],
+        })
+        self.assertEqual(prd.rows, {})
+        self.assertIsNone(prd._projection)
+
+    def test_to_columns_raw_values_and_callable_decoder(self):
+        prd = self._make_columnar_stream()
+
+        row_keys, columns = prd.to_columns(
+            {'f:name': 'name', 'f:other': 'other'},
+            decoders={'other': lambda value: value.upper()})
+
+        self.assertEqual(row_keys, [b'a', b'b', b'c'])
+        self.assertEqual(columns, {
+            'name': [u'caf\u00e9'.encode('utf-8'), b'bob', b'new'],
+            'other': [b'X', None, None],
+        })
+
+    def test_to_columns_unknown_decoder(self):
+        prd = self._make_one(_MockCancellableIterator())
+        with self.assertRaises(ValueError):
+            prd.to_columns({'f:q': 'q'}, decoders={'q': 'int32'})
+
+    def test_to_columns_invalid_column(self):
+        prd = self._make_one(_MockCancellableIterator())
+        with self.assertRaises(ValueError):
+            prd.to_columns({'no-qualifier': 'q'})
+        with self.assertRaises(ValueError):
+            prd.to_columns([('f:q', 'q1'), ((u'f', b'q'), 'q2')])
+
+    def test_to_columns_last_row_missing_commit(self):
+        response = _ReadRowsResponseV2(_generate_cell_chunks([
+            'row_key: "a" family_name: < value: "f" > '
+            'qualifier: < value: "q" > value: "v"']))
+        prd = self._make_one(_MockCancellableIterator(response))
+        with self.assertRaises(ValueError):
+            prd.to_columns({'f:q': 'q'})
+        self.assertIsNone(prd._projection)
+
+    @unittest.skipUnless(HAVE_PANDAS, 'No pandas')
+    def test_to_dataframe(self):  # pragma: NO COVER
+        prd = self._make_columnar_stream()
+
+        dataframe = prd.to_dataframe(
+            [('f:name', 'name'), ('f:count', 'count')],
+            decoders={'count': 'int64', 'name': 'utf-8'})
+
+        self.assertEqual(list(dataframe.columns), ['name', 'count'])
+        self.assertEqual(dataframe.index.name, 'row_key')
+        self.assertEqual(list(dataframe.index), [b'a', b'b', b'c'])
+        self.assertEqual(
+            list(dataframe['name']), [u'caf\u00e9', u'bob', u'new'])
+        self.assertEqual(dataframe['count'][b'a'], 7)
+        self.assertTrue(pandas.isnull(dataframe['count'][b'b']))
+
+    @unittest.skipUnless(HAVE_PANDAS, 'No pandas')
+    def test_to_dataframe_columns_iterator(self):  # pragma: NO COVER
+        prd = self._make_columnar_stream()
+
+        dataframe = prd.to_dataframe(
+            iter([('f:name', 'name'), ('f:count', 'count')]),
+            decoders={'count': 'int64', 'name': 'utf-8'})
+
+        self.assertEqual(list(dataframe.columns), ['name', 'count'])
+        self.assertEqual(
+            list(dataframe['name']), [u'caf\u00e9', u'bob', u'new'])
+
+
+class Test__retry_read_rows_exception(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(exc):
+        from google.cloud.bigtable.row_data import _retry_read_rows_exception
+
+        return _retry_read_rows_exception(exc)
+
+    def test_retryable(self):
+        from google.api_core import exceptions
+
+        for exc in (exceptions.ServiceUnavailable('unavailable'),
+                    exceptions.DeadlineExceeded('deadline exceeded'),
+                    exceptions.Aborted('aborted')):
+            self.assertTrue(self._call_fut(exc))
+
+    def test_not_retryable(self):
+        import grpc
+        from google.api_core import exceptions
+
+        self.assertFalse(self._call_fut(exceptions.NotFound('not found')))
+        self.assertFalse(self._call_fut(grpc.RpcError()))
+        self.assertFalse(self._call_fut(ValueError()))
+
+
+class Test__create_resume_request(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(request, resume_key, rows_read):
+        from google.cloud.bigtable.row_data import _create_resume_request
+
+        return _create_resume_request(request, resume_key, rows_read)
+
+    @staticmethod
+    def _make_request(**kwargs):
+        from google.cloud.bigtable._generated import bigtable_pb2
+
+        return bigtable_pb2.ReadRowsRequest(table_name=u'table', **kwargs)
+
+    def test_no_row_read(self):
+        request = self._make_request(rows_limit=5)
+        request.rows.row_keys.append(b'a')
+        resumed = self._call_fut(request, None, 0)
+        self.assertEqual(resumed, request)
+        self.assertIsNot(resumed, request)
+
+    def test_full_table_scan(self):
+        request = self._make_request()
+        resumed = self._call_fut(request, b'b', 2)
+        expected = self._make_request()
+        expected.rows.row_ranges.add(start_key_open=b'b')
+        self.assertEqual(resumed, expected)
+
+    def test_rows_limit(self):
+        request = self._make_request(rows_limit=5)
+        resumed = self._call_fut(request, b'b', 2)
+        self.assertEqual(resumed.rows_limit, 3)
+        self.assertIsNone(self._call_fut(request, b'e', 5))
+
+    def test_row_keys(self):
+        request = self._make_request()
+        request.rows.row_keys.extend([b'a', b'b', b'c'])
+        resumed = self._call_fut(request, b'b', 2)
+        expected = self._make_request()
+        expected.rows.row_keys.append(b'c')
+        self.assertEqual(resumed, expected)
+        self.assertIsNone(self._call_fut(request, b'c', 3))
+
+    def test_row_ranges(self):
+        request = self._make_request()
+        request.rows.row_ranges.add(
+            start_key_closed=b'a', end_key_open=b'c')
+        request.rows.row_ranges.add(
+            start_key_open=b'c', end_key_closed=b'e')
+        request.rows.row_ranges.add(start_key_closed=b'x')
+        resumed = self._call_fut(request, b'd', 3)
+        expected = self._make_request()
+        expected.rows.row_ranges.add(
+            start_key_open=b'd', end_key_closed=b'e')
+        expected.rows.row_ranges.add(start_key_closed=b'x')
+        self.assertEqual(resumed, expected)
+
+    def test_row_range_ending_at_resume_key(self):
+        request = self._make_request()
+        request.rows.row_ranges.add(end_key_closed=b'd')
+        self.assertIsNone(self._call_fut(request, b'd', 3))
+
 
 class TestPartialRowsData_JSON_acceptance_tests(unittest.TestCase):
 
@@ -497,6 +849,40 @@ class TestPartialRowsData_JSON_acceptance_tests(unittest.TestCase):
     def test_invalid_commit_with_chunk(self):
         self._fail_during_consume('invalid - commit with chunk')
 
+    # Error cases derived from 'split cell': keys in a continuation chunk
+
+    def _fail_split_cell_continuation(self, key_text_pb):
+        from google.cloud.bigtable.row_data import InvalidChunk
+
+        chunks = _generate_cell_chunks([
+            'row_key: "RK" family_name: < value: "A" > '
+            'qualifier: < value: "C" > timestamp_micros: 100 '
+            'value: "v" value_size: 10 commit_row: false',
+            key_text_pb + ' value: "alue-VAL" commit_row: true',
+        ])
+        response = _ReadRowsResponseV2(chunks)
+        iterator = _MockCancellableIterator(response)
+        prd = self._make_one(iterator)
+        with self.assertRaises(InvalidChunk):
+            prd.consume_next()
+        self.assertEqual(prd.rows, {})
+
+    def test_invalid_split_cell_continuation_w_row_key(self):
+        self._fail_split_cell_continuation('row_key: "RK"')
+
+    def test_invalid_split_cell_continuation_w_family_name(self):
+        self._fail_split_cell_continuation(
+            'family_name: < value: "A" > qualifier: < value: "C" >')
+
+    def test_invalid_split_cell_continuation_w_qualifier(self):
+        self._fail_split_cell_continuation('qualifier: < value: "C" >')
+
+    def test_invalid_split_cell_continuation_w_timestamp(self):
+        self._fail_split_cell_continuation('timestamp_micros: 100')
+
+    def test_invalid_split_cell_continuation_w_labels(self):
+        self._fail_split_cell_continuation('labels: "L"')
+
     # JSON Error cases:  incomplete final row
 
     def _sort_flattend_cells(self, flattened):
@@ -638,6 +1024,18 @@ class TestPartialRowsData_JSON_acceptance_tests(unittest.TestCase):
     def test_empty_second_qualifier(self):
         self._match_results('empty second qualifier')
 
+
+class TestPartialRowsData_JSON_acceptance_tests_fast_decode(
+        TestPartialRowsData_JSON_acceptance_tests):
+
+    # Not shared with the base class, which copies fields into the chunks.
+    _json_tests = None
+
+    def _make_one(self, *args, **kwargs):
+        kwargs['fast_decode'] = True
+        return self._get_target_class()(*args, **kwargs)
+
+
 def _flatten_cells(prd):
     # Match results format from JSON testcases.
     # Doesn't handle error cases.
@@ -670,7 +1068,10 @@ class _MockCancellableIterator(object):
         self.cancel_calls += 1
 
     def next(self):
-        return next(self.iter_values)
+        value = next(self.iter_values)
+        if isinstance(value, Exception):
+            raise value
+        return value
 
     def __next__(self):  # pragma: NO COVER Py3k
         return self.next()
@@ -708,6 +1109,28 @@ def _generate_cell_chunks(chunk_text_pbs):
     return chunks
 
 
+def _generate_row_chunks(*row_keys):
+    return _generate_cell_chunks([
+        'row_key: "%s" family_name: < value: "f" > '
+        'qualifier: < value: "q" > value: "v" commit_row: true' % (
+            row_key.decode('ascii'),)
+        for row_key in row_keys])
+
+
+def _escape(value):
+    # Escape bytes for a text format string field.
+    from google.protobuf.text_encoding import CEscape
+
+    return CEscape(value, as_utf8=False)
+
+
+def _make_no_delay_retry():
+    from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
+
+    return DEFAULT_RETRY_READ_ROWS.with_delay(
+        initial=0.0, maximum=0.0, multiplier=1.0)
+
+
 def _parse_readrows_acceptance_tests(filename):
     """Parse acceptance tests from JSON
 
@@ -0,0 +1,151 @@
+# Copyright 2017 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+
+class TestRowSet(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_set import RowSet
+
+        return RowSet
+
+    def _make_one(self):
+        return self._get_target_class()()
+
+    def test_constructor(self):
+        row_set = self._make_one()
+        self.assertEqual(row_set.row_keys, [])
+        self.assertEqual(row_set.row_ranges, [])
+
+    def test___eq__(self):
+        row_set1 = self._make_one()
+        row_set2 = self._make_one()
+        row_set1.add_row_key(b'row_key')
+        row_set2.add_row_key(b'row_key')
+        self.assertEqual(row_set1, row_set2)
+
+    def test___eq__type_differ(self):
+        row_set = self._make_one()
+        self.assertNotEqual(row_set, object())
+
+    def test___ne__(self):
+        row_set1 = self._make_one()
+        row_set2 = self._make_one()
+        row_set1.add_row_key(b'row_key')
+        self.assertNotEqual(row_set1, row_set2)
+
+    def test_add_row_key(self):
+        row_set = self._make_one()
+        row_set.add_row_key(u'row_key1')
+        row_set.add_row_key(b'row_key2')
+        self.assertEqual(row_set.row_keys, [b'row_key1', b'row_key2'])
+
+    def test_add_row_range(self):
+        from google.cloud.bigtable.row_set import RowRange
+
+        row_set = self._make_one()
+        row_range = RowRange(b'start_key', b'end_key')
+        row_set.add_row_range(row_range)
+        self.assertEqual(row_set.row_ranges, [row_range])
+
+    def test_add_row_range_from_keys(self):
+        from google.cloud.bigtable.row_set import RowRange
+
+        row_set = self._make_one()
+        row_set.add_row_range_from_keys(
+            b'start_key', b'end_key', start_inclusive=False,
+            end_inclusive=True)
+        self.assertEqual(row_set.row_ranges, [
+            RowRange(b'start_key', b'end_key', False, True)])
+
+    def test__update_message_request(self):
+        from google.cloud.bigtable._generated import bigtable_pb2
+
+        row_set = self._make_one()
+        row_set.add_row_key(b'row_key')
+        row_set.add_row_range_from_keys(b'start_key', b'end_key')
+        row_set.add_row_range_from_keys(start_key=b'other_key')
+        message = bigtable_pb2.ReadRowsRequest()
+        row_set._update_message_request(message)
+
+        expected = bigtable_pb2.ReadRowsRequest()
+        expected.rows.row_keys.append(b'row_key')
+        expected.rows.row_ranges.add(
+            start_key_closed=b'start_key', end_key_open=b'end_key')
+        expected.rows.row_ranges.add(start_key_closed=b'other_key')
+        self.assertEqual(message, expected)
+
+
+class TestRowRange(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_set import RowRange
+
+        return RowRange
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_constructor(self):
+        row_range = self._make_one(u'start_key', b'end_key')
+        self.assertEqual(row_range.start_key, b'start_key')
+        self.assertEqual(row_range.end_key, b'end_key')
+        self.assertTrue(row_range.start_inclusive)
+        self.assertFalse(row_range.end_inclusive)
+
+    def test_constructor_unbounded(self):
+        row_range = self._make_one()
+        self.assertIsNone(row_range.start_key)
+        self.assertIsNone(row_range.end_key)
+
+    def test___eq__and___hash__(self):
+        row_range1 = self._make_one(b'start_key', b'end_key')
+        row_range2 = self._make_one(b'start_key', b'end_key')
+        self.assertEqual(row_range1, row_range2)
+        self.assertEqual(hash(row_range1), hash(row_range2))
+
+    def test___eq__type_differ(self):
+        row_range = self._make_one(b'start_key', b'end_key')
+        self.assertNotEqual(row_range, object())
+
+    def test___ne__(self):
+        row_range1 = self._make_one(b'start_key', b'end_key')
+        row_range2 = self._make_one(b'start_key', b'end_key',
+                                    end_inclusive=True)
+        self.assertNotEqual(row_range1, row_range2)
+
+    def test_get_range_kwargs_closed_open(self):
+        row_range = self._make_one(b'start_key', b'end_key')
+        self.assertEqual(row_range.get_range_kwargs(), {
+            'start_key_closed': b'start_key',
+            'end_key_open': b'end_key',
+        })
+
+    def test_get_range_kwargs_open_closed(self):
+        row_range = self._make_one(
+            b'start_key', b'end_key', start_inclusive=False,
+            end_inclusive=True)
+        self.assertEqual(row_range.get_range_kwargs(), {
+            'start_key_open': b'start_key',
+            'end_key_closed': b'end_key',
+        })
+
+    def test_get_range_kwargs_unbounded(self):
+        row_range = self._make_one()
+        self.assertEqual(row_range.get_range_kwargs(), {})
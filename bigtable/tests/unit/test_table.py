@@ -507,6 +507,7 @@ class TestTable(unittest.TestCase):
                 limit=limit)
 
         self.assertEqual(result, expected_result)
+        self.assertIs(result.request, request_pb)
         self.assertEqual(stub.method_calls, [(
             'ReadRows',
             (request_pb,),
@@ -518,6 +519,7 @@ class TestTable(unittest.TestCase):
             'filter_': filter_obj,
             'limit': limit,
             'end_inclusive': False,
+            'row_set': None,
         }
         self.assertEqual(mock_created, [(table.name, created_kwargs)])
 
@@ -549,6 +551,115 @@ class TestTable(unittest.TestCase):
             {},
         )])
 
+    def test_read_rows_empty_row_set(self):
+        from tests.unit._testing import _FakeStub
+        from google.cloud.bigtable.row_set import RowSet
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        client._data_stub = stub = _FakeStub()
+
+        with self.assertRaises(ValueError):
+            table.read_rows(row_set=RowSet())
+        self.assertEqual(stub.method_calls, [])
+
+    def test_read_rows_parallel_ordered(self):
+        table, stub = self._make_table_with_rows(
+            [b'a', b'b', b'c', b'd', b'e', b'f', b'g'], [b'c', b'f', b''])
+
+        rows = table.read_rows_parallel(max_workers=2)
+        row_keys = [row.row_key for row in rows]
+
+        self.assertEqual(
+            row_keys, [b'a', b'b', b'c', b'd', b'e', b'f', b'g'])
+        self.assertEqual(stub.read_ranges, [
+            (b'', b'c'),
+            (b'c', b'f'),
+            (b'f', b''),
+        ])
+
+    def test_read_rows_parallel_unordered(self):
+        table, _ = self._make_table_with_rows(
+            [b'a', b'b', b'c', b'd', b'e'], [b'b', b'd', b''])
+
+        rows = table.read_rows_parallel(ordered=False, fast_decode=True)
+        row_keys = [row.row_key for row in rows]
+
+        self.assertEqual(sorted(row_keys), [b'a', b'b', b'c', b'd', b'e'])
+
+    def test_read_rows_parallel_range(self):
+        table, stub = self._make_table_with_rows(
+            [b'a', b'b', b'c', b'd', b'e', b'f', b'g', b'h'],
+            [b'a', b'c', b'f', b'h', b''])
+
+        rows = table.read_rows_parallel(
+            start_key=b'b', end_key=b'g', end_inclusive=True)
+        row_keys = [row.row_key for row in rows]
+
+        self.assertEqual(row_keys, [b'b', b'c', b'd', b'e', b'f', b'g'])
+        self.assertEqual(stub.read_ranges, [
+            (b'b', b'c'),
+            (b'c', b'f'),
+            (b'f', b'g'),
+        ])
+        self.assertEqual(
+            stub.read_requests[-1].rows.row_ranges[0].end_key_closed, b'g')
+
+    def test_read_rows_parallel_error(self):
+        from google.api_core import exceptions
+
+        table, stub = self._make_table_with_rows(
+            [b'a', b'b', b'c'], [b'b', b''])
+        stub.errors[b'b'] = exceptions.NotFound('Table not found.')
+
+        rows = table.read_rows_parallel()
+        with self.assertRaises(exceptions.NotFound):
+            list(rows)
+
+    def test_read_rows_parallel_stopped_early(self):
+        table, _ = self._make_table_with_rows(
+            [b'a', b'b', b'c', b'd'], [b'c', b''])
+
+        rows = table.read_rows_parallel()
+        self.assertEqual(next(rows).row_key, b'a')
+        rows.close()
+
+    def test_read_rows_parallel_bad_max_workers(self):
+        table, _ = self._make_table_with_rows([], [])
+        with self.assertRaises(ValueError):
+            table.read_rows_parallel(max_workers=0)
+
+    def test_read_rows_multi(self):
+        table, stub = self._make_table_with_rows(
+            [b'a', b'b', b'c', b'd', b'e'], [])
+
+        rows = table.read_rows_multi(
+            [b'e', u'a', b'c', b'a', b'x', b'b'], batch_size=2)
+
+        self.assertEqual(sorted(rows), [b'a', b'b', b'c', b'e'])
+        self.assertEqual(rows[b'c'].row_key, b'c')
+        requested = sorted(
+            list(request.rows.row_keys) for request in stub.read_requests)
+        self.assertEqual(requested, [[b'a', b'b'], [b'c', b'e'], [b'x']])
+
+    def test_read_rows_multi_empty(self):
+        table, stub = self._make_table_with_rows([b'a'], [])
+        self.assertEqual(table.read_rows_multi([]), {})
+        self.assertEqual(stub.read_requests, [])
+
+    def test_read_rows_multi_bad_batch_size(self):
+        table, _ = self._make_table_with_rows([], [])
+        with self.assertRaises(ValueError):
+            table.read_rows_multi([b'a'], batch_size=0)
+
+    def _make_table_with_rows(self, row_keys, sample_keys):
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        client._data_stub = stub = _FakeDataStub(row_keys, sample_keys)
+        return table, stub
+
 
 class Test__RetryableMutateRowsWorker(unittest.TestCase):
     from grpc import StatusCode
@@ -1000,12 +1111,14 @@ class Test__RetryableMutateRowsWorker(unittest.TestCase):
 class Test__create_row_request(unittest.TestCase):
 
     def _call_fut(self, table_name, row_key=None, start_key=None, end_key=None,
-                  filter_=None, limit=None, end_inclusive=False):
+                  filter_=None, limit=None, end_inclusive=False,
+                  row_set=None):
         from google.cloud.bigtable.table import _create_row_request
 
         return _create_row_request(
             table_name, row_key=row_key, start_key=start_key, end_key=end_key,
-            filter_=filter_, limit=limit, end_inclusive=end_inclusive)
+            filter_=filter_, limit=limit, end_inclusive=end_inclusive,
+            row_set=row_set)
 
     def test_table_name_only(self):
         table_name = 'table_name'
@@ -1018,6 +1131,35 @@ class Test__create_row_request(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._call_fut(None, row_key=object(), end_key=object())
 
+    def test_row_set_conflict(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        with self.assertRaises(ValueError):
+            self._call_fut(None, row_key=b'row_key', row_set=RowSet())
+        with self.assertRaises(ValueError):
+            self._call_fut(None, start_key=b'start_key', row_set=RowSet())
+
+    def test_row_set_empty(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        with self.assertRaises(ValueError):
+            self._call_fut('table_name', row_set=RowSet())
+
+    def test_row_set(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        table_name = 'table_name'
+        row_set = RowSet()
+        row_set.add_row_key(b'row_key1')
+        row_set.add_row_key(b'row_key2')
+        row_set.add_row_range_from_keys(b'start_key', b'end_key')
+        result = self._call_fut(table_name, row_set=row_set)
+        expected_result = _ReadRowsRequestPB(table_name=table_name)
+        expected_result.rows.row_keys.extend([b'row_key1', b'row_key2'])
+        expected_result.rows.row_ranges.add(
+            start_key_closed=b'start_key', end_key_open=b'end_key')
+        self.assertEqual(result, expected_result)
+
     def test_row_key(self):
         table_name = 'table_name'
         row_key = b'row_key'
@@ -1171,6 +1313,95 @@ def _ColumnFamilyPB(*args, **kw):
     return table_v2_pb2.ColumnFamily(*args, **kw)
 
 
+class _FakeResponseIterator(object):
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._responses)
+
+    next = __next__
+
+    def cancel(self):
+        pass
+
+
+class _FakeDataStub(object):
+    """Serves ``ReadRows`` for a table with one cell per row."""
+
+    def __init__(self, row_keys, sample_keys):
+        import threading
+
+        self.row_keys = row_keys
+        self.sample_keys = sample_keys
+        self.read_requests = []
+        # Errors to raise for ``ReadRows`` requests, by first row key.
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    @property
+    def read_ranges(self):
+        ranges = [
+            (row_range.start_key_closed or row_range.start_key_open,
+             row_range.end_key_open or row_range.end_key_closed)
+            for request in self.read_requests
+            for row_range in request.rows.row_ranges
+        ]
+        return sorted(ranges)
+
+    def SampleRowKeys(self, request_pb):
+        from google.cloud.bigtable._generated import (
+            bigtable_pb2 as messages_v2_pb2)
+
+        return _FakeResponseIterator([
+            messages_v2_pb2.SampleRowKeysResponse(row_key=row_key)
+            for row_key in self.sample_keys
+        ])
+
+    def ReadRows(self, request_pb):
+        with self._lock:
+            self.read_requests.append(request_pb)
+        row_keys = [row_key for row_key in self.row_keys
+                    if self._in_request(row_key, request_pb)]
+        if row_keys and row_keys[0] in self.errors:
+            raise self.errors[row_keys[0]]
+        return _FakeResponseIterator([
+            _ReadRowsResponsePB(chunks=[_ReadRowsResponseCellChunkPB(
+                row_key=row_key, family_name=u'family', qualifier=b'qual',
+                value=b'value', commit_row=True)])
+            for row_key in row_keys
+        ])
+
+    @staticmethod
+    def _in_request(row_key, request_pb):
+        rows = request_pb.rows
+        if not rows.row_keys and not rows.row_ranges:
+            return True
+        if row_key in rows.row_keys:
+            return True
+        for row_range in rows.row_ranges:
+            start_key = row_range.WhichOneof('start_key')
+            end_key = row_range.WhichOneof('end_key')
+            if start_key == 'start_key_closed' and (
+                    row_key < row_range.start_key_closed):
+                continue
+            if start_key == 'start_key_open' and (
+                    row_key <= row_range.start_key_open):
+                continue
+            if end_key == 'end_key_open' and (
+                    row_key >= row_range.end_key_open):
+                continue
+            if end_key == 'end_key_closed' and (
+                    row_key > row_range.end_key_closed):
+                continue
+            return True
+        return False
+
+
 class _Client(object):
 
     data_stub = None
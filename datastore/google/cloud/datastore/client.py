@@ -15,6 +15,8 @@
 
 import os
 
+from concurrent import futures
+
 from google.cloud._helpers import _LocalStack
 from google.cloud._helpers import (_determine_default_project as
                                    _base_default_project)
@@ -40,6 +42,10 @@ except ImportError:  # pragma: NO COVER
 
 _MAX_LOOPS = 128
 """Maximum number of iterations to wait for deferred keys."""
+_MAX_KEYS_PER_LOOKUP = 1000
+"""Maximum number of keys sent in a single lookup request."""
+_MAX_LOOKUP_WORKERS = 16
+"""Maximum number of lookup requests made concurrently."""
 _DATASTORE_BASE_URL = 'https://datastore.googleapis.com'
 """Datastore API request URL base."""
 
@@ -77,6 +83,72 @@ def _determine_default_project(project=None):
     return project
 
 
+def _key_pb_identity(key_pb):
+    """Identify a key protobuf, for matching results to requested keys.
+
+    :type key_pb: :class:`.entity_pb2.Key`
+    :param key_pb: The key to identify.
+
+    :rtype: tuple
+    :returns: The key's project, namespace and path.
+    """
+    return (
+        key_pb.partition_id.project_id,
+        key_pb.partition_id.namespace_id,
+        tuple((element.kind, element.id, element.name)
+              for element in key_pb.path),
+    )
+
+
+def _chunk_key_pbs(key_pbs):
+    """Split keys into chunks which fit in a single lookup request.
+
+    :type key_pbs: list of :class:`.entity_pb2.Key`
+    :param key_pbs: The keys to split.
+
+    :rtype: list of list of :class:`.entity_pb2.Key`
+    :returns: Chunks of at most ``_MAX_KEYS_PER_LOOKUP`` keys.
+    """
+    return [key_pbs[start:start + _MAX_KEYS_PER_LOOKUP]
+            for start in range(0, len(key_pbs), _MAX_KEYS_PER_LOOKUP)]
+
+
+def _lookup_chunks(datastore_api, project, chunks, read_options):
+    """Look up chunks of keys, concurrently if there are several.
+
+    :type datastore_api:
+        :class:`google.cloud.datastore._http.HTTPDatastoreAPI`
+        or :class:`google.cloud.datastore._gax.GAPICDatastoreAPI`
+    :param datastore_api: The datastore API object used to connect
+                          to datastore.
+
+    :type project: str
+    :param project: The project to make the requests for.
+
+    :type chunks: list of list of :class:`.entity_pb2.Key`
+    :param chunks: The keys of each request.
+
+    :type read_options: :class:`.datastore_pb2.ReadOptions`
+    :param read_options: The read options of each request.
+
+    :rtype: list of :class:`.datastore_pb2.LookupResponse`
+    :returns: The response to each request, in the order of ``chunks``.
+    """
+    def lookup(key_pbs):
+        return datastore_api.lookup(
+            project,
+            key_pbs,
+            read_options=read_options,
+        )
+
+    if len(chunks) == 1:
+        return [lookup(chunks[0])]
+
+    workers = min(len(chunks), _MAX_LOOKUP_WORKERS)
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lookup, chunks))
+
+
 def _extended_lookup(datastore_api, project, key_pbs,
                      missing=None, deferred=None,
                      eventual=False, transaction_id=None):
@@ -84,6 +156,10 @@ def _extended_lookup(datastore_api, project, key_pbs,
 
     Helper function for :meth:`Client.get_multi`.
 
+    The keys are split into chunks of at most ``_MAX_KEYS_PER_LOOKUP`` keys,
+    looked up concurrently.  The keys deferred by the backend are then looked
+    up again, also concurrently, in chunks of their own.
+
     :type datastore_api:
         :class:`google.cloud.datastore._http.HTTPDatastoreAPI`
         or :class:`google.cloud.datastore._gax.GAPICDatastoreAPI`
@@ -99,7 +175,7 @@ def _extended_lookup(datastore_api, project, key_pbs,
     :type missing: list
     :param missing: (Optional) If a list is passed, the key-only entity
                     protobufs returned by the backend as "missing" will be
-                    copied into it.
+                    copied into it, in the order of ``key_pbs``.
 
     :type deferred: list
     :param deferred: (Optional) If a list is passed, the key protobufs returned
@@ -116,7 +192,7 @@ def _extended_lookup(datastore_api, project, key_pbs,
                            ``eventual==True``.
 
     :rtype: list of :class:`.entity_pb2.Entity`
-    :returns: The requested entities.
+    :returns: The requested entities, in the order of ``key_pbs``.
     :raises: :class:`ValueError` if missing / deferred are not null or
              empty list.
     """
@@ -127,35 +203,44 @@ def _extended_lookup(datastore_api, project, key_pbs,
         raise ValueError('deferred must be None or an empty list')
 
     results = []
+    missed = []
 
     loop_num = 0
     read_options = helpers.get_read_options(eventual, transaction_id)
-    while loop_num < _MAX_LOOPS:  # loop against possible deferred.
+    chunks = _chunk_key_pbs(key_pbs)
+    while chunks and loop_num < _MAX_LOOPS:  # loop against possible deferred.
         loop_num += 1
-        lookup_response = datastore_api.lookup(
-            project,
-            key_pbs,
-            read_options=read_options,
-        )
+        lookup_responses = _lookup_chunks(
+            datastore_api, project, chunks, read_options)
+
+        pending = []
+        for lookup_response in lookup_responses:
+            # Accumulate the new results.
+            results.extend(
+                result.entity for result in lookup_response.found)
+            missed.extend(
+                result.entity for result in lookup_response.missing)
+            if deferred is not None:
+                deferred.extend(lookup_response.deferred)
+            else:
+                pending.extend(lookup_response.deferred)
 
-        # Accumulate the new results.
-        results.extend(result.entity for result in lookup_response.found)
+        # If we have deferred keys, and the user didn't ask to know about
+        # them, retry (but only with the deferred ones).
+        chunks = _chunk_key_pbs(pending)
 
-        if missing is not None:
-            missing.extend(result.entity for result in lookup_response.missing)
+    # Return the entities in the order in which their keys were requested.
+    positions = {}
+    for position, key_pb in enumerate(key_pbs):
+        positions.setdefault(_key_pb_identity(key_pb), position)
 
-        if deferred is not None:
-            deferred.extend(lookup_response.deferred)
-            break
+    def position_of(entity_pb):
+        return positions.get(_key_pb_identity(entity_pb.key), len(key_pbs))
 
-        if len(lookup_response.deferred) == 0:
-            break
+    if missing is not None:
+        missing.extend(sorted(missed, key=position_of))
 
-        # We have deferred keys, and the user didn't ask to know about
-        # them, so retry (but only with the deferred ones).
-        key_pbs = lookup_response.deferred
-
-    return results
+    return sorted(results, key=position_of)
 
 
 class Client(ClientWithProject):
@@ -349,8 +434,13 @@ class Client(ClientWithProject):
                          Setting True will use eventual consistency, but cannot
                          be used inside a transaction or will raise ValueError.
 
+        The keys are looked up in concurrent requests of at most 1000 keys
+        each, and so are the keys deferred by the backend, unless
+        ``deferred`` is passed.
+
         :rtype: list of :class:`google.cloud.datastore.entity.Entity`
-        :returns: The requested entities.
+        :returns: The requested entities, in the order of ``keys`` (missing
+                  entities are left out).
         :raises: :class:`ValueError` if one or more of ``keys`` has a project
                  which does not match our project.
         :raises: :class:`ValueError` if eventual is True and in a transaction.
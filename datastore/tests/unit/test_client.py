@@ -661,6 +661,105 @@ class TestClient(unittest.TestCase):
         self.assertEqual(deferred, [])
         ds_api.lookup.assert_not_called()
 
+    def _make_chunked_lookup_api(self, missing_ids=(), deferred_ids=()):
+        """Fake lookup answering each chunk of keys, in reverse order.
+
+        The keys in ``deferred_ids`` are deferred on their first lookup.
+        """
+        import threading
+
+        lock = threading.Lock()
+        seen = set()
+
+        def lookup(project, key_pbs, read_options=None):
+            found, missing, deferred = [], [], []
+            for key_pb in reversed(key_pbs):
+                id_ = key_pb.path[0].id
+                with lock:
+                    first_lookup = id_ not in seen
+                    seen.add(id_)
+                if id_ in deferred_ids and first_lookup:
+                    deferred.append(key_pb)
+                elif id_ in missing_ids:
+                    missing.append(
+                        _make_entity_pb(self.PROJECT, 'Kind', id_))
+                else:
+                    found.append(_make_entity_pb(self.PROJECT, 'Kind', id_))
+            return _make_lookup_response(
+                results=found, missing=missing, deferred=deferred)
+
+        ds_api = _make_datastore_api()
+        ds_api.lookup = mock.Mock(side_effect=lookup, spec=[])
+        return ds_api
+
+    def test_get_multi_chunked_in_key_order(self):
+        from google.cloud.datastore.key import Key
+
+        creds = _make_credentials()
+        client = self._make_one(credentials=creds)
+        ds_api = self._make_chunked_lookup_api(missing_ids=(3,))
+        client._datastore_api_internal = ds_api
+        keys = [Key('Kind', id_, project=self.PROJECT)
+                for id_ in (5, 1, 4, 3, 2)]
+
+        missing = []
+        patch = mock.patch(
+            'google.cloud.datastore.client._MAX_KEYS_PER_LOOKUP', new=2)
+        with patch:
+            found = client.get_multi(keys, missing=missing)
+
+        self.assertEqual([entity.key.id for entity in found], [5, 1, 4, 2])
+        self.assertEqual([entity.key.id for entity in missing], [3])
+        self.assertEqual(ds_api.lookup.call_count, 3)
+        requested = sorted(
+            [key_pb.path[0].id for key_pb in call[0][1]]
+            for call in ds_api.lookup.call_args_list)
+        self.assertEqual(requested, [[2], [4, 3], [5, 1]])
+
+    def test_get_multi_chunked_w_deferred_from_backend(self):
+        from google.cloud.datastore.key import Key
+
+        creds = _make_credentials()
+        client = self._make_one(credentials=creds)
+        ds_api = self._make_chunked_lookup_api(deferred_ids=(1, 2, 3))
+        client._datastore_api_internal = ds_api
+        keys = [Key('Kind', id_, project=self.PROJECT)
+                for id_ in (1, 2, 3, 4)]
+
+        patch = mock.patch(
+            'google.cloud.datastore.client._MAX_KEYS_PER_LOOKUP', new=2)
+        with patch:
+            found = client.get_multi(keys)
+
+        self.assertEqual([entity.key.id for entity in found], [1, 2, 3, 4])
+        # Two chunks, then the three deferred keys in two chunks.
+        self.assertEqual(ds_api.lookup.call_count, 4)
+        retried = sorted(
+            key_pb.path[0].id
+            for call in ds_api.lookup.call_args_list[2:]
+            for key_pb in call[0][1])
+        self.assertEqual(retried, [1, 2, 3])
+
+    def test_get_multi_chunked_w_deferred_passed(self):
+        from google.cloud.datastore.key import Key
+
+        creds = _make_credentials()
+        client = self._make_one(credentials=creds)
+        ds_api = self._make_chunked_lookup_api(deferred_ids=(1, 4))
+        client._datastore_api_internal = ds_api
+        keys = [Key('Kind', id_, project=self.PROJECT)
+                for id_ in (1, 2, 3, 4)]
+
+        deferred = []
+        patch = mock.patch(
+            'google.cloud.datastore.client._MAX_KEYS_PER_LOOKUP', new=2)
+        with patch:
+            found = client.get_multi(keys, deferred=deferred)
+
+        self.assertEqual([entity.key.id for entity in found], [2, 3])
+        self.assertEqual(sorted(key.id for key in deferred), [1, 4])
+        self.assertEqual(ds_api.lookup.call_count, 2)
+
     def test_put(self):
         _called_with = []
 
@@ -0,0 +1,320 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End-to-end throughput benchmark for the Pub/Sub publisher and subscriber.
+
+Publishes messages at a configurable rate while subscribing to them, and
+reports the throughput, the publish and end-to-end latency percentiles, the
+number of threads and the CPU time per message.
+
+The benchmark runs against the Pub/Sub emulator (when
+``PUBSUB_EMULATOR_HOST`` is set), or against an in-process fake server
+(with ``--fake``), which measures the client library alone.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import itertools
+import os
+import resource
+import threading
+import time
+
+from concurrent import futures
+import grpc
+from six.moves import queue
+
+from google.api_core import exceptions
+from google.cloud import pubsub
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.proto import pubsub_pb2
+from google.cloud.pubsub_v1.proto import pubsub_pb2_grpc
+
+
+# The attribute carrying the time a message was published, for measuring
+# the end-to-end latency.
+_SENT_ATTRIBUTE = 'benchmark_sent'
+
+
+class FakePubSub(pubsub_pb2_grpc.PublisherServicer,
+                 pubsub_pb2_grpc.SubscriberServicer):
+    """An in-process Pub/Sub server, with a single topic and subscription.
+
+    Published messages are delivered to the streaming pulls (in turn, if
+    there are several) and are never redelivered; acknowledgements and
+    deadline modifications are counted, but otherwise ignored.
+    """
+    def __init__(self, max_messages_per_response=1000):
+        self._max_messages_per_response = max_messages_per_response
+        self._messages = queue.Queue()
+        self._message_ids = itertools.count()
+        self._lock = threading.Lock()
+        self.acks = 0
+        self.modacks = 0
+
+    def Publish(self, request, context):
+        message_ids = []
+        for message in request.messages:
+            message_id = str(next(self._message_ids))
+            delivered = pubsub_pb2.PubsubMessage()
+            delivered.CopyFrom(message)
+            delivered.message_id = message_id
+            self._messages.put(delivered)
+            message_ids.append(message_id)
+        return pubsub_pb2.PublishResponse(message_ids=message_ids)
+
+    def StreamingPull(self, request_iterator, context):
+        stopped = threading.Event()
+        thread = threading.Thread(
+            name='Thread-FakeStreamingPullRequests',
+            target=self._consume_requests,
+            args=(request_iterator, stopped),
+        )
+        thread.daemon = True
+        thread.start()
+
+        while not stopped.is_set() and context.is_active():
+            try:
+                message = self._messages.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            received = [message]
+            while len(received) < self._max_messages_per_response:
+                try:
+                    received.append(self._messages.get_nowait())
+                except queue.Empty:
+                    break
+            yield pubsub_pb2.StreamingPullResponse(received_messages=[
+                pubsub_pb2.ReceivedMessage(
+                    ack_id=message.message_id, message=message)
+                for message in received
+            ])
+
+    def _consume_requests(self, request_iterator, stopped):
+        try:
+            for request in request_iterator:
+                with self._lock:
+                    self.acks += len(request.ack_ids)
+                    self.modacks += len(request.modify_deadline_ack_ids)
+        except grpc.RpcError:
+            pass
+        finally:
+            stopped.set()
+
+
+def start_fake_server():
+    """Start a fake server, and point the clients at it.
+
+    Returns:
+        Tuple[grpc.Server, FakePubSub]: The server and its servicer.
+    """
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+    servicer = FakePubSub()
+    pubsub_pb2_grpc.add_PublisherServicer_to_server(servicer, server)
+    pubsub_pb2_grpc.add_SubscriberServicer_to_server(servicer, server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+    os.environ['PUBSUB_EMULATOR_HOST'] = 'localhost:{}'.format(port)
+    return server, servicer
+
+
+def percentile(values, percent):
+    """Return the given percentile of some values.
+
+    Args:
+        values (List[float]): The values, sorted in ascending order.
+        percent (Union[int, float]): The percentile, from 0 to 100.
+
+    Returns:
+        float: The value at the percentile, or 0 if there are no values.
+    """
+    if not values:
+        return 0.0
+    index = int(round((len(values) - 1) * percent / 100))
+    return values[index]
+
+
+def cpu_time():
+    """Return the CPU time (user and system) used by the process so far."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class Stats(object):
+    """Thread-safe collection of the benchmark measurements."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.publish_latencies = []
+        self.end_to_end_latencies = []
+        self.publish_errors = 0
+        self.max_threads = threading.active_count()
+        self.received = threading.Condition(self._lock)
+
+    def on_published(self, sent, future):
+        latency = time.time() - sent
+        with self._lock:
+            if future.exception() is None:
+                self.publish_latencies.append(latency)
+            else:
+                self.publish_errors += 1
+
+    def on_received(self, message):
+        sent = float(message.attributes[_SENT_ATTRIBUTE])
+        latency = time.time() - sent
+        message.ack()
+        with self._lock:
+            self.end_to_end_latencies.append(latency)
+            self.received.notify_all()
+
+    def sample_threads(self):
+        count = threading.active_count()
+        with self._lock:
+            self.max_threads = max(self.max_threads, count)
+
+
+def publish_messages(publisher, topic, args, stats):
+    """Publish the messages at the requested rate."""
+    data = b'x' * args.message_size
+    interval = 1.0 / args.rate if args.rate else 0.0
+    start = time.time()
+    for index in range(args.messages):
+        if interval:
+            delay = start + index * interval - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        sent = time.time()
+        future = publisher.publish(
+            topic, data, **{_SENT_ATTRIBUTE: repr(sent)})
+        future.add_done_callback(
+            lambda future, sent=sent: stats.on_published(sent, future))
+        if index % 1000 == 0:
+            stats.sample_threads()
+
+
+def ensure_resources(publisher, subscriber, topic, subscription):
+    """Create the topic and subscription, if they do not exist yet."""
+    try:
+        publisher.create_topic(topic)
+    except exceptions.AlreadyExists:
+        pass
+    try:
+        subscriber.create_subscription(subscription, topic)
+    except exceptions.AlreadyExists:
+        pass
+
+
+def report(args, stats, elapsed, cpu):
+    """Print the results of the benchmark."""
+    publish_latencies = sorted(stats.publish_latencies)
+    end_to_end_latencies = sorted(stats.end_to_end_latencies)
+    received = len(end_to_end_latencies)
+
+    print('Messages: {} published ({} errors), {} received, {} bytes '
+          'each'.format(len(publish_latencies), stats.publish_errors,
+                        received, args.message_size))
+    print('Elapsed: {:.2f} s, throughput: {:.1f} messages/s, '
+          '{:.2f} MB/s'.format(
+              elapsed, received / elapsed,
+              received * args.message_size / elapsed / 2 ** 20))
+    for name, latencies in (('Publish', publish_latencies),
+                            ('End-to-end', end_to_end_latencies)):
+        print('{} latency (ms): p50 {:.1f}, p90 {:.1f}, p99 {:.1f}, '
+              'max {:.1f}'.format(
+                  name,
+                  *[1000 * percentile(latencies, percent)
+                    for percent in (50, 90, 99, 100)]))
+    print('Threads: {} at most'.format(stats.max_threads))
+    print('CPU: {:.2f} s, {:.1f} us/message'.format(
+        cpu, 10 ** 6 * cpu / max(received, 1)))
+
+
+def run(args):
+    server = None
+    if args.fake:
+        server, servicer = start_fake_server()
+    elif not os.environ.get('PUBSUB_EMULATOR_HOST'):
+        raise SystemExit(
+            'Set PUBSUB_EMULATOR_HOST, or use --fake for a fake server.')
+
+    publisher = pubsub.PublisherClient(batch_settings=types.BatchSettings(
+        max_bytes=args.batch_max_bytes,
+        max_latency=args.batch_max_latency,
+        max_messages=args.batch_max_messages,
+    ))
+    subscriber = pubsub.SubscriberClient()
+    topic = publisher.topic_path(args.project, args.topic)
+    subscription = subscriber.subscription_path(
+        args.project, args.subscription)
+    if not args.fake:
+        ensure_resources(publisher, subscriber, topic, subscription)
+
+    stats = Stats()
+    flow_control = types.FlowControl(
+        max_bytes=args.flow_max_bytes,
+        max_messages=args.flow_max_messages,
+    )
+    kwargs = {}
+    if args.streams != 1:
+        kwargs['streams'] = args.streams
+    policy = subscriber.subscribe(
+        subscription, flow_control=flow_control, **kwargs)
+
+    cpu_start = cpu_time()
+    start = time.time()
+    policy.open(stats.on_received)
+    publish_messages(publisher, topic, args, stats)
+
+    deadline = time.time() + args.timeout
+    with stats.received:
+        while (len(stats.end_to_end_latencies) < args.messages and
+                time.time() < deadline):
+            stats.received.wait(0.5)
+    stats.sample_threads()
+    elapsed = time.time() - start
+    cpu = cpu_time() - cpu_start
+
+    policy.close()
+    if server is not None:
+        server.stop(0)
+    report(args, stats, elapsed, cpu)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fake', action='store_true',
+                        help='Run against an in-process fake server.')
+    parser.add_argument('--project', default='benchmark')
+    parser.add_argument('--topic', default='benchmark')
+    parser.add_argument('--subscription', default='benchmark')
+    parser.add_argument('--messages', type=int, default=100000,
+                        help='The number of messages to publish.')
+    parser.add_argument('--rate', type=float, default=0,
+                        help='Messages published per second (0: no limit).')
+    parser.add_argument('--message-size', type=int, default=100,
+                        help='The size of the message data, in bytes.')
+    parser.add_argument('--batch-max-messages', type=int, default=1000)
+    parser.add_argument('--batch-max-bytes', type=int, default=5 * 2 ** 20)
+    parser.add_argument('--batch-max-latency', type=float, default=0.05)
+    parser.add_argument('--flow-max-messages', type=int, default=1000)
+    parser.add_argument('--flow-max-bytes', type=int, default=100 * 2 ** 20)
+    parser.add_argument('--streams', type=int, default=1,
+                        help='The number of streaming pulls to open.')
+    parser.add_argument('--timeout', type=float, default=60,
+                        help='Seconds to wait for the messages to arrive.')
+    return parser
+
+
+if __name__ == '__main__':
+    run(get_parser().parse_args())
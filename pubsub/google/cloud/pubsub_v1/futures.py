@@ -49,6 +49,7 @@ class Future(google.api_core.future.Future):
         self._result = self._SENTINEL
         self._exception = self._SENTINEL
         self._callbacks = []
+        self._callbacks_lock = threading.Lock()
         if completed is None:
             completed = threading.Event()
         self._completed = completed
@@ -146,9 +147,14 @@ class Future(google.api_core.future.Future):
         The provided function is called, with this future as its only argument,
         when the future finishes running.
         """
-        if self.done():
-            return fn(self)
-        self._callbacks.append(fn)
+        # The lock guarantees that a callback registered while the future
+        # is being completed on another thread is either run by
+        # :meth:`_trigger` or run here, but never dropped.
+        with self._callbacks_lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        return fn(self)
 
     def set_result(self, result):
         """Set the result of the future to the provided result.
@@ -188,5 +194,7 @@ class Future(google.api_core.future.Future):
             message_id (str): The message ID, as a string.
         """
         self._completed.set()
-        for callback in self._callbacks:
+        with self._callbacks_lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
             callback(self)
@@ -0,0 +1,287 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-ordering-key sequencing of published messages."""
+
+from __future__ import absolute_import
+
+import collections
+import functools
+import logging
+import threading
+
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.batch import base
+
+
+_LOGGER = logging.getLogger(__name__)
+_NOT_COMPLETED = (
+    base.BatchStatus.ACCEPTING_MESSAGES,
+    base.BatchStatus.STARTING,
+    base.BatchStatus.IN_PROGRESS,
+)
+
+
+def _copy_outcome(target, source):
+    """Complete ``target`` with the outcome of the completed ``source``.
+
+    Args:
+        target (~.pubsub_v1.publisher.futures.Future): The future returned
+            to the caller of ``publish``.
+        source (~.pubsub_v1.publisher.futures.Future): The future returned
+            by the batch the message was eventually published in.
+    """
+    # The caller may have cancelled the future (e.g. after a timeout).
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+        return
+    exception = source.exception()
+    if exception is None:
+        target.set_result(source.result())
+    else:
+        target.set_exception(exception)
+
+
+class OrderedSequencer(object):
+    """Publish the messages for a single ordering key in order.
+
+    At most one batch per ordering key is being committed at any time;
+    messages published while it is in flight wait in a queue, and are
+    committed (as one or more batches, in order) once it succeeds. Messages
+    for different ordering keys are sequenced independently and are thus
+    published in parallel.
+
+    If a batch fails, the ordering key is paused: the waiting messages
+    fail, and the sequencer finishes; the client rejects further messages
+    with the ordering key until it is resumed.
+
+    Args:
+        client (~.pubsub_v1.publisher.client.Client): The publisher client
+            used to create this sequencer.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        ordering_key (str): The ordering key.
+    """
+    def __init__(self, client, topic, ordering_key):
+        self._client = client
+        self._topic = topic
+        self._ordering_key = ordering_key
+
+        self._state_lock = threading.Lock()
+        # These members are all communicated between threads; ensure that
+        # any writes to them use the "state lock" to remain atomic.
+        self._batch = None
+        self._batch_futures = []
+        self._batch_done = 0
+        self._batch_error = None
+        self._pending = collections.deque()
+        self._paused = False
+        self._finished = False
+
+    @property
+    def topic(self):
+        """str: The topic."""
+        return self._topic
+
+    @property
+    def finished(self):
+        """bool: Whether the sequencer has no more messages to publish.
+
+        A finished sequencer does not accept messages; a new one must be
+        created for the ordering key.
+        """
+        return self._finished
+
+    @property
+    def ordering_key(self):
+        """str: The ordering key."""
+        return self._ordering_key
+
+    @property
+    def paused(self):
+        """bool: Whether publishing is paused after a failed batch."""
+        return self._paused
+
+    def resume(self):
+        """Resume publishing after a failed batch."""
+        with self._state_lock:
+            self._paused = False
+
+    def publish(self, message):
+        """Publish a single message after every earlier one with its key.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            Optional[~google.api_core.future.Future]: An object conforming to
+            the :class:`~concurrent.futures.Future` interface or :data:`None`.
+            If :data:`None` is returned, this sequencer has finished and a
+            new one must be created for the ordering key.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.OrderingKeyPausedError: If the
+                ordering key is paused.
+            ValueError: If the message is larger than the ``max_bytes``
+                batch setting, and so could never be published.
+        """
+        # Sanity check: A message which does not fit in an empty batch
+        # would stall every later message with the same ordering key.
+        if message.ByteSize() > self._client.batch_settings.max_bytes:
+            raise ValueError(
+                'Message exceeds the max_bytes batch setting.')
+
+        with self._state_lock:
+            if self._paused:
+                raise exceptions.OrderingKeyPausedError(self._ordering_key)
+            if self._finished:
+                return None
+
+            future = None
+            if self._batch is None:
+                # Nothing is in flight: the message opens a new batch, which
+                # commits itself on the usual size / latency triggers.
+                batch = self._create_batch(autocommit=True)
+                future = batch.publish(message)
+                self._start_batch(batch, [future])
+            elif not self._pending:
+                future = self._batch.publish(message)
+                if future is not None:
+                    self._batch_futures.append(future)
+
+            if future is None:
+                # The current batch is already being committed, so the
+                # message must wait for it to complete.
+                future = self._batch.make_future()
+                self._pending.append((message, future))
+                return future
+
+            batch = self._batch
+
+        future.add_done_callback(functools.partial(self._on_done, batch))
+        return future
+
+    def _create_batch(self, autocommit):
+        return self._client._batch_class(
+            autocommit=autocommit,
+            client=self._client,
+            settings=self._client.batch_settings,
+            topic=self._topic,
+        )
+
+    def _start_batch(self, batch, batch_futures):
+        """Make ``batch`` the batch in flight.
+
+        .. note::
+
+            This assumes, but does not check, that the state lock is held.
+        """
+        self._batch = batch
+        self._batch_futures = batch_futures
+        self._batch_done = 0
+        self._batch_error = None
+
+    def _on_done(self, batch, future):
+        """Track the completion of a message in the batch in flight.
+
+        Once every message in the batch has completed, the next batch (if
+        any) is committed, or the ordering key is paused if the batch failed.
+
+        Args:
+            batch (~.pubsub_v1.publisher.batch.base.Batch): The batch the
+                message was published in.
+            future (~.pubsub_v1.publisher.futures.Future): The message's
+                future.
+        """
+        links = []
+        failed = []
+        finished = False
+        paused = False
+        with self._state_lock:
+            if batch is not self._batch:
+                return
+
+            self._batch_done += 1
+            # A caller may cancel the future it was returned (e.g. on an
+            # ``asyncio`` timeout); the message still counts as completed,
+            # and calling ``exception()`` on it would raise.
+            if not future.cancelled():
+                exception = future.exception()
+                if exception is not None and self._batch_error is None:
+                    self._batch_error = exception
+
+            if (self._batch_done < len(self._batch_futures) or
+                    batch.status in _NOT_COMPLETED):
+                return
+
+            if self._batch_error is not None:
+                _LOGGER.debug('Pausing ordering key %r after failure: %r',
+                              self._ordering_key, self._batch_error)
+                self._paused = True
+                self._batch = None
+                failed = [pending for _, pending in self._pending]
+                self._pending.clear()
+                # The client remembers the paused ordering key, so that
+                # the (empty) sequencer need not be kept.
+                self._finished = True
+                paused = True
+            elif self._pending:
+                batch, links = self._next_batch()
+            else:
+                self._batch = None
+                if not self._paused:
+                    self._finished = True
+                    finished = True
+
+        # Futures are completed (and callbacks attached) without the state
+        # lock held, since callbacks may re-enter this sequencer.
+        for pending in failed:
+            pending.set_exception(
+                exceptions.OrderingKeyPausedError(self._ordering_key))
+        for target, source in links:
+            source.add_done_callback(functools.partial(_copy_outcome, target))
+            source.add_done_callback(functools.partial(self._on_done, batch))
+        if links:
+            batch.commit()
+        if paused:
+            self._client._pause_sequencer(self)
+        if finished:
+            self._client._remove_sequencer(self)
+
+    def _next_batch(self):
+        """Move as many waiting messages as fit into a new batch.
+
+        .. note::
+
+            This assumes, but does not check, that the state lock is held.
+
+        Returns:
+            Tuple[~.pubsub_v1.publisher.batch.base.Batch, list]: The new
+            batch, and pairs of the waiting future and the batch future
+            for each message moved into it.
+        """
+        batch = self._create_batch(autocommit=False)
+        links = []
+        while self._pending:
+            message, target = self._pending[0]
+            source = batch.publish(message)
+            if source is None:
+                break
+            self._pending.popleft()
+            links.append((target, source))
+
+        self._start_batch(batch, [source for _, source in links])
+        return batch, links
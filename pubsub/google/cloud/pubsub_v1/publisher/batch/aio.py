@@ -0,0 +1,279 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A batch based on :mod:`asyncio`.
+
+.. note::
+
+    This module requires Python 3.5 or later.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import logging
+import threading
+import time
+
+import google.api_core.exceptions
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.batch import base
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Batch(base.Batch):
+    """A batch of messages, published from an :mod:`asyncio` event loop.
+
+    This works like :class:`~.pubsub_v1.publisher.batch.thread.Batch`, but
+    without a thread per batch: the maximum latency is timed by the event
+    loop, and the futures returned by :meth:`publish` are
+    :class:`asyncio.Future` instances, which can be awaited directly. Pass
+    this class as the ``batch_class`` argument to
+    :class:`~.pubsub_v1.PublisherClient` to use it.
+
+    .. warning::
+
+        Batches are not thread-safe: the client's ``publish`` method must be
+        called from the event loop thread. For the same reason, the client's
+        flow control must not use the ``BLOCK`` behavior, which would block
+        the event loop which completes the outstanding messages.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+        loop (Optional[~asyncio.AbstractEventLoop]): The event loop. Defaults
+            to the current event loop.
+    """
+    def __init__(self, client, topic, settings, autocommit=True, loop=None):
+        self._client = client
+        self._topic = topic
+        self._settings = settings
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self._loop = loop
+
+        self._futures = []
+        self._messages = []
+        self._size = 0
+        self._status = base.BatchStatus.ACCEPTING_MESSAGES
+
+        # If max latency is specified, have the event loop commit the batch
+        # when the max latency is reached.
+        self._timer = None
+        if autocommit and self._settings.max_latency < float('inf'):
+            self._timer = self._loop.call_later(
+                self._settings.max_latency, self.commit)
+
+    @staticmethod
+    def make_lock():
+        """Return a threading lock.
+
+        The batches themselves are only used from the event loop, but the
+        client may still be shared with other threads.
+
+        Returns:
+            _thread.Lock: A newly created lock.
+        """
+        return threading.Lock()
+
+    def make_future(self):
+        """Return a future attached to the batch's event loop.
+
+        Returns:
+            asyncio.Future: A newly created, pending future.
+        """
+        return self._loop.create_future()
+
+    @property
+    def client(self):
+        """~.pubsub_v1.client.PublisherClient: A publisher client."""
+        return self._client
+
+    @property
+    def messages(self):
+        """Sequence: The messages currently in the batch."""
+        return self._messages
+
+    @property
+    def settings(self):
+        """Return the batch settings.
+
+        Returns:
+            ~.pubsub_v1.types.BatchSettings: The batch settings. These are
+                considered immutable once the batch has been opened.
+        """
+        return self._settings
+
+    @property
+    def size(self):
+        """Return the total size of all of the messages currently in the batch.
+
+        Returns:
+            int: The total size of all of the messages currently
+                 in the batch, in bytes.
+        """
+        return self._size
+
+    @property
+    def status(self):
+        """Return the status of this batch.
+
+        Returns:
+            str: The status of this batch. All statuses are human-readable,
+                all-lowercase strings.
+        """
+        return self._status
+
+    def commit(self):
+        """Actually publish all of the messages on the active batch.
+
+        .. note::
+
+            This method is non-blocking. It schedules :meth:`_commit` as a
+            task on the event loop.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+            return
+        self._status = base.BatchStatus.STARTING
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._loop.create_task(self._commit())
+
+    async def _commit(self):
+        """Actually publish all of the messages on the active batch.
+
+        The Publish RPC itself is blocking, so it is run in the event loop's
+        default executor; the event loop is free while it is in flight.
+        """
+        self._status = base.BatchStatus.IN_PROGRESS
+
+        # Sanity check: If there are no messages, no-op.
+        if not self._messages:
+            _LOGGER.debug('No messages to publish, exiting commit')
+            self._status = base.BatchStatus.SUCCESS
+            return
+
+        # Begin the request to publish these messages.
+        # Log how long the underlying request takes.
+        start = time.time()
+        try:
+            response = await self._loop.run_in_executor(
+                None, self._client.api.publish, self._topic, self._messages)
+        except google.api_core.exceptions.GoogleAPIError as exc:
+            # The request failed (after any retries); the futures must
+            # still complete, or callers would wait on them forever.
+            self._status = base.BatchStatus.ERROR
+            self._set_exception(exc)
+            _LOGGER.debug('gRPC Publish failed: %r', exc)
+            return
+        end = time.time()
+        _LOGGER.debug('gRPC Publish took %s seconds.', end - start)
+
+        if len(response.message_ids) == len(self._futures):
+            self._status = base.BatchStatus.SUCCESS
+            for message_id, future in zip(
+                    response.message_ids, self._futures):
+                # The caller may have cancelled the future (e.g. after a
+                # timeout); the message is published regardless.
+                if not future.done():
+                    future.set_result(message_id)
+        else:
+            # Sanity check: If the number of message IDs is not equal to
+            # the number of futures I have, then something went wrong.
+            self._status = base.BatchStatus.ERROR
+            self._set_exception(exceptions.PublishError(
+                'Some messages were not successfully published.'))
+
+    def _set_exception(self, exception):
+        """Fail every future in the batch which is not already done.
+
+        Args:
+            exception (Exception): The exception to set on the futures.
+        """
+        for future in self._futures:
+            if not future.done():
+                future.set_exception(exception)
+
+    def remove(self, future):
+        """Remove a message which has not yet been sent from the batch.
+
+        Args:
+            future (asyncio.Future): The future returned by :meth:`publish`
+                for the message.
+
+        Returns:
+            bool: Whether the message was removed.
+        """
+        if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+            return False
+
+        for index, candidate in enumerate(self._futures):
+            if candidate is future:
+                break
+        else:
+            return False
+
+        del self._futures[index]
+        message = self._messages.pop(index)
+        self._size -= message.ByteSize()
+        return True
+
+    def publish(self, message):
+        """Publish a single message.
+
+        Add the given message to this object; this will cause it to be
+        published once the batch either has enough messages or a sufficient
+        period of time has elapsed.
+
+        This method is called by :meth:`~.PublisherClient.publish`.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            Optional[asyncio.Future]: A future which resolves to the message
+            ID, or :data:`None`. If :data:`None` is returned, that signals
+            that the batch cannot accept a message.
+        """
+        # Coerce the type, just in case.
+        if not isinstance(message, types.PubsubMessage):
+            message = types.PubsubMessage(**message)
+
+        if not self.will_accept(message):
+            return None
+
+        self._size += message.ByteSize()
+        self._messages.append(message)
+        future = self.make_future()
+        self._futures.append(future)
+
+        if len(self._messages) >= self._settings.max_messages:
+            self.commit()
+
+        return future
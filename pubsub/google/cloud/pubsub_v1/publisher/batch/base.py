@@ -15,9 +15,12 @@
 from __future__ import absolute_import
 
 import abc
+import threading
 
 import six
 
+from google.cloud.pubsub_v1.publisher import futures
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Batch(object):
@@ -59,6 +62,19 @@ class Batch(object):
         """
         raise NotImplementedError
 
+    def make_future(self):
+        """Return a future for a message in the chosen concurrency model.
+
+        This is used for the futures returned by :meth:`publish`, as well as
+        by the publisher client for messages which must wait before they
+        can be added to a batch (e.g. behind others with the same ordering
+        key).
+
+        Returns:
+            ~google.api_core.future.Future: A newly created, pending future.
+        """
+        return futures.Future(completed=threading.Event())
+
     @property
     @abc.abstractmethod
     def messages(self):
@@ -154,6 +170,28 @@ class Batch(object):
         """
         raise NotImplementedError
 
+    def remove(self, future):
+        """Remove a message which has not yet been sent from the batch.
+
+        This is used by the publisher client to drop the oldest messages
+        when its flow control limits are exceeded. The future belonging to
+        the removed message is left untouched; it is up to the caller to
+        resolve it.
+
+        Batch implementations which cannot remove messages need not
+        override this method.
+
+        Args:
+            future (~google.api_core.future.Future): The future returned by
+                :meth:`publish` for the message.
+
+        Returns:
+            bool: Whether the message was removed. This is :data:`False` if
+            the batch has stopped accepting messages (and so is committing or
+            has committed them) or if the future does not belong to it.
+        """
+        return False
+
 
 class BatchStatus(object):
     """An enum-like class representing valid statuses for a batch.
@@ -20,9 +20,9 @@ import time
 
 import six
 
+import google.api_core.exceptions
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher import exceptions
-from google.cloud.pubsub_v1.publisher import futures
 from google.cloud.pubsub_v1.publisher.batch import base
 
 
@@ -199,10 +199,19 @@ class Batch(base.Batch):
             # Begin the request to publish these messages.
             # Log how long the underlying request takes.
             start = time.time()
-            response = self._client.api.publish(
-                self._topic,
-                self._messages,
-            )
+            try:
+                response = self._client.api.publish(
+                    self._topic,
+                    self._messages,
+                )
+            except google.api_core.exceptions.GoogleAPIError as exc:
+                # The request failed (after any retries); the futures must
+                # still complete, or callers would wait on them forever.
+                self._status = base.BatchStatus.ERROR
+                for future in self._futures:
+                    future.set_exception(exc)
+                _LOGGER.debug('gRPC Publish failed: %r', exc)
+                return
             end = time.time()
             _LOGGER.debug('gRPC Publish took %s seconds.', end - start)
 
@@ -223,6 +232,33 @@ class Batch(base.Batch):
                 for future in self._futures:
                     future.set_exception(exception)
 
+    def remove(self, future):
+        """Remove a message which has not yet been sent from the batch.
+
+        Args:
+            future (~google.api_core.future.Future): The future returned by
+                :meth:`publish` for the message.
+
+        Returns:
+            bool: Whether the message was removed.
+        """
+        with self._state_lock:
+            if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+                return False
+
+            # Messages are usually removed oldest first, so this is
+            # normally a scan of a single item.
+            for index, candidate in enumerate(self._futures):
+                if candidate is future:
+                    break
+            else:
+                return False
+
+            del self._futures[index]
+            message = self._messages.pop(index)
+            self._size -= message.ByteSize()
+            return True
+
     def monitor(self):
         """Commit this batch after sufficient time has elapsed.
 
@@ -271,7 +307,7 @@ class Batch(base.Batch):
             self._messages.append(message)
             # Track the future on this batch (so that the result of the
             # future can be set).
-            future = futures.Future(completed=threading.Event())
+            future = self.make_future()
             self._futures.append(future)
             # Determine the number of messages before releasing the lock.
             num_messages = len(self._messages)
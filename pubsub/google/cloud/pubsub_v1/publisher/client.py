@@ -14,8 +14,11 @@
 
 from __future__ import absolute_import
 
+import collections
 import copy
+import functools
 import os
+import threading
 import pkg_resources
 
 import grpc
@@ -26,6 +29,9 @@ from google.api_core import grpc_helpers
 from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
+from google.cloud.pubsub_v1.publisher import _sequencer
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import flow_controller
 from google.cloud.pubsub_v1.publisher.batch import thread
 
 
@@ -51,6 +57,10 @@ class Client(object):
             is based on :class:`threading.Thread`. This class should also have
             a class method (or static method) that takes no arguments and
             produces a lock that can be used as a context manager.
+        flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            flow control settings. Use this to bound the number and size of
+            messages which have been published but not yet sent, so that a
+            slow backend does not cause unbounded memory growth.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
@@ -59,7 +69,8 @@ class Client(object):
             be added if ``credentials`` are passed explicitly or if the
             Pub / Sub emulator is detected as running.
     """
-    def __init__(self, batch_settings=(), batch_class=thread.Batch, **kwargs):
+    def __init__(self, batch_settings=(), batch_class=thread.Batch,
+                 flow_control=(), **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -93,6 +104,37 @@ class Client(object):
         self._batch_lock = batch_class.make_lock()
         self._batches = {}
 
+        # Messages published with an ordering key bypass ``_batches``; they
+        # are sequenced per ``(topic, ordering_key)`` instead.
+        self._sequencers = {}
+        # Paused ordering keys, as ``(topic, ordering_key)``; the sequencers
+        # of paused ordering keys are dropped.
+        self._paused_keys = set()
+
+        # The flow controller tracks every message from ``publish`` until its
+        # future completes. When dropping the oldest messages on overflow,
+        # the futures of messages which may still be removed from their
+        # batch are also kept (oldest first), along with that batch.
+        self.flow_control = types.PublishFlowControl(*flow_control)
+        self._flow_controller = flow_controller.FlowController(
+            self.flow_control)
+        self._droppable = collections.OrderedDict()
+        self._droppable_lock = threading.Lock()
+
+    @property
+    def flow_controller(self):
+        """Return the flow controller for this client.
+
+        This can be used to monitor the messages which are currently
+        outstanding, e.g. via its ``message_count``, ``byte_count`` and
+        ``load`` properties.
+
+        Returns:
+            ~.pubsub_v1.publisher.flow_controller.FlowController: The flow
+            controller.
+        """
+        return self._flow_controller
+
     @property
     def target(self):
         """Return the target (where the API is).
@@ -140,7 +182,84 @@ class Client(object):
 
         return batch
 
-    def publish(self, topic, data, **attrs):
+    def _sequencer(self, topic, ordering_key):
+        """Return the sequencer for the provided topic and ordering key.
+
+        This will create a new sequencer if none exists, or if the current
+        one has finished.
+
+        Args:
+            topic (str): A string representing the topic.
+            ordering_key (str): The ordering key.
+
+        Returns:
+            ~.pubsub_v1.publisher._sequencer.OrderedSequencer: The sequencer.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.OrderingKeyPausedError: If the
+                ordering key is paused.
+        """
+        key = (topic, ordering_key)
+        with self._batch_lock:
+            sequencer = self._sequencers.get(key)
+            if key in self._paused_keys or (
+                    sequencer is not None and sequencer.paused):
+                raise exceptions.OrderingKeyPausedError(ordering_key)
+            if sequencer is None or sequencer.finished:
+                sequencer = _sequencer.OrderedSequencer(
+                    self, topic, ordering_key)
+                self._sequencers[key] = sequencer
+        return sequencer
+
+    def _remove_sequencer(self, sequencer):
+        """Forget a sequencer which has no more messages to publish.
+
+        Args:
+            sequencer (~.pubsub_v1.publisher._sequencer.OrderedSequencer):
+                The finished sequencer.
+        """
+        key = (sequencer.topic, sequencer.ordering_key)
+        with self._batch_lock:
+            if self._sequencers.get(key) is sequencer:
+                del self._sequencers[key]
+
+    def _pause_sequencer(self, sequencer):
+        """Pause the ordering key of a sequencer whose batch failed.
+
+        The sequencer itself, which has no more messages to publish, is
+        forgotten.
+
+        Args:
+            sequencer (~.pubsub_v1.publisher._sequencer.OrderedSequencer):
+                The paused sequencer.
+        """
+        key = (sequencer.topic, sequencer.ordering_key)
+        with self._batch_lock:
+            self._paused_keys.add(key)
+            if self._sequencers.get(key) is sequencer:
+                del self._sequencers[key]
+
+    def resume_publish(self, topic, ordering_key):
+        """Resume publishing with an ordering key after a failure.
+
+        When publishing a message with an ordering key fails, publishing
+        with that ordering key is paused (so that later messages are not
+        published out of order), and messages published with it fail with
+        :exc:`~.pubsub_v1.publisher.exceptions.OrderingKeyPausedError`
+        until this method is called.
+
+        Args:
+            topic (str): The topic the messages are published to.
+            ordering_key (str): The ordering key to resume.
+        """
+        key = (topic, ordering_key)
+        with self._batch_lock:
+            self._paused_keys.discard(key)
+            sequencer = self._sequencers.get(key)
+        if sequencer is not None:
+            sequencer.resume()
+
+    def publish(self, topic, data, ordering_key='', **attrs):
         """Publish a single message.
 
         .. note::
@@ -170,12 +289,31 @@ class Client(object):
             topic (str): The topic to publish messages to.
             data (bytes): A bytestring representing the message body. This
                 must be a bytestring.
+            ordering_key (str): If set, the message is published only after
+                every message previously published to the topic with the same
+                ordering key has been published successfully. Messages with
+                different ordering keys are published in parallel. If a
+                message fails to publish, publishing with its ordering key is
+                paused until :meth:`resume_publish` is called.
+
+                .. note::
+                    ``ordering_key`` is not a message attribute: a message
+                    can no longer be given an attribute named
+                    ``ordering_key`` through ``attrs``.
             attrs (Mapping[str, str]): A dictionary of attributes to be
                 sent as metadata. (These may be text strings or byte strings.)
 
         Returns:
             ~concurrent.futures.Future: An object conforming to the
             ``concurrent.futures.Future`` interface.
+
+        Raises:
+            TypeError: If ``ordering_key`` is not a string.
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If
+                the message would exceed the flow control limits and
+                ``flow_control.limit_exceeded_behavior`` is ``ERROR``.
+            ~.pubsub_v1.publisher.exceptions.OrderingKeyPausedError: If
+                publishing with ``ordering_key`` is paused.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -183,6 +321,11 @@ class Client(object):
             raise TypeError('Data being published to Pub/Sub must be sent '
                             'as a bytestring.')
 
+        # Sanity check: ``ordering_key`` used to be a valid attribute name,
+        # so make sure a (non-string) attribute value is not taken for it.
+        if not isinstance(ordering_key, six.string_types):
+            raise TypeError('The ordering key must be a string.')
+
         # Coerce all attributes to text strings.
         for k, v in copy.copy(attrs).items():
             if isinstance(v, six.text_type):
@@ -196,12 +339,87 @@ class Client(object):
         # Create the Pub/Sub message object.
         message = types.PubsubMessage(data=data, attributes=attrs)
 
+        # Wait for (or make) room for the message within the flow control
+        # limits. This may block or raise, depending on the settings.
+        # Ordered messages are never dropped, since that would break the
+        # ordering of the messages after them.
+        drop_oldest = (self.flow_control.limit_exceeded_behavior ==
+                       types.LimitExceededBehavior.DROP_OLDEST and
+                       not ordering_key)
+        if drop_oldest:
+            # Sanity check: Dropping messages cannot make room for a message
+            # which is larger than the limits on its own.
+            self._flow_controller.check_limits(message)
+            while (not self._flow_controller.has_capacity(message) and
+                    self._drop_oldest()):
+                pass
+        self._flow_controller.add(message)
+
         # Delegate the publishing to the batch.
-        batch = self.batch(topic)
-        future = None
-        while future is None:
-            future = batch.publish(message)
-            if future is None:
-                batch = self.batch(topic, create=True)
+        try:
+            if ordering_key:
+                sequencer = self._sequencer(topic, ordering_key)
+                future = None
+                while future is None:
+                    future = sequencer.publish(message)
+                    if future is None:
+                        sequencer = self._sequencer(topic, ordering_key)
+            else:
+                batch = self.batch(topic)
+                future = None
+                while future is None:
+                    future = batch.publish(message)
+                    if future is None:
+                        batch = self.batch(topic, create=True)
+        except Exception:
+            self._flow_controller.release(message)
+            raise
+
+        if drop_oldest:
+            with self._droppable_lock:
+                self._droppable[future] = batch
+        future.add_done_callback(
+            functools.partial(self._on_publish_done, message))
 
         return future
+
+    def _on_publish_done(self, message, future):
+        """Stop tracking a message once its future has completed.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+            future (~google.api_core.future.Future): The message's future.
+        """
+        if self._droppable:
+            with self._droppable_lock:
+                self._droppable.pop(future, None)
+        self._flow_controller.release(message)
+
+    def _drop_oldest(self):
+        """Drop the oldest message which has not yet been sent.
+
+        The dropped message's future fails with
+        :exc:`~.pubsub_v1.publisher.exceptions.FlowControlLimitError`.
+
+        Returns:
+            bool: Whether a message was dropped. This is :data:`False` if
+            every outstanding message is already being sent.
+        """
+        while True:
+            with self._droppable_lock:
+                if not self._droppable:
+                    return False
+                future, batch = self._droppable.popitem(last=False)
+
+            # Once a batch stops accepting messages it never accepts them
+            # again, so messages which cannot be removed are forgotten rather
+            # than revisited. The batch is asked without holding the lock,
+            # since batches complete futures while holding their own lock.
+            if batch.remove(future):
+                break
+
+        # The caller may have cancelled the future (e.g. after a timeout).
+        if not future.done():
+            future.set_exception(exceptions.FlowControlLimitError(
+                'Message dropped to stay within the flow control limits.'))
+        return True
@@ -22,7 +22,28 @@ class PublishError(GoogleAPICallError):
     pass
 
 
+class FlowControlLimitError(Exception):
+    """Raised (or set on a message's future) when publishing would exceed
+    the publisher's flow control limits."""
+
+
+class OrderingKeyPausedError(Exception):
+    """Raised (or set on a message's future) when publishing with an
+    ordering key which is paused after a failure.
+
+    Call :meth:`~.pubsub_v1.publisher.client.Client.resume_publish` to
+    resume publishing with the ordering key.
+    """
+    def __init__(self, ordering_key):
+        self.ordering_key = ordering_key
+        super(OrderingKeyPausedError, self).__init__(
+            'Publishing with ordering key {!r} is paused.'.format(
+                ordering_key))
+
+
 __all__ = (
+    'FlowControlLimitError',
+    'OrderingKeyPausedError',
     'PublishError',
     'TimeoutError',
 )
@@ -0,0 +1,176 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division
+
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FlowController(object):
+    """Bound the messages held by a publisher client.
+
+    A message is *outstanding* from the time it is handed to
+    :meth:`~.pubsub_v1.publisher.client.Client.publish` until its future
+    completes (successfully or not). The flow controller counts outstanding
+    messages and bytes and, depending on
+    ``settings.limit_exceeded_behavior``, blocks or rejects new messages
+    which would push either count over its limit.
+
+    Args:
+        settings (~.pubsub_v1.types.PublishFlowControl): The flow control
+            settings.
+    """
+    def __init__(self, settings=types.PublishFlowControl()):
+        self._settings = settings
+        self._message_count = 0
+        self._byte_count = 0
+        # Re-entrant, because releasing a message may happen on the thread
+        # which is currently adding one (e.g. when a dropped message's future
+        # is failed).
+        self._operational_lock = threading.RLock()
+        self._has_capacity = threading.Condition(self._operational_lock)
+
+    @property
+    def settings(self):
+        """~.pubsub_v1.types.PublishFlowControl: The flow control settings."""
+        return self._settings
+
+    @property
+    def message_count(self):
+        """int: The number of outstanding messages."""
+        return self._message_count
+
+    @property
+    def byte_count(self):
+        """int: The total size of the outstanding messages, in bytes."""
+        return self._byte_count
+
+    @property
+    def load(self):
+        """Return the current load.
+
+        The load is represented as a float, where 1.0 represents having
+        hit one of the flow control limits, and values between 0.0 and 1.0
+        represent how close we are to them.
+
+        Returns:
+            float: The load value.
+        """
+        return max([
+            self._message_count / self._settings.message_limit,
+            self._byte_count / self._settings.byte_limit,
+        ])
+
+    def has_capacity(self, message):
+        """Return True if the message fits within the flow control limits.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            bool: Whether adding the message keeps the outstanding messages
+            and bytes within their limits.
+        """
+        return self._fits(message.ByteSize())
+
+    def _fits(self, byte_size):
+        return (
+            self._message_count + 1 <= self._settings.message_limit and
+            self._byte_count + byte_size <= self._settings.byte_limit)
+
+    def check_limits(self, message):
+        """Check that the message alone fits within the flow control limits.
+
+        A message which does not would never fit, however many outstanding
+        messages are released (or dropped).
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                message is larger than the limits themselves.
+        """
+        self._check_size(message.ByteSize())
+
+    def _check_size(self, byte_size):
+        if self._settings.message_limit < 1:
+            raise exceptions.FlowControlLimitError(
+                'The flow control message limit allows no messages.')
+        if byte_size > self._settings.byte_limit:
+            raise exceptions.FlowControlLimitError(
+                'Message of {} bytes exceeds the flow control '
+                'byte limit.'.format(byte_size))
+
+    def add(self, message):
+        """Add a message to the outstanding messages.
+
+        Depending on ``settings.limit_exceeded_behavior``, this blocks
+        until there is room for the message, or raises if there is none.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                message does not fit and the behavior is ``ERROR``, or if
+                the message is larger than the limits themselves (and so
+                could never fit).
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        byte_size = message.ByteSize()
+
+        with self._operational_lock:
+            if behavior != types.LimitExceededBehavior.IGNORE:
+                if not self._fits(byte_size):
+                    if behavior == types.LimitExceededBehavior.ERROR:
+                        raise exceptions.FlowControlLimitError(
+                            'Publishing this message would exceed the flow '
+                            'control limits.')
+
+                    # Sanity check: A message which is larger than the
+                    # limits on its own would block forever.
+                    self._check_size(byte_size)
+
+                    _LOGGER.debug('Blocking until there is capacity for a '
+                                  'message of %d bytes.', byte_size)
+                    while not self._fits(byte_size):
+                        self._has_capacity.wait()
+
+            self._message_count += 1
+            self._byte_count += byte_size
+
+    def release(self, message):
+        """Remove a message from the outstanding messages.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+        """
+        with self._operational_lock:
+            self._message_count -= 1
+            self._byte_count -= message.ByteSize()
+            if self._message_count < 0 or self._byte_count < 0:
+                _LOGGER.debug('Outstanding counts were unexpectedly '
+                              'negative: %d messages, %d bytes',
+                              self._message_count, self._byte_count)
+                self._message_count = max(self._message_count, 0)
+                self._byte_count = max(self._byte_count, 0)
+            self._has_capacity.notify_all()
@@ -175,8 +175,18 @@ class Consumer(object):
     simple objects between queues. The overhead for these helper threads is
     low. The Consumer and end-user can configure any sort of executor they want
     for the actual processing of the responses, which may be CPU intensive.
+
+    Args:
+        extend_leases (bool): Whether the initial request of the stream
+            extends the ack deadline of the messages under lease management.
+        on_fatal_error (Optional[Callable[[], None]]): Called (from the
+            consumer thread) once the stream has stopped on an error which
+            is not retried.
     """
-    def __init__(self):
+    def __init__(self, extend_leases=True, on_fatal_error=None):
+        self._extend_leases = extend_leases
+        self._on_fatal_error = on_fatal_error
+        self._stop_lock = threading.Lock()
         self._request_queue = queue.Queue()
         self._stopped = threading.Event()
         self._can_consume = threading.Event()
@@ -219,7 +229,8 @@ class Consumer(object):
         """
         # First, yield the initial request. This occurs on every new
         # connection, fundamentally including a resumed connection.
-        initial_request = policy.get_initial_request(ack_queue=True)
+        initial_request = policy.get_initial_request(
+            ack_queue=True, extend_leases=self._extend_leases)
         _LOGGER.debug('Sending initial request:\n%r', initial_request)
         yield initial_request
 
@@ -350,6 +361,8 @@ class Consumer(object):
                         request_generator, response_generator)
                 if not recover:
                     self._stop_no_join()
+                    if self._on_fatal_error is not None:
+                        self._on_fatal_error()
                     return
 
     @property
@@ -404,9 +417,10 @@ class Consumer(object):
             args=(policy,),
         )
         thread.daemon = True
+        # Set before starting, in case the stream stops itself right away.
+        self._consumer_thread = thread
         thread.start()
         _LOGGER.debug('Started helper thread %s', thread.name)
-        self._consumer_thread = thread
 
     def _stop_no_join(self):
         """Signal the request stream to stop.
@@ -415,18 +429,22 @@ class Consumer(object):
         sent to the request queue.
 
         The ``_consumer_thread`` member is removed from the current instance
-        and returned.
+        and returned. This is safe to call from several threads at once.
 
         Returns:
-            threading.Thread: The worker ("consumer thread") that is being
-            stopped.
+            Optional[threading.Thread]: The worker ("consumer thread") that
+            is being stopped, or :data:`None` if it was already stopped.
         """
+        with self._stop_lock:
+            if self._stopped.is_set():
+                return None
+            self._stopped.set()
+            thread = self._consumer_thread
+            self._consumer_thread = None
         self.resume()  # Make sure we aren't paused.
-        self._stopped.set()
-        _LOGGER.debug('Stopping helper thread %s', self._consumer_thread.name)
+        _LOGGER.debug(
+            'Stopping helper thread %s', getattr(thread, 'name', None))
         self.send_request(_helper_threads.STOP)
-        thread = self._consumer_thread
-        self._consumer_thread = None
         return thread
 
     def stop_consuming(self):
@@ -439,7 +457,111 @@ class Consumer(object):
         (since a thread cannot ``join()`` itself).
         """
         thread = self._stop_no_join()
-        thread.join()
+        if thread is not None:
+            thread.join()
+
+
+class MultiConsumer(object):
+    """A group of bi-directional streaming RPC consumers.
+
+    This opens several streams for the same policy, each driven by its own
+    :class:`Consumer`, and presents them to the policy with the interface of
+    a single :class:`Consumer`. Since every stream shares the policy, the
+    streams share its flow control, lease management and executor.
+
+    Requests sent through the group (acks and ack deadline modifications)
+    are spread over the active streams in turn; acknowledgements do not
+    have to be sent on the stream which received the message. For the same
+    reason, only the first stream extends the leased messages' ack deadlines
+    when it is (re)opened. Once a stream stops on an error which is not
+    retried, every stream is stopped.
+
+    Args:
+        streams (int): The number of streams to open.
+    """
+    def __init__(self, streams):
+        if streams < 1:
+            raise ValueError('At least one stream is required.')
+        self._consumers = [
+            Consumer(extend_leases=(index == 0),
+                     on_fatal_error=self._stop_no_join)
+            for index in range(streams)]
+        self._next_index = 0
+
+    @property
+    def consumers(self):
+        """Sequence[Consumer]: The consumer of each stream."""
+        return self._consumers
+
+    @property
+    def active(self):
+        """bool: Indicates if any of the consumers is active."""
+        return any(consumer.active for consumer in self._consumers)
+
+    @property
+    def paused(self):
+        """bool: Check if any of the consumers is paused."""
+        return any(consumer.paused for consumer in self._consumers)
+
+    def send_request(self, request):
+        """Queue a request to be sent to gRPC on one of the streams.
+
+        Args:
+            request (Any): The request protobuf.
+        """
+        # Races on the index are harmless; they only skew the spread.
+        num_consumers = len(self._consumers)
+        for _ in range(num_consumers):
+            consumer = self._consumers[self._next_index % num_consumers]
+            self._next_index += 1
+            if consumer.active:
+                consumer.send_request(request)
+                return
+
+        # No stream is active; queue the request on the first one, to be
+        # sent if it is restarted.
+        self._consumers[0].send_request(request)
+
+    def pause(self):
+        """Pause all of the consumers."""
+        for consumer in self._consumers:
+            consumer.pause()
+
+    def resume(self):
+        """Resume all of the consumers."""
+        for consumer in self._consumers:
+            consumer.resume()
+
+    def start_consuming(self, policy):
+        """Start consuming all of the streams.
+
+        Args:
+            policy (~.pubsub_v1.subscriber.policy.base.BasePolicy): The policy
+                that owns these consumers.
+        """
+        for consumer in self._consumers:
+            consumer.start_consuming(policy)
+
+    def stop_consuming(self):
+        """Signal all of the streams to stop and block until they complete.
+
+        Streams which have already stopped on their own (after an
+        unrecoverable error) are skipped.
+        """
+        for thread in self._stop_no_join():
+            thread.join()
+
+    def _stop_no_join(self):
+        """Signal all of the streams to stop.
+
+        This is called from a consumer thread once its stream stopped on an
+        error which is not retried.
+
+        Returns:
+            List[threading.Thread]: The consumer threads being stopped.
+        """
+        threads = [consumer._stop_no_join() for consumer in self._consumers]
+        return [thread for thread in threads if thread is not None]
 
 
 def _pausable_iterator(iterator, can_continue):
@@ -459,4 +581,9 @@ def _pausable_iterator(iterator, can_continue):
     """
     while True:
         can_continue.wait()
-        yield next(iterator)
+        # A ``StopIteration`` must not escape a generator (PEP 479).
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        yield item
@@ -14,6 +14,17 @@
 
 from __future__ import absolute_import, division
 
+import time
+
+
+# The bounds of the values stored, which are the bounds of leases in the
+# actual API.
+_MIN_VALUE = 10
+_MAX_VALUE = 600
+
+# After decaying, buckets with less weight than this are considered empty.
+_NEGLIGIBLE_WEIGHT = 0.01
+
 
 class Histogram(object):
     """Representation of a single histogram.
@@ -29,36 +40,50 @@ class Histogram(object):
     The precision of data stored is to the nearest integer. Additionally,
     values outside the range of ``10 <= x <= 600`` are stored as ``10`` or
     ``600``, since these are the boundaries of leases in the actual API.
+
+    Values are counted in a fixed array with one bucket per possible value,
+    so that :meth:`add` is constant-time and :meth:`percentile`, :attr:`min`
+    and :attr:`max` are linear in the number of buckets, regardless of how
+    many values have been added.
+
+    If a ``half_life`` is given, the weight of every value previously added
+    halves every ``half_life`` seconds, so that old values age out (for
+    example, so that the 99th percentile comes back down after a burst of
+    slow acks).
+
+    .. note::
+
+        :meth:`add` takes no lock; it is expected to be called from a single
+        thread (as the default policies do). The statistics may be read from
+        any thread.
     """
-    def __init__(self, data=None):
+    def __init__(self, data=None, half_life=None):
         """Instantiate the histogram.
 
         Args:
-            data (Mapping[str, int]): The data strucure to be used to store
-                the underlying data. The default is an empty dictionary.
-                This can be set to a dictionary-like object if required
-                (for example, if a special object is needed for
-                concurrency reasons).
+            data (Mapping[int, int]): Optional: Initial data, mapping values
+                to the number of times each value was seen.
+            half_life (Optional[Union[int, float]]): Optional: The time, in
+                seconds, for the weight of a value to halve. If not set,
+                values never age out.
         """
-        # The data is stored as a dictionary, with the keys being the
-        # value being added and the values being the number of times that
-        # value was added to the dictionary.
-        #
-        # This is depending on the Python interpreter's implicit ordering
-        # of dictionaries, which is a bitwise sort by the key's ``hash()``
-        # value. Because ``hash(int i) -> i`` and all of our keys are
-        # positive integers (negatives would be a problem because the sort
-        # is bitwise), we can rely on this.
-        if data is None:
-            data = {}
-        self._data = data
+        self._counts = [0] * (_MAX_VALUE - _MIN_VALUE + 1)
+        self._total = 0
         self._len = 0
+        self._half_life = half_life
+        self._last_decay = time.time()
+        if data is not None:
+            for value, count in data.items():
+                index = self._index(value)
+                self._counts[index] += count
+                self._total += count
+                self._len += count
 
     def __len__(self):
         """Return the total number of data points in this histogram.
 
-        This is cached on a separate counter (rather than computing it using
-        ``sum([v for v in self._data.values()])``) to optimize lookup.
+        This counts every value ever added (even if it has since aged out),
+        and is cached on a separate counter to optimize lookup.
 
         Returns:
             int: The total number of data points in this histogram.
@@ -71,7 +96,9 @@ class Histogram(object):
         Returns:
             bool: True or False
         """
-        return needle in self._data
+        if not _MIN_VALUE <= needle <= _MAX_VALUE:
+            return False
+        return self._counts[needle - _MIN_VALUE] > 0
 
     def __repr__(self):
         return '<Histogram: {len} values between {min} and {max}>'.format(
@@ -80,6 +107,16 @@ class Histogram(object):
             min=self.min,
         )
 
+    @staticmethod
+    def _index(value):
+        """Return the bucket index for a value, clamping it to the bounds."""
+        value = int(value)
+        if value < _MIN_VALUE:
+            value = _MIN_VALUE
+        if value > _MAX_VALUE:
+            value = _MAX_VALUE
+        return value - _MIN_VALUE
+
     @property
     def max(self):
         """Return the maximum value in this histogram.
@@ -89,9 +126,11 @@ class Histogram(object):
         Returns:
             int: The maximum value in the histogram.
         """
-        if len(self._data) == 0:
-            return 600
-        return next(iter(reversed(sorted(self._data.keys()))))
+        counts = self._counts
+        for index in range(len(counts) - 1, -1, -1):
+            if counts[index] > 0:
+                return index + _MIN_VALUE
+        return _MAX_VALUE
 
     @property
     def min(self):
@@ -102,9 +141,11 @@ class Histogram(object):
         Returns:
             int: The minimum value in the histogram.
         """
-        if len(self._data) == 0:
-            return 10
-        return next(iter(sorted(self._data.keys())))
+        counts = self._counts
+        for index in range(len(counts)):
+            if counts[index] > 0:
+                return index + _MIN_VALUE
+        return _MIN_VALUE
 
     def add(self, value):
         """Add the value to this histogram.
@@ -113,18 +154,58 @@ class Histogram(object):
             value (int): The value. Values outside of ``10 <= x <= 600``
                 will be raised to ``10`` or reduced to ``600``.
         """
-        # If the value is out of bounds, bring it in bounds.
-        value = int(value)
-        if value < 10:
-            value = 10
-        if value > 600:
-            value = 600
-
-        # Add the value to the histogram's data dictionary.
-        self._data.setdefault(value, 0)
-        self._data[value] += 1
+        if self._half_life is not None:
+            self._decay()
+        self._counts[self._index(value)] += 1
+        self._total += 1
         self._len += 1
 
+    def _decay(self, now=None):
+        """Age out the existing values, according to the half life.
+
+        To keep :meth:`add` cheap, the buckets are only rescaled once at
+        least a tenth of the half life has passed since the last time.
+
+        Args:
+            now (Optional[float]): The current time, in seconds since the
+                epoch. Defaults to :func:`time.time`.
+        """
+        if now is None:
+            now = time.time()
+        elapsed = now - self._last_decay
+        if elapsed < self._half_life / 10:
+            return
+
+        factor = 0.5 ** (elapsed / self._half_life)
+        counts = []
+        for count in self._counts:
+            count *= factor
+            if count < _NEGLIGIBLE_WEIGHT:
+                count = 0
+            counts.append(count)
+        # Swap in the new buckets in one step, so concurrent readers see
+        # either the old or the new data.
+        self._counts = counts
+        self._total = sum(counts)
+        self._last_decay = now
+
+    def buckets(self):
+        """Return the distribution of the values in this histogram.
+
+        This is intended for exporting the distribution to a monitoring
+        system.
+
+        Returns:
+            List[Tuple[int, float]]: Pairs of each value present in the
+            histogram and its weight (the number of times it was added, if
+            values do not age out), in ascending order of value.
+        """
+        return [
+            (index + _MIN_VALUE, count)
+            for index, count in enumerate(self._counts)
+            if count > 0
+        ]
+
     def percentile(self, percent):
         """Return the value that is the Nth precentile in the histogram.
 
@@ -140,16 +221,18 @@ class Histogram(object):
             percent = 100
 
         # Determine the actual target number.
-        target = len(self) - len(self) * (percent / 100)
+        counts = self._counts
+        total = self._total
+        target = total - total * (percent / 100)
 
         # Iterate over the values in reverse, dropping the target by the
         # number of times each value has been seen. When the target passes
         # 0, return the value we are currently viewing.
-        for k in reversed(sorted(self._data.keys())):
-            target -= self._data[k]
+        for index in range(len(counts) - 1, -1, -1):
+            target -= counts[index]
             if target < 0:
-                return k
+                return index + _MIN_VALUE
 
         # The only way to get here is if there was no data.
         # In this case, just return 10 seconds.
-        return 10
+        return _MIN_VALUE
@@ -0,0 +1,192 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import threading
+import time
+
+
+class _Lease(object):
+    """The lease on a single message.
+
+    Attributes:
+        received (float): When the message was leased, in seconds since the
+            epoch.
+        deadline (float): When the lease expires, in seconds since the epoch.
+        size (int): The size of the message, in bytes.
+        bucket (int): The bucket the lease is filed under.
+    """
+    __slots__ = ('received', 'deadline', 'size', 'bucket')
+
+    def __init__(self, received, deadline, size):
+        self.received = received
+        self.deadline = deadline
+        self.size = size
+        self.bucket = None
+
+
+class Leaser(object):
+    """Bookkeeping for the leases on the messages held by a policy.
+
+    Each lease records when its message was received and when the lease
+    expires. Leases are kept in one-second buckets ordered by expiry (a
+    timing wheel), so adding, removing and finding the leases which are
+    about to expire are all constant-time per lease, no matter how many
+    messages are outstanding.
+
+    Args:
+        max_lease_duration (Union[int, float]): The maximum time, in
+            seconds, that a message is kept under lease management. Leases
+            held for longer are not renewed; the message will be redelivered
+            once its current lease expires.
+    """
+    def __init__(self, max_lease_duration=float('inf')):
+        self._max_lease_duration = max_lease_duration
+        self._lock = threading.Lock()
+        # These members are all communicated between threads; ensure that
+        # any access to them holds the lock.
+        self._leases = {}
+        self._buckets = collections.defaultdict(set)
+        self._bytes = 0
+        # Every bucket before this one is known to be empty.
+        self._cursor = int(time.time())
+
+    def __len__(self):
+        """Return the number of leased messages."""
+        return len(self._leases)
+
+    def __contains__(self, ack_id):
+        """Return True if the message is leased, False otherwise."""
+        return ack_id in self._leases
+
+    @property
+    def bytes(self):
+        """int: The total size of the leased messages, in bytes."""
+        return self._bytes
+
+    @property
+    def ack_ids(self):
+        """Return the ack IDs of the leased messages.
+
+        Returns:
+            list: A snapshot of the ack IDs.
+        """
+        with self._lock:
+            return list(self._leases)
+
+    def _file(self, ack_id, lease, deadline):
+        """File a lease under the bucket for its deadline.
+
+        .. note::
+
+            This assumes, but does not check, that the lock is held.
+        """
+        # Leases already past the cursor are filed under it, so that they
+        # are picked up by the next call to :meth:`renew`.
+        lease.deadline = deadline
+        lease.bucket = max(int(deadline), self._cursor)
+        self._buckets[lease.bucket].add(ack_id)
+
+    def add(self, ack_id, byte_size, seconds, now=None):
+        """Add a message to lease management.
+
+        Args:
+            ack_id (str): The ack ID.
+            byte_size (int): The size of the message, in bytes.
+            seconds (Union[int, float]): The time, in seconds, until the
+                message's current lease expires.
+            now (Optional[float]): The current time, in seconds since the
+                epoch. Defaults to :func:`time.time`.
+
+        Returns:
+            bool: Whether the message was added, i.e. was not already leased.
+        """
+        if now is None:
+            now = time.time()
+        with self._lock:
+            if ack_id in self._leases:
+                return False
+            lease = _Lease(now, now + seconds, byte_size)
+            self._leases[ack_id] = lease
+            self._file(ack_id, lease, lease.deadline)
+            self._bytes += byte_size
+            return True
+
+    def remove(self, ack_id):
+        """Remove a message from lease management.
+
+        Args:
+            ack_id (str): The ack ID.
+
+        Returns:
+            Optional[int]: The size of the message, in bytes, or :data:`None`
+            if the message was not leased.
+        """
+        with self._lock:
+            lease = self._leases.pop(ack_id, None)
+            if lease is None:
+                return None
+            bucket = self._buckets.get(lease.bucket)
+            if bucket is not None:
+                bucket.discard(ack_id)
+            self._bytes -= lease.size
+            return lease.size
+
+    def renew(self, horizon, seconds, now=None):
+        """Renew the leases which expire within ``horizon`` seconds.
+
+        Leases which have been held for longer than the maximum lease
+        duration are removed instead.
+
+        Args:
+            horizon (Union[int, float]): Leases expiring within this many
+                seconds are renewed.
+            seconds (Union[int, float]): The time, in seconds, until the
+                renewed leases expire.
+            now (Optional[float]): The current time, in seconds since the
+                epoch. Defaults to :func:`time.time`.
+
+        Returns:
+            Tuple[List[str], List[str]]: The ack IDs of the renewed leases,
+            and the ack IDs of the leases removed for being held too long.
+        """
+        if now is None:
+            now = time.time()
+        renewed = []
+        expired = []
+        with self._lock:
+            stop = int(now + horizon)
+            if not self._leases:
+                # Nothing to walk over; leftover buckets can only be empty.
+                self._buckets.clear()
+                self._cursor = max(self._cursor, stop + 1)
+            while self._cursor <= stop:
+                ack_ids = self._buckets.pop(self._cursor, ())
+                self._cursor += 1
+                for ack_id in ack_ids:
+                    lease = self._leases[ack_id]
+                    if now - lease.received > self._max_lease_duration:
+                        del self._leases[ack_id]
+                        self._bytes -= lease.size
+                        expired.append(ack_id)
+                    else:
+                        renewed.append(ack_id)
+
+            deadline = now + seconds
+            for ack_id in renewed:
+                self._file(ack_id, self._leases[ack_id], deadline)
+
+        return renewed, expired
@@ -93,7 +93,8 @@ class Client(object):
         """
         return subscriber_client.SubscriberClient.SERVICE_ADDRESS
 
-    def subscribe(self, subscription, callback=None, flow_control=()):
+    def subscribe(self, subscription, callback=None, flow_control=(),
+                  streams=1, callback_batch_size=None):
         """Return a representation of an individual subscription.
 
         This method creates and returns a ``Consumer`` object (that is, a
@@ -120,6 +121,15 @@ class Client(object):
             flow_control (~.pubsub_v1.types.FlowControl): The flow control
                 settings. Use this to prevent situations where you are
                 inundated with too many messages at once.
+            streams (int): The number of streaming pull streams to open in
+                parallel. A single stream can deliver fewer messages than a
+                machine with many cores can process; more streams raise the
+                delivery throughput. The streams share the ``flow_control``
+                settings.
+            callback_batch_size (Union[int, float]): If set, ``callback``
+                receives lists of up to this many messages rather than single
+                messages; ``float('inf')`` delivers each response's messages
+                in one list. This is supported by the default policy class.
 
         Returns:
             ~.pubsub_v1.subscriber._consumer.Consumer: An instance
@@ -129,7 +139,15 @@ class Client(object):
             TypeError: If ``callback`` is not callable.
         """
         flow_control = types.FlowControl(*flow_control)
-        subscr = self._policy_class(self, subscription, flow_control)
+        # Only pass the optional arguments when they are needed, so that
+        # custom policy classes without them keep working.
+        kwargs = {}
+        if streams != 1:
+            kwargs['streams'] = streams
+        if callback_batch_size is not None:
+            kwargs['callback_batch_size'] = callback_batch_size
+        subscr = self._policy_class(
+            self, subscription, flow_control, **kwargs)
         if callable(callback):
             subscr.open(callback)
         elif callback is not None:
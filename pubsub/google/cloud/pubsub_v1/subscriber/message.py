@@ -66,6 +66,17 @@ class Message(object):
             published.
     """
 
+    # Subscribers may hold many thousands of messages at once; do not give
+    # each of them a ``__dict__``.
+    __slots__ = (
+        '_message',
+        '_ack_id',
+        '_request_queue',
+        '_received_timestamp',
+        '_size',
+        'message_id',
+    )
+
     def __init__(self, message, ack_id, request_queue):
         """Construct the Message.
 
@@ -86,6 +97,9 @@ class Message(object):
         self._ack_id = ack_id
         self._request_queue = request_queue
         self.message_id = message.message_id
+        # The size is sent along with every request about this message, and
+        # the underlying message does not change; compute it once.
+        self._size = message.ByteSize()
 
         # The instantiation time is the time that this message
         # was received. Tracking this provides us a way to be smart about
@@ -154,7 +168,7 @@ class Message(object):
     @property
     def size(self):
         """Return the size of the underlying message, in bytes."""
-        return self._message.ByteSize()
+        return self._size
 
     def ack(self):
         """Acknowledge the given message.
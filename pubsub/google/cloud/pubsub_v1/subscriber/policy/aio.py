@@ -0,0 +1,255 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A subscription policy based on :mod:`asyncio`.
+
+.. note::
+
+    This module requires Python 3.5 or later.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import inspect
+import logging
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber.policy import base
+from google.cloud.pubsub_v1.subscriber.message import Message
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _DispatchQueue(object):
+    """The request queue handed to messages.
+
+    Rather than queueing the requests made by messages (acks, leases, etc.)
+    for a worker, they are dispatched to the policy immediately; handling
+    them does not block.
+
+    Args:
+        policy (~.pubsub_v1.subscriber.policy.base.BasePolicy): The policy
+            which handles the requests.
+    """
+    def __init__(self, policy):
+        self._policy = policy
+
+    def put(self, item):
+        """Dispatch a request to the policy.
+
+        Args:
+            item (Tuple[str, Dict[str, Any]]): The action and its keyword
+                arguments.
+        """
+        action, kwargs = item
+        self._policy.dispatch_callback(action, kwargs)
+
+
+def _set_exception(future, exception):
+    """Fail the subscription's future, unless it is already done.
+
+    Args:
+        future (asyncio.Future): The future returned by ``open``.
+        exception (Exception): The exception raised by the stream.
+    """
+    if not future.done():
+        future.set_exception(exception)
+
+
+class Policy(base.BasePolicy):
+    """A consumer class based on :mod:`asyncio`.
+
+    Messages are dispatched to the callback on an event loop, rather than
+    on a thread pool. The callback may be a coroutine function (``async
+    def``); at most ``flow_control.max_messages`` callbacks run at once.
+    Lease maintenance runs as a task on the event loop too, so that only
+    the streaming pull RPC itself (which is blocking) needs a thread per
+    stream.
+
+    Pass this class as the ``policy_class`` argument to
+    :class:`~.pubsub_v1.SubscriberClient` to use it, and call :meth:`open`
+    and :meth:`close` from the event loop thread.
+
+    Args:
+        client (~.pubsub_v1.subscriber.client): The subscriber client used
+            to create this instance.
+        subscription (str): The name of the subscription. The canonical
+            format for this is
+            ``projects/{project}/subscriptions/{subscription}``.
+        flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow
+            control settings.
+        loop (~asyncio.AbstractEventLoop): (Optional.) The event loop to run
+            the callbacks on. Defaults to the current event loop when the
+            policy is opened.
+        streams (int): (Optional.) The number of streaming pull streams to
+            open in parallel. Defaults to one.
+    """
+
+    def __init__(self, client, subscription, flow_control=types.FlowControl(),
+                 loop=None, streams=1):
+        super(Policy, self).__init__(
+            client=client,
+            flow_control=flow_control,
+            subscription=subscription,
+            streams=streams,
+        )
+        self._loop = loop
+        # The **actual** callback is provided by ``.open()``.
+        self._callback = None
+        self._request_queue = _DispatchQueue(self)
+        # Created on the event loop, since (before Python 3.10) it binds to
+        # the current event loop.
+        self._semaphore = None
+        # The task created in ``.open()``.
+        self._leases_task = None
+
+    def close(self):
+        """Close the existing connection.
+
+        .. note::
+
+            This blocks the event loop until the streams have stopped.
+
+        Returns:
+            asyncio.Future: The future that **was** attached to the
+            subscription.
+
+        Raises:
+            ValueError: If the policy has not been opened yet.
+        """
+        if self._future is None:
+            raise ValueError('This policy has not been opened yet.')
+
+        # Stop consuming messages.
+        self._consumer.stop_consuming()
+        self._leases_task.cancel()
+        self._leases_task = None
+
+        # The subscription is closing cleanly; resolve the future if it is not
+        # resolved already.
+        if not self._future.done():
+            self._future.set_result(None)
+        future = self._future
+        self._future = None
+        return future
+
+    def open(self, callback):
+        """Open a streaming pull connection and begin receiving messages.
+
+        For each message received, the ``callback`` is called on the event
+        loop with a :class:`~.pubsub_v1.subscriber.message.Message` as its
+        only argument. If it returns an awaitable (e.g. it is a coroutine
+        function), that is awaited.
+
+        Args:
+            callback (Callable): The callback function.
+
+        Returns:
+            asyncio.Future: A future which can be awaited to wait on the
+            subscription, and to handle errors.
+
+        Raises:
+            ValueError: If the policy has already been opened.
+        """
+        if self._future is not None:
+            raise ValueError('This policy has already been opened.')
+
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        self._future = self._loop.create_future()
+
+        self._callback = callback
+        # Actually start consuming messages.
+        self._consumer.start_consuming(self)
+        self._leases_task = self._loop.create_task(self._maintain_leases())
+
+        return self._future
+
+    async def _maintain_leases(self):
+        """Maintain all of the leases being managed by the policy.
+
+        This is the counterpart of :meth:`maintain_leases` which sleeps on
+        the event loop, rather than blocking a thread.
+        """
+        while self._consumer.active:
+            snooze = self._renew_leases()
+            _LOGGER.debug('Snoozing lease management for %f seconds.', snooze)
+            await asyncio.sleep(snooze)
+        _LOGGER.debug('Consumer inactive, ending lease maintenance.')
+
+    def on_exception(self, exception):
+        """Handle the exception.
+
+        If the exception is one of the retryable exceptions, this will signal
+        to the consumer thread that it should "recover" from the failure.
+
+        This will cause the stream to exit when it returns :data:`False`.
+
+        Returns:
+            bool: Indicates if the caller should recover or shut down.
+            Will be :data:`True` if the ``exception`` is "acceptable", i.e.
+            in a list of retryable / idempotent exceptions.
+        """
+        if isinstance(exception, self._RETRYABLE_STREAM_ERRORS):
+            return True
+
+        # Set any other exception on the future; this is called from the
+        # consumer thread, and the future belongs to the event loop.
+        self._loop.call_soon_threadsafe(
+            _set_exception, self._future, exception)
+        return False
+
+    def on_response(self, response):
+        """Process all received Pub/Sub messages.
+
+        The messages are leased immediately, on the consumer thread, so that
+        flow control applies to them; their callbacks are then scheduled on
+        the event loop, all at once.
+        """
+        messages = [
+            Message(msg.message, msg.ack_id, self._request_queue)
+            for msg in response.received_messages
+        ]
+        self._loop.call_soon_threadsafe(self._schedule, messages)
+
+    def _schedule(self, messages):
+        """Start a task to run the callback for each message.
+
+        Args:
+            messages (List[~.pubsub_v1.subscriber.message.Message]): The
+                received messages.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.flow_control.max_messages)
+        for message in messages:
+            self._loop.create_task(self._run_callback(message))
+
+    async def _run_callback(self, message):
+        """Run the callback for a message, awaiting its result if needed.
+
+        Args:
+            message (~.pubsub_v1.subscriber.message.Message): The message.
+        """
+        async with self._semaphore:
+            try:
+                result = self._callback(message)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception:
+                _LOGGER.exception(
+                    'Callback failed for message %s.', message.message_id)
+            else:
+                _LOGGER.debug('Result: %s', result)
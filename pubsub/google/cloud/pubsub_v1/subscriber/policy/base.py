@@ -27,10 +27,23 @@ import six
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber import _consumer
 from google.cloud.pubsub_v1.subscriber import _histogram
+from google.cloud.pubsub_v1.subscriber import _leaser
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# The maximum number of ack IDs sent in a single request to modify ack
+# deadlines, which keeps each request well under the API's size limit.
+_MAX_ACK_IDS_PER_REQUEST = 2500
+
+# Leases are renewed when they would otherwise expire before the next
+# lease maintenance cycle plus this many seconds, to allow for latency.
+_LEASE_RENEWAL_GRACE = 2
+
+# The time, in seconds, for the weight of an ack time in the histogram to
+# halve, so that the ack deadline adapts back down after slow periods.
+_HISTOGRAM_HALF_LIFE = 10 * 60
+
 
 @six.add_metaclass(abc.ABCMeta)
 class BasePolicy(object):
@@ -53,38 +66,40 @@ class BasePolicy(object):
             ``projects/{project}/subscriptions/{subscription}``.
         flow_control (google.cloud.pubsub_v1.types.FlowControl): The flow
             control settings.
-        histogram_data (dict): Optional: A structure to store the histogram
-            data for predicting appropriate ack times. If set, this should
-            be a dictionary-like object.
-
-            .. note::
-                Additionally, the histogram relies on the assumption
-                that the dictionary will properly sort keys provided
-                that all keys are positive integers. If you are sending
-                your own dictionary class, ensure this assumption holds
-                or you will get strange behavior.
+        histogram_data (dict): Optional: Initial histogram data for
+            predicting appropriate ack times, mapping ack times (in seconds)
+            to the number of times each was seen.
+        streams (int): Optional: The number of streaming pull streams to
+            open in parallel. All of the streams share the flow control
+            settings and lease management. Defaults to one.
     """
 
-    _managed_ack_ids = None
     _RETRYABLE_STREAM_ERRORS = (
         exceptions.DeadlineExceeded,
         exceptions.ServiceUnavailable,
     )
 
     def __init__(self, client, subscription,
-                 flow_control=types.FlowControl(), histogram_data=None):
+                 flow_control=types.FlowControl(), histogram_data=None,
+                 streams=1):
         self._client = client
         self._subscription = subscription
-        self._consumer = _consumer.Consumer()
+        if streams == 1:
+            self._consumer = _consumer.Consumer()
+        else:
+            self._consumer = _consumer.MultiConsumer(streams)
         self._ack_deadline = 10
         self._last_histogram_size = 0
         self._future = None
         self.flow_control = flow_control
-        self.histogram = _histogram.Histogram(data=histogram_data)
+        self.histogram = _histogram.Histogram(
+            data=histogram_data, half_life=_HISTOGRAM_HALF_LIFE)
 
         # These are for internal flow control tracking.
         # They should not need to be used by subclasses.
-        self._bytes = 0
+        self._leaser = _leaser.Leaser(
+            max_lease_duration=flow_control.max_lease_duration)
+        self._stream_ack_deadline = 10
         self._ack_on_resume = set()
 
     @property
@@ -121,11 +136,9 @@ class BasePolicy(object):
         """Return the ack IDs currently being managed by the policy.
 
         Returns:
-            set: The set of ack IDs being managed.
+            set: A snapshot of the set of ack IDs being managed.
         """
-        if self._managed_ack_ids is None:
-            self._managed_ack_ids = set()
-        return self._managed_ack_ids
+        return set(self._leaser.ack_ids)
 
     @property
     def subscription(self):
@@ -154,8 +167,8 @@ class BasePolicy(object):
             float: The load value.
         """
         return max([
-            len(self.managed_ack_ids) / self.flow_control.max_messages,
-            self._bytes / self.flow_control.max_bytes,
+            len(self._leaser) / self.flow_control.max_messages,
+            self._leaser.bytes / self.flow_control.max_bytes,
         ])
 
     def ack(self, ack_id, time_to_ack=None, byte_size=None):
@@ -199,23 +212,50 @@ class BasePolicy(object):
         """
         return self._client.api.streaming_pull(request_generator)
 
+    def dispatch_callback(self, action, kwargs):
+        """Map the callback request to the appropriate gRPC request.
+
+        Args:
+            action (str): The method to be invoked.
+            kwargs (Dict[str, Any]): The keyword arguments for the method
+                specified by ``action``.
+
+        Raises:
+            ValueError: If ``action`` isn't one of the expected actions
+                "ack", "drop", "lease", "modify_ack_deadline" or "nack".
+        """
+        if action == 'ack':
+            self.ack(**kwargs)
+        elif action == 'drop':
+            self.drop(**kwargs)
+        elif action == 'lease':
+            self.lease(**kwargs)
+        elif action == 'modify_ack_deadline':
+            self.modify_ack_deadline(**kwargs)
+        elif action == 'nack':
+            self.nack(**kwargs)
+        else:
+            raise ValueError(
+                'Unexpected action', action,
+                'Must be one of "ack", "drop", "lease", '
+                '"modify_ack_deadline" or "nack".')
+
     def drop(self, ack_id, byte_size):
         """Remove the given ack ID from lease management.
 
         Args:
             ack_id (str): The ack ID.
-            byte_size (int): The size of the PubSub message, in bytes.
+            byte_size (int): The size of the PubSub message, in bytes. This
+                is unused; the size recorded by :meth:`lease` is used
+                instead.
         """
-        # Remove the ack ID from lease management, and decrement the
-        # byte counter.
-        if ack_id in self.managed_ack_ids:
-            self.managed_ack_ids.remove(ack_id)
-            self._bytes -= byte_size
-            if self._bytes < 0:
-                _LOGGER.debug(
-                    'Bytes was unexpectedly negative: %d', self._bytes)
-                self._bytes = 0
+        # Remove the ack ID from lease management (which also decrements
+        # the byte counter).
+        self._leaser.remove(ack_id)
+        self._maybe_resume()
 
+    def _maybe_resume(self):
+        """Resume the consumer if it is paused and within its limits."""
         # If we have been paused by flow control, check and see if we are
         # back within our limits.
         #
@@ -226,7 +266,7 @@ class BasePolicy(object):
                 self._load < self.flow_control.resume_threshold):
             self._consumer.resume()
 
-    def get_initial_request(self, ack_queue=False):
+    def get_initial_request(self, ack_queue=False, extend_leases=True):
         """Return the initial request.
 
         This defines the initial request that must always be sent to Pub/Sub
@@ -235,6 +275,9 @@ class BasePolicy(object):
         Args:
             ack_queue (bool): Whether to include any acks that were sent
                 while the connection was paused.
+            extend_leases (bool): Whether to extend the ack deadline of the
+                messages under lease management. When several streams are
+                open for the subscription, only one of them needs to.
 
         Returns:
             google.cloud.pubsub_v1.types.StreamingPullRequest: A request
@@ -251,17 +294,21 @@ class BasePolicy(object):
         # Any ack IDs that are under lease management and not being acked
         # need to have their deadline extended immediately.
         ack_ids = set()
-        lease_ids = self.managed_ack_ids
+        lease_ids = self.managed_ack_ids if extend_leases else set()
         if ack_queue:
             ack_ids = self._ack_on_resume
             lease_ids = lease_ids.difference(ack_ids)
 
+        # Messages received on the new stream are leased for the stream's
+        # ack deadline; remember it so that they are renewed in time.
+        self._stream_ack_deadline = self.histogram.percentile(99)
+
         # Put the request together.
         request = types.StreamingPullRequest(
             ack_ids=list(ack_ids),
             modify_deadline_ack_ids=list(lease_ids),
             modify_deadline_seconds=[self.ack_deadline] * len(lease_ids),
-            stream_ack_deadline_seconds=self.histogram.percentile(99),
+            stream_ack_deadline_seconds=self._stream_ack_deadline,
             subscription=self.subscription,
         )
 
@@ -280,11 +327,10 @@ class BasePolicy(object):
             ack_id (str): The ack ID.
             byte_size (int): The size of the PubSub message, in bytes.
         """
-        # Add the ack ID to the set of managed ack IDs, and increment
-        # the size counter.
-        if ack_id not in self.managed_ack_ids:
-            self.managed_ack_ids.add(ack_id)
-            self._bytes += byte_size
+        # Add the ack ID to the managed ack IDs (which also increments the
+        # size counter). Until it is first renewed, the lease is the one
+        # granted on delivery, which lasts for the stream's ack deadline.
+        self._leaser.add(ack_id, byte_size, self._stream_ack_deadline)
 
         # Sanity check: Do we have too many things in our inventory?
         # If we do, we need to stop the stream.
@@ -294,9 +340,9 @@ class BasePolicy(object):
     def maintain_leases(self):
         """Maintain all of the leases being managed by the policy.
 
-        This method modifies the ack deadline for all of the managed
-        ack IDs, then waits for most of that time (but with jitter), and
-        then calls itself.
+        This method periodically modifies the ack deadline for the managed
+        ack IDs whose leases are about to expire. Leases held for longer than
+        ``flow_control.max_lease_duration`` are dropped instead.
 
         .. warning::
             This method blocks, and generally should be run in a separate
@@ -313,39 +359,65 @@ class BasePolicy(object):
                 _LOGGER.debug('Consumer inactive, ending lease maintenance.')
                 return
 
-            # Determine the appropriate duration for the lease. This is
-            # based off of how long previous messages have taken to ack, with
-            # a sensible default and within the ranges allowed by Pub/Sub.
-            p99 = self.histogram.percentile(99)
-            _LOGGER.debug('The current p99 value is %d seconds.', p99)
-
-            # Create a streaming pull request.
-            # We do not actually call `modify_ack_deadline` over and over
-            # because it is more efficient to make a single request.
-            ack_ids = list(self.managed_ack_ids)
-            _LOGGER.debug('Renewing lease for %d ack IDs.', len(ack_ids))
-            if ack_ids:
-                request = types.StreamingPullRequest(
-                    modify_deadline_ack_ids=ack_ids,
-                    modify_deadline_seconds=[p99] * len(ack_ids),
-                )
-                # NOTE: This may not work as expected if ``consumer.active``
-                #       has changed since we checked it. An implementation
-                #       without any sort of race condition would require a
-                #       way for ``send_request`` to fail when the consumer
-                #       is inactive.
-                self._consumer.send_request(request)
+            snooze = self._renew_leases()
 
             # Now wait an appropriate period of time and do this again.
-            #
-            # We determine the appropriate period of time based on a random
-            # period between 0 seconds and 90% of the lease. This use of
-            # jitter (http://bit.ly/2s2ekL7) helps decrease contention in cases
-            # where there are many clients.
-            snooze = random.uniform(0.0, p99 * 0.9)
             _LOGGER.debug('Snoozing lease management for %f seconds.', snooze)
             time.sleep(snooze)
 
+    def _renew_leases(self):
+        """Run a single cycle of lease maintenance.
+
+        This renews the leases which are about to expire and drops those
+        held for too long; see :meth:`maintain_leases`. It does not block,
+        so that policies based on other concurrency models can schedule the
+        cycles themselves.
+
+        Returns:
+            float: The time, in seconds, to wait before the next cycle.
+        """
+        # Determine the appropriate duration for the lease. This is
+        # based off of how long previous messages have taken to ack, with
+        # a sensible default and within the ranges allowed by Pub/Sub.
+        p99 = self.histogram.percentile(99)
+        _LOGGER.debug('The current p99 value is %d seconds.', p99)
+
+        # Wake up at least ten times per lease. The use of jitter
+        # (http://bit.ly/2s2ekL7) helps decrease contention in cases
+        # where there are many clients.
+        interval = max(p99 / 10, 1.0)
+        snooze = random.uniform(interval / 2, interval)
+
+        # Only renew the leases which would expire before the next cycle;
+        # the others are left alone until they get close.
+        ack_ids, expired = self._leaser.renew(
+            horizon=interval + _LEASE_RENEWAL_GRACE, seconds=p99)
+        if expired:
+            _LOGGER.debug(
+                'Dropped %d leases held for longer than %s seconds.',
+                len(expired), self.flow_control.max_lease_duration)
+            self._maybe_resume()
+
+        # Create streaming pull requests, each with a bounded number of
+        # ack IDs. We do not actually call `modify_ack_deadline` over and
+        # over because it is more efficient to make fewer requests.
+        _LOGGER.debug('Renewing lease for %d ack IDs.', len(ack_ids))
+        for start in six.moves.range(
+                0, len(ack_ids), _MAX_ACK_IDS_PER_REQUEST):
+            chunk = ack_ids[start:start + _MAX_ACK_IDS_PER_REQUEST]
+            request = types.StreamingPullRequest(
+                modify_deadline_ack_ids=chunk,
+                modify_deadline_seconds=[p99] * len(chunk),
+            )
+            # NOTE: This may not work as expected if ``consumer.active``
+            #       has changed since we checked it. An implementation
+            #       without any sort of race condition would require a
+            #       way for ``send_request`` to fail when the consumer
+            #       is inactive.
+            self._consumer.send_request(request)
+
+        return snooze
+
     def modify_ack_deadline(self, ack_id, seconds):
         """Modify the ack deadline for the given ack_id.
 
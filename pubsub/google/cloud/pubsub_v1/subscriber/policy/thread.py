@@ -20,6 +20,7 @@ import sys
 import threading
 
 import grpc
+import six
 from six.moves import queue as queue_mod
 
 from google.cloud.pubsub_v1 import types
@@ -82,14 +83,25 @@ class Policy(base.BasePolicy):
         queue (~queue.Queue): (Optional.) A Queue instance, appropriate
             for crossing the concurrency boundary implemented by
             ``executor``.
+        streams (int): (Optional.) The number of streaming pull streams to
+            open in parallel. They share the flow control settings, lease
+            management and ``executor``. Defaults to one.
+        callback_batch_size (Union[int, float]): (Optional.) If set, the
+            callback receives a list of up to this many messages from the
+            same response, rather than a single message, and each list is
+            handled by a single ``executor`` task. Use ``float('inf')`` to
+            receive all of the messages in a response at once. Batching
+            reduces the per-message overhead for small messages.
     """
 
     def __init__(self, client, subscription, flow_control=types.FlowControl(),
-                 executor=None, queue=None):
+                 executor=None, queue=None, streams=1,
+                 callback_batch_size=None):
         super(Policy, self).__init__(
             client=client,
             flow_control=flow_control,
             subscription=subscription,
+            streams=streams,
         )
         # Default the callback to a no-op; the **actual** callback is
         # provided by ``.open()``.
@@ -98,9 +110,14 @@ class Policy(base.BasePolicy):
         self._request_queue = self._get_queue(queue)
         # Also maintain an executor.
         self._executor = self._get_executor(executor)
+        if callback_batch_size is not None and callback_batch_size < 1:
+            raise ValueError('The callback batch size must be positive.')
+        self._callback_batch_size = callback_batch_size
         # The threads created in ``.open()``.
         self._dispatch_thread = None
         self._leases_thread = None
+        # Guards failing ``_future``, from any of the consumer threads.
+        self._future_lock = threading.Lock()
 
     @staticmethod
     def _get_queue(queue):
@@ -275,34 +292,6 @@ class Policy(base.BasePolicy):
         # Return the future.
         return self._future
 
-    def dispatch_callback(self, action, kwargs):
-        """Map the callback request to the appropriate gRPC request.
-
-        Args:
-            action (str): The method to be invoked.
-            kwargs (Dict[str, Any]): The keyword arguments for the method
-                specified by ``action``.
-
-        Raises:
-            ValueError: If ``action`` isn't one of the expected actions
-                "ack", "drop", "lease", "modify_ack_deadline" or "nack".
-        """
-        if action == 'ack':
-            self.ack(**kwargs)
-        elif action == 'drop':
-            self.drop(**kwargs)
-        elif action == 'lease':
-            self.lease(**kwargs)
-        elif action == 'modify_ack_deadline':
-            self.modify_ack_deadline(**kwargs)
-        elif action == 'nack':
-            self.nack(**kwargs)
-        else:
-            raise ValueError(
-                'Unexpected action', action,
-                'Must be one of "ack", "drop", "lease", '
-                '"modify_ack_deadline" or "nack".')
-
     def on_exception(self, exception):
         """Handle the exception.
 
@@ -321,19 +310,44 @@ class Policy(base.BasePolicy):
         if isinstance(exception, self._RETRYABLE_STREAM_ERRORS):
             return True
 
-        # Set any other exception on the future.
-        self._future.set_exception(exception)
+        # Set any other exception on the future, unless another stream
+        # already did.
+        with self._future_lock:
+            if not self._future.done():
+                self._future.set_exception(exception)
         return False
 
     def on_response(self, response):
         """Process all received Pub/Sub messages.
 
-        For each message, schedule a callback with the executor.
+        For each message, schedule a callback with the executor. If the
+        policy was created with a ``callback_batch_size``, schedule a
+        callback for each batch of messages instead.
         """
-        for msg in response.received_messages:
-            _LOGGER.debug(
-                'Using %s to process new message received:\n%r',
-                self._callback, msg)
-            message = Message(msg.message, msg.ack_id, self._request_queue)
-            future = self._executor.submit(self._callback, message)
+        received_messages = response.received_messages
+        _LOGGER.debug('Using %s to process %d new messages.',
+                      self._callback, len(received_messages))
+        request_queue = self._request_queue
+        messages = [
+            Message(msg.message, msg.ack_id, request_queue)
+            for msg in received_messages
+        ]
+
+        batch_size = self._callback_batch_size
+        if batch_size is None:
+            for message in messages:
+                future = self._executor.submit(self._callback, message)
+                future.add_done_callback(_callback_completed)
+            return
+
+        if batch_size >= len(messages):
+            batches = [messages] if messages else []
+        else:
+            batch_size = int(batch_size)
+            batches = [
+                messages[start:start + batch_size]
+                for start in six.moves.range(0, len(messages), batch_size)
+            ]
+        for batch in batches:
+            future = self._executor.submit(self._callback, batch)
             future.add_done_callback(_callback_completed)
@@ -53,16 +53,58 @@ BatchSettings.__new__.__defaults__ = (
 # The defaults should be fine for most use cases.
 FlowControl = collections.namedtuple(
     'FlowControl',
-    ['max_bytes', 'max_messages', 'resume_threshold'],
+    ['max_bytes', 'max_messages', 'resume_threshold', 'max_lease_duration'],
 )
 FlowControl.__new__.__defaults__ = (
     psutil.virtual_memory().total * 0.2,  # max_bytes: 20% of total RAM
     float('inf'),                         # max_messages: no limit
     0.8,                                  # resume_threshold: 80%
+    2 * 60 * 60,                          # max_lease_duration: 2 hours
 )
 
 
-names = ['BatchSettings', 'FlowControl']
+class LimitExceededBehavior(object):
+    """An enum-like class of the actions taken when publishing would
+    exceed the publisher's flow control limits.
+
+    * ``IGNORE``: Track outstanding messages, but never limit them.
+    * ``BLOCK``: Block the caller of ``publish`` until enough outstanding
+      messages have been published to make room.
+    * ``ERROR``: Raise :exc:`~.publisher.exceptions.FlowControlLimitError`.
+    * ``DROP_OLDEST``: Drop the oldest messages which have not yet been sent
+      (failing their futures with
+      :exc:`~.publisher.exceptions.FlowControlLimitError`), falling back to
+      blocking if every outstanding message is already being sent.
+    """
+    IGNORE = 'ignore'
+    BLOCK = 'block'
+    ERROR = 'error'
+    DROP_OLDEST = 'drop oldest'
+
+
+# Define the type class and default values for publisher flow control.
+#
+# This class is used when creating a publisher client, and bounds the number
+# and total size of messages which have been published but whose futures
+# have not yet completed (i.e. messages buffered in batches or in flight).
+# By default, outstanding messages are tracked but not limited.
+PublishFlowControl = collections.namedtuple(
+    'PublishFlowControl',
+    ['message_limit', 'byte_limit', 'limit_exceeded_behavior'],
+)
+PublishFlowControl.__new__.__defaults__ = (
+    10 * BatchSettings.__new__.__defaults__[2],  # message_limit: 10,000
+    10 * BatchSettings.__new__.__defaults__[0],  # byte_limit: 50 MB
+    LimitExceededBehavior.IGNORE,                # limit_exceeded_behavior
+)
+
+
+names = [
+    'BatchSettings',
+    'FlowControl',
+    'LimitExceededBehavior',
+    'PublishFlowControl',
+]
 for name, message in get_messages(pubsub_pb2).items():
     message.__module__ = 'google.cloud.pubsub_v1.types'
     setattr(sys.modules[__name__], name, message)
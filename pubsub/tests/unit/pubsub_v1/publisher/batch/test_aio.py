@@ -0,0 +1,226 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+import mock
+import pytest
+
+if sys.version_info < (3, 5):
+    pytest.skip('asyncio support requires Python 3.5.',
+                allow_module_level=True)
+
+import asyncio  # noqa: E402
+
+import google.api_core.exceptions  # noqa: E402
+from google.auth import credentials  # noqa: E402
+from google.cloud.pubsub_v1 import publisher  # noqa: E402
+from google.cloud.pubsub_v1 import types  # noqa: E402
+from google.cloud.pubsub_v1.publisher import exceptions  # noqa: E402
+from google.cloud.pubsub_v1.publisher.batch import aio  # noqa: E402
+from google.cloud.pubsub_v1.publisher.batch.base import BatchStatus  # noqa
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def create_client():
+    creds = mock.Mock(spec=credentials.Credentials)
+    return publisher.Client(credentials=creds, batch_class=aio.Batch)
+
+
+def create_batch(loop, autocommit=False, **batch_settings):
+    client = create_client()
+    settings = types.BatchSettings(**batch_settings)
+    return aio.Batch(
+        client, 'topic_name', settings, autocommit=autocommit, loop=loop)
+
+
+def run_commit(loop, batch):
+    """Commit the batch and run the event loop until the commit is done."""
+    batch.commit()
+    loop.run_until_complete(asyncio.sleep(0))
+    while batch.status == BatchStatus.IN_PROGRESS:
+        loop.run_until_complete(asyncio.sleep(0.001))
+
+
+def test_init_autocommit(loop):
+    batch = create_batch(loop, autocommit=True, max_latency=0.01)
+    assert batch.status == BatchStatus.ACCEPTING_MESSAGES
+    assert batch._timer is not None
+
+    # The timer commits the batch, without a thread.
+    with mock.patch.object(type(batch.client.api), 'publish') as publish:
+        loop.run_until_complete(asyncio.sleep(0.02))
+    publish.assert_not_called()
+    assert batch.status == BatchStatus.SUCCESS
+    assert batch._timer is None
+
+
+def test_init_infinite_latency(loop):
+    batch = create_batch(loop, autocommit=True, max_latency=float('inf'))
+    assert batch._timer is None
+
+
+def test_publish(loop):
+    batch = create_batch(loop)
+    message = types.PubsubMessage(data=b'foo')
+    future = batch.publish(message)
+
+    assert isinstance(future, asyncio.Future)
+    assert batch.messages == [message]
+    assert batch.size == message.ByteSize()
+
+
+def test_publish_not_will_accept(loop):
+    batch = create_batch(loop, max_bytes=0)
+    assert batch.publish(types.PubsubMessage(data=b'foo')) is None
+    assert batch.messages == []
+
+
+def test_publish_exceed_max_messages(loop):
+    batch = create_batch(loop, max_messages=2)
+    with mock.patch.object(batch, 'commit') as commit:
+        batch.publish({'data': b'foo'})
+        commit.assert_not_called()
+        batch.publish({'data': b'bar'})
+        commit.assert_called_once_with()
+
+
+def test_commit(loop):
+    batch = create_batch(loop)
+    futures = [
+        batch.publish({'data': b'foo'}),
+        batch.publish({'data': b'bar'}),
+    ]
+    publish_response = types.PublishResponse(message_ids=['a', 'b'])
+    with mock.patch.object(
+            type(batch.client.api), 'publish',
+            return_value=publish_response) as publish:
+        run_commit(loop, batch)
+
+    publish.assert_called_once_with('topic_name', batch.messages)
+    assert batch.status == BatchStatus.SUCCESS
+    assert [future.result() for future in futures] == ['a', 'b']
+
+
+def test_commit_no_op(loop):
+    batch = create_batch(loop)
+    batch._status = BatchStatus.IN_PROGRESS
+    with mock.patch.object(loop, 'create_task') as create_task:
+        batch.commit()
+    create_task.assert_not_called()
+
+
+def test_commit_cancels_timer(loop):
+    batch = create_batch(loop, autocommit=True)
+    timer = batch._timer
+    with mock.patch.object(loop, 'create_task') as create_task:
+        batch.commit()
+    create_task.call_args[0][0].close()
+    assert timer.cancelled()
+    assert batch._timer is None
+    assert batch.status == BatchStatus.STARTING
+
+
+def test_commit_no_messages(loop):
+    batch = create_batch(loop)
+    with mock.patch.object(type(batch.client.api), 'publish') as publish:
+        run_commit(loop, batch)
+    publish.assert_not_called()
+    assert batch.status == BatchStatus.SUCCESS
+
+
+def test_commit_api_error(loop):
+    batch = create_batch(loop)
+    future = batch.publish({'data': b'foo'})
+    error = google.api_core.exceptions.InternalServerError('uh oh')
+    with mock.patch.object(
+            type(batch.client.api), 'publish', side_effect=error):
+        run_commit(loop, batch)
+
+    assert batch.status == BatchStatus.ERROR
+    assert future.exception() is error
+
+
+def test_commit_wrong_messageid_length(loop):
+    batch = create_batch(loop)
+    futures = [
+        batch.publish({'data': b'foo'}),
+        batch.publish({'data': b'bar'}),
+    ]
+    publish_response = types.PublishResponse(message_ids=['a'])
+    with mock.patch.object(
+            type(batch.client.api), 'publish',
+            return_value=publish_response):
+        run_commit(loop, batch)
+
+    assert batch.status == BatchStatus.ERROR
+    for future in futures:
+        assert isinstance(future.exception(), exceptions.PublishError)
+
+
+def test_commit_cancelled_future(loop):
+    batch = create_batch(loop)
+    cancelled = batch.publish({'data': b'foo'})
+    future = batch.publish({'data': b'bar'})
+    cancelled.cancel()
+    publish_response = types.PublishResponse(message_ids=['a', 'b'])
+    with mock.patch.object(
+            type(batch.client.api), 'publish',
+            return_value=publish_response):
+        run_commit(loop, batch)
+
+    assert batch.status == BatchStatus.SUCCESS
+    assert future.result() == 'b'
+
+
+def test_remove(loop):
+    batch = create_batch(loop)
+    future1 = batch.publish({'data': b'foo'})
+    future2 = batch.publish({'data': b'bar'})
+
+    assert batch.remove(future1) is True
+    assert batch.messages == [types.PubsubMessage(data=b'bar')]
+    assert batch.size == batch.messages[0].ByteSize()
+    assert batch.remove(future1) is False
+    assert batch.remove(future2) is True
+    assert batch.messages == []
+
+
+def test_remove_not_accepting(loop):
+    batch = create_batch(loop)
+    future = batch.publish({'data': b'foo'})
+    batch._status = BatchStatus.STARTING
+    assert batch.remove(future) is False
+
+
+def test_client_publish(loop):
+    client = create_client()
+    publish_response = types.PublishResponse(message_ids=['a'])
+
+    asyncio.set_event_loop(loop)
+    try:
+        with mock.patch.object(
+                type(client.api), 'publish', return_value=publish_response):
+            future = client.publish('topic_name', b'foo')
+            assert loop.run_until_complete(future) == 'a'
+    finally:
+        asyncio.set_event_loop(None)
+
+    assert client.flow_controller.message_count == 0
@@ -76,3 +76,15 @@ def test_will_not_accept_number():
     )
     message = types.PubsubMessage(data=b'abc')
     assert batch.will_accept(message) is False
+
+
+def test_remove_not_supported():
+    batch = create_batch(status=BatchStatus.ACCEPTING_MESSAGES)
+    assert batch.remove(mock.sentinel.future) is False
+
+
+def test_make_future():
+    batch = create_batch(status=BatchStatus.ACCEPTING_MESSAGES)
+    future = batch.make_future()
+    assert future.done() is False
+    assert future is not batch.make_future()
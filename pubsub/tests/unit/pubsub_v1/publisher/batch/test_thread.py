@@ -17,6 +17,7 @@ import time
 
 import mock
 
+import google.api_core.exceptions
 from google.auth import credentials
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
@@ -149,6 +150,24 @@ def test_blocking__commit():
     assert futures[1].result() == 'b'
 
 
+def test_blocking__commit_api_error():
+    batch = create_batch()
+    futures = (
+        batch.publish({'data': b'This is my message.'}),
+        batch.publish({'data': b'This is another message.'}),
+    )
+
+    error = google.api_core.exceptions.InternalServerError('uh oh')
+    patch = mock.patch.object(
+        type(batch.client.api), 'publish', side_effect=error)
+    with patch:
+        batch._commit()
+
+    assert batch.status == BatchStatus.ERROR
+    for future in futures:
+        assert future.exception() is error
+
+
 @mock.patch.object(thread, '_LOGGER')
 def test_blocking__commit_starting(_LOGGER):
     batch = create_batch()
@@ -300,3 +319,26 @@ def test_publish_dict():
         data=b'foobarbaz', attributes={'spam': 'eggs'})
     assert batch.messages == [expected_message]
     assert batch._futures == [future]
+
+
+def test_remove():
+    batch = create_batch()
+    future1 = batch.publish(types.PubsubMessage(data=b'spam'))
+    future2 = batch.publish(types.PubsubMessage(data=b'eggs'))
+    size = batch.size
+
+    assert batch.remove(future1) is True
+    assert batch.messages == [types.PubsubMessage(data=b'eggs')]
+    assert batch._futures == [future2]
+    assert batch.size == size - types.PubsubMessage(data=b'spam').ByteSize()
+
+    # A second removal of the same future is a no-op.
+    assert batch.remove(future1) is False
+
+
+def test_remove_not_accepting():
+    batch = create_batch()
+    future = batch.publish(types.PubsubMessage(data=b'spam'))
+    batch._status = BatchStatus.IN_PROGRESS
+    assert batch.remove(future) is False
+    assert len(batch.messages) == 1
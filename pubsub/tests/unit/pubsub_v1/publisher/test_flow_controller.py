@@ -0,0 +1,138 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.flow_controller import FlowController
+
+
+def _message(data=b'spam'):
+    return types.PubsubMessage(data=data)
+
+
+def _flow_controller(behavior, **kwargs):
+    settings = types.PublishFlowControl(
+        limit_exceeded_behavior=behavior, **kwargs)
+    return FlowController(settings)
+
+
+def test_defaults():
+    flow_controller = FlowController()
+    assert flow_controller.settings == types.PublishFlowControl()
+    assert flow_controller.message_count == 0
+    assert flow_controller.byte_count == 0
+    assert flow_controller.load == 0.0
+
+
+def test_add_and_release():
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.ERROR, message_limit=4)
+    message = _message()
+
+    flow_controller.add(message)
+    flow_controller.add(message)
+    assert flow_controller.message_count == 2
+    assert flow_controller.byte_count == 2 * message.ByteSize()
+    assert flow_controller.load == 0.5
+
+    flow_controller.release(message)
+    assert flow_controller.message_count == 1
+    assert flow_controller.byte_count == message.ByteSize()
+
+
+def test_release_never_negative():
+    flow_controller = FlowController()
+    flow_controller.release(_message())
+    assert flow_controller.message_count == 0
+    assert flow_controller.byte_count == 0
+
+
+def test_ignore_exceeds_limits():
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.IGNORE, message_limit=1)
+    flow_controller.add(_message())
+    flow_controller.add(_message())
+    assert flow_controller.message_count == 2
+    assert flow_controller.load == 2.0
+
+
+def test_error_message_limit():
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.ERROR, message_limit=1)
+    flow_controller.add(_message())
+    with pytest.raises(exceptions.FlowControlLimitError):
+        flow_controller.add(_message())
+    assert flow_controller.message_count == 1
+
+
+def test_error_byte_limit():
+    message = _message()
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.ERROR,
+        byte_limit=message.ByteSize() + 1)
+    assert flow_controller.has_capacity(message)
+    flow_controller.add(message)
+    assert not flow_controller.has_capacity(message)
+    with pytest.raises(exceptions.FlowControlLimitError):
+        flow_controller.add(message)
+
+
+def test_block_message_too_large():
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.BLOCK, byte_limit=1)
+    with pytest.raises(exceptions.FlowControlLimitError):
+        flow_controller.add(_message())
+
+
+def test_check_limits():
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.DROP_OLDEST, byte_limit=10)
+    flow_controller.check_limits(_message(b'spam'))
+    with pytest.raises(exceptions.FlowControlLimitError):
+        flow_controller.check_limits(_message(b'too large to fit'))
+
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.DROP_OLDEST, message_limit=0)
+    with pytest.raises(exceptions.FlowControlLimitError):
+        flow_controller.check_limits(_message())
+
+
+def test_block_until_released():
+    flow_controller = _flow_controller(
+        types.LimitExceededBehavior.BLOCK, message_limit=1)
+    message = _message()
+    flow_controller.add(message)
+
+    added = threading.Event()
+
+    def add():
+        flow_controller.add(message)
+        added.set()
+
+    thread = threading.Thread(target=add)
+    thread.start()
+    time.sleep(0.05)
+    assert not added.is_set()
+
+    flow_controller.release(message)
+    thread.join(timeout=1.0)
+    assert added.is_set()
+    assert flow_controller.message_count == 1
@@ -23,6 +23,8 @@ import pytest
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import futures
 
 
 def test_init():
@@ -95,10 +97,9 @@ def test_publish():
     batch = mock.Mock(spec=client._batch_class)
     # Set the mock up to claim indiscriminately that it accepts all messages.
     batch.will_accept.return_value = True
-    batch.publish.side_effect = (
-        mock.sentinel.future1,
-        mock.sentinel.future2,
-    )
+    expected1 = mock.Mock(spec=futures.Future)
+    expected2 = mock.Mock(spec=futures.Future)
+    batch.publish.side_effect = (expected1, expected2)
 
     topic = 'topic/path'
     client._batches[topic] = batch
@@ -107,8 +108,8 @@ def test_publish():
     future1 = client.publish(topic, b'spam')
     future2 = client.publish(topic, b'foo', bar='baz')
 
-    assert future1 is mock.sentinel.future1
-    assert future2 is mock.sentinel.future2
+    assert future1 is expected1
+    assert future2 is expected2
 
     # Check mock.
     batch.publish.assert_has_calls(
@@ -132,6 +133,16 @@ def test_publish_data_not_bytestring_error():
         client.publish(topic, 42)
 
 
+def test_publish_ordering_key_not_string_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    topic = 'topic/path'
+    with pytest.raises(TypeError):
+        client.publish(topic, b'This is a bytestring.', ordering_key=42)
+    assert client._sequencers == {}
+    assert client.flow_controller.message_count == 0
+
+
 def test_publish_attrs_bytestring():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
@@ -168,7 +179,8 @@ def test_publish_new_batch_needed():
     # Set the first mock up to claim indiscriminately that it rejects all
     # messages and the second accepts all.
     batch1.publish.return_value = None
-    batch2.publish.return_value = mock.sentinel.future
+    expected = mock.Mock(spec=futures.Future)
+    batch2.publish.return_value = expected
 
     topic = 'topic/path'
     client._batches[topic] = batch1
@@ -179,7 +191,7 @@ def test_publish_new_batch_needed():
 
     # Publish a message.
     future = client.publish(topic, b'foo', bar=b'baz')
-    assert future is mock.sentinel.future
+    assert future is expected
 
     # Check the mocks.
     batch_class.assert_called_once_with(
@@ -196,6 +208,117 @@ def test_publish_new_batch_needed():
     batch2.publish.assert_called_once_with(message_pb)
 
 
+def test_publish_flow_control_tracks_outstanding():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    batch = client.batch('topic/path', autocommit=False)
+
+    future = client.publish('topic/path', b'spam')
+    message_size = batch.messages[0].ByteSize()
+    assert client.flow_controller.message_count == 1
+    assert client.flow_controller.byte_count == message_size
+
+    future.set_result('1')
+    assert client.flow_controller.message_count == 0
+    assert client.flow_controller.byte_count == 0
+
+
+def test_publish_flow_control_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+    batch = client.batch('topic/path', autocommit=False)
+
+    client.publish('topic/path', b'spam')
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish('topic/path', b'eggs')
+
+    assert len(batch.messages) == 1
+    assert client.flow_controller.message_count == 1
+
+
+def test_publish_flow_control_batch_error_releases():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = ValueError
+    client._batches['topic/path'] = batch
+
+    with pytest.raises(ValueError):
+        client.publish('topic/path', b'spam')
+    assert client.flow_controller.message_count == 0
+
+
+def test_publish_flow_control_drop_oldest():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=2,
+        limit_exceeded_behavior=types.LimitExceededBehavior.DROP_OLDEST,
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+    batch = client.batch('topic/path', autocommit=False)
+
+    future1 = client.publish('topic/path', b'one')
+    future2 = client.publish('topic/path', b'two')
+    future3 = client.publish('topic/path', b'three')
+
+    # The oldest message was removed from its batch and its future failed.
+    assert [message.data for message in batch.messages] == [b'two', b'three']
+    assert isinstance(
+        future1.exception(timeout=0), exceptions.FlowControlLimitError)
+    assert not future2.done()
+    assert not future3.done()
+    assert client.flow_controller.message_count == 2
+    assert list(client._droppable) == [future2, future3]
+
+
+def test_publish_flow_control_drop_oldest_message_too_large():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        byte_limit=20,
+        limit_exceeded_behavior=types.LimitExceededBehavior.DROP_OLDEST,
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+    batch = client.batch('topic/path', autocommit=False)
+    future1 = client.publish('topic/path', b'one')
+    future2 = client.publish('topic/path', b'two')
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish('topic/path', b'much too large to ever fit')
+
+    # The queued messages survive the rejected message.
+    assert [message.data for message in batch.messages] == [b'one', b'two']
+    assert not future1.done()
+    assert not future2.done()
+    assert client.flow_controller.message_count == 2
+
+
+def test_drop_oldest_skips_committing_batches():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    batch1 = mock.Mock(spec=client._batch_class)
+    batch1.remove.return_value = False
+    batch2 = mock.Mock(spec=client._batch_class)
+    batch2.remove.return_value = True
+    future1 = mock.Mock(spec=futures.Future)
+    future2 = mock.Mock(spec=futures.Future)
+    future2.done.return_value = False
+    client._droppable[future1] = batch1
+    client._droppable[future2] = batch2
+
+    assert client._drop_oldest() is True
+    batch1.remove.assert_called_once_with(future1)
+    batch2.remove.assert_called_once_with(future2)
+    future1.set_exception.assert_not_called()
+    future2.set_exception.assert_called_once()
+    assert not client._droppable
+
+    assert client._drop_oldest() is False
+
+
 def test_publish_attrs_type_error():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
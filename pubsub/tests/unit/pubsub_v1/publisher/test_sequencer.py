@@ -0,0 +1,231 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import google.api_core.exceptions
+from google.auth import credentials
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.batch.base import BatchStatus
+
+TOPIC = 'topic/path'
+
+
+def create_client(**batch_settings):
+    """Return a client whose batches never commit on a timer."""
+    creds = mock.Mock(spec=credentials.Credentials)
+    batch_settings.setdefault('max_latency', float('inf'))
+    return publisher.Client(
+        credentials=creds,
+        batch_settings=types.BatchSettings(**batch_settings),
+    )
+
+
+def patch_publish(client, **kwargs):
+    return mock.patch.object(type(client.api), 'publish', **kwargs)
+
+
+def _publish_response(topic, messages):
+    return types.PublishResponse(
+        message_ids=[message.data.decode('utf-8') for message in messages])
+
+
+def test_publish_first_message_opens_batch():
+    client = create_client()
+    future = client.publish(TOPIC, b'1', ordering_key='k')
+
+    sequencer = client._sequencers[(TOPIC, 'k')]
+    assert sequencer.ordering_key == 'k'
+    assert sequencer.topic == TOPIC
+    assert sequencer._batch.messages == [types.PubsubMessage(data=b'1')]
+    assert sequencer._batch_futures == [future]
+    # Ordered messages never go through the per-topic batches.
+    assert client._batches == {}
+
+
+def test_publish_in_order_one_batch_at_a_time():
+    client = create_client()
+    future1 = client.publish(TOPIC, b'1', ordering_key='k')
+    future2 = client.publish(TOPIC, b'2', ordering_key='k')
+    sequencer = client._sequencers[(TOPIC, 'k')]
+    head = sequencer._batch
+
+    # Once the first batch starts to commit, later messages wait.
+    head._status = BatchStatus.STARTING
+    future3 = client.publish(TOPIC, b'3', ordering_key='k')
+    future4 = client.publish(TOPIC, b'4', ordering_key='k')
+    assert len(head.messages) == 2
+    assert len(sequencer._pending) == 2
+
+    with patch_publish(client, side_effect=_publish_response) as publish:
+        head._commit()
+        assert future1.result(timeout=1) == '1'
+        assert future2.result(timeout=1) == '2'
+        # The waiting messages are then committed together, in order.
+        assert future3.result(timeout=1) == '3'
+        assert future4.result(timeout=1) == '4'
+
+    assert publish.mock_calls == [
+        mock.call(TOPIC, [types.PubsubMessage(data=b'1'),
+                          types.PubsubMessage(data=b'2')]),
+        mock.call(TOPIC, [types.PubsubMessage(data=b'3'),
+                          types.PubsubMessage(data=b'4')]),
+    ]
+    # The sequencer is forgotten once it has nothing left to publish.
+    assert sequencer.finished
+    assert client._sequencers == {}
+    assert client.flow_controller.message_count == 0
+
+
+def test_waiting_messages_split_by_batch_settings():
+    client = create_client(max_messages=2)
+    future1 = client.publish(TOPIC, b'1', ordering_key='k')
+    sequencer = client._sequencers[(TOPIC, 'k')]
+    head = sequencer._batch
+    head._status = BatchStatus.STARTING
+    futures = [
+        client.publish(TOPIC, data, ordering_key='k')
+        for data in (b'2', b'3', b'4')
+    ]
+
+    with patch_publish(client, side_effect=_publish_response) as publish:
+        head._commit()
+        assert future1.result(timeout=1) == '1'
+        assert [future.result(timeout=1) for future in futures] == [
+            '2', '3', '4']
+
+    assert [len(call[1][1]) for call in publish.mock_calls] == [1, 2, 1]
+
+
+def test_different_keys_are_independent():
+    client = create_client()
+    client.publish(TOPIC, b'1', ordering_key='a')
+    client.publish(TOPIC, b'2', ordering_key='b')
+    client.publish('other/topic', b'3', ordering_key='a')
+
+    assert set(client._sequencers) == {
+        (TOPIC, 'a'), (TOPIC, 'b'), ('other/topic', 'a')}
+    batches = [seq._batch for seq in client._sequencers.values()]
+    assert len(set(batches)) == 3
+
+
+def test_failure_pauses_key():
+    client = create_client()
+    future1 = client.publish(TOPIC, b'1', ordering_key='k')
+    sequencer = client._sequencers[(TOPIC, 'k')]
+    head = sequencer._batch
+    head._status = BatchStatus.STARTING
+    future2 = client.publish(TOPIC, b'2', ordering_key='k')
+
+    error = google.api_core.exceptions.ServiceUnavailable('down')
+    with patch_publish(client, side_effect=error):
+        head._commit()
+
+    assert future1.exception(timeout=1) is error
+    assert isinstance(
+        future2.exception(timeout=1), exceptions.OrderingKeyPausedError)
+    assert sequencer.paused
+    # Only the paused key is kept, not its (empty) sequencer.
+    assert client._sequencers == {}
+    assert client._paused_keys == {(TOPIC, 'k')}
+    with pytest.raises(exceptions.OrderingKeyPausedError):
+        client.publish(TOPIC, b'3', ordering_key='k')
+    assert client.flow_controller.message_count == 0
+
+    # Other ordering keys are unaffected.
+    client.publish(TOPIC, b'4', ordering_key='other')
+
+    client.resume_publish(TOPIC, 'k')
+    assert client._paused_keys == set()
+    future5 = client.publish(TOPIC, b'5', ordering_key='k')
+    resumed = client._sequencers[(TOPIC, 'k')]
+    assert resumed is not sequencer
+    assert resumed._batch_futures == [future5]
+
+
+def test_publish_paused_sequencer_not_yet_dropped():
+    client = create_client()
+    client.publish(TOPIC, b'1', ordering_key='k')
+    sequencer = client._sequencers[(TOPIC, 'k')]
+    # As between pausing the sequencer and the client dropping it.
+    sequencer._paused = sequencer._finished = True
+
+    with pytest.raises(exceptions.OrderingKeyPausedError):
+        client.publish(TOPIC, b'2', ordering_key='k')
+    assert client._sequencers[(TOPIC, 'k')] is sequencer
+
+
+def test_resume_publish_unknown_key():
+    client = create_client()
+    client.resume_publish(TOPIC, 'k')
+    assert client._sequencers == {}
+
+
+def test_publish_finished_sequencer_replaced():
+    client = create_client()
+    client.publish(TOPIC, b'1', ordering_key='k')
+    sequencer = client._sequencers[(TOPIC, 'k')]
+    sequencer._finished = True
+
+    client.publish(TOPIC, b'2', ordering_key='k')
+    assert client._sequencers[(TOPIC, 'k')] is not sequencer
+
+
+def test_publish_message_too_large():
+    client = create_client(max_bytes=4)
+    with pytest.raises(ValueError):
+        client.publish(TOPIC, b'too large', ordering_key='k')
+    assert client.flow_controller.message_count == 0
+
+
+def test_cancelled_future_counts_as_completed():
+    client = create_client()
+    future1 = client.publish(TOPIC, b'1', ordering_key='k')
+    sequencer = client._sequencers[(TOPIC, 'k')]
+    head = sequencer._batch
+    head._status = BatchStatus.SUCCESS
+    future2 = client.publish(TOPIC, b'2', ordering_key='k')
+
+    # As ``asyncio.Future`` does, raise from ``exception()`` once cancelled.
+    cancelled = mock.Mock(spec=['cancelled', 'exception'])
+    cancelled.cancelled.return_value = True
+    cancelled.exception.side_effect = AssertionError('cancelled')
+    with mock.patch.object(client._batch_class, 'commit') as commit:
+        sequencer._on_done(head, cancelled)
+
+    assert sequencer._batch is not head
+    assert sequencer._batch.messages == [types.PubsubMessage(data=b'2')]
+    assert not sequencer.paused
+    commit.assert_called_once_with()
+    assert not future1.done()
+    assert not future2.done()
+
+
+def test_copy_outcome_cancelled_source():
+    from google.cloud.pubsub_v1.publisher import _sequencer
+
+    target = mock.Mock(spec=['done', 'cancel'])
+    target.done.return_value = False
+    source = mock.Mock(spec=['cancelled', 'exception'])
+    source.cancelled.return_value = True
+
+    _sequencer._copy_outcome(target, source)
+
+    target.cancel.assert_called_once_with()
+    source.exception.assert_not_called()
@@ -24,6 +24,7 @@ from google.cloud.pubsub_v1 import subscriber
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber import _consumer
 from google.cloud.pubsub_v1.subscriber import _helper_threads
+from google.cloud.pubsub_v1.subscriber.futures import Future
 from google.cloud.pubsub_v1.subscriber.policy import thread
 
 
@@ -168,6 +169,82 @@ def test_blocking_consume_two_exceptions():
         [mock.call(exc1), mock.call(exc2)])
 
 
+class GatedResponseGenerator(RaisingResponseGenerator):
+    # Raises only once the gate opens, so that every stream fails at
+    # (about) the same time.
+
+    def __init__(self, exception, gate):
+        super(GatedResponseGenerator, self).__init__(exception)
+        self.gate = gate
+
+    def __next__(self):
+        self.gate.wait(timeout=5.0)
+        return super(GatedResponseGenerator, self).__next__()
+
+
+def test_multi_consumer_streams_fail_together():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    policy = thread.Policy(client, 'sub_name_e', streams=2)
+    policy._future = Future(policy=policy)
+
+    exceptions = [NameError('Oh noes.'), ValueError('Something grumble.')]
+    gate = threading.Event()
+    response_generators = [
+        GatedResponseGenerator(exc, gate) for exc in exceptions]
+
+    results = []
+    on_exception = policy.on_exception
+
+    def record_on_exception(exc):
+        try:
+            results.append(on_exception(exc))
+        except Exception as raised:
+            results.append(raised)
+        return results[-1]
+
+    consumer = policy._consumer
+    patch_call_rpc = mock.patch.object(
+        policy, 'call_rpc', side_effect=response_generators)
+    patch_on_exception = mock.patch.object(
+        policy, 'on_exception', side_effect=record_on_exception)
+    with patch_call_rpc, patch_on_exception:
+        consumer.start_consuming(policy)
+        threads = [member._consumer_thread for member in consumer.consumers]
+        gate.set()
+        for member_thread in threads:
+            member_thread.join(timeout=5.0)
+
+    assert results == [False, False]
+    assert policy.future.exception() in exceptions
+    assert consumer.active is False
+    for member, member_thread in zip(consumer.consumers, threads):
+        assert member._consumer_thread is None
+        assert not member_thread.is_alive()
+
+
+def test_multi_consumer_fatal_error_stops_all():
+    consumer = _consumer.MultiConsumer(2)
+    threads = [mock.Mock(spec=threading.Thread) for _ in range(2)]
+    for member, member_thread in zip(consumer.consumers, threads):
+        member.resume()
+        member._consumer_thread = member_thread
+
+    policy = mock.Mock(spec=('call_rpc', 'on_exception'))
+    policy.call_rpc.return_value = RaisingResponseGenerator(
+        ValueError('Something grumble.'))
+    policy.on_exception.return_value = False
+
+    consumer.consumers[0]._blocking_consume(policy)
+
+    assert consumer.active is False
+    for member in consumer.consumers:
+        assert member._consumer_thread is None
+    # The failed stream ran in its own thread, which cannot join itself.
+    for member_thread in threads:
+        member_thread.join.assert_not_called()
+
+
 def test_paused():
     consumer = _consumer.Consumer()
     assert consumer.paused is True
@@ -231,6 +308,103 @@ def test_stop_consuming():
     thread.join.assert_called_once_with()
 
 
+def test_multi_consumer_init_no_streams():
+    with pytest.raises(ValueError):
+        _consumer.MultiConsumer(0)
+
+
+def test_multi_consumer_extend_leases_first_stream_only():
+    consumer = _consumer.MultiConsumer(3)
+    policy = mock.Mock(spec=('get_initial_request',))
+
+    for sub_consumer in consumer.consumers:
+        next(sub_consumer._request_generator_thread(policy))
+
+    assert [call[2] for call in policy.get_initial_request.mock_calls] == [
+        {'ack_queue': True, 'extend_leases': True},
+        {'ack_queue': True, 'extend_leases': False},
+        {'ack_queue': True, 'extend_leases': False},
+    ]
+
+
+def test_multi_consumer_send_request_round_robin():
+    consumer = _consumer.MultiConsumer(3)
+    # The stopped consumer is skipped.
+    consumer.consumers[1]._stopped.set()
+    for request in ('a', 'b', 'c', 'd'):
+        consumer.send_request(request)
+
+    queues = [member._request_queue for member in consumer.consumers]
+    assert [queues[0].get_nowait() for _ in range(2)] == ['a', 'c']
+    assert [queues[2].get_nowait() for _ in range(2)] == ['b', 'd']
+    assert all(q.empty() for q in queues)
+
+
+def test_multi_consumer_send_request_spread():
+    consumer = _consumer.MultiConsumer(2)
+    consumer.consumers[1]._stopped.set()
+    for request in ('a', 'b', 'c'):
+        consumer.send_request(request)
+
+    # Every request goes to the only active consumer.
+    first = consumer.consumers[0]._request_queue
+    assert [first.get_nowait() for _ in range(3)] == ['a', 'b', 'c']
+    assert consumer.consumers[1]._request_queue.empty()
+
+
+def test_multi_consumer_send_request_none_active():
+    consumer = _consumer.MultiConsumer(2)
+    for member in consumer.consumers:
+        member._stopped.set()
+    assert consumer.active is False
+
+    consumer.send_request('a')
+    assert consumer.consumers[0]._request_queue.get_nowait() == 'a'
+    assert consumer.consumers[1]._request_queue.empty()
+
+
+def test_multi_consumer_pause_resume():
+    consumer = _consumer.MultiConsumer(2)
+    consumer.consumers[0].resume()
+    consumer.consumers[1].resume()
+    assert consumer.paused is False
+
+    consumer.consumers[1].pause()
+    assert consumer.paused is True
+
+    consumer.resume()
+    assert consumer.paused is False
+
+    consumer.pause()
+    assert all(member.paused for member in consumer.consumers)
+
+
+def test_multi_consumer_start_consuming():
+    consumer = _consumer.MultiConsumer(3)
+    policy = mock.sentinel.policy
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        consumer.start_consuming(policy)
+
+    assert Thread.call_count == 3
+    assert consumer.active is True
+    for member in consumer.consumers:
+        assert member._consumer_thread is Thread.return_value
+
+
+def test_multi_consumer_stop_consuming():
+    consumer = _consumer.MultiConsumer(2)
+    threads = [mock.Mock(spec=threading.Thread) for _ in range(2)]
+    consumer.consumers[0]._consumer_thread = threads[0]
+    # The second consumer has already stopped itself.
+    consumer.consumers[1]._stopped.set()
+
+    assert consumer.stop_consuming() is None
+
+    assert consumer.active is False
+    threads[0].join.assert_called_once_with()
+    assert consumer.consumers[0]._consumer_thread is None
+
+
 def basic_queue_generator(queue, received):
     while True:
         value = queue.get()
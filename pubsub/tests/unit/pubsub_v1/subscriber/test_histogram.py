@@ -12,14 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+
+import mock
+
 from google.cloud.pubsub_v1.subscriber import _histogram
 
 
 def test_init():
-    data = {}
-    histo = _histogram.Histogram(data=data)
-    assert histo._data is data
+    histo = _histogram.Histogram()
     assert len(histo) == 0
+    assert histo.buckets() == []
+
+
+def test_init_data():
+    histo = _histogram.Histogram(data={20: 2, 5: 1})
+    assert len(histo) == 3
+    assert histo.buckets() == [(10, 1), (20, 2)]
 
 
 def test_contains():
@@ -56,9 +65,10 @@ def test_min():
 def test_add():
     histo = _histogram.Histogram()
     histo.add(60)
-    assert histo._data[60] == 1
+    assert histo.buckets() == [(60, 1)]
     histo.add(60)
-    assert histo._data[60] == 2
+    assert histo.buckets() == [(60, 2)]
+    assert len(histo) == 2
 
 
 def test_add_lower_limit():
@@ -82,3 +92,47 @@ def test_percentile():
     assert histo.percentile(101) == 200
     assert histo.percentile(99) == 199
     assert histo.percentile(1) == 101
+
+
+def test_percentile_empty():
+    histo = _histogram.Histogram()
+    assert histo.percentile(99) == 10
+
+
+def test_repr():
+    histo = _histogram.Histogram()
+    histo.add(20)
+    histo.add(40)
+    assert repr(histo) == '<Histogram: 2 values between 20 and 40>'
+
+
+def test_decay():
+    histo = _histogram.Histogram(half_life=60)
+    now = histo._last_decay
+    for _ in range(10):
+        histo.add(500)
+
+    # After one half life, each old value weighs half as much.
+    with mock.patch.object(time, 'time', return_value=now + 60):
+        for _ in range(10):
+            histo.add(20)
+    assert histo.buckets() == [(20, 10), (500, 5.0)]
+    assert histo.percentile(99) == 500
+    assert len(histo) == 20
+
+    # Eventually, the old values age out entirely.
+    with mock.patch.object(time, 'time', return_value=now + 60 * 60):
+        histo.add(20)
+    assert histo.buckets() == [(20, 1)]
+    assert histo.percentile(99) == 20
+    assert histo.max == 20
+    assert 500 not in histo
+
+
+def test_decay_not_too_often():
+    histo = _histogram.Histogram(half_life=60)
+    now = histo._last_decay
+    histo.add(500)
+    with mock.patch.object(time, 'time', return_value=now + 1):
+        histo.add(20)
+    assert histo.buckets() == [(20, 1), (500, 1)]
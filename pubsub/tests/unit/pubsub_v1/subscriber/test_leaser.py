@@ -0,0 +1,95 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from google.cloud.pubsub_v1.subscriber import _leaser
+
+
+def test_add():
+    leaser = _leaser.Leaser()
+    assert leaser.add('ack_id', 20, 10) is True
+    assert len(leaser) == 1
+    assert 'ack_id' in leaser
+    assert leaser.bytes == 20
+    assert leaser.ack_ids == ['ack_id']
+
+    # Adding again is a no-op.
+    assert leaser.add('ack_id', 20, 10) is False
+    assert len(leaser) == 1
+    assert leaser.bytes == 20
+
+
+def test_remove():
+    leaser = _leaser.Leaser()
+    leaser.add('ack_id', 20, 10)
+    assert leaser.remove('ack_id') == 20
+    assert len(leaser) == 0
+    assert leaser.bytes == 0
+    assert leaser.remove('ack_id') is None
+
+
+def test_renew_only_expiring():
+    now = time.time()
+    leaser = _leaser.Leaser()
+    leaser.add('soon', 10, 3, now=now)
+    leaser.add('later', 10, 30, now=now)
+
+    renewed, expired = leaser.renew(horizon=5, seconds=60, now=now)
+    assert renewed == ['soon']
+    assert expired == []
+
+    # The renewed lease is not due again until close to its new deadline.
+    renewed, _ = leaser.renew(horizon=5, seconds=60, now=now + 10)
+    assert renewed == []
+    renewed, _ = leaser.renew(horizon=5, seconds=60, now=now + 30)
+    assert renewed == ['later']
+    renewed, _ = leaser.renew(horizon=5, seconds=60, now=now + 60)
+    assert renewed == ['soon']
+
+
+def test_renew_skips_removed():
+    now = time.time()
+    leaser = _leaser.Leaser()
+    leaser.add('acked', 10, 3, now=now)
+    leaser.add('kept', 10, 3, now=now)
+    leaser.remove('acked')
+
+    renewed, expired = leaser.renew(horizon=5, seconds=60, now=now)
+    assert renewed == ['kept']
+    assert expired == []
+
+
+def test_renew_expires_old_leases():
+    now = time.time()
+    leaser = _leaser.Leaser(max_lease_duration=100)
+    leaser.add('old', 10, 3, now=now - 200)
+    leaser.add('young', 15, 3, now=now)
+
+    renewed, expired = leaser.renew(horizon=5, seconds=60, now=now)
+    assert renewed == ['young']
+    assert expired == ['old']
+    assert len(leaser) == 1
+    assert leaser.bytes == 15
+
+
+def test_renew_empty_advances():
+    now = time.time()
+    leaser = _leaser.Leaser()
+    assert leaser.renew(horizon=5, seconds=60, now=now + 3600) == ([], [])
+
+    # A lease whose deadline has already passed is renewed on the next call.
+    leaser.add('late', 10, 3, now=now)
+    renewed, _ = leaser.renew(horizon=5, seconds=60, now=now + 3601)
+    assert renewed == ['late']
@@ -116,3 +116,16 @@ def test_repr():
         '}',
     ))
     assert repr(msg) == expected_repr
+
+
+def test_size_cached():
+    msg = create_message(b'foo')
+    assert msg.size == 25
+    with mock.patch.object(types.PubsubMessage, 'ByteSize') as byte_size:
+        assert msg.size == 25
+    byte_size.assert_not_called()
+
+
+def test_no_instance_dict():
+    msg = create_message(b'foo')
+    assert not hasattr(msg, '__dict__')
@@ -0,0 +1,205 @@
+# Copyright 2017, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import sys
+
+import mock
+import pytest
+
+if sys.version_info < (3, 5):
+    pytest.skip('asyncio support requires Python 3.5.',
+                allow_module_level=True)
+
+import asyncio  # noqa: E402
+
+from google.api_core import exceptions  # noqa: E402
+from google.auth import credentials  # noqa: E402
+
+from google.cloud.pubsub_v1 import subscriber  # noqa: E402
+from google.cloud.pubsub_v1 import types  # noqa: E402
+from google.cloud.pubsub_v1.subscriber import message  # noqa: E402
+from google.cloud.pubsub_v1.subscriber.policy import aio  # noqa: E402
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def create_policy(loop, **kwargs):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds, policy_class=aio.Policy)
+    return aio.Policy(client, 'sub_name_c', loop=loop, **kwargs)
+
+
+def create_response(count):
+    return types.StreamingPullResponse(
+        received_messages=[
+            {
+                'ack_id': 'ack{}'.format(index),
+                'message': {'data': b'foo', 'message_id': str(index)},
+            }
+            for index in range(count)
+        ],
+    )
+
+
+def run_briefly(loop):
+    loop.run_until_complete(asyncio.sleep(0.001))
+
+
+def test_subscribe():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds, policy_class=aio.Policy)
+    policy = client.subscribe('sub_name_a')
+    assert isinstance(policy, aio.Policy)
+
+
+def test_open(loop):
+    policy = create_policy(loop)
+    consumer = mock.Mock(spec=('active', 'start_consuming'))
+    consumer.active = False
+    policy._consumer = consumer
+
+    future = policy.open(mock.sentinel.callback)
+    assert isinstance(future, asyncio.Future)
+    assert policy.future is future
+    assert policy._callback is mock.sentinel.callback
+    consumer.start_consuming.assert_called_once_with(policy)
+
+    # Lease maintenance runs as a task, and ends with the consumer.
+    run_briefly(loop)
+    assert policy._leases_task.done()
+
+    with pytest.raises(ValueError):
+        policy.open(mock.sentinel.callback)
+
+
+def test_close(loop):
+    policy = create_policy(loop)
+    consumer = mock.Mock(spec=('active', 'start_consuming', 'stop_consuming'))
+    policy._consumer = consumer
+    future = policy.open(mock.sentinel.callback)
+    leases_task = policy._leases_task
+
+    assert policy.close() is future
+    consumer.stop_consuming.assert_called_once_with()
+    assert future.result() is None
+    assert policy.future is None
+    run_briefly(loop)
+    assert leases_task.cancelled()
+
+
+def test_close_without_future(loop):
+    policy = create_policy(loop)
+    with pytest.raises(ValueError):
+        policy.close()
+
+
+def test_on_response(loop):
+    policy = create_policy(loop)
+    received = []
+    policy._callback = received.append
+
+    policy.on_response(create_response(2))
+
+    # The messages are leased right away, but called back on the loop.
+    assert policy.managed_ack_ids == {'ack0', 'ack1'}
+    assert received == []
+    run_briefly(loop)
+    assert [msg.message_id for msg in received] == ['0', '1']
+    assert all(isinstance(msg, message.Message) for msg in received)
+
+
+def test_on_response_awaits_callback(loop):
+    policy = create_policy(loop)
+    pending = []
+
+    def callback(msg):
+        future = loop.create_future()
+        pending.append((msg, future))
+        return future
+
+    policy._callback = callback
+    policy.on_response(create_response(1))
+    run_briefly(loop)
+
+    msg, future = pending[0]
+    msg.ack()
+    assert policy.managed_ack_ids == set()
+    future.set_result(None)
+    run_briefly(loop)
+
+
+def test_on_response_flow_control(loop):
+    flow_control = types.FlowControl(max_messages=2)
+    policy = create_policy(loop, flow_control=flow_control)
+    started = []
+    futures = []
+
+    def callback(msg):
+        started.append(msg.message_id)
+        future = loop.create_future()
+        futures.append(future)
+        return future
+
+    policy._callback = callback
+    policy.on_response(create_response(3))
+    run_briefly(loop)
+
+    # Only as many callbacks as messages allowed by flow control run at once.
+    assert started == ['0', '1']
+    futures[0].set_result(None)
+    run_briefly(loop)
+    assert started == ['0', '1', '2']
+    for future in futures[1:]:
+        future.set_result(None)
+    run_briefly(loop)
+
+
+def test_on_response_callback_error(loop):
+    policy = create_policy(loop)
+    policy._callback = mock.Mock(side_effect=ValueError('nope'))
+
+    with mock.patch.object(aio, '_LOGGER') as _LOGGER:
+        policy.on_response(create_response(1))
+        run_briefly(loop)
+
+    _LOGGER.exception.assert_called_once()
+
+
+def test_request_queue_dispatches(loop):
+    policy = create_policy(loop)
+    with mock.patch.object(policy, 'dispatch_callback') as dispatch_callback:
+        policy._request_queue.put(('ack', {'ack_id': 'a'}))
+    dispatch_callback.assert_called_once_with('ack', {'ack_id': 'a'})
+
+
+def test_on_exception_unavailable(loop):
+    policy = create_policy(loop)
+    exc = exceptions.ServiceUnavailable('What is this?')
+    assert policy.on_exception(exc) is True
+
+
+def test_on_exception_other(loop):
+    policy = create_policy(loop)
+    policy._future = loop.create_future()
+    exc = TypeError('wahhhhhh')
+    assert policy.on_exception(exc) is False
+    run_briefly(loop)
+    assert policy.future.exception() is exc
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
 import time
 
 from google.api_core import exceptions
@@ -65,17 +64,33 @@ def test_get_initial_request():
     assert isinstance(initial_request, types.StreamingPullRequest)
     assert initial_request.subscription == 'sub_name_d'
     assert initial_request.stream_ack_deadline_seconds == 10
+    assert policy._stream_ack_deadline == 10
+
+
+def test_get_initial_request_extend_leases():
+    policy = create_policy()
+    policy.lease('ack_id_string', 20)
+
+    initial_request = policy.get_initial_request()
+    assert initial_request.modify_deadline_ack_ids == ['ack_id_string']
+    assert initial_request.modify_deadline_seconds == [10]
+
+    initial_request = policy.get_initial_request(extend_leases=False)
+    assert initial_request.modify_deadline_ack_ids == []
+    assert initial_request.modify_deadline_seconds == []
 
 
 def test_managed_ack_ids():
     policy = create_policy()
 
-    # Ensure we always get a set back, even if the property is not yet set.
+    # Ensure we always get a set back, even if nothing is leased.
     managed_ack_ids = policy.managed_ack_ids
-    assert isinstance(managed_ack_ids, set)
+    assert managed_ack_ids == set()
 
-    # Ensure that multiple calls give the same actual object back.
-    assert managed_ack_ids is policy.managed_ack_ids
+    # The set is a snapshot of the leased ack IDs.
+    policy.lease('ack_id_string', 20)
+    assert managed_ack_ids == set()
+    assert policy.managed_ack_ids == {'ack_id_string'}
 
 
 def test_subscription():
@@ -127,28 +142,15 @@ def test_call_rpc():
 
 def test_drop():
     policy = create_policy()
-    policy.managed_ack_ids.add('ack_id_string')
-    policy._bytes = 20
+    policy.lease('ack_id_string', 20)
     policy.drop('ack_id_string', 20)
     assert len(policy.managed_ack_ids) == 0
-    assert policy._bytes == 0
+    assert policy._leaser.bytes == 0
 
     # Do this again to establish idempotency.
     policy.drop('ack_id_string', 20)
     assert len(policy.managed_ack_ids) == 0
-    assert policy._bytes == 0
-
-
-@mock.patch.object(base, '_LOGGER', spec=logging.Logger)
-def test_drop_unexpected_negative(_LOGGER):
-    policy = create_policy()
-    policy.managed_ack_ids.add('ack_id_string')
-    policy._bytes = 0
-    policy.drop('ack_id_string', 20)
-    assert len(policy.managed_ack_ids) == 0
-    assert policy._bytes == 0
-    _LOGGER.debug.assert_called_once_with(
-        'Bytes was unexpectedly negative: %d', -20)
+    assert policy._leaser.bytes == 0
 
 
 def test_drop_below_threshold():
@@ -158,9 +160,8 @@ def test_drop_below_threshold():
     the flow control thresholds, it should resume.
     """
     policy = create_policy()
-    policy.managed_ack_ids.add('ack_id_string')
     num_bytes = 20
-    policy._bytes = num_bytes
+    policy.lease('ack_id_string', num_bytes)
     consumer = policy._consumer
     assert consumer.paused is True
 
@@ -210,7 +211,9 @@ def test_maintain_leases_inactive_consumer():
 def test_maintain_leases_ack_ids():
     policy = create_policy()
     policy._consumer._stopped.clear()
-    policy.lease('my ack id', 50)
+    # This lease expires before the next cycle; the other one does not.
+    policy._leaser.add('my ack id', 50, 2)
+    policy._leaser.add('later ack id', 50, 30)
 
     # Mock the sleep object.
     with mock.patch.object(time, 'sleep', autospec=True) as sleep:
@@ -230,6 +233,45 @@ def test_maintain_leases_ack_ids():
         sleep.assert_called()
 
 
+def test_maintain_leases_chunks_requests():
+    policy = create_policy()
+    policy._consumer._stopped.clear()
+    num_ack_ids = base._MAX_ACK_IDS_PER_REQUEST + 1
+    for index in range(num_ack_ids):
+        policy._leaser.add('ack_id_{}'.format(index), 10, 0)
+
+    with mock.patch.object(time, 'sleep', autospec=True) as sleep:
+        sleep.side_effect = lambda seconds: policy._consumer._stopped.set()
+        with mock.patch.object(policy._consumer, 'send_request') as send:
+            policy.maintain_leases()
+
+    assert send.call_count == 2
+    requests = [call[1][0] for call in send.mock_calls]
+    sizes = [len(request.modify_deadline_ack_ids) for request in requests]
+    assert sizes == [base._MAX_ACK_IDS_PER_REQUEST, 1]
+    assert all(
+        len(request.modify_deadline_seconds) == size
+        for request, size in zip(requests, sizes))
+
+
+def test_maintain_leases_drops_old_leases():
+    flow_control = types.FlowControl(max_messages=1, max_lease_duration=60)
+    policy = create_policy(flow_control=flow_control)
+    policy._consumer._stopped.clear()
+    policy._leaser.add('old ack id', 20, 0, now=time.time() - 120)
+    policy._consumer.pause()
+
+    with mock.patch.object(time, 'sleep', autospec=True) as sleep:
+        sleep.side_effect = lambda seconds: policy._consumer._stopped.set()
+        with mock.patch.object(policy._consumer, 'send_request') as send:
+            policy.maintain_leases()
+
+    send.assert_not_called()
+    assert policy.managed_ack_ids == set()
+    assert policy._leaser.bytes == 0
+    assert policy._consumer.paused is False
+
+
 def test_maintain_leases_no_ack_ids():
     policy = create_policy()
     policy._consumer._stopped.clear()
@@ -247,12 +289,12 @@ def test_lease():
     policy = create_policy()
     policy.lease(ack_id='ack_id_string', byte_size=20)
     assert len(policy.managed_ack_ids) == 1
-    assert policy._bytes == 20
+    assert policy._leaser.bytes == 20
 
     # Do this again to prove idempotency.
     policy.lease(ack_id='ack_id_string', byte_size=20)
     assert len(policy.managed_ack_ids) == 1
-    assert policy._bytes == 20
+    assert policy._leaser.bytes == 20
 
 
 def test_lease_above_threshold():
@@ -25,6 +25,7 @@ from six.moves import queue
 
 from google.cloud.pubsub_v1 import subscriber
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import _consumer
 from google.cloud.pubsub_v1.subscriber import _helper_threads
 from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber.futures import Future
@@ -48,6 +49,12 @@ def test_init_with_executor():
     assert policy._executor is executor
 
 
+def test_init_with_streams():
+    policy = create_policy(streams=3)
+    assert isinstance(policy._consumer, _consumer.MultiConsumer)
+    assert len(policy._consumer.consumers) == 3
+
+
 def test_close():
     dispatch_thread = mock.Mock(spec=threading.Thread)
     leases_thread = mock.Mock(spec=threading.Thread)
@@ -192,6 +199,17 @@ def test_on_exception_other():
         policy.future.result()
 
 
+def test_on_exception_other_twice():
+    policy = create_policy(streams=2)
+    policy._future = Future(policy=policy)
+    exc1 = TypeError('wahhhhhh')
+    exc2 = ValueError('boo')
+    assert policy.on_exception(exc1) is False
+    # Another stream failing afterwards does not raise.
+    assert policy.on_exception(exc2) is False
+    assert policy.future.exception() is exc1
+
+
 def test_on_response():
     callback = mock.Mock(spec=())
 
@@ -237,6 +255,53 @@ def test_on_response():
         assert call[1][0] == thread._callback_completed
 
 
+def create_response(count):
+    return types.StreamingPullResponse(
+        received_messages=[
+            {
+                'ack_id': 'ack{}'.format(index),
+                'message': {'data': b'foo', 'message_id': str(index)},
+            }
+            for index in range(count)
+        ],
+    )
+
+
+def test_init_callback_batch_size_invalid():
+    with pytest.raises(ValueError):
+        create_policy(callback_batch_size=0)
+
+
+def test_on_response_callback_batch_size():
+    executor = mock.Mock(spec=('submit',))
+    policy = create_policy(executor=executor, callback_batch_size=2)
+    policy._callback = mock.sentinel.callback
+
+    policy.on_response(create_response(5))
+
+    batches = [call[0][1] for call in executor.submit.call_args_list]
+    assert [[msg.message_id for msg in batch] for batch in batches] == [
+        ['0', '1'], ['2', '3'], ['4']]
+    for call in executor.submit.call_args_list:
+        assert call[0][0] is mock.sentinel.callback
+    future = executor.submit.return_value
+    assert future.add_done_callback.call_count == 3
+
+
+def test_on_response_callback_batch_size_whole_response():
+    executor = mock.Mock(spec=('submit',))
+    policy = create_policy(
+        executor=executor, callback_batch_size=float('inf'))
+    policy._callback = mock.sentinel.callback
+
+    policy.on_response(create_response(3))
+    policy.on_response(create_response(0))
+
+    executor.submit.assert_called_once()
+    batch = executor.submit.call_args[0][1]
+    assert [msg.message_id for msg in batch] == ['0', '1', '2']
+
+
 def test__callback_completed():
     future = mock.Mock()
     thread._callback_completed(future)
@@ -17,6 +17,7 @@ import mock
 import pytest
 
 from google.cloud.pubsub_v1 import subscriber
+from google.cloud.pubsub_v1.subscriber import _consumer
 from google.cloud.pubsub_v1.subscriber.policy import thread
 
 
@@ -47,6 +48,31 @@ def test_subscribe():
     assert isinstance(subscription, thread.Policy)
 
 
+def test_subscribe_with_streams():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    subscription = client.subscribe('sub_name_a', streams=2)
+    assert isinstance(subscription._consumer, _consumer.MultiConsumer)
+    assert len(subscription._consumer.consumers) == 2
+
+
+def test_subscribe_custom_policy_without_streams():
+    creds = mock.Mock(spec=credentials.Credentials)
+    policy_class = mock.Mock()
+    client = subscriber.Client(policy_class=policy_class, credentials=creds)
+    subscription = client.subscribe('sub_name_a')
+    assert subscription is policy_class.return_value
+    policy_class.assert_called_once_with(
+        client, 'sub_name_a', mock.ANY)
+
+
+def test_subscribe_with_callback_batch_size():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    subscription = client.subscribe('sub_name_a', callback_batch_size=10)
+    assert subscription._callback_batch_size == 10
+
+
 def test_subscribe_with_callback():
     creds = mock.Mock(spec=credentials.Credentials)
     client = subscriber.Client(credentials=creds)
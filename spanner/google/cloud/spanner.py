@@ -22,9 +22,11 @@ from google.cloud.spanner_v1 import BurstyPool
 from google.cloud.spanner_v1 import Client
 from google.cloud.spanner_v1 import enums
 from google.cloud.spanner_v1 import FixedSizePool
+from google.cloud.spanner_v1 import HealthTrackedPool
 from google.cloud.spanner_v1 import KeyRange
 from google.cloud.spanner_v1 import KeySet
 from google.cloud.spanner_v1 import param_types
+from google.cloud.spanner_v1 import StreamRetry
 from google.cloud.spanner_v1 import types
 
 
@@ -35,8 +37,10 @@ __all__ = (
     'Client',
     'enums',
     'FixedSizePool',
+    'HealthTrackedPool',
     'KeyRange',
     'KeySet',
     'param_types',
+    'StreamRetry',
     'types',
 )
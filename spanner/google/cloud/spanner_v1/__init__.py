@@ -26,6 +26,8 @@ from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import AbstractSessionPool
 from google.cloud.spanner_v1.pool import BurstyPool
 from google.cloud.spanner_v1.pool import FixedSizePool
+from google.cloud.spanner_v1.pool import HealthTrackedPool
+from google.cloud.spanner_v1.snapshot import StreamRetry
 
 
 __all__ = (
@@ -45,6 +47,10 @@ __all__ = (
     'AbstractSessionPool',
     'BurstyPool',
     'FixedSizePool',
+    'HealthTrackedPool',
+
+    # google.cloud.spanner_v1.snapshot
+    'StreamRetry',
 
     # google.cloud.spanner_v1.gapic
     'enums',
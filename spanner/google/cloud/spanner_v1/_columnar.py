@@ -0,0 +1,377 @@
+# Copyright 2017 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decode result set values into typed column buffers.
+
+The buffers are converted to :mod:`pandas` / :mod:`pyarrow` columns by
+:meth:`~google.cloud.spanner_v1.streamed.StreamedResultSet.to_dataframe`
+and :meth:`~google.cloud.spanner_v1.streamed.StreamedResultSet.to_arrow`:
+neither library is required by this module.
+"""
+
+import array
+import datetime
+
+import six
+
+from google.cloud._helpers import UTC
+from google.cloud.spanner_v1.proto import type_pb2
+from google.cloud.spanner_v1._helpers import _DECODERS_BY_CODE
+from google.cloud.spanner_v1._helpers import _make_value_decoder
+
+
+def _int64_typecode():
+    """Return the :mod:`array` typecode of signed 64-bit integers."""
+    for typecode in ('q', 'l'):
+        try:
+            if array.array(typecode).itemsize == 8:
+                return typecode
+        except ValueError:  # 'q' is not available on Python 2.
+            pass
+    raise ValueError('No 64-bit array typecode')  # pragma: NO COVER
+
+
+_INT64_TYPECODE = _int64_typecode()
+_NAT = -2 ** 63  # NumPy's ``NaT``, as an integer.
+_NANOS_PER_SECOND = 10 ** 9
+_SECONDS_PER_DAY = 24 * 60 * 60
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+_NANOS_PER_MICROSECOND = 1000
+
+
+def _rfc3339_to_nanos(text):
+    """Convert a Spanner timestamp to nanoseconds since the epoch.
+
+    :type text: str
+    :param text: timestamp formatted as ``YYYY-MM-DDTHH:MM:SS[.fffffffff]Z``
+
+    :rtype: int
+    :returns: nanoseconds since the Unix epoch (UTC)
+    :raises ValueError: if the timestamp is not in UTC.
+    """
+    if not text.endswith('Z'):
+        raise ValueError('Timestamp not in UTC: %r' % (text,))
+    days = datetime.date(
+        int(text[0:4]), int(text[5:7]), int(text[8:10])).toordinal()
+    seconds = ((days - _EPOCH_ORDINAL) * _SECONDS_PER_DAY +
+               int(text[11:13]) * 3600 +
+               int(text[14:16]) * 60 +
+               int(text[17:19]))
+    nanos = 0
+    if text[19] == '.':
+        nanos = int(text[20:-1].ljust(9, '0'))
+    return seconds * _NANOS_PER_SECOND + nanos
+
+
+def _iso8601_to_days(text):
+    """Convert a Spanner date to days since the epoch.
+
+    :type text: str
+    :param text: date formatted as ``YYYY-MM-DD``
+
+    :rtype: int
+    :returns: days since the Unix epoch
+    """
+    return datetime.date(
+        int(text[0:4]), int(text[5:7]), int(text[8:10])
+    ).toordinal() - _EPOCH_ORDINAL
+
+
+def _days_to_date(days):
+    """Convert days since the epoch to a :class:`datetime.date`."""
+    return datetime.date.fromordinal(days + _EPOCH_ORDINAL)
+
+
+def _micros_to_datetime(micros):
+    """Convert microseconds since the epoch to a UTC datetime."""
+    return _EPOCH + datetime.timedelta(microseconds=micros)
+
+
+def _decode_int64(value_pb):
+    """Decode an INT64 value."""
+    return int(value_pb.string_value)
+
+
+def _decode_bool(value_pb):
+    """Decode a BOOL value, as an integer."""
+    return int(value_pb.bool_value)
+
+
+def _decode_date(value_pb):
+    """Decode a DATE value, as days since the epoch."""
+    return _iso8601_to_days(value_pb.string_value)
+
+
+def _decode_timestamp(value_pb):
+    """Decode a TIMESTAMP value, as nanoseconds since the epoch."""
+    return _rfc3339_to_nanos(value_pb.string_value)
+
+
+def _decode_timestamp_micros(value_pb):
+    """Decode a TIMESTAMP value, as microseconds since the epoch."""
+    return _rfc3339_to_nanos(value_pb.string_value) // _NANOS_PER_MICROSECOND
+
+
+# Type code -> (array typecode, fill value for nulls, decoder)
+_ARRAY_COLUMNS = {
+    type_pb2.INT64: (_INT64_TYPECODE, 0, _decode_int64),
+    type_pb2.FLOAT64: (
+        'd', float('nan'), _DECODERS_BY_CODE[type_pb2.FLOAT64]),
+    type_pb2.BOOL: ('b', 0, _decode_bool),
+    type_pb2.DATE: ('i', 0, _decode_date),
+    type_pb2.TIMESTAMP: (_INT64_TYPECODE, _NAT, _decode_timestamp),
+}
+
+
+class _ColumnBuffer(object):
+    """Values of one column of a result set, decoded into a typed buffer.
+
+    INT64 / FLOAT64 / BOOL values are stored in an :class:`array.array`, as
+    are DATE values (as days since the epoch) and TIMESTAMP values (as
+    nanoseconds since the epoch).  Values of other types are stored in a
+    list, as decoded for rows.  Nulls are recorded in :attr:`nulls`; in
+    the typed buffers, they hold ``NaN`` (FLOAT64), ``NaT`` (TIMESTAMP) or
+    zero.
+
+    Nanoseconds since the epoch only fit in 64 bits for the years 1677 to
+    2262: once a TIMESTAMP value is out of that range, the whole column is
+    stored as microseconds since the epoch instead (see
+    :attr:`timestamp_unit`), dropping any nanoseconds.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param field_type: type of the column
+    """
+    __slots__ = (
+        'field_type', 'values', 'nulls', 'null_count', 'timestamp_unit',
+        '_fill', '_decode')
+
+    def __init__(self, field_type):
+        self.field_type = field_type
+        self.timestamp_unit = 'ns'
+        code = field_type.code
+        if code in _ARRAY_COLUMNS:
+            typecode, self._fill, self._decode = _ARRAY_COLUMNS[code]
+            self.values = array.array(typecode)
+        elif code in (type_pb2.ARRAY, type_pb2.STRUCT):
+            self._fill = None
+            self._decode = _make_value_decoder(field_type)
+            self.values = []
+        else:
+            self._fill = None
+            try:
+                self._decode = _DECODERS_BY_CODE[code]
+            except KeyError:
+                raise ValueError("Unknown type: %s" % (field_type,))
+            self.values = []
+        self.nulls = bytearray()
+        self.null_count = 0
+
+    def __len__(self):
+        return len(self.nulls)
+
+    def extend(self, value_pbs):
+        """Decode values at the end of the column.
+
+        :type value_pbs: list of :class:`~google.protobuf.struct_pb2.Value`
+        :param value_pbs: the values to append
+        """
+        nulls = [value_pb.HasField('null_value') for value_pb in value_pbs]
+        fill = self._fill
+        decode = self._decode
+        decoded = [
+            fill if is_null else decode(value_pb)
+            for value_pb, is_null in zip(value_pbs, nulls)]
+        length = len(self.values)
+        try:
+            self.values.extend(decoded)
+        except OverflowError:
+            if (self.field_type.code != type_pb2.TIMESTAMP or
+                    self.timestamp_unit != 'ns'):
+                raise
+            del self.values[length:]
+            self._to_microseconds()
+            self.values.extend([
+                fill if is_null else value // _NANOS_PER_MICROSECOND
+                for value, is_null in zip(decoded, nulls)])
+        self.nulls.extend(nulls)
+        self.null_count += sum(nulls)
+
+    def _to_microseconds(self):
+        """Store the values of a TIMESTAMP column as microseconds."""
+        self.timestamp_unit = 'us'
+        self.values = array.array(self.values.typecode, [
+            value if is_null else value // _NANOS_PER_MICROSECOND
+            for value, is_null in zip(self.values, self.nulls)])
+        self._decode = _decode_timestamp_micros
+
+    def to_list(self, convert=None):
+        """Return the values of the column, with ``None`` for nulls.
+
+        :type convert: callable
+        :param convert: (Optional) applied to each non-null value.
+
+        :rtype: list
+        :returns: the values of the column
+        """
+        values = self.values
+        if isinstance(values, array.array):
+            values = values.tolist()
+        if convert is None and not self.null_count:
+            return values
+        if convert is None:
+            return [None if is_null else value
+                    for value, is_null in zip(values, self.nulls)]
+        return [None if is_null else convert(value)
+                for value, is_null in zip(values, self.nulls)]
+
+
+def _make_column_buffers(fields):
+    """Build empty column buffers for a row type's fields.
+
+    :type fields:
+        list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Field`
+    :param fields: the fields of the result set's row type
+
+    :rtype: list of :class:`_ColumnBuffer`
+    :returns: one buffer per field
+    """
+    return [_ColumnBuffer(field.type) for field in fields]
+
+
+def _numpy_values(numpy, column):
+    """Return the typed buffer of a column as a NumPy array (no copy)."""
+    values = column.values
+    if not values:
+        return numpy.array([], dtype=values.typecode)
+    return numpy.frombuffer(values, dtype=values.typecode)
+
+
+def _column_to_pandas(numpy, pandas, column):
+    """Convert a column buffer to the data of a :mod:`pandas` column.
+
+    INT64 and BOOL columns without nulls become ``int64`` / ``bool``
+    columns, FLOAT64 columns ``float64`` columns (``NaN`` for nulls), and
+    TIMESTAMP columns ``datetime64[ns, UTC]`` columns (``NaT`` for nulls),
+    unless they hold values out of the range of ``datetime64[ns]``.  Other
+    columns are ``object`` columns.
+    """
+    code = column.field_type.code
+    if code == type_pb2.FLOAT64:
+        return _numpy_values(numpy, column)
+    if code == type_pb2.TIMESTAMP:
+        if column.timestamp_unit != 'ns':
+            return pandas.Series(
+                column.to_list(_micros_to_datetime), dtype=object)
+        return pandas.to_datetime(
+            _numpy_values(numpy, column).view('datetime64[ns]'), utc=True)
+    if code in (type_pb2.INT64, type_pb2.BOOL) and not column.null_count:
+        values = _numpy_values(numpy, column)
+        if code == type_pb2.BOOL:
+            values = values.astype(bool)
+        return values
+    if code == type_pb2.DATE:
+        values = column.to_list(_days_to_date)
+    elif code == type_pb2.BOOL:
+        values = column.to_list(bool)
+    else:
+        values = column.to_list()
+    # Keep pandas from turning integers with nulls into floats.
+    return pandas.Series(values, dtype=object)
+
+
+def _arrow_type(pyarrow, field_type):
+    """Return the :mod:`pyarrow` type of the values of a Spanner type."""
+    code = field_type.code
+    if code == type_pb2.ARRAY:
+        return pyarrow.list_(
+            _arrow_type(pyarrow, field_type.array_element_type))
+    if code == type_pb2.STRUCT:
+        return pyarrow.struct([
+            pyarrow.field(field.name, _arrow_type(pyarrow, field.type))
+            for field in field_type.struct_type.fields])
+    return {
+        type_pb2.BOOL: pyarrow.bool_,
+        type_pb2.INT64: pyarrow.int64,
+        type_pb2.FLOAT64: pyarrow.float64,
+        type_pb2.STRING: pyarrow.string,
+        type_pb2.BYTES: pyarrow.binary,
+        type_pb2.DATE: pyarrow.date32,
+        type_pb2.TIMESTAMP: lambda: pyarrow.timestamp('ns', tz='UTC'),
+    }[code]()
+
+
+def _to_arrow_value(value, field_type):
+    """Convert the STRUCT values nested in a decoded value to dicts."""
+    if value is None:
+        return None
+    code = field_type.code
+    if code == type_pb2.ARRAY:
+        element_type = field_type.array_element_type
+        return [_to_arrow_value(item, element_type) for item in value]
+    if code == type_pb2.STRUCT:
+        return {
+            field.name: _to_arrow_value(item, field.type)
+            for field, item in zip(field_type.struct_type.fields, value)}
+    return value
+
+
+def _column_to_arrow(numpy, pyarrow, column):
+    """Convert a column buffer to a :class:`pyarrow.Array`."""
+    field_type = column.field_type
+    arrow_type = _arrow_type(pyarrow, field_type)
+    code = field_type.code
+    if isinstance(column.values, array.array):
+        values = _numpy_values(numpy, column)
+        if code == type_pb2.BOOL:
+            values = values.astype(bool)
+        elif code == type_pb2.DATE:
+            values = values.astype('datetime64[D]')
+        elif code == type_pb2.TIMESTAMP:
+            unit = column.timestamp_unit
+            values = values.view('datetime64[%s]' % (unit,))
+            arrow_type = pyarrow.timestamp(unit, tz='UTC')
+        mask = None
+        if column.null_count:
+            mask = numpy.frombuffer(column.nulls, dtype=numpy.bool_)
+        return pyarrow.array(values, mask=mask, type=arrow_type)
+    values = column.values
+    if code in (type_pb2.ARRAY, type_pb2.STRUCT):
+        values = [_to_arrow_value(value, field_type) for value in values]
+    return pyarrow.array(values, type=arrow_type)
+
+
+def _field_names(fields):
+    """Return the column names of a result set's fields."""
+    return [field.name for field in fields]
+
+
+def _columns_to_dataframe(pandas, fields, columns):
+    """Build a :class:`pandas.DataFrame` from column buffers."""
+    import numpy   # pylint: disable=import-error
+
+    data = {
+        index: _column_to_pandas(numpy, pandas, column)
+        for index, column in enumerate(columns)}
+    frame = pandas.DataFrame(data, columns=list(six.moves.range(len(data))))
+    frame.columns = _field_names(fields)
+    return frame
+
+
+def _columns_to_record_batch(pyarrow, fields, columns):
+    """Build a :class:`pyarrow.RecordBatch` from column buffers."""
+    import numpy   # pylint: disable=import-error
+
+    arrays = [_column_to_arrow(numpy, pyarrow, column) for column in columns]
+    return pyarrow.RecordBatch.from_arrays(arrays, _field_names(fields))
@@ -16,6 +16,7 @@
 
 import datetime
 import math
+import operator
 
 import six
 
@@ -168,19 +169,332 @@ def _make_list_value_pb(values):
     return ListValue(values=[_make_value_pb(value) for value in values])
 
 
-def _make_list_value_pbs(values):
+def _make_list_value_pbs(values, column_types=None):
     """Construct a sequence of ListValue protobufs.
 
     :type values: list of list of scalar
-    :param values: Row data
+    :param values: Row data.  If ``column_types`` is passed, may also be a
+                   two-dimensional NumPy array, or a pandas DataFrame whose
+                   columns are in the same order as ``column_types``.
+
+    :type column_types:
+        list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param column_types: (Optional) type of each column, used to encode the
+                         values of each column in bulk.
 
     :rtype: list of :class:`~google.protobuf.struct_pb2.ListValue`
     :returns: sequence of protobufs
     """
-    return [_make_list_value_pb(row) for row in values]
+    if column_types is None:
+        return [_make_list_value_pb(row) for row in values]
+    encoders = [_make_column_encoder(type_) for type_ in column_types]
+    columns = _split_columns(values, len(encoders))
+    encoded = [encode(column) for encode, column in zip(encoders, columns)]
+    return [ListValue(values=row) for row in zip(*encoded)]
+
+
+def _make_null_value_pb():
+    """Construct a null Value protobuf."""
+    return Value(null_value='NULL_VALUE')
+
+
+def _encode_string(value):
+    """Encode a STRING or BYTES value, or return None if not a string."""
+    if isinstance(value, six.text_type):
+        return Value(string_value=value)
+    if isinstance(value, six.binary_type):
+        return Value(string_value=_try_to_coerce_bytes(value))
+
+
+def _encode_bool(value):
+    """Encode a BOOL value, or return None if not a bool."""
+    if isinstance(value, bool):
+        return Value(bool_value=value)
+
+
+def _encode_int64(value):
+    """Encode an INT64 value, or return None if not an integer."""
+    try:
+        return Value(string_value=str(operator.index(value)))
+    except TypeError:
+        return None
+
+
+def _encode_float64(value):
+    """Encode a FLOAT64 value, or return None if not a number."""
+    if isinstance(value, (float, six.integer_types)) and (
+            not isinstance(value, bool)):
+        return _make_value_pb(float(value))
+
+
+def _encode_date(value):
+    """Encode a DATE value, or return None if not a date."""
+    if isinstance(value, datetime.date) and (
+            not isinstance(value, datetime.datetime)):
+        return Value(string_value=value.isoformat())
+
+
+def _encode_timestamp(value):
+    """Encode a TIMESTAMP value, or return None if not a timestamp."""
+    if isinstance(value, TimestampWithNanoseconds):
+        return Value(string_value=value.rfc3339())
+    if isinstance(value, datetime.datetime):
+        return Value(string_value=_datetime_to_rfc3339(value))
+
+
+_ENCODERS_BY_CODE = {
+    type_pb2.STRING: _encode_string,
+    type_pb2.BYTES: _encode_string,
+    type_pb2.BOOL: _encode_bool,
+    type_pb2.INT64: _encode_int64,
+    type_pb2.FLOAT64: _encode_float64,
+    type_pb2.DATE: _encode_date,
+    type_pb2.TIMESTAMP: _encode_timestamp,
+}
+
+
+def _make_value_encoder(field_type):
+    """Build a function converting values of a given type to protobufs.
+
+    The type is inspected only once, so that the returned function can be
+    applied to every value of a column without trying each of the Python
+    types :func:`_make_value_pb` accepts.  Values which do not match the
+    type are still converted by :func:`_make_value_pb`.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param field_type: type of the values to be converted
+
+    :rtype: callable
+    :returns: function taking a value (or ``None``) and returning a
+              :class:`~google.protobuf.struct_pb2.Value`.
+    """
+    if field_type.code == type_pb2.ARRAY:
+        element_encoder = _make_value_encoder(field_type.array_element_type)
+
+        def encode(value):
+            if isinstance(value, (list, tuple)):
+                return Value(list_value=ListValue(
+                    values=[element_encoder(item) for item in value]))
+    else:
+        encode = _ENCODERS_BY_CODE.get(field_type.code, lambda value: None)
+
+    def encode_nullable(value):
+        if value is None:
+            return _make_null_value_pb()
+        value_pb = encode(value)
+        if value_pb is None:
+            value_pb = _make_value_pb(value)
+        return value_pb
+
+    return encode_nullable
+
+
+def _make_column_encoder(field_type):
+    """Build a function converting a column of values to protobufs.
+
+    Columns may be Python sequences, NumPy arrays or pandas Series: these
+    are converted to Python values in bulk, and INT64 columns of NumPy
+    integers (without missing values) are formatted in bulk.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param field_type: type of the values of the column
+
+    :rtype: callable
+    :returns: function taking a column and returning a list of
+              :class:`~google.protobuf.struct_pb2.Value`.
+    """
+    encode = _make_value_encoder(field_type)
+    code = field_type.code
+
+    def encode_column(column):
+        if code == type_pb2.INT64:
+            integers = _integer_array(column)
+            if integers is not None:
+                return [Value(string_value=formatted)
+                        for formatted in integers.astype(str).tolist()]
+        return [encode(value) for value in _column_values(column)]
+
+    return encode_column
+
+
+def _integer_array(column):
+    """Return an integer column as a NumPy integer array.
+
+    :rtype: :class:`numpy.ndarray`
+    :returns: the array, or ``None`` if the column is not a NumPy / pandas
+              integer column, or if it has missing values (e.g. in pandas'
+              nullable ``Int64`` columns).
+    """
+    if getattr(getattr(column, 'dtype', None), 'kind', None) not in ('i', 'u'):
+        return None
+    isna = getattr(column, 'isna', None)
+    if isna is not None and isna().any():
+        return None
+    array = _to_array(column)
+    if getattr(getattr(array, 'dtype', None), 'kind', None) not in ('i', 'u'):
+        return None
+    return array
+
+
+def _to_array(column):
+    """Return the NumPy array of a NumPy array or pandas Series."""
+    to_numpy = getattr(column, 'to_numpy', None)
+    if to_numpy is not None:
+        return to_numpy()
+    return getattr(column, 'values', column)
+
+
+def _column_values(column):
+    """Convert a column to a list of Python values.
+
+    Missing values of pandas Series and ``NaT`` values of NumPy datetime
+    arrays become ``None``; NumPy datetimes become :class:`datetime.datetime`
+    instances (with microsecond precision).
+    """
+    if not hasattr(column, 'dtype'):
+        return list(column)
+    if hasattr(column, 'isna'):  # pandas.Series
+        missing = column.isna()
+        if missing.any():
+            if column.dtype.kind == 'M':
+                values = _column_values(_to_array(column))
+            else:
+                # ``to_numpy()`` would turn the integers of nullable
+                # ``Int64`` columns into floats.
+                values = column.to_numpy(dtype=object).tolist()
+            return [None if is_missing else value for value, is_missing
+                    in zip(values, missing.tolist())]
+        column = _to_array(column)
+    if column.dtype.kind == 'M':
+        column = column.astype('datetime64[us]')
+    return column.tolist()
+
+
+def _split_columns(values, width):
+    """Split row data into columns.
+
+    :type values: list of list of scalar, NumPy array, or pandas DataFrame
+    :param values: row data
+
+    :type width: int
+    :param width: number of columns
+
+    :rtype: list
+    :returns: ``width`` columns.
+    """
+    if hasattr(values, 'iloc'):  # pandas.DataFrame
+        return [values.iloc[:, index] for index in six.moves.range(width)]
+    if getattr(values, 'ndim', None) == 2:  # numpy.ndarray
+        return [values[:, index] for index in six.moves.range(width)]
+    columns = list(zip(*values))
+    if not columns:
+        return [()] * width
+    return columns
+
+
+def _decode_string(value_pb):
+    """Decode a STRING value."""
+    return value_pb.string_value
+
+
+def _decode_bytes(value_pb):
+    """Decode a BYTES value."""
+    return value_pb.string_value.encode('utf8')
+
+
+def _decode_bool(value_pb):
+    """Decode a BOOL value."""
+    return value_pb.bool_value
+
+
+def _decode_int64(value_pb):
+    """Decode an INT64 value."""
+    return int(value_pb.string_value)
+
+
+def _decode_float64(value_pb):
+    """Decode a FLOAT64 value: ``NaN`` / ``Infinity`` arrive as strings."""
+    if value_pb.HasField('string_value'):
+        return float(value_pb.string_value)
+    return value_pb.number_value
+
+
+def _decode_date(value_pb):
+    """Decode a DATE value."""
+    return _date_from_iso8601_date(value_pb.string_value)
+
+
+def _decode_timestamp(value_pb):
+    """Decode a TIMESTAMP value."""
+    return TimestampWithNanoseconds.from_rfc3339(value_pb.string_value)
+
+
+_DECODERS_BY_CODE = {
+    type_pb2.STRING: _decode_string,
+    type_pb2.BYTES: _decode_bytes,
+    type_pb2.BOOL: _decode_bool,
+    type_pb2.INT64: _decode_int64,
+    type_pb2.FLOAT64: _decode_float64,
+    type_pb2.DATE: _decode_date,
+    type_pb2.TIMESTAMP: _decode_timestamp,
+}
+
+
+def _make_value_decoder(field_type):
+    """Build a function converting Value protobufs of a given type.
+
+    The type is inspected only once, so that the returned function can be
+    applied to every value of a column without dispatching on its type code.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param field_type: type of the values to be converted
+
+    :rtype: callable
+    :returns: function taking a :class:`~google.protobuf.struct_pb2.Value`
+              and returning the cell data (``None`` for null values).
+    :raises ValueError: if unknown type is passed
+    """
+    code = field_type.code
+    if code == type_pb2.ARRAY:
+        element_decoder = _make_value_decoder(field_type.array_element_type)
+
+        def decode(value_pb):
+            return [element_decoder(item_pb)
+                    for item_pb in value_pb.list_value.values]
+    elif code == type_pb2.STRUCT:
+        field_decoders = [
+            _make_value_decoder(field.type)
+            for field in field_type.struct_type.fields]
+
+        def decode(value_pb):
+            return [field_decoder(item_pb) for field_decoder, item_pb
+                    in zip(field_decoders, value_pb.list_value.values)]
+    else:
+        try:
+            decode = _DECODERS_BY_CODE[code]
+        except KeyError:
+            raise ValueError("Unknown type: %s" % (field_type,))
+
+    def decode_nullable(value_pb):
+        if value_pb.HasField('null_value'):
+            return None
+        return decode(value_pb)
+
+    return decode_nullable
+
+
+def _make_row_decoders(row_type):
+    """Build value decoders for each column of a row type.
+
+    :type row_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.StructType`
+    :param row_type: row schema specification
+
+    :rtype: list of callable
+    :returns: one decoder per column, as built by :func:`_make_value_decoder`
+    """
+    return [_make_value_decoder(field.type) for field in row_type.fields]
 
 
-# pylint: disable=too-many-branches
 def _parse_value_pb(value_pb, field_type):
     """Convert a Value protobuf to cell data.
 
@@ -194,37 +508,7 @@ def _parse_value_pb(value_pb, field_type):
     :returns: value extracted from value_pb
     :raises ValueError: if unknown type is passed
     """
-    if value_pb.HasField('null_value'):
-        return None
-    if field_type.code == type_pb2.STRING:
-        result = value_pb.string_value
-    elif field_type.code == type_pb2.BYTES:
-        result = value_pb.string_value.encode('utf8')
-    elif field_type.code == type_pb2.BOOL:
-        result = value_pb.bool_value
-    elif field_type.code == type_pb2.INT64:
-        result = int(value_pb.string_value)
-    elif field_type.code == type_pb2.FLOAT64:
-        if value_pb.HasField('string_value'):
-            result = float(value_pb.string_value)
-        else:
-            result = value_pb.number_value
-    elif field_type.code == type_pb2.DATE:
-        result = _date_from_iso8601_date(value_pb.string_value)
-    elif field_type.code == type_pb2.TIMESTAMP:
-        result = TimestampWithNanoseconds.from_rfc3339(value_pb.string_value)
-    elif field_type.code == type_pb2.ARRAY:
-        result = [
-            _parse_value_pb(item_pb, field_type.array_element_type)
-            for item_pb in value_pb.list_value.values]
-    elif field_type.code == type_pb2.STRUCT:
-        result = [
-            _parse_value_pb(item_pb, field_type.struct_type.fields[i].type)
-            for (i, item_pb) in enumerate(value_pb.list_value.values)]
-    else:
-        raise ValueError("Unknown type: %s" % (field_type,))
-    return result
-# pylint: enable=too-many-branches
+    return _make_value_decoder(field_type)(value_pb)
 
 
 def _parse_list_value_pbs(rows, row_type):
@@ -239,13 +523,11 @@ def _parse_list_value_pbs(rows, row_type):
     :rtype: list of list of cell data
     :returns: data for the rows, coerced into appropriate types
     """
-    result = []
-    for row in rows:
-        row_data = []
-        for value_pb, field in zip(row.values, row_type.fields):
-            row_data.append(_parse_value_pb(value_pb, field.type))
-        result.append(row_data)
-    return result
+    decoders = _make_row_decoders(row_type)
+    return [
+        [decoder(value_pb) for decoder, value_pb in zip(decoders, row.values)]
+        for row in rows
+    ]
 
 
 class _SessionWrapper(object):
@@ -45,7 +45,7 @@ class _BatchBase(_SessionWrapper):
         """
         raise NotImplementedError
 
-    def insert(self, table, columns, values):
+    def insert(self, table, columns, values, column_types=None):
         """Insert one or more new table rows.
 
         :type table: str
@@ -56,11 +56,17 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
         """
         self._mutations.append(Mutation(
-            insert=_make_write_pb(table, columns, values)))
+            insert=_make_write_pb(table, columns, values, column_types)))
 
-    def update(self, table, columns, values):
+    def update(self, table, columns, values, column_types=None):
         """Update one or more existing table rows.
 
         :type table: str
@@ -71,11 +77,17 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
         """
         self._mutations.append(Mutation(
-            update=_make_write_pb(table, columns, values)))
+            update=_make_write_pb(table, columns, values, column_types)))
 
-    def insert_or_update(self, table, columns, values):
+    def insert_or_update(self, table, columns, values, column_types=None):
         """Insert/update one or more table rows.
 
         :type table: str
@@ -86,11 +98,18 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
         """
         self._mutations.append(Mutation(
-            insert_or_update=_make_write_pb(table, columns, values)))
+            insert_or_update=_make_write_pb(
+                table, columns, values, column_types)))
 
-    def replace(self, table, columns, values):
+    def replace(self, table, columns, values, column_types=None):
         """Replace one or more table rows.
 
         :type table: str
@@ -101,9 +120,15 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
         """
         self._mutations.append(Mutation(
-            replace=_make_write_pb(table, columns, values)))
+            replace=_make_write_pb(table, columns, values, column_types)))
 
     def delete(self, table, keyset):
         """Delete one or more table rows.
@@ -170,7 +195,7 @@ class Batch(_BatchBase):
             self.commit()
 
 
-def _make_write_pb(table, columns, values):
+def _make_write_pb(table, columns, values, column_types=None):
     """Helper for :meth:`Batch.insert` et aliae.
 
     :type table: str
@@ -182,11 +207,15 @@ def _make_write_pb(table, columns, values):
     :type values: list of lists
     :param values: Values to be modified.
 
+    :type column_types:
+        list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param column_types: (Optional) types of the columns.
+
     :rtype: :class:`google.cloud.spanner_v1.proto.mutation_pb2.Mutation.Write`
     :returns: Write protobuf
     """
     return Mutation.Write(
         table=table,
         columns=columns,
-        values=_make_list_value_pbs(values),
+        values=_make_list_value_pbs(values, column_types),
     )
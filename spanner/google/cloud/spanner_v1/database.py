@@ -14,9 +14,12 @@
 
 """User friendly container for Cloud Spanner Database."""
 
+import random
 import re
 import threading
+import time
 
+from concurrent import futures
 from google.api_core import exceptions
 import google.auth.credentials
 from google.cloud.exceptions import Conflict
@@ -25,14 +28,25 @@ from google.gax.errors import GaxError
 from google.gax.grpc import exc_to_code
 from grpc import StatusCode
 import six
+from six.moves import queue
 
 # pylint: disable=ungrouped-imports
+from google.cloud._helpers import _pb_timestamp_to_datetime
+from google.cloud._helpers import _timedelta_to_duration_pb
 from google.cloud.spanner_v1 import __version__
+from google.cloud.spanner_v1._helpers import _make_list_value_pbs
 from google.cloud.spanner_v1._helpers import _options_with_prefix
 from google.cloud.spanner_v1.batch import Batch
 from google.cloud.spanner_v1.gapic.spanner_client import SpannerClient
+from google.cloud.spanner_v1.keyset import KeyRange
+from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import BurstyPool
 from google.cloud.spanner_v1.pool import SessionCheckout
+from google.cloud.spanner_v1.proto.mutation_pb2 import Mutation
+from google.cloud.spanner_v1.proto.transaction_pb2 import (
+    TransactionOptions)
+from google.cloud.spanner_v1.session import _get_retry_delay
+from google.cloud.spanner_v1.session import DEFAULT_RETRY_TIMEOUT_SECS
 from google.cloud.spanner_v1.session import Session
 from google.cloud.spanner_v1.snapshot import Snapshot
 # pylint: enable=ungrouped-imports
@@ -300,6 +314,17 @@ class Database(object):
             if exc_to_code(exc.cause) == StatusCode.NOT_FOUND:
                 raise NotFound(self.name)
             raise
+        self.close()
+
+    def close(self):
+        """Stop the background work of the database's session pool.
+
+        Call this method when done with the database, so that the pool no
+        longer keeps its sessions alive.  The sessions are not deleted:  see
+        :meth:`~google.cloud.spanner_v1.pool.AbstractSessionPool.clear`.
+        :meth:`drop` calls this method.
+        """
+        self._pool.close()
 
     def session(self):
         """Factory to create a session for this database.
@@ -339,6 +364,39 @@ class Database(object):
         """
         return BatchCheckout(self)
 
+    def batch_snapshot(self, read_timestamp=None, exact_staleness=None):
+        """Return an object which wraps a batch read / query.
+
+        :type read_timestamp: :class:`datetime.datetime`
+        :param read_timestamp: Execute all reads at the given timestamp.
+
+        :type exact_staleness: :class:`datetime.timedelta`
+        :param exact_staleness: Execute all reads at a timestamp that is
+                                ``exact_staleness`` old.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.BatchSnapshot`
+        :returns: new wrapper
+        """
+        return BatchSnapshot(
+            self,
+            read_timestamp=read_timestamp,
+            exact_staleness=exact_staleness,
+        )
+
+    def mutation_writer(self, **kw):
+        """Return a writer committing mutations in concurrent batches.
+
+        :type kw: dict
+        :param kw:
+            Passed through to
+            :class:`~google.cloud.spanner_v1.database.MutationWriter`
+            constructor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.MutationWriter`
+        :returns: new writer
+        """
+        return MutationWriter(self, **kw)
+
     def run_in_transaction(self, func, *args, **kw):
         """Perform a unit of work in a transaction, retrying on abort.
 
@@ -437,6 +495,817 @@ class SnapshotCheckout(object):
         self._database._pool.put(self._session)
 
 
+_SAMPLES_PER_PARTITION = 100
+"""Rows sampled per requested partition when computing split points."""
+
+_DEFAULT_MAX_WORKERS = 8
+"""Default number of batches processed concurrently."""
+
+_ROWS_PER_CHUNK = 100
+"""Rows handed over at once from a worker to the consuming thread."""
+
+_CHUNKS_PER_BATCH = 16
+"""Chunks buffered for each batch being processed."""
+
+_PUT_POLL_INTERVAL = 0.1
+"""Seconds between checks for cancellation, while a worker is blocked."""
+
+
+class BatchSnapshot(object):
+    """Wrapper for reading a database in parallel, at a single timestamp.
+
+    Splits a read or a query into batches, which can be processed
+    concurrently, on separate sessions, by threads (see
+    :meth:`process_batches`) or by other processes (see :meth:`to_dict`,
+    :meth:`from_dict` and :meth:`process`).  Every batch is read with a
+    single-use snapshot at the same timestamp, so that the results of all
+    of the batches are consistent with each other.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to use
+
+    :type read_timestamp: :class:`datetime.datetime`
+    :param read_timestamp: Execute all reads at the given timestamp.
+
+    :type exact_staleness: :class:`datetime.timedelta`
+    :param exact_staleness: Execute all reads at a timestamp that is
+                            ``exact_staleness`` old.
+    """
+    def __init__(self, database, read_timestamp=None, exact_staleness=None):
+        if read_timestamp is not None and exact_staleness is not None:
+            raise ValueError("Supply zero or one options.")
+        self._database = database
+        self._read_timestamp = read_timestamp
+        self._exact_staleness = exact_staleness
+
+    @classmethod
+    def from_dict(cls, database, mapping):
+        """Reconstruct an instance from a mapping.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: database to use
+
+        :type mapping: mapping
+        :param mapping: serialized state of the instance, as returned by
+                        :meth:`to_dict`
+
+        :rtype: :class:`BatchSnapshot`
+        :returns: an instance reading at the same timestamp
+        """
+        return cls(database, read_timestamp=mapping['read_timestamp'])
+
+    def to_dict(self):
+        """Return state as a dictionary.
+
+        Result can be used to serialize the instance and reconstitute
+        it later using :meth:`from_dict`.
+
+        :rtype: dict
+        :returns: the instance's read timestamp, fixing it if needed
+        """
+        return {'read_timestamp': self.read_timestamp}
+
+    @property
+    def read_timestamp(self):
+        """Timestamp at which all of the batches are read.
+
+        Unless passed to the constructor, the timestamp is fixed on first
+        access, by beginning a read-only transaction.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: the read timestamp.
+        """
+        if self._read_timestamp is None:
+            self._read_timestamp = self._begin()
+        return self._read_timestamp
+
+    def _begin(self):
+        """Begin a read-only transaction, returning its read timestamp."""
+        if self._exact_staleness is not None:
+            read_only = TransactionOptions.ReadOnly(
+                exact_staleness=_timedelta_to_duration_pb(
+                    self._exact_staleness),
+                return_read_timestamp=True)
+        else:
+            read_only = TransactionOptions.ReadOnly(
+                strong=True, return_read_timestamp=True)
+        database = self._database
+        options = _options_with_prefix(database.name)
+        with SessionCheckout(database._pool) as session:
+            response = database.spanner_api.begin_transaction(
+                session.name, TransactionOptions(read_only=read_only),
+                options=options)
+        return _pb_timestamp_to_datetime(response.read_timestamp)
+
+    def _snapshot(self, session):
+        """Create a single-use snapshot at the read timestamp."""
+        return Snapshot(session, read_timestamp=self.read_timestamp)
+
+    def sample_split_points(self, table, key_columns, partitions, index='',
+                            descending_columns=()):
+        """Estimate keys splitting a table into ranges of similar size.
+
+        Samples the keys of the table (or index) at the read timestamp; the
+        sample is sorted by Spanner, in key order.
+
+        :type table: str
+        :param table: name of the table to be split
+
+        :type key_columns: list of str
+        :param key_columns: names of the table's primary key columns (or of
+                            the index's key columns), in key order
+
+        :type partitions: int
+        :param partitions: the number of ranges wanted
+
+        :type index: str
+        :param index: (Optional) name of an index to split, rather than the
+                      table's primary key
+
+        :type descending_columns: list of str
+        :param descending_columns: (Optional) names of the key columns
+                                   declared ``DESC`` in the table's primary
+                                   key (or in the index)
+
+        :rtype: list of list
+        :returns: at most ``partitions - 1`` keys, in key order
+        :raises ValueError: if ``partitions`` is not positive, or if
+                            ``descending_columns`` are not key columns.
+        """
+        if partitions < 1:
+            raise ValueError("'partitions' must be positive.")
+        unknown = set(descending_columns).difference(key_columns)
+        if unknown:
+            raise ValueError(
+                'Descending columns are not key columns: %s' % (
+                    ', '.join(sorted(unknown)),))
+        if partitions == 1:
+            return []
+        source = '`%s`' % (table,)
+        if index:
+            source += '@{FORCE_INDEX=`%s`}' % (index,)
+        columns = ', '.join('`%s`' % (column,) for column in key_columns)
+        # Python does not sort BYTES (returned as base64 text) or DESC
+        # columns in key order: let Spanner do it.
+        order = ', '.join(
+            '`%s` %s' % (
+                column, 'DESC' if column in descending_columns else 'ASC')
+            for column in key_columns)
+        sql = (
+            'SELECT %s FROM (SELECT %s FROM %s TABLESAMPLE RESERVOIR '
+            '(%d ROWS)) ORDER BY %s' % (
+                columns, columns, source,
+                partitions * _SAMPLES_PER_PARTITION, order))
+        with SessionCheckout(self._database._pool) as session:
+            sample = list(self._snapshot(session).execute_sql(sql))
+
+        points = []
+        for partition in six.moves.range(1, partitions):
+            position = len(sample) * partition // partitions
+            if position >= len(sample):
+                break
+            point = list(sample[position])
+            if not points or point != points[-1]:
+                points.append(point)
+        return points
+
+    def generate_read_batches(self, table, columns, keyset=None, index='',
+                              key_ranges=None, key_columns=None,
+                              partitions=None, descending_columns=()):
+        """Split a read into batches.
+
+        Batches either read the ranges in ``key_ranges``, or, if
+        ``key_columns`` and ``partitions`` are passed, ranges computed by
+        :meth:`sample_split_points`; otherwise the read is a single batch.
+
+        :type table: str
+        :param table: name of the table from which to fetch data
+
+        :type columns: list of str
+        :param columns: names of columns to be retrieved
+
+        :type keyset: :class:`~google.cloud.spanner_v1.keyset.KeySet`
+        :param keyset: (Optional) keys / ranges identifying rows to be
+                       retrieved, when the read is not split; defaults to
+                       all of the rows.
+
+        :type index: str
+        :param index: (Optional) name of index to use, rather than the
+                      table's primary key
+
+        :type key_ranges:
+            list of :class:`~google.cloud.spanner_v1.keyset.KeyRange`
+        :param key_ranges: (Optional) ranges to be read by each batch
+
+        :type key_columns: list of str
+        :param key_columns: (Optional) names of the key columns of the table
+                            (or index), used to sample split points
+
+        :type partitions: int
+        :param partitions: (Optional) number of batches to split the table
+                           (or index) into, using sampled split points
+
+        :type descending_columns: list of str
+        :param descending_columns: (Optional) names of the key columns
+                                   declared ``DESC``, used to sample split
+                                   points
+
+        :rtype: list of dict
+        :returns: batches, to be passed to :meth:`process` or
+                  :meth:`process_batches`.
+        :raises ValueError: if both ``keyset`` and a way of splitting it are
+                            passed.
+        """
+        if key_ranges is None and partitions is not None:
+            if key_columns is None:
+                raise ValueError(
+                    "Pass 'key_columns' to sample split points.")
+            key_ranges = _split_points_to_key_ranges(
+                self.sample_split_points(
+                    table, key_columns, partitions, index=index,
+                    descending_columns=descending_columns))
+
+        if key_ranges is None:
+            if keyset is None:
+                keyset = KeySet(all_=True)
+            keysets = [keyset]
+        elif keyset is not None:
+            raise ValueError(
+                "Pass either 'keyset' or a way to split the table.")
+        else:
+            keysets = [KeySet(ranges=[key_range]) for key_range in key_ranges]
+
+        return [{
+            'read': {
+                'table': table,
+                'columns': list(columns),
+                'keyset': batch_keyset,
+                'index': index,
+            },
+        } for batch_keyset in keysets]
+
+    def generate_query_batches(self, sql, params=None, param_types=None,
+                               partition_params=None):
+        """Split a query into batches.
+
+        Each batch runs the query with ``params`` updated from one item of
+        ``partition_params``: the query typically restricts its results
+        to a key range, e.g. ``WHERE id >= @start AND id < @end``, and
+        each item binds the bounds of one range (see
+        :meth:`sample_split_points`).
+
+        :type sql: str
+        :param sql: SQL query statement
+
+        :type params: dict, {str -> column value}
+        :param params: (Optional) values for parameter replacement shared by
+                       all of the batches.
+
+        :type param_types: dict
+        :param param_types: (Optional) maps explicit types for one or more
+                            param values; required if parameters are passed.
+
+        :type partition_params: list of dict
+        :param partition_params: (Optional) values for parameter replacement
+                                 specific to each batch; if not passed, the
+                                 query is a single batch.
+
+        :rtype: list of dict
+        :returns: batches, to be passed to :meth:`process` or
+                  :meth:`process_batches`.
+        """
+        if partition_params is None:
+            partition_params = [{}]
+        batches = []
+        for extra in partition_params:
+            batch_params = dict(params or {})
+            batch_params.update(extra)
+            batches.append({
+                'query': {
+                    'sql': sql,
+                    'params': batch_params or None,
+                    'param_types': param_types,
+                },
+            })
+        return batches
+
+    def process(self, batch):
+        """Read the rows of a single batch.
+
+        A session is checked out of the database's pool until the rows
+        have been consumed.
+
+        :type batch: dict
+        :param batch: one of the batches returned by
+                      :meth:`generate_read_batches` or
+                      :meth:`generate_query_batches`.
+
+        :rtype: iterable of list
+        :returns: the batch's rows.
+        :raises ValueError: if the batch is neither a read nor a query.
+        """
+        if 'read' not in batch and 'query' not in batch:
+            raise ValueError("Invalid batch")
+        with SessionCheckout(self._database._pool) as session:
+            snapshot = self._snapshot(session)
+            if 'read' in batch:
+                rows = snapshot.read(**batch['read'])
+            else:
+                rows = snapshot.execute_sql(**batch['query'])
+            for row in rows:
+                yield row
+
+    def process_batches(self, batches, max_workers=_DEFAULT_MAX_WORKERS,
+                        ordered=False):
+        """Read the rows of several batches, in parallel.
+
+        Rows are yielded as soon as they are received; only a bounded
+        number of them is buffered for each batch.  Processing stops when
+        the returned iterator is closed or garbage collected.
+
+        :type batches: list of dict
+        :param batches: batches returned by :meth:`generate_read_batches` or
+                        :meth:`generate_query_batches`.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of batches processed
+                            concurrently, each on its own session: the
+                            database's pool must be able to provide them.
+
+        :type ordered: bool
+        :param ordered: (Optional) If true, yield the rows of each batch
+                        after those of the previous batches (for batches
+                        generated from key ranges, yielding the rows in key
+                        order); otherwise, yield rows from all of the
+                        batches as they are received.
+
+        :rtype: iterable of list
+        :returns: the rows of all of the batches.
+        :raises: the first error raised while processing a batch.
+        """
+        batches = list(batches)
+        if ordered:
+            outputs = [queue.Queue(maxsize=_CHUNKS_PER_BATCH)
+                       for _ in batches]
+        else:
+            shared = queue.Queue(
+                maxsize=_CHUNKS_PER_BATCH * min(max_workers, len(batches)))
+            outputs = [shared] * len(batches)
+
+        cancelled = threading.Event()
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for batch, output in zip(batches, outputs):
+                executor.submit(
+                    self._process_into, batch, output, cancelled)
+            if ordered:
+                for output in outputs:
+                    for row in _drain(output, 1):
+                        yield row
+            else:
+                for row in _drain(shared, len(batches)):
+                    yield row
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=False)
+
+    def _process_into(self, batch, output, cancelled):
+        """Process a batch, handing its rows over in chunks."""
+        rows = self.process(batch)
+        try:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) == _ROWS_PER_CHUNK:
+                    if not _put(output, (chunk, None), cancelled):
+                        return
+                    chunk = []
+            if chunk and not _put(output, (chunk, None), cancelled):
+                return
+        except Exception as exc:  # pylint: disable=broad-except
+            _put(output, (None, exc), cancelled)
+        else:
+            _put(output, (None, None), cancelled)
+        finally:
+            rows.close()
+
+
+def _split_points_to_key_ranges(points):
+    """Convert ordered split points to the key ranges they delimit.
+
+    :type points: list of list
+    :param points: keys, in key order
+
+    :rtype: list of :class:`~google.cloud.spanner_v1.keyset.KeyRange`
+    :returns: ``len(points) + 1`` ranges, covering all of the keys.
+    """
+    bounds = [None] + list(points) + [None]
+    ranges = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if end is None:
+            end_kw = {'end_closed': []}
+        else:
+            end_kw = {'end_open': list(end)}
+        ranges.append(KeyRange(
+            start_closed=[] if start is None else list(start), **end_kw))
+    return ranges
+
+
+def _put(output, item, cancelled):
+    """Put an item in a queue, unless processing is cancelled.
+
+    :rtype: bool
+    :returns: False if processing was cancelled before the item was put.
+    """
+    while not cancelled.is_set():
+        try:
+            output.put(item, timeout=_PUT_POLL_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _drain(output, count):
+    """Yield rows from a queue until ``count`` batches are done.
+
+    :raises: the first error raised by a worker.
+    """
+    while count:
+        chunk, error = output.get()
+        if error is not None:
+            raise error
+        if chunk is None:
+            count -= 1
+        else:
+            for row in chunk:
+                yield row
+
+
+MAX_MUTATIONS_PER_COMMIT = 20000
+"""Maximum number of mutations (cells) allowed by Spanner in a commit."""
+
+DEFAULT_MAX_COMMIT_BYTES = 10 * 1024 * 1024
+"""Default size limit of the mutations of a :class:`MutationWriter` commit."""
+
+_INITIAL_RETRY_DELAY = 0.1
+"""Seconds to wait before retrying an aborted commit for the first time."""
+
+_MAX_RETRY_DELAY = 32.0
+"""Maximum number of seconds to wait before retrying an aborted commit."""
+
+
+class MutationWriter(object):
+    """Write mutations in batches, committed concurrently.
+
+    Mutations are accumulated until the next one would exceed the number of
+    mutations or bytes allowed per commit; they are then committed (as a
+    single-use read-write transaction) by a background thread, on a session
+    checked out of the database's pool, while accumulation continues.
+    Aborted commits are retried, with an exponential backoff.
+
+    Commits may complete out of order, so a row should not be written
+    more than once by the same writer, unless ``max_commits`` is 1.
+
+    Errors are raised from the next call to the writer, or from
+    :meth:`flush` / :meth:`close`.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to use
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) maximum number of mutations per commit,
+                          counting one per cell written, or per key / range
+                          deleted.  Spanner also counts a mutation per
+                          secondary index entry written: lower this limit
+                          for tables with indexes.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) maximum (approximate) size of the mutations
+                      of each commit.
+
+    :type max_commits: int
+    :param max_commits: (Optional) maximum number of commits in progress
+                        concurrently; further writes block until one of them
+                        completes.
+
+    :type timeout_secs: int
+    :param timeout_secs: (Optional) time after which a commit is no longer
+                         retried.
+    """
+    def __init__(self, database, max_mutations=MAX_MUTATIONS_PER_COMMIT,
+                 max_bytes=DEFAULT_MAX_COMMIT_BYTES, max_commits=4,
+                 timeout_secs=DEFAULT_RETRY_TIMEOUT_SECS):
+        if max_commits < 1:
+            raise ValueError("'max_commits' must be positive.")
+        self._database = database
+        self._max_mutations = max_mutations
+        self._max_bytes = max_bytes
+        self._timeout_secs = timeout_secs
+        self._pending = []          # Mutations for the next commit
+        self._pending_count = 0
+        self._pending_bytes = 0
+        self._slots = threading.Semaphore(max_commits)
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_commits)
+        self._lock = threading.Lock()
+        self._in_flight = set()
+        self._error = None
+        self.commit_count = 0
+        self.retry_count = 0
+
+    def insert(self, table, columns, values, column_types=None):
+        """Insert one or more new table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: list of lists
+        :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
+        """
+        self._write('insert', table, columns, values, column_types)
+
+    def update(self, table, columns, values, column_types=None):
+        """Update one or more existing table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: list of lists
+        :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
+        """
+        self._write('update', table, columns, values, column_types)
+
+    def insert_or_update(self, table, columns, values, column_types=None):
+        """Insert/update one or more table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: list of lists
+        :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
+        """
+        self._write('insert_or_update', table, columns, values, column_types)
+
+    def replace(self, table, columns, values, column_types=None):
+        """Replace one or more table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: list of lists
+        :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: (Optional) types of the columns, used to encode
+                             the values in bulk.  ``values`` may then also be
+                             a NumPy array or a pandas DataFrame.
+        """
+        self._write('replace', table, columns, values, column_types)
+
+    def delete(self, table, keyset):
+        """Delete one or more table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type keyset: :class:`~google.cloud.spanner_v1.keyset.Keyset`
+        :param keyset: Keys/ranges identifying rows to delete.
+        """
+        self._check_error()
+        mutation = Mutation(delete=Mutation.Delete(
+            table=table, key_set=keyset.to_pb()))
+        count = max(len(keyset.keys) + len(keyset.ranges), 1)
+        self._add(mutation, count, mutation.ByteSize())
+
+    def _write(self, kind, table, columns, values, column_types):
+        """Add rows to the pending mutations, splitting them across commits.
+
+        :type kind: str
+        :param kind: name of the ``Mutation`` field to be set
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type values: list of lists
+        :param values: Values to be modified.
+
+        :type column_types:
+            list of :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+        :param column_types: types of the columns, or ``None``.
+
+        :raises ValueError: if a single row exceeds the limits of a commit,
+                            in which case none of the rows are added.
+        """
+        self._check_error()
+        columns = list(columns)
+        width = len(columns)
+        overhead = len(table) + sum(len(column) for column in columns)
+        # Encode and check every row before any of them is added.
+        row_pbs = list(_make_list_value_pbs(values, column_types))
+        sizes = [row_pb.ByteSize() for row_pb in row_pbs]
+        if row_pbs and (width > self._max_mutations or
+                        overhead + max(sizes) > self._max_bytes):
+            raise ValueError("Row exceeds the limits of a commit.")
+        rows = []
+        rows_bytes = 0
+        for row_pb, row_bytes in zip(row_pbs, sizes):
+            full = (
+                self._pending_count + width > self._max_mutations or
+                self._pending_bytes + overhead + rows_bytes + row_bytes >
+                self._max_bytes)
+            if full:
+                self._add_write(kind, table, columns, rows, rows_bytes)
+                self._send()
+                rows = []
+                rows_bytes = 0
+            rows.append(row_pb)
+            rows_bytes += row_bytes
+            self._pending_count += width
+        self._add_write(kind, table, columns, rows, rows_bytes)
+
+    def _add_write(self, kind, table, columns, rows, rows_bytes):
+        """Add a write mutation for rows already counted as pending."""
+        if rows:
+            write = Mutation.Write(table=table, columns=columns, values=rows)
+            self._pending.append(Mutation(**{kind: write}))
+            self._pending_bytes += (
+                len(table) + sum(len(column) for column in columns) +
+                rows_bytes)
+
+    def _add(self, mutation, count, size):
+        """Add a mutation, committing the pending ones first if needed."""
+        full = (
+            self._pending_count + count > self._max_mutations or
+            self._pending_bytes + size > self._max_bytes)
+        if full:
+            self._send()
+        self._pending.append(mutation)
+        self._pending_count += count
+        self._pending_bytes += size
+
+    def _send(self):
+        """Commit the pending mutations in the background."""
+        if not self._pending:
+            return
+        mutations = self._pending
+        self._pending = []
+        self._pending_count = self._pending_bytes = 0
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._commit, mutations)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._in_flight.add(future)
+        future.add_done_callback(self._commit_done)
+
+    def _commit_done(self, future):
+        """Record the outcome of a background commit."""
+        self._slots.release()
+        with self._lock:
+            self._in_flight.discard(future)
+            exc = future.exception()
+            if exc is not None and self._error is None:
+                self._error = exc
+
+    def _commit(self, mutations):
+        """Commit mutations, retrying if the transaction is aborted.
+
+        :type mutations: list of
+            :class:`~google.cloud.spanner_v1.proto.mutation_pb2.Mutation`
+        :param mutations: the mutations to be committed.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: timestamp of the committed changes.
+        """
+        deadline = time.time() + self._timeout_secs
+        attempt = 0
+        with SessionCheckout(self._database._pool) as session:
+            while True:
+                batch = Batch(session)
+                batch._mutations.extend(mutations)
+                try:
+                    committed = batch.commit()
+                except Exception as exc:
+                    delay = _abort_retry_delay(exc, attempt)
+                    if delay is None or time.time() + delay > deadline:
+                        raise
+                    with self._lock:
+                        self.retry_count += 1
+                    time.sleep(delay)
+                    attempt += 1
+                else:
+                    with self._lock:
+                        self.commit_count += 1
+                    return committed
+
+    def _check_error(self):
+        """Raise the error of a failed background commit, if any."""
+        if self._error is not None:
+            raise self._error
+
+    def flush(self):
+        """Commit the pending mutations, and wait for all commits to complete.
+
+        :raises: the error of the first commit which failed.
+        """
+        self._check_error()
+        self._send()
+        with self._lock:
+            in_flight = list(self._in_flight)
+        futures.wait(in_flight)
+        self._check_error()
+
+    def close(self):
+        """Flush the writer, and stop its background threads.
+
+        :raises: the error of the first commit which failed.
+        """
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Begin ``with`` block."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block.
+
+        Closes the writer, unless an exception was raised: the pending
+        mutations are then discarded.
+        """
+        if exc_type is None:
+            self.close()
+        else:
+            del self._pending[:]
+            self._executor.shutdown(wait=True)
+
+
+def _abort_retry_delay(exc, attempt):
+    """Delay before retrying a commit, if it failed from an abort.
+
+    Uses the delay suggested by the server, or else an exponential backoff
+    with jitter.
+
+    :type exc: Exception
+    :param exc: error raised by the commit
+
+    :type attempt: int
+    :param attempt: number of previous retries
+
+    :rtype: float
+    :returns: seconds to wait, or ``None`` if the error is not an abort.
+    """
+    if isinstance(exc, exceptions.Aborted):
+        delay = None
+    elif isinstance(exc, GaxError) and (
+            exc_to_code(exc.cause) == StatusCode.ABORTED):
+        delay = _get_retry_delay(exc.cause)
+    else:
+        return None
+    if delay is None:
+        backoff = min(_INITIAL_RETRY_DELAY * 2 ** attempt, _MAX_RETRY_DELAY)
+        delay = backoff * (0.5 + random.random() / 2)
+    return delay
+
+
 def _check_ddl_statements(value):
     """Validate DDL Statements used to define database schema.
 
@@ -14,8 +14,13 @@
 
 """Pools managing shared Session objects."""
 
+import collections
 import datetime
+import logging
+import threading
+import time
 
+from concurrent import futures
 from six.moves import queue
 from six.moves import xrange
 
@@ -24,6 +29,11 @@ from google.cloud.exceptions import NotFound
 
 _NOW = datetime.datetime.utcnow  # unit tests may replace
 
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_CREATE_WORKERS = 16
+"""Maximum number of sessions created concurrently when binding a pool."""
+
 
 class AbstractSessionPool(object):
     """Specifies required API for concrete session pool implementations."""
@@ -80,6 +90,12 @@ class AbstractSessionPool(object):
         """
         raise NotImplementedError()
 
+    def close(self):
+        """Stop any background work of the pool, without deleting sessions.
+
+        Pools without background work have nothing to stop.
+        """
+
     def session(self, **kwargs):
         """Check out a session from the pool.
 
@@ -278,8 +294,11 @@ class PingingPool(AbstractSessionPool):
       never expected in normal practice, as users should be calling
       :meth:`get` followed by :meth:`put` whenever in need of a session.
 
-    The application is responsible for calling :meth:`ping` at appropriate
-    times, e.g. from a background thread.
+    - Calls :meth:`ping` every ``refresh_interval`` seconds from a
+      background thread started by :meth:`bind`, issuing at most
+      ``max_refresh_rpcs`` requests per interval.  With
+      ``refresh_interval=None``, the application is responsible for calling
+      :meth:`ping` at appropriate times, e.g. from a background thread.
 
     :type size: int
     :param size: fixed pool size
@@ -290,13 +309,28 @@ class PingingPool(AbstractSessionPool):
 
     :type ping_interval: int
     :param ping_interval: interval at which to ping sessions.
+
+    :type refresh_interval: int
+    :param refresh_interval: interval, in seconds, at which the background
+                             thread pings the sessions due.  If ``None``, no
+                             thread is started.
+
+    :type max_refresh_rpcs: int
+    :param max_refresh_rpcs: (Optional) maximum number of requests issued by
+                             the background thread per ``refresh_interval``;
+                             the sessions left over are pinged in the next
+                             interval.  By default, there is no limit.
     """
 
-    def __init__(self, size=10, default_timeout=10, ping_interval=3000):
+    def __init__(self, size=10, default_timeout=10, ping_interval=3000,
+                 refresh_interval=60, max_refresh_rpcs=None):
         self.size = size
         self.default_timeout = default_timeout
+        self.refresh_interval = refresh_interval
         self._delta = datetime.timedelta(seconds=ping_interval)
         self._sessions = queue.PriorityQueue(size)
+        self._budget = _RpcBudget(max_refresh_rpcs, refresh_interval)
+        self._scheduler = None
 
     def bind(self, database):
         """Associate the pool with a database.
@@ -312,6 +346,12 @@ class PingingPool(AbstractSessionPool):
             session.create()
             self.put(session)
 
+        if self.refresh_interval is not None and self._scheduler is None:
+            self._scheduler = _BackgroundScheduler(
+                'Thread-SpannerSessionPoolKeepalive', self._keepalive,
+                self.refresh_interval)
+            self._scheduler.start()
+
     def get(self, timeout=None):  # pylint: disable=arguments-differ
         """Check a session out from the pool.
 
@@ -348,7 +388,8 @@ class PingingPool(AbstractSessionPool):
         self._sessions.put_nowait((_NOW() + self._delta, session))
 
     def clear(self):
-        """Delete all sessions in the pool."""
+        """Stop the background thread, and delete all sessions in the pool."""
+        self.close()
         while True:
             try:
                 _, session = self._sessions.get(block=False)
@@ -357,18 +398,40 @@ class PingingPool(AbstractSessionPool):
             else:
                 session.delete()
 
+    def close(self):
+        """Stop the background thread, without deleting the sessions."""
+        scheduler, self._scheduler = self._scheduler, None
+        if scheduler is not None:
+            scheduler.stop()
+
     def ping(self):
         """Refresh maybe-expired sessions in the pool.
 
-        This method is designed to be called from a background thread,
-        or during the "idle" phase of an event loop.
+        This method is called from the pool's background thread; when
+        constructed with ``refresh_interval=None``, it is designed to be
+        called by the application from a background thread, or during the
+        "idle" phase of an event loop.
+        """
+        self._ping()
+
+    def _keepalive(self):
+        """Background work: refresh sessions within the request budget."""
+        self._ping(self._budget)
+
+    def _ping(self, budget=None):
+        """Refresh maybe-expired sessions in the pool.
+
+        :type budget: :class:`_RpcBudget`
+        :param budget: (Optional) budget of the requests to be made:  once
+                       spent, the remaining sessions are left for later.
         """
         while True:
             try:
                 ping_after, session = self._sessions.get(block=False)
             except queue.Empty:  # all sessions in use
                 break
-            if ping_after > _NOW():  # oldest session is fresh
+            if ping_after > _NOW() or (  # oldest session is fresh
+                    budget is not None and not budget.acquire()):
                 # Re-add to queue with existing expiration
                 self._sessions.put((ping_after, session))
                 break
@@ -388,8 +451,12 @@ class TransactionPingingPool(PingingPool):
     When a session is returned to the pool, if its transaction has been
     committed or rolled back, the pool creates a new transaction for the
     session and pushes the transaction onto a separate queue of "transactions
-    to begin."  The application is responsible for flushing this queue
-    as appropriate via the pool's :meth:`begin_pending_transactions` method.
+    to begin."  The background thread begins these transactions as soon as
+    the sessions are returned, before pinging the sessions due, within the
+    same request budget; once it is spent, the sessions are made available
+    without a transaction begun.  With ``refresh_interval=None``, the
+    application is responsible for flushing this queue as appropriate via
+    the pool's :meth:`begin_pending_transactions` method.
 
     :type size: int
     :param size: fixed pool size
@@ -400,13 +467,26 @@ class TransactionPingingPool(PingingPool):
 
     :type ping_interval: int
     :param ping_interval: interval at which to ping sessions.
+
+    :type refresh_interval: int
+    :param refresh_interval: interval, in seconds, at which the background
+                             thread pings the sessions due.  If ``None``, no
+                             thread is started.
+
+    :type max_refresh_rpcs: int
+    :param max_refresh_rpcs: (Optional) maximum number of requests issued by
+                             the background thread per ``refresh_interval``.
+                             By default, there is no limit.
     """
 
-    def __init__(self, size=10, default_timeout=10, ping_interval=3000):
+    def __init__(self, size=10, default_timeout=10, ping_interval=3000,
+                 refresh_interval=60, max_refresh_rpcs=None):
         self._pending_sessions = queue.Queue()
 
         super(TransactionPingingPool, self).__init__(
-            size, default_timeout, ping_interval)
+            size, default_timeout, ping_interval,
+            refresh_interval=refresh_interval,
+            max_refresh_rpcs=max_refresh_rpcs)
 
         self.begin_pending_transactions()
 
@@ -437,17 +517,472 @@ class TransactionPingingPool(PingingPool):
         if txn is None or txn.committed() or txn._rolled_back:
             session.transaction()
             self._pending_sessions.put(session)
+            if self._scheduler is not None:
+                self._scheduler.wake()
         else:
             super(TransactionPingingPool, self).put(session)
 
     def begin_pending_transactions(self):
         """Begin all transactions for sessions added to the pool."""
-        while not self._pending_sessions.empty():
-            session = self._pending_sessions.get()
-            session._transaction.begin()
+        self._begin_pending_transactions()
+
+    def _keepalive(self):
+        """Background work: begin pending transactions, then refresh sessions.
+
+        Both are done within the same request budget.
+        """
+        self._begin_pending_transactions(self._budget)
+        self._ping(self._budget)
+
+    def _begin_pending_transactions(self, budget=None):
+        """Begin transactions for sessions added to the pool.
+
+        :type budget: :class:`_RpcBudget`
+        :param budget: (Optional) budget of the requests to be made:  once
+                       spent, the remaining sessions are returned to the
+                       pool without beginning their transactions, rather
+                       than being held back until the next interval.
+        """
+        while True:
+            try:
+                session = self._pending_sessions.get(block=False)
+            except queue.Empty:
+                break
+            if budget is None or budget.acquire():
+                session._transaction.begin()
             super(TransactionPingingPool, self).put(session)
 
 
+class HealthTrackedPool(AbstractSessionPool):
+    """Concrete session pool implementation:
+
+    - Creates ``min_size`` sessions concurrently when bound to a database.
+
+    - Tracks the time each session was last used, and "pings" a session
+      via :meth:`session.exists` before returning it only if it has been
+      idle for longer than ``validate_after`` seconds.
+
+    - Grows on demand, creating a new session when :meth:`get` is called
+      while every session is in use, up to ``max_size`` sessions; beyond
+      that, blocks with a timeout, and raises after timing out.
+
+    - Shrinks back to ``min_size`` sessions, deleting the sessions which
+      have been idle for longer than ``idle_timeout`` seconds.
+
+    - Refreshes the idle sessions (and shrinks) in :meth:`ping`, which is
+      called every ``refresh_interval`` seconds from a background thread
+      started by :meth:`bind`.
+
+    - Keeps metrics of the checkouts, the time spent waiting for a
+      session, and the sessions created, validated and deleted (see
+      :attr:`metrics`).
+
+    :type min_size: int
+    :param min_size: number of sessions created up front, and kept when idle
+
+    :type max_size: int
+    :param max_size: maximum number of sessions
+
+    :type default_timeout: int
+    :param default_timeout: default timeout, in seconds, to wait for
+                            a returned session when ``max_size`` sessions
+                            are in use.
+
+    :type validate_after: int
+    :param validate_after: idle time, in seconds, after which a session is
+                           checked for existence before being used.
+
+    :type idle_timeout: int
+    :param idle_timeout: idle time, in seconds, after which a session above
+                         ``min_size`` is deleted.
+
+    :type refresh_interval: int
+    :param refresh_interval: interval, in seconds, at which the background
+                             thread calls :meth:`ping`.  If ``None``, no
+                             thread is started, and the application is
+                             responsible for calling :meth:`ping`.
+
+    :raises ValueError: if ``min_size`` is negative, or ``max_size`` is
+                        lower than 1 or than ``min_size``.
+    """
+    DEFAULT_MIN_SIZE = 10
+    DEFAULT_MAX_SIZE = 100
+    DEFAULT_TIMEOUT = 10
+
+    def __init__(self, min_size=DEFAULT_MIN_SIZE, max_size=DEFAULT_MAX_SIZE,
+                 default_timeout=DEFAULT_TIMEOUT, validate_after=3000,
+                 idle_timeout=600, refresh_interval=60):
+        if min_size < 0 or max_size < 1 or max_size < min_size:
+            raise ValueError(
+                'Expected 0 <= min_size <= max_size, with max_size >= 1')
+        self.min_size = min_size
+        self.max_size = max_size
+        self.default_timeout = default_timeout
+        self.refresh_interval = refresh_interval
+        self._validate_after = datetime.timedelta(seconds=validate_after)
+        self._idle_timeout = datetime.timedelta(seconds=idle_timeout)
+
+        # The idle sessions, with the time they were last used (most
+        # recently used last), and the number of sessions owned by the
+        # pool, guarded by ``_condition``.
+        self._condition = threading.Condition()
+        self._idle = collections.deque()
+        self._size = 0
+        self._in_use = 0
+        self._counters = collections.Counter()
+        self._wait_time_max = 0.0
+
+        self._scheduler = None
+
+    @property
+    def metrics(self):
+        """Snapshot of the pool's metrics.
+
+        :rtype: dict
+        :returns: the current number of sessions (``size``), of sessions in
+                  use (``in_use``) and idle (``idle``); the total number of
+                  ``checkouts``, and of sessions ``created``, ``validated``
+                  (via :meth:`session.exists`), ``refreshed`` (by
+                  :meth:`ping`) and ``deleted``; the total and maximum
+                  number of seconds spent waiting in :meth:`get`
+                  (``wait_time_total`` and ``wait_time_max``).
+        """
+        with self._condition:
+            metrics = {
+                'size': self._size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'wait_time_max': self._wait_time_max,
+            }
+            for key in ('checkouts', 'created', 'validated', 'refreshed',
+                        'deleted'):
+                metrics[key] = self._counters[key]
+            metrics['wait_time_total'] = self._counters['wait_time_total']
+        return metrics
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        Creates ``min_size`` sessions concurrently, then starts the
+        background thread refreshing them.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: database used by the pool:  used to create sessions
+                         when needed.
+        """
+        self._database = database
+
+        if self.min_size:
+            workers = min(self.min_size, _MAX_CREATE_WORKERS)
+            with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                sessions = list(executor.map(
+                    lambda _: self._new_session(),
+                    xrange(self.min_size)))
+            now = _NOW()
+            with self._condition:
+                self._size += len(sessions)
+                self._idle.extend((session, now) for session in sessions)
+                self._condition.notify_all()
+
+        if self.refresh_interval is not None and self._scheduler is None:
+            self._scheduler = _BackgroundScheduler(
+                'Thread-SpannerSessionPoolRefresh', self.ping,
+                self.refresh_interval)
+            self._scheduler.start()
+
+    def get(self, timeout=None):  # pylint: disable=arguments-differ
+        """Check a session out from the pool.
+
+        :type timeout: int
+        :param timeout: seconds to block waiting for an available session
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: an existing session from the pool, or a newly-created
+                  session.
+        :raises: :exc:`six.moves.queue.Empty` if ``max_size`` sessions are
+                 still in use after ``timeout`` seconds.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        start = time.time()
+        session = last_used = None
+        with self._condition:
+            while True:
+                if self._idle:
+                    session, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1  # Reserve a slot for a new session.
+                    break
+                remaining = start + timeout - time.time()
+                if remaining <= 0:
+                    raise queue.Empty()
+                self._condition.wait(remaining)
+            self._in_use += 1
+            waited = time.time() - start
+            self._counters['checkouts'] += 1
+            self._counters['wait_time_total'] += waited
+            self._wait_time_max = max(self._wait_time_max, waited)
+
+        try:
+            if session is None:
+                session = self._new_session()
+            elif _NOW() - last_used > self._validate_after:
+                session = self._validate(session)
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        return session
+
+    def put(self, session):
+        """Return a session to the pool.
+
+        Never blocks:  if the pool is full, raises.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+
+        :raises: :exc:`six.moves.queue.Full` if no session is checked out.
+        """
+        with self._condition:
+            if self._in_use <= 0:
+                raise queue.Full
+            self._in_use -= 1
+            self._idle.append((session, _NOW()))
+            self._condition.notify()
+
+    def clear(self):
+        """Stop the background thread, and delete the idle sessions."""
+        self.close()
+        with self._condition:
+            sessions = [session for session, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(sessions)
+        for session in sessions:
+            self._delete(session)
+
+    def close(self):
+        """Stop the background thread, without deleting the sessions."""
+        scheduler, self._scheduler = self._scheduler, None
+        if scheduler is not None:
+            scheduler.stop()
+
+    def ping(self):
+        """Refresh the idle sessions, and shrink the pool.
+
+        Deletes the sessions idle for longer than ``idle_timeout`` above
+        ``min_size``, checks the existence of those idle for longer than
+        ``validate_after`` (replacing the expired ones), and creates
+        sessions if there are fewer than ``min_size``.
+
+        This method is called from the pool's background thread; when
+        constructed with ``refresh_interval=None``, it is designed to be
+        called by the application from a background thread, or during the
+        "idle" phase of an event loop.
+        """
+        now = _NOW()
+        to_delete = []
+        to_refresh = []
+        with self._condition:
+            kept = collections.deque()
+            # Oldest first, so that the least recently used sessions go.
+            for session, last_used in self._idle:
+                idle_time = now - last_used
+                if (idle_time > self._idle_timeout and
+                        self._size > self.min_size):
+                    to_delete.append(session)
+                    self._size -= 1
+                elif idle_time > self._validate_after:
+                    to_refresh.append(session)
+                else:
+                    kept.append((session, last_used))
+            self._idle = kept
+            # Sessions being refreshed count as in use meanwhile.
+            self._in_use += len(to_refresh)
+            missing = max(self.min_size - self._size, 0)
+            self._size += missing
+
+        for session in to_delete:
+            self._delete(session)
+
+        errors = []
+        for session in to_refresh:
+            try:
+                session = self._validate(session)
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+                with self._condition:  # The session is dropped.
+                    self._size -= 1
+                    self._in_use -= 1
+                continue
+            with self._condition:
+                self._counters['refreshed'] += 1
+                self._in_use -= 1
+                self._idle.appendleft((session, _NOW()))
+                self._condition.notify()
+
+        for _ in xrange(missing):
+            try:
+                session = self._new_session()
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+                with self._condition:
+                    self._size -= 1
+                continue
+            with self._condition:
+                self._idle.appendleft((session, _NOW()))
+                self._condition.notify()
+
+        if errors:
+            raise errors[0]
+
+    def _new_session(self):
+        """Create a new session, bound to the pool's database.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the created session.
+        """
+        session = self._database.session()
+        session.create()
+        with self._condition:
+            self._counters['created'] += 1
+        return session
+
+    def _validate(self, session):
+        """Check that a session still exists, or replace it.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session to check.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the session, or a newly-created one if it had expired.
+        """
+        with self._condition:
+            self._counters['validated'] += 1
+        if session.exists():
+            return session
+        return self._new_session()
+
+    def _delete(self, session):
+        """Delete a session, which may have expired already.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session to delete.
+        """
+        try:
+            session.delete()
+        except NotFound:
+            pass
+        with self._condition:
+            self._counters['deleted'] += 1
+
+
+class _BackgroundScheduler(object):
+    """Run a pool's maintenance work from a single daemon thread.
+
+    The work is done every ``interval`` seconds, or as soon as
+    :meth:`wake` is called, until :meth:`stop` is called.
+
+    :type name: str
+    :param name: name of the thread
+
+    :type work: callable
+    :param work: function doing the work, taking no argument.  Its errors
+                 are logged, and do not stop the thread.
+
+    :type interval: float
+    :param interval: seconds between two runs of ``work``.
+    """
+
+    def __init__(self, name, work, interval):
+        self._work = work
+        self._interval = interval
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(name=name, target=self._run)
+        self._thread.daemon = True
+
+    @property
+    def thread(self):
+        """The thread doing the work.
+
+        :rtype: :class:`threading.Thread`
+        :returns: the scheduler's thread
+        """
+        return self._thread
+
+    def start(self):
+        """Start the background thread."""
+        self._thread.start()
+
+    def wake(self):
+        """Run the work now, rather than at the end of the interval."""
+        self._wakeup.set()
+
+    def stop(self):
+        """Stop the thread, after the current run of the work ends."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        """Do the work at each interval or wake-up, until stopped."""
+        while True:
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self._work()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception('Failed to refresh the session pool.')
+
+
+class _RpcBudget(object):
+    """Limit the number of requests made per interval.
+
+    :type max_rpcs: int
+    :param max_rpcs: maximum number of requests per interval, or ``None``
+                     for no limit.
+
+    :type interval: float
+    :param interval: length of the interval, in seconds, or ``None`` for a
+                     single interval, never renewed.
+    """
+
+    def __init__(self, max_rpcs, interval):
+        self._max_rpcs = max_rpcs
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._window_start = None
+        self._used = 0
+
+    def acquire(self):
+        """Account for one request, if the budget allows it.
+
+        :rtype: bool
+        :returns: whether the request may be made.
+        """
+        if self._max_rpcs is None:
+            return True
+        now = time.time()
+        with self._lock:
+            if self._window_start is None or (
+                    self._interval is not None and
+                    now - self._window_start >= self._interval):
+                self._window_start = now
+                self._used = 0
+            if self._used >= self._max_rpcs:
+                return False
+            self._used += 1
+            return True
+
+
 class SessionCheckout(object):
     """Context manager: hold session checked out from a pool.
 
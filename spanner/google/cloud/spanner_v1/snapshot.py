@@ -15,48 +15,181 @@
 """Model a set of read-only queries to a database as a snapshot."""
 
 import functools
+import time
 
 from google.protobuf.struct_pb2 import Struct
 from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionOptions
 from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionSelector
+from google.cloud.spanner_v1.proto import type_pb2
 
+from google.api_core.exceptions import InternalServerError
 from google.api_core.exceptions import ServiceUnavailable
+from google.api_core.retry import exponential_sleep_generator
 from google.cloud._helpers import _datetime_to_pb_timestamp
 from google.cloud._helpers import _timedelta_to_duration_pb
+from google.cloud.spanner_v1._helpers import _make_value_encoder
 from google.cloud.spanner_v1._helpers import _make_value_pb
 from google.cloud.spanner_v1._helpers import _options_with_prefix
 from google.cloud.spanner_v1._helpers import _SessionWrapper
 from google.cloud.spanner_v1.streamed import StreamedResultSet
 
 
-def _restart_on_unavailable(restart):
-    """Restart iteration after :exc:`.ServiceUnavailable`.
+_RESTARTABLE_INTERNAL_ERRORS = (
+    'RST_STREAM',
+    'Received unexpected EOS on DATA frame from server',
+)
+
+
+def _is_restartable(exc):
+    """Default predicate for :class:`StreamRetry`.
+
+    :type exc: Exception
+    :param exc: error raised while iterating a stream
+
+    :rtype: bool
+    :returns: True for :exc:`~google.api_core.exceptions.ServiceUnavailable`,
+              and for :exc:`~google.api_core.exceptions.InternalServerError`
+              caused by a reset HTTP/2 stream.
+    """
+    if isinstance(exc, ServiceUnavailable):
+        return True
+    if isinstance(exc, InternalServerError):
+        message = str(exc)
+        return any(cause in message for cause in _RESTARTABLE_INTERNAL_ERRORS)
+    return False
+
+
+class StreamRetry(object):
+    """Policy for resuming interrupted streaming reads / queries.
+
+    Partial result sets received after the last resume token are buffered,
+    to be discarded (and fetched again) if the stream must be resumed.  Once
+    ``max_buffered`` of them are pending, they are delivered: the stream can
+    then not be resumed until the next resume token is received.
+
+    :type predicate: callable
+    :param predicate: (Optional) takes an error raised by the stream, and
+                      returns True if the stream should be resumed.
+                      Defaults to resuming after
+                      :exc:`~google.api_core.exceptions.ServiceUnavailable`
+                      errors and reset streams.
+
+    :type initial: float
+    :param initial: (Optional) seconds to wait before the first retry.
+
+    :type maximum: float
+    :param maximum: (Optional) maximum seconds to wait between retries.
+
+    :type multiplier: float
+    :param multiplier: (Optional) factor applied to the delay after each
+                       retry.
+
+    :type deadline: float
+    :param deadline: (Optional) seconds after which to stop retrying, counted
+                     from the first of successive errors which are not
+                     separated by any progress of the stream.
+
+    :type max_buffered: int
+    :param max_buffered: (Optional) maximum number of partial result sets
+                         held back while waiting for a resume token.
+    """
+    def __init__(self, predicate=_is_restartable, initial=0.1, maximum=32.0,
+                 multiplier=2.0, deadline=120.0, max_buffered=128):
+        self.predicate = predicate
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.deadline = deadline
+        self.max_buffered = max_buffered
+
+
+DEFAULT_STREAM_RETRY = StreamRetry()
+"""Policy used to resume streams, unless another one is passed."""
+
+
+def _restart_on_unavailable(restart, retry=None, on_restart=None):
+    """Restart iteration after a retryable error.
+
+    Yields each partial result set as soon as it cannot be fetched again on
+    restarting the stream: either once a resume token covering it has been
+    received, or once the buffer of pending ones is full.
 
     :type restart: callable
     :param restart: curried function returning iterator
+
+    :type retry: :class:`StreamRetry`
+    :param retry: (Optional) policy for retrying; defaults to
+                  :data:`DEFAULT_STREAM_RETRY`.
+
+    :type on_restart: callable
+    :param on_restart: (Optional) called before each restart, with the size
+                       (in bytes) of the discarded partial result sets.
     """
+    if retry is None:
+        retry = DEFAULT_STREAM_RETRY
     resume_token = ''
     item_buffer = []
+    resumable = True
+    sleep_generator = deadline = None
     iterator = restart()
     while True:
         try:
             for item in iterator:
-                item_buffer.append(item)
                 if item.resume_token:
                     resume_token = item.resume_token
-                    break
-        except ServiceUnavailable:
+                    for buffered in item_buffer:
+                        yield buffered
+                    del item_buffer[:]
+                    resumable = True
+                    sleep_generator = deadline = None
+                    yield item
+                elif not resumable:
+                    yield item
+                else:
+                    item_buffer.append(item)
+                    if len(item_buffer) >= retry.max_buffered:
+                        for buffered in item_buffer:
+                            yield buffered
+                        del item_buffer[:]
+                        resumable = False
+        except Exception as exc:  # pylint: disable=broad-except
+            if not resumable or not retry.predicate(exc):
+                raise
+            now = time.time()
+            if sleep_generator is None:
+                sleep_generator = exponential_sleep_generator(
+                    retry.initial, retry.maximum, retry.multiplier)
+                deadline = now + retry.deadline
+            delay = next(sleep_generator)
+            if now + delay > deadline:
+                raise
+            if on_restart is not None:
+                on_restart(sum(item.ByteSize() for item in item_buffer))
             del item_buffer[:]
+            time.sleep(delay)
             iterator = restart(resume_token=resume_token)
             continue
+        break
+
+    for item in item_buffer:
+        yield item
 
-        if len(item_buffer) == 0:
-            break
 
-        for item in item_buffer:
-            yield item
+def _make_param_value_pb(value, param_type):
+    """Helper for :meth:`_SnapshotBase.execute_sql`.
 
-        del item_buffer[:]
+    :type value: scalar value
+    :param value: value of a query parameter
+
+    :type param_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param param_type: declared type of the parameter, if any
+
+    :rtype: :class:`~google.protobuf.struct_pb2.Value`
+    :returns: value protobuf
+    """
+    if not isinstance(param_type, type_pb2.Type):
+        return _make_value_pb(value)
+    return _make_value_encoder(param_type)(value)
 
 
 class _SnapshotBase(_SessionWrapper):
@@ -70,6 +203,31 @@ class _SnapshotBase(_SessionWrapper):
     _multi_use = False
     _transaction_id = None
     _read_request_count = 0
+    _retry_count = 0
+    _bytes_refetched = 0
+
+    @property
+    def retry_count(self):
+        """Number of times the streams of this snapshot were resumed.
+
+        :rtype: int
+        :returns: the count of restarts.
+        """
+        return self._retry_count
+
+    @property
+    def bytes_refetched(self):
+        """Size of the results discarded when resuming streams.
+
+        :rtype: int
+        :returns: bytes received again after restarts.
+        """
+        return self._bytes_refetched
+
+    def _record_restart(self, refetched):
+        """Helper for :meth:`read` / :meth:`execute_sql`."""
+        self._retry_count += 1
+        self._bytes_refetched += refetched
 
     def _make_txn_selector(self):  # pylint: disable=redundant-returns-doc
         """Helper for :meth:`read` / :meth:`execute_sql`.
@@ -82,7 +240,8 @@ class _SnapshotBase(_SessionWrapper):
         """
         raise NotImplementedError
 
-    def read(self, table, columns, keyset, index='', limit=0):
+    def read(self, table, columns, keyset, index='', limit=0, lazy=False,
+             stream_retry=None):
         """Perform a ``StreamingRead`` API request for rows in a table.
 
         :type table: str
@@ -101,6 +260,15 @@ class _SnapshotBase(_SessionWrapper):
         :type limit: int
         :param limit: (Optional) maximum number of rows to return
 
+        :type lazy: bool
+        :param lazy: (Optional) decode the cells of each row on first access,
+                     rather than as they are received
+
+        :type stream_retry: :class:`StreamRetry`
+        :param stream_retry: (Optional) policy for resuming the stream after
+                             errors; defaults to
+                             :data:`DEFAULT_STREAM_RETRY`.
+
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows.
         :raises ValueError:
@@ -124,16 +292,18 @@ class _SnapshotBase(_SessionWrapper):
             transaction=transaction, index=index, limit=limit,
             options=options)
 
-        iterator = _restart_on_unavailable(restart)
+        iterator = _restart_on_unavailable(
+            restart, stream_retry, self._record_restart)
 
         self._read_request_count += 1
 
         if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
+            return StreamedResultSet(iterator, source=self, lazy=lazy)
         else:
-            return StreamedResultSet(iterator)
+            return StreamedResultSet(iterator, lazy=lazy)
 
-    def execute_sql(self, sql, params=None, param_types=None, query_mode=None):
+    def execute_sql(self, sql, params=None, param_types=None,
+                    query_mode=None, lazy=False, stream_retry=None):
         """Perform an ``ExecuteStreamingSql`` API request for rows in a table.
 
         :type sql: str
@@ -153,6 +323,15 @@ class _SnapshotBase(_SessionWrapper):
         :param query_mode: Mode governing return of results / query plan. See
             https://cloud.google.com/spanner/reference/rpc/google.spanner.v1#google.spanner.v1.ExecuteSqlRequest.QueryMode1
 
+        :type lazy: bool
+        :param lazy: (Optional) decode the cells of each row on first access,
+                     rather than as they are received
+
+        :type stream_retry: :class:`StreamRetry`
+        :param stream_retry: (Optional) policy for resuming the stream after
+                             errors; defaults to
+                             :data:`DEFAULT_STREAM_RETRY`.
+
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows.
         :raises ValueError:
@@ -170,7 +349,8 @@ class _SnapshotBase(_SessionWrapper):
                 raise ValueError(
                     "Specify 'param_types' when passing 'params'.")
             params_pb = Struct(fields={
-                key: _make_value_pb(value) for key, value in params.items()})
+                key: _make_param_value_pb(value, param_types.get(key))
+                for key, value in params.items()})
         else:
             params_pb = None
 
@@ -185,14 +365,15 @@ class _SnapshotBase(_SessionWrapper):
             transaction=transaction, params=params_pb, param_types=param_types,
             query_mode=query_mode, options=options)
 
-        iterator = _restart_on_unavailable(restart)
+        iterator = _restart_on_unavailable(
+            restart, stream_retry, self._record_restart)
 
         self._read_request_count += 1
 
         if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
+            return StreamedResultSet(iterator, source=self, lazy=lazy)
         else:
-            return StreamedResultSet(iterator)
+            return StreamedResultSet(iterator, lazy=lazy)
 
 
 class Snapshot(_SnapshotBase):
@@ -21,10 +21,18 @@ from google.cloud.spanner_v1.proto import type_pb2
 import six
 
 # pylint: disable=ungrouped-imports
-from google.cloud.spanner_v1._helpers import _parse_value_pb
+from google.cloud.spanner_v1._columnar import _columns_to_dataframe
+from google.cloud.spanner_v1._columnar import _columns_to_record_batch
+from google.cloud.spanner_v1._columnar import _make_column_buffers
+from google.cloud.spanner_v1._helpers import _make_row_decoders
 # pylint: enable=ungrouped-imports
 
 
+DEFAULT_ROWS_PER_BATCH = 10000
+"""Number of rows in each record batch of
+:meth:`StreamedResultSet.to_arrow_batches`."""
+
+
 class StreamedResultSet(object):
     """Process a sequence of partial result sets into a single set of row data.
 
@@ -36,8 +44,14 @@ class StreamedResultSet(object):
 
     :type source: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
     :param source: Snapshot from which the result set was fetched.
+
+    :type lazy: bool
+    :param lazy: (Optional) If true, yield rows which decode each cell on
+                 first access, rather than decoding every cell as it is
+                 received.  Useful when only a few of the columns of each
+                 row are used.
     """
-    def __init__(self, response_iterator, source=None):
+    def __init__(self, response_iterator, source=None, lazy=False):
         self._response_iterator = response_iterator
         self._rows = []             # Fully-processed rows
         self._counter = 0           # Counter for processed responses
@@ -46,6 +60,9 @@ class StreamedResultSet(object):
         self._current_row = []      # Accumulated values for incomplete row
         self._pending_chunk = None  # Incomplete value
         self._source = source       # Source snapshot
+        self._lazy = lazy
+        self._decoders = None       # Per-column decoders, from metadata
+        self._raw = False           # Collect values without making rows
 
     @property
     def fields(self):
@@ -85,7 +102,10 @@ class StreamedResultSet(object):
         :rtype: :class:`~google.protobuf.struct_pb2.Value`
         :returns: the merged value
         """
-        current_column = len(self._current_row)
+        if self._raw:
+            current_column = len(self._rows) % len(self.fields)
+        else:
+            current_column = len(self._current_row)
         field = self.fields[current_column]
         merged = _merge_by_type(self._pending_chunk, value, field.type)
         self._pending_chunk = None
@@ -97,14 +117,32 @@ class StreamedResultSet(object):
         :type values: list of :class:`~google.protobuf.struct_pb2.Value`
         :param values: non-chunked values from partial result set.
         """
-        width = len(self.fields)
+        if self._raw:
+            self._rows.extend(values)
+            return
+        decoders = self._decoders
+        if decoders is None:
+            decoders = self._decoders = _make_row_decoders(
+                self._metadata.row_type)
+        width = len(decoders)
+        lazy = self._lazy
+        rows = self._rows
+        current_row = self._current_row
+        index = len(current_row)
         for value in values:
-            index = len(self._current_row)
-            field = self.fields[index]
-            self._current_row.append(_parse_value_pb(value, field.type))
-            if len(self._current_row) == width:
-                self._rows.append(self._current_row)
-                self._current_row = []
+            if lazy:
+                current_row.append(value)
+            else:
+                current_row.append(decoders[index](value))
+            index += 1
+            if index == width:
+                if lazy:
+                    rows.append(_LazyRow(current_row, decoders))
+                else:
+                    rows.append(current_row)
+                current_row = []
+                index = 0
+        self._current_row = current_row
 
     def _consume_next(self):
         """Consume the next partial result set from the stream.
@@ -134,13 +172,158 @@ class StreamedResultSet(object):
         self._merge_values(values)
 
     def __iter__(self):
-        iter_rows, self._rows[:] = self._rows[:], ()
         while True:
-            if not iter_rows:
-                self._consume_next()  # raises StopIteration
-                iter_rows, self._rows[:] = self._rows[:], ()
-            while iter_rows:
-                yield iter_rows.pop(0)
+            iter_rows, self._rows = self._rows, []
+            for row in iter_rows:
+                yield row
+            try:
+                self._consume_next()
+            except StopIteration:
+                return
+
+    def _iter_column_batches(self, rows_per_batch=None):
+        """Consume the stream into typed column buffers.
+
+        The values of each partial result set are decoded one column at a
+        time, without building rows.
+
+        :type rows_per_batch: int
+        :param rows_per_batch: (Optional) maximum number of rows in each
+                               batch.  By default, all of the rows are
+                               returned in a single batch.
+
+        :rtype: iterable of list
+        :returns: lists of
+                  :class:`~google.cloud.spanner_v1._columnar._ColumnBuffer`,
+                  one per column.  At least one (possibly empty) batch is
+                  returned, unless the stream returned no response at all.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        :raises: :exc:`ValueError`: If ``rows_per_batch`` is not positive.
+        """
+        if rows_per_batch is not None and rows_per_batch < 1:
+            raise ValueError('rows_per_batch must be positive')
+        if self._metadata is not None:
+            raise RuntimeError('Can not convert the result set after stream '
+                               'consumption has already started.')
+        self._raw = True
+        values = self._rows
+        columns = None
+        batch_rows = 0
+        batch_count = 0
+        exhausted = False
+        while not exhausted:
+            try:
+                self._consume_next()
+            except StopIteration:
+                exhausted = True
+            if self._metadata is None:
+                return
+            fields = self.fields
+            width = len(fields)
+            if columns is None:
+                columns = _make_column_buffers(fields)
+            while width and len(values) >= width:
+                rows = len(values) // width
+                if rows_per_batch is not None:
+                    rows = min(rows, rows_per_batch - batch_rows)
+                end = rows * width
+                for index, column in enumerate(columns):
+                    column.extend(values[index:end:width])
+                del values[:end]
+                batch_rows += rows
+                if batch_rows == rows_per_batch:
+                    yield columns
+                    batch_count += 1
+                    columns = _make_column_buffers(fields)
+                    batch_rows = 0
+        if batch_rows or not batch_count:
+            yield columns
+
+    def to_arrow_batches(self, rows_per_batch=DEFAULT_ROWS_PER_BATCH):
+        """Consume the stream as a sequence of :mod:`pyarrow` record batches.
+
+        Values are decoded straight from the result set's protobufs into
+        typed columns.  TIMESTAMP columns have the ``timestamp('ns', 'UTC')``
+        type, DATE columns the ``date32`` type.
+
+        Nanosecond timestamps only cover the years 1677 to 2262: in a batch
+        holding a TIMESTAMP value out of that range, the column has the
+        ``timestamp('us', 'UTC')`` type instead, and its values are
+        truncated to microseconds.
+
+        .. note::
+
+            Use of this method requires that you have :mod:`pyarrow`
+            installed.
+
+        :type rows_per_batch: int
+        :param rows_per_batch: (Optional) maximum number of rows in each
+                               batch.
+
+        :rtype: iterable of :class:`pyarrow.RecordBatch`
+        :returns: record batches of at most ``rows_per_batch`` rows.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        import pyarrow   # pylint: disable=import-error
+
+        for columns in self._iter_column_batches(rows_per_batch):
+            yield _columns_to_record_batch(pyarrow, self.fields, columns)
+
+    def to_arrow(self):
+        """Consume the stream into a :class:`pyarrow.Table`.
+
+        See :meth:`to_arrow_batches` for the types of the columns.
+
+        .. note::
+
+            Use of this method requires that you have :mod:`pyarrow`
+            installed.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: a table with a column per field of the result set.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        import pyarrow   # pylint: disable=import-error
+
+        batches = [
+            _columns_to_record_batch(pyarrow, self.fields, columns)
+            for columns in self._iter_column_batches()]
+        if not batches:
+            return pyarrow.Table.from_arrays([], names=[])
+        return pyarrow.Table.from_batches(batches)
+
+    def to_dataframe(self):
+        """Consume the stream into a :class:`pandas.DataFrame`.
+
+        Values are decoded straight from the result set's protobufs into
+        typed columns: FLOAT64 columns have the ``float64`` dtype, TIMESTAMP
+        columns the ``datetime64[ns, UTC]`` dtype, and INT64 / BOOL columns
+        the ``int64`` / ``bool`` dtypes unless they hold nulls.  Other
+        columns have the ``object`` dtype.
+
+        ``datetime64[ns]`` only covers the years 1677 to 2262: a TIMESTAMP
+        column holding a value out of that range has the ``object`` dtype
+        instead, with :class:`datetime.datetime` values truncated to
+        microseconds.
+
+        .. note::
+
+            Use of this method requires that you have :mod:`pandas`
+            installed.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: a dataframe with a column per field of the result set.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        import pandas   # pylint: disable=import-error
+
+        for columns in self._iter_column_batches():
+            return _columns_to_dataframe(pandas, self.fields, columns)
+        return pandas.DataFrame()
 
     def one(self):
         """Return exactly one result, or raise an exception.
@@ -185,6 +368,61 @@ class StreamedResultSet(object):
             return answer
 
 
+_UNDECODED = object()
+
+
+class _LazyRow(object):
+    """Row of a result set, decoding each of its cells on first access.
+
+    Behaves as a (read-only) list of cell data.
+
+    :type value_pbs: list of :class:`~google.protobuf.struct_pb2.Value`
+    :param value_pbs: the row's values, as received
+
+    :type decoders: list of callable
+    :param decoders: one decoder per column, as built by
+                     :func:`~google.cloud.spanner_v1._helpers._make_row_decoders`
+    """
+    __slots__ = ('_value_pbs', '_decoders', '_cells')
+
+    def __init__(self, value_pbs, decoders):
+        self._value_pbs = value_pbs
+        self._decoders = decoders
+        self._cells = [_UNDECODED] * len(value_pbs)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in six.moves.range(
+                *index.indices(len(self._cells)))]
+        cell = self._cells[index]
+        if cell is _UNDECODED:
+            cell = self._decoders[index](self._value_pbs[index])
+            self._cells[index] = cell
+        return cell
+
+    def __iter__(self):
+        for index in six.moves.range(len(self._cells)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, _LazyRow)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        if not isinstance(other, (list, _LazyRow)):
+            return NotImplemented
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class Unmergeable(ValueError):
     """Unable to merge two values.
 
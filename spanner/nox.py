@@ -36,7 +36,10 @@ def default(session):
     """
     # Install all test dependencies, then install this package in-place.
     session.install('mock', 'pytest', 'pytest-cov', *LOCAL_DEPS)
-    session.install('-e', '.')
+    if session.interpreter == 'python3.4':
+        session.install('-e', '.')
+    else:
+        session.install('-e', '.[pandas,pyarrow]')
 
     # Run py.test against the unit tests.
     session.run(
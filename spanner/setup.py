@@ -59,6 +59,11 @@ REQUIREMENTS = [
     'requests >= 2.18.4, < 3.0dev',
 ]
 
+EXTRAS_REQUIREMENTS = {
+    'pandas': ['pandas >= 0.17.1'],
+    'pyarrow': ['pyarrow >= 0.8.0'],
+}
+
 setup(
     name='google-cloud-spanner',
     version='0.29.1.dev1',
@@ -70,5 +75,6 @@ setup(
     ],
     packages=find_packages(exclude=('tests*',)),
     install_requires=REQUIREMENTS,
+    extras_require=EXTRAS_REQUIREMENTS,
     **SETUP_BASE
 )
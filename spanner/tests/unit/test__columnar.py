@@ -0,0 +1,330 @@
+# Copyright 2017 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+
+class Test_rfc3339_to_nanos(unittest.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._columnar import _rfc3339_to_nanos
+
+        return _rfc3339_to_nanos(*args, **kw)
+
+    def test_wo_fraction(self):
+        self.assertEqual(
+            self._callFUT(u'2017-01-02T03:04:05Z'), 1483326245000000000)
+
+    def test_w_partial_precision(self):
+        self.assertEqual(
+            self._callFUT(u'2017-01-02T03:04:05.25Z'), 1483326245250000000)
+
+    def test_w_full_precision(self):
+        self.assertEqual(
+            self._callFUT(u'2017-01-02T03:04:05.123456789Z'),
+            1483326245123456789)
+
+    def test_before_epoch(self):
+        self.assertEqual(
+            self._callFUT(u'1969-12-31T23:59:59.5Z'), -500000000)
+
+    def test_wo_utc(self):
+        with self.assertRaises(ValueError):
+            self._callFUT(u'2017-01-02T03:04:05+01:00')
+
+
+class Test_iso8601_to_days(unittest.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._columnar import _iso8601_to_days
+
+        return _iso8601_to_days(*args, **kw)
+
+    def test_it(self):
+        self.assertEqual(self._callFUT(u'1970-01-01'), 0)
+        self.assertEqual(self._callFUT(u'2017-01-02'), 17168)
+        self.assertEqual(self._callFUT(u'1969-12-31'), -1)
+
+
+class Test_ColumnBuffer(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1._columnar import _ColumnBuffer
+
+        return _ColumnBuffer
+
+    def _make_one(self, code, **kw):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+
+        return self._getTargetClass()(Type(code=code, **kw))
+
+    @staticmethod
+    def _make_values(*values):
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        return [_make_value_pb(value) for value in values]
+
+    def test_ctor_w_unknown_type(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import (
+            TYPE_CODE_UNSPECIFIED)
+
+        with self.assertRaises(ValueError):
+            self._make_one(TYPE_CODE_UNSPECIFIED)
+
+    def test_int64(self):
+        import array
+        from google.cloud.spanner_v1.proto.type_pb2 import INT64
+
+        column = self._make_one(INT64)
+        column.extend(self._make_values(1, None))
+        column.extend(self._make_values(-2 ** 63))
+
+        self.assertIsInstance(column.values, array.array)
+        self.assertEqual(column.values.itemsize, 8)
+        self.assertEqual(column.values.tolist(), [1, 0, -2 ** 63])
+        self.assertEqual(len(column), 3)
+        self.assertEqual(column.null_count, 1)
+        self.assertEqual(column.to_list(), [1, None, -2 ** 63])
+
+    def test_float64(self):
+        import math
+        from google.cloud.spanner_v1.proto.type_pb2 import FLOAT64
+
+        column = self._make_one(FLOAT64)
+        column.extend(self._make_values(1.5, None, float('inf')))
+
+        self.assertEqual(column.values[0], 1.5)
+        self.assertTrue(math.isnan(column.values[1]))
+        self.assertEqual(column.values[2], float('inf'))
+        self.assertEqual(column.to_list(), [1.5, None, float('inf')])
+
+    def test_bool(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import BOOL
+
+        column = self._make_one(BOOL)
+        column.extend(self._make_values(True, False, None))
+
+        self.assertEqual(column.values.tolist(), [1, 0, 0])
+        self.assertEqual(column.to_list(bool), [True, False, None])
+
+    def test_date(self):
+        import datetime
+        from google.cloud.spanner_v1.proto.type_pb2 import DATE
+        from google.cloud.spanner_v1._columnar import _days_to_date
+
+        when = datetime.date(2017, 1, 2)
+        column = self._make_one(DATE)
+        column.extend(self._make_values(when, None))
+
+        self.assertEqual(column.values.tolist(), [17168, 0])
+        self.assertEqual(column.to_list(_days_to_date), [when, None])
+
+    def test_timestamp(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import TIMESTAMP
+        from google.cloud.spanner_v1._columnar import _NAT
+
+        column = self._make_one(TIMESTAMP)
+        column.extend(self._make_values(u'1970-01-01T00:00:01.5Z', None))
+
+        self.assertEqual(column.values.tolist(), [1500000000, _NAT])
+        self.assertEqual(column.nulls, bytearray([0, 1]))
+
+    def test_timestamp_out_of_nanosecond_range(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.spanner_v1.proto.type_pb2 import TIMESTAMP
+        from google.cloud.spanner_v1._columnar import _micros_to_datetime
+
+        column = self._make_one(TIMESTAMP)
+        column.extend(self._make_values(u'1970-01-01T00:00:01.5000009Z', None))
+        self.assertEqual(column.timestamp_unit, 'ns')
+
+        column.extend(self._make_values(
+            u'0001-01-01T00:00:00Z', u'9999-12-31T23:59:59.999999999Z'))
+        column.extend(self._make_values(u'1970-01-01T00:00:02Z'))
+
+        self.assertEqual(column.timestamp_unit, 'us')
+        self.assertEqual(column.values.itemsize, 8)
+        self.assertEqual(column.to_list(_micros_to_datetime), [
+            datetime.datetime(1970, 1, 1, 0, 0, 1, 500000, tzinfo=UTC),
+            None,
+            datetime.datetime(1, 1, 1, tzinfo=UTC),
+            datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=UTC),
+            datetime.datetime(1970, 1, 1, 0, 0, 2, tzinfo=UTC),
+        ])
+
+    def test_string(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import STRING
+
+        column = self._make_one(STRING)
+        column.extend(self._make_values(u'phred', None))
+
+        self.assertEqual(column.values, [u'phred', None])
+        self.assertEqual(column.to_list(), [u'phred', None])
+
+    def test_array(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import ARRAY, INT64
+
+        column = self._make_one(
+            ARRAY, array_element_type=Type(code=INT64))
+        column.extend(self._make_values([1, None], None))
+
+        self.assertEqual(column.to_list(), [[1, None], None])
+
+
+class Test_to_arrow_value(unittest.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._columnar import _to_arrow_value
+
+        return _to_arrow_value(*args, **kw)
+
+    def test_w_array_of_struct(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, StructType
+        from google.cloud.spanner_v1.proto.type_pb2 import (
+            ARRAY, INT64, STRING, STRUCT)
+
+        struct_type = Type(code=STRUCT, struct_type=StructType(fields=[
+            StructType.Field(name='name', type=Type(code=STRING)),
+            StructType.Field(name='age', type=Type(code=INT64)),
+        ]))
+        field_type = Type(code=ARRAY, array_element_type=struct_type)
+
+        self.assertEqual(
+            self._callFUT([[u'phred', 32], None], field_type),
+            [{'name': u'phred', 'age': 32}, None])
+        self.assertIsNone(self._callFUT(None, field_type))
+
+
+class _ConversionTest(unittest.TestCase):
+
+    @staticmethod
+    def _make_fields():
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, StructType
+        from google.cloud.spanner_v1.proto.type_pb2 import (
+            BOOL, DATE, FLOAT64, INT64, TIMESTAMP)
+
+        return [
+            StructType.Field(name='id', type=Type(code=INT64)),
+            StructType.Field(name='score', type=Type(code=FLOAT64)),
+            StructType.Field(name='active', type=Type(code=BOOL)),
+            StructType.Field(name='born', type=Type(code=DATE)),
+            StructType.Field(name='seen', type=Type(code=TIMESTAMP)),
+        ]
+
+    def _make_columns(self, fields, seen=u'2017-01-02T03:04:05.123456789Z'):
+        import datetime
+        from google.cloud.spanner_v1._columnar import _make_column_buffers
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        rows = [
+            [1, 1.5, True, datetime.date(2017, 1, 2), seen],
+            [2, None, None, None, None],
+        ]
+        columns = _make_column_buffers(fields)
+        for index, column in enumerate(columns):
+            column.extend([_make_value_pb(row[index]) for row in rows])
+        return columns
+
+
+@unittest.skipIf(pandas is None, 'Requires `pandas`')
+class Test_columns_to_dataframe(_ConversionTest):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._columnar import _columns_to_dataframe
+
+        return _columns_to_dataframe(*args, **kw)
+
+    def test_it(self):
+        import datetime
+
+        fields = self._make_fields()
+
+        frame = self._callFUT(pandas, fields, self._make_columns(fields))
+
+        self.assertEqual(
+            list(frame.columns), ['id', 'score', 'active', 'born', 'seen'])
+        self.assertEqual(str(frame['id'].dtype), 'int64')
+        self.assertEqual(str(frame['score'].dtype), 'float64')
+        self.assertEqual(list(frame['active']), [True, None])
+        self.assertEqual(
+            list(frame['born']), [datetime.date(2017, 1, 2), None])
+        self.assertEqual(frame['seen'][0].value, 1483326245123456789)
+        self.assertTrue(pandas.isnull(frame['seen'][1]))
+
+    def test_timestamp_out_of_nanosecond_range(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        fields = self._make_fields()
+        columns = self._make_columns(fields, seen=u'0001-01-01T00:00:00Z')
+
+        frame = self._callFUT(pandas, fields, columns)
+
+        self.assertEqual(str(frame['seen'].dtype), 'object')
+        self.assertEqual(
+            list(frame['seen']),
+            [datetime.datetime(1, 1, 1, tzinfo=UTC), None])
+
+
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class Test_columns_to_record_batch(_ConversionTest):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._columnar import _columns_to_record_batch
+
+        return _columns_to_record_batch(*args, **kw)
+
+    def test_it(self):
+        fields = self._make_fields()
+
+        batch = self._callFUT(pyarrow, fields, self._make_columns(fields))
+
+        self.assertEqual(batch.num_rows, 2)
+        schema = batch.schema
+        self.assertEqual(schema.field('id').type, pyarrow.int64())
+        self.assertEqual(schema.field('born').type, pyarrow.date32())
+        self.assertEqual(
+            schema.field('seen').type, pyarrow.timestamp('ns', tz='UTC'))
+        self.assertEqual(batch.column(0).to_pylist(), [1, 2])
+        self.assertEqual(batch.column(1).null_count, 1)
+        self.assertEqual(batch.column(2).to_pylist(), [True, None])
+
+    def test_timestamp_out_of_nanosecond_range(self):
+        import datetime
+
+        fields = self._make_fields()
+        columns = self._make_columns(
+            fields, seen=u'9999-12-31T23:59:59.999999999Z')
+
+        batch = self._callFUT(pyarrow, fields, columns)
+
+        self.assertEqual(
+            batch.schema.field('seen').type,
+            pyarrow.timestamp('us', tz='UTC'))
+        seen = batch.column(4).cast(pyarrow.timestamp('us')).to_pylist()
+        self.assertEqual(
+            seen, [datetime.datetime(9999, 12, 31, 23, 59, 59, 999999), None])
@@ -15,6 +15,11 @@
 
 import unittest
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 
 class TestTimestampWithNanoseconds(unittest.TestCase):
 
@@ -303,6 +308,171 @@ class Test_make_list_value_pbs(unittest.TestCase):
             self.assertEqual(found.values[0].string_value, str(expected[0]))
             self.assertEqual(found.values[1].string_value, expected[1])
 
+    def test_w_column_types_empty(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, INT64
+
+        result = self._callFUT(values=[], column_types=[Type(code=INT64)])
+        self.assertEqual(result, [])
+
+    def test_w_column_types(self):
+        import datetime
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import (
+            DATE, FLOAT64, INT64, STRING)
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        when = datetime.date(2017, 1, 2)
+        values = [[0, u'A', 1.5, when], [1, None, 2, None]]
+        column_types = [
+            Type(code=INT64),
+            Type(code=STRING),
+            Type(code=FLOAT64),
+            Type(code=DATE),
+        ]
+
+        result = self._callFUT(values=values, column_types=column_types)
+
+        self.assertEqual(result, [
+            _make_list_value_pb([0, u'A', 1.5, when]),
+            _make_list_value_pb([1, None, 2.0, None]),
+        ])
+
+    def test_w_column_types_w_ndarray(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import FLOAT64, INT64
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        values = _FakeArray([[1, 2], [3, 4]], kind='i')
+        column_types = [Type(code=INT64), Type(code=FLOAT64)]
+
+        result = self._callFUT(values=values, column_types=column_types)
+
+        self.assertEqual(result, [
+            _make_list_value_pb([1, 2.0]),
+            _make_list_value_pb([3, 4.0]),
+        ])
+
+    def test_w_column_types_w_dataframe(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import INT64, STRING
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        values = _FakeDataFrame([
+            _FakeSeries([1, 2], kind='i'),
+            _FakeSeries([u'A', u'B'], kind='O', missing=[False, True]),
+        ])
+        column_types = [Type(code=INT64), Type(code=STRING)]
+
+        result = self._callFUT(values=values, column_types=column_types)
+
+        self.assertEqual(result, [
+            _make_list_value_pb([1, u'A']),
+            _make_list_value_pb([2, None]),
+        ])
+
+    def test_w_column_types_w_nullable_integers(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import INT64
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        # Like pandas' ``Int64`` columns, whose NumPy arrays hold floats
+        # once values are missing.
+        values = _FakeDataFrame([
+            _FakeSeries([1, None, 3], kind='i', missing=[False, True, False],
+                        numpy_values=[1.0, float('nan'), 3.0]),
+        ])
+
+        result = self._callFUT(values=values, column_types=[Type(code=INT64)])
+
+        self.assertEqual(result, [
+            _make_list_value_pb([1]),
+            _make_list_value_pb([None]),
+            _make_list_value_pb([3]),
+        ])
+        self.assertEqual(result[0].values[0].string_value, u'1')
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_w_column_types_w_pandas_nullable_integers(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import INT64
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        values = pandas.DataFrame(
+            {'id': pandas.array([1, None, 3], dtype='Int64')})
+
+        result = self._callFUT(values=values, column_types=[Type(code=INT64)])
+
+        self.assertEqual(result, [
+            _make_list_value_pb([1]),
+            _make_list_value_pb([None]),
+            _make_list_value_pb([3]),
+        ])
+
+
+class Test_make_value_encoder(unittest.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _make_value_encoder
+
+        return _make_value_encoder(*args, **kw)
+
+    def test_w_none(self):
+        from google.protobuf.struct_pb2 import Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, STRING
+
+        encoder = self._callFUT(Type(code=STRING))
+
+        self.assertEqual(encoder(None), Value(null_value=NULL_VALUE))
+
+    def test_w_scalar_types(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import (
+            BOOL, BYTES, DATE, FLOAT64, INT64, STRING, TIMESTAMP)
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        when = datetime.datetime(2017, 1, 2, 3, 4, 5, tzinfo=UTC)
+        for code, value in [
+                (STRING, u'abc'),
+                (BYTES, b'abc'),
+                (BOOL, True),
+                (INT64, 42),
+                (FLOAT64, float('inf')),
+                (DATE, when.date()),
+                (TIMESTAMP, when)]:
+            encoder = self._callFUT(Type(code=code))
+            self.assertEqual(encoder(value), _make_value_pb(value))
+
+    def test_w_float64_int(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, FLOAT64
+
+        encoder = self._callFUT(Type(code=FLOAT64))
+
+        self.assertEqual(encoder(3), Value(number_value=3.0))
+
+    def test_w_mismatched_value(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, INT64
+
+        encoder = self._callFUT(Type(code=INT64))
+
+        self.assertEqual(encoder(u'12'), Value(string_value=u'12'))
+        with self.assertRaises(ValueError):
+            encoder(object())
+
+    def test_w_array_w_nulls(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import ARRAY, INT64
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        encoder = self._callFUT(
+            Type(code=ARRAY, array_element_type=Type(code=INT64)))
+
+        self.assertEqual(encoder([1, None, 3]), _make_value_pb([1, None, 3]))
+        self.assertEqual(encoder(None), _make_value_pb(None))
+
 
 class Test_parse_value_pb(unittest.TestCase):
 
@@ -462,6 +632,57 @@ class Test_parse_value_pb(unittest.TestCase):
             self._callFUT(value_pb, field_type)
 
 
+class Test_make_value_decoder(unittest.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _make_value_decoder
+
+        return _make_value_decoder(*args, **kw)
+
+    def test_w_float_string(self):
+        import math
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, FLOAT64
+
+        decoder = self._callFUT(Type(code=FLOAT64))
+
+        self.assertEqual(decoder(Value(number_value=3.25)), 3.25)
+        self.assertTrue(math.isnan(decoder(Value(string_value='NaN'))))
+
+    def test_w_array_of_struct_w_nulls(self):
+        from google.protobuf.struct_pb2 import Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, StructType
+        from google.cloud.spanner_v1.proto.type_pb2 import (
+            ARRAY, INT64, STRING, STRUCT)
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        struct_type = Type(code=STRUCT, struct_type=StructType(fields=[
+            StructType.Field(name='name', type=Type(code=STRING)),
+            StructType.Field(name='age', type=Type(code=INT64)),
+        ]))
+        field_type = Type(code=ARRAY, array_element_type=struct_type)
+        null_pb = Value(null_value=NULL_VALUE)
+        value_pb = Value(list_value=_make_list_value_pb([
+            [u'phred', 32],
+            [u'bharney', None],
+            None,
+        ]))
+
+        decoder = self._callFUT(field_type)
+
+        self.assertEqual(
+            decoder(value_pb), [[u'phred', 32], [u'bharney', None], None])
+        self.assertIsNone(decoder(null_pb))
+
+    def test_w_unknown_type(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import (
+            TYPE_CODE_UNSPECIFIED)
+
+        with self.assertRaises(ValueError):
+            self._callFUT(Type(code=TYPE_CODE_UNSPECIFIED))
+
+
 class Test_parse_list_value_pbs(unittest.TestCase):
 
     def _callFUT(self, *args, **kw):
@@ -541,3 +762,78 @@ class Test_options_with_prefix(unittest.TestCase):
         self.assertEqual(options.kwargs['metadata'],
                          [('google-cloud-resource-prefix', PREFIX)])
         self.assertEqual(options.page_token, TOKEN)
+
+
+class _FakeDtype(object):
+
+    def __init__(self, kind):
+        self.kind = kind
+
+
+class _FakeArray(object):
+    """Minimal stand-in for a one- or two-dimensional NumPy array."""
+
+    def __init__(self, rows, kind):
+        self._rows = rows
+        self.dtype = _FakeDtype(kind)
+        self.ndim = 2 if rows and isinstance(rows[0], list) else 1
+
+    def __getitem__(self, key):
+        _, index = key
+        return _FakeArray([row[index] for row in self._rows], self.dtype.kind)
+
+    def astype(self, dtype):
+        assert dtype is str
+        return _FakeArray([str(value) for value in self._rows], 'U')
+
+    def tolist(self):
+        return list(self._rows)
+
+
+class _FakeMissing(object):
+
+    def __init__(self, missing):
+        self._missing = missing
+
+    def any(self):
+        return any(self._missing)
+
+    def tolist(self):
+        return list(self._missing)
+
+
+class _FakeSeries(object):
+    """Minimal stand-in for a pandas Series."""
+
+    def __init__(self, values, kind, missing=None, numpy_values=None):
+        self._values = values
+        self._array = _FakeArray(values, kind)
+        if numpy_values is not None:
+            self._array = _FakeArray(numpy_values, 'f')
+        self.dtype = _FakeDtype(kind)
+        self._missing = missing or [False] * len(values)
+
+    def isna(self):
+        return _FakeMissing(self._missing)
+
+    def to_numpy(self, dtype=None):
+        if dtype is object:
+            return _FakeArray(self._values, 'O')
+        return self._array
+
+
+class _FakeILoc(object):
+
+    def __init__(self, columns):
+        self._columns = columns
+
+    def __getitem__(self, key):
+        _, index = key
+        return self._columns[index]
+
+
+class _FakeDataFrame(object):
+    """Minimal stand-in for a pandas DataFrame."""
+
+    def __init__(self, columns):
+        self.iloc = _FakeILoc(columns)
@@ -91,6 +91,23 @@ class Test_BatchBase(_BaseTest):
         self.assertEqual(write.columns, COLUMNS)
         self._compare_values(write.values, VALUES)
 
+    def test_insert_w_column_types(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import INT64, STRING
+
+        session = _Session()
+        base = self._make_one(session)
+        column_types = [Type(code=STRING)] * 3 + [Type(code=INT64)]
+
+        base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES,
+                    column_types=column_types)
+
+        self.assertEqual(len(base._mutations), 1)
+        write = base._mutations[0].insert
+        self.assertEqual(write.table, TABLE_NAME)
+        self.assertEqual(write.columns, COLUMNS)
+        self._compare_values(write.values, VALUES)
+
     def test_update(self):
         from google.cloud.spanner_v1.proto.mutation_pb2 import Mutation
 
@@ -606,6 +606,17 @@ class TestDatabase(_BaseTest):
         self.assertEqual(name, self.DATABASE_NAME)
         self.assertEqual(options.kwargs['metadata'],
                          [('google-cloud-resource-prefix', database.name)])
+        self.assertTrue(pool._closed)
+
+    def test_close(self):
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        database.close()
+
+        self.assertTrue(pool._closed)
 
     def test_session_factory(self):
         from google.cloud.spanner_v1.session import Session
@@ -670,6 +681,34 @@ class TestDatabase(_BaseTest):
         self.assertIsInstance(checkout, BatchCheckout)
         self.assertIs(checkout._database, database)
 
+    def test_mutation_writer(self):
+        from google.cloud.spanner_v1.database import MutationWriter
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        database = self._make_one(self.DATABASE_ID, instance, pool=_Pool())
+
+        with database.mutation_writer(max_mutations=10) as writer:
+            self.assertIsInstance(writer, MutationWriter)
+            self.assertIs(writer._database, database)
+            self.assertEqual(writer._max_mutations, 10)
+
+    def test_batch_snapshot(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.spanner_v1.database import BatchSnapshot
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        database = self._make_one(self.DATABASE_ID, instance, pool=_Pool())
+
+        batch_snapshot = database.batch_snapshot(read_timestamp=now)
+        self.assertIsInstance(batch_snapshot, BatchSnapshot)
+        self.assertIs(batch_snapshot._database, database)
+        self.assertEqual(batch_snapshot._read_timestamp, now)
+        self.assertIsNone(batch_snapshot._exact_staleness)
+
     def test_run_in_transaction_wo_args(self):
         import datetime
 
@@ -882,6 +921,778 @@ class TestSnapshotCheckout(_BaseTest):
         self.assertIs(pool._session, session)
 
 
+class TestBatchSnapshot(_BaseTest):
+
+    TABLE = 'citizens'
+    COLUMNS = ['email', 'first_name', 'age']
+    SQL = 'SELECT * FROM citizens WHERE email >= @start AND email < @end'
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.database import BatchSnapshot
+
+        return BatchSnapshot
+
+    def _make_database(self):
+        database = _Database(self.DATABASE_NAME)
+        database._pool = _SessionPerGetPool(database)
+        return database
+
+    @staticmethod
+    def _make_timestamp():
+        import datetime
+        from google.cloud._helpers import UTC
+
+        return datetime.datetime(2017, 11, 21, 12, 34, 56, tzinfo=UTC)
+
+    def _make_one_w_snapshot(self, snapshot):
+        database = self._make_database()
+        batch_snapshot = self._make_one(
+            database, read_timestamp=self._make_timestamp())
+        patch = mock.patch.object(
+            batch_snapshot, '_snapshot', return_value=snapshot)
+        patch.start()
+        self.addCleanup(patch.stop)
+        return batch_snapshot
+
+    def test_ctor_w_read_timestamp_and_exact_staleness(self):
+        import datetime
+
+        with self.assertRaises(ValueError):
+            self._make_one(
+                self._make_database(),
+                read_timestamp=self._make_timestamp(),
+                exact_staleness=datetime.timedelta(seconds=10))
+
+    def test_read_timestamp_explicit(self):
+        database = self._make_database()
+        database.spanner_api = mock.Mock(spec=[])
+        timestamp = self._make_timestamp()
+        batch_snapshot = self._make_one(database, read_timestamp=timestamp)
+        self.assertEqual(batch_snapshot.read_timestamp, timestamp)
+
+    def _read_timestamp_helper(self, exact_staleness=None):
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+        from google.cloud.spanner_v1.proto.transaction_pb2 import (
+            Transaction)
+
+        database = self._make_database()
+        timestamp = self._make_timestamp()
+        api = database.spanner_api = mock.Mock(spec=['begin_transaction'])
+        api.begin_transaction.return_value = Transaction(
+            id=b'DEADBEEF',
+            read_timestamp=_datetime_to_pb_timestamp(timestamp))
+        batch_snapshot = self._make_one(
+            database, exact_staleness=exact_staleness)
+
+        self.assertEqual(batch_snapshot.read_timestamp, timestamp)
+        self.assertEqual(batch_snapshot.read_timestamp, timestamp)
+
+        api.begin_transaction.assert_called_once()
+        session_name, txn_options = api.begin_transaction.call_args[0]
+        options = api.begin_transaction.call_args[1]['options']
+        self.assertEqual(session_name, database._pool._returned[0].name)
+        self.assertTrue(txn_options.read_only.return_read_timestamp)
+        self.assertEqual(
+            options.kwargs['metadata'],
+            [('google-cloud-resource-prefix', database.name)])
+        return txn_options.read_only
+
+    def test_read_timestamp_strong(self):
+        read_only = self._read_timestamp_helper()
+        self.assertTrue(read_only.strong)
+
+    def test_read_timestamp_w_exact_staleness(self):
+        import datetime
+
+        read_only = self._read_timestamp_helper(
+            exact_staleness=datetime.timedelta(seconds=10))
+        self.assertEqual(read_only.exact_staleness.seconds, 10)
+
+    def test_to_dict_from_dict(self):
+        database = self._make_database()
+        timestamp = self._make_timestamp()
+        batch_snapshot = self._make_one(database, read_timestamp=timestamp)
+
+        mapping = batch_snapshot.to_dict()
+        restored = self._getTargetClass().from_dict(database, mapping)
+
+        self.assertEqual(mapping, {'read_timestamp': timestamp})
+        self.assertIs(restored._database, database)
+        self.assertEqual(restored.read_timestamp, timestamp)
+
+    def test__snapshot(self):
+        database = self._make_database()
+        timestamp = self._make_timestamp()
+        batch_snapshot = self._make_one(database, read_timestamp=timestamp)
+        session = _Session(database)
+
+        snapshot = batch_snapshot._snapshot(session)
+
+        self.assertIs(snapshot._session, session)
+        self.assertEqual(snapshot._read_timestamp, timestamp)
+        self.assertFalse(snapshot._multi_use)
+
+    def test_sample_split_points_invalid_partitions(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+        with self.assertRaises(ValueError):
+            batch_snapshot.sample_split_points(self.TABLE, ['email'], 0)
+
+    def test_sample_split_points_single_partition(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+        self.assertEqual(
+            batch_snapshot.sample_split_points(self.TABLE, ['email'], 1), [])
+
+    def test_sample_split_points_invalid_descending_columns(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+        with self.assertRaises(ValueError):
+            batch_snapshot.sample_split_points(
+                self.TABLE, ['email'], 4, descending_columns=['id'])
+
+    def test_sample_split_points(self):
+        snapshot = mock.Mock(spec=['execute_sql'])
+        snapshot.execute_sql.return_value = iter([
+            [u'a', None], [u'a', 1], [u'b', 3], [u'c', 2], [u'e', 1],
+            [u'e', 1], [u'f', 2], [u'g', 2],
+        ])
+        batch_snapshot = self._make_one_w_snapshot(snapshot)
+
+        points = batch_snapshot.sample_split_points(
+            self.TABLE, ['email', 'id'], 4, index='by_email')
+
+        self.assertEqual(points, [[u'b', 3], [u'e', 1], [u'f', 2]])
+        snapshot.execute_sql.assert_called_once_with(
+            'SELECT `email`, `id` FROM (SELECT `email`, `id` FROM '
+            '`citizens`@{FORCE_INDEX=`by_email`} '
+            'TABLESAMPLE RESERVOIR (400 ROWS)) '
+            'ORDER BY `email` ASC, `id` ASC')
+        pool = batch_snapshot._database._pool
+        self.assertEqual(len(pool._returned), 1)
+
+    def test_sample_split_points_w_bytes_keys(self):
+        import base64
+
+        # Spanner returns BYTES as base64 text, which does not sort in the
+        # order of the bytes: the sample must be kept in Spanner's order.
+        keys = [b'\x00', b'\x10', b'\x80', b'\xf8']
+        snapshot = mock.Mock(spec=['execute_sql'])
+        snapshot.execute_sql.return_value = iter([
+            [base64.b64encode(key).decode('ascii')] for key in keys])
+        batch_snapshot = self._make_one_w_snapshot(snapshot)
+
+        points = batch_snapshot.sample_split_points(self.TABLE, ['hash'], 4)
+
+        self.assertEqual(points, [[u'EA=='], [u'gA=='], [u'+A==']])
+        sql, = snapshot.execute_sql.call_args[0]
+        self.assertTrue(sql.endswith(' ORDER BY `hash` ASC'))
+
+    def test_sample_split_points_w_descending_columns(self):
+        snapshot = mock.Mock(spec=['execute_sql'])
+        snapshot.execute_sql.return_value = iter([
+            [u'a', 9], [u'a', 2], [u'b', 7], [u'b', 5],
+        ])
+        batch_snapshot = self._make_one_w_snapshot(snapshot)
+
+        points = batch_snapshot.sample_split_points(
+            self.TABLE, ['email', 'version'], 2,
+            descending_columns=['version'])
+
+        self.assertEqual(points, [[u'b', 7]])
+        sql, = snapshot.execute_sql.call_args[0]
+        self.assertTrue(
+            sql.endswith(' ORDER BY `email` ASC, `version` DESC'))
+
+    def test_sample_split_points_dedupes(self):
+        snapshot = mock.Mock(spec=['execute_sql'])
+        snapshot.execute_sql.return_value = iter(
+            [[u'a'], [u'b'], [u'b'], [u'b']])
+        batch_snapshot = self._make_one_w_snapshot(snapshot)
+
+        points = batch_snapshot.sample_split_points(self.TABLE, ['email'], 4)
+
+        self.assertEqual(points, [[u'b']])
+
+    def test_generate_read_batches_single(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+        keyset = KeySet(keys=[[u'phred@example.com']])
+
+        batches = batch_snapshot.generate_read_batches(
+            self.TABLE, self.COLUMNS, keyset=keyset, index='by_email')
+
+        self.assertEqual(batches, [{
+            'read': {
+                'table': self.TABLE,
+                'columns': self.COLUMNS,
+                'keyset': keyset,
+                'index': 'by_email',
+            },
+        }])
+
+    def test_generate_read_batches_default_keyset(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+
+        batches = batch_snapshot.generate_read_batches(
+            self.TABLE, self.COLUMNS)
+
+        self.assertEqual(len(batches), 1)
+        self.assertTrue(batches[0]['read']['keyset'].all_)
+
+    def test_generate_read_batches_w_key_ranges(self):
+        from google.cloud.spanner_v1.keyset import KeyRange
+
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+        ranges = [
+            KeyRange(start_closed=[u'a'], end_open=[u'm']),
+            KeyRange(start_closed=[u'm'], end_closed=[]),
+        ]
+
+        batches = batch_snapshot.generate_read_batches(
+            self.TABLE, self.COLUMNS, key_ranges=ranges)
+
+        self.assertEqual(len(batches), 2)
+        for batch, key_range in zip(batches, ranges):
+            self.assertEqual(batch['read']['keyset'].ranges, [key_range])
+            self.assertEqual(batch['read']['table'], self.TABLE)
+
+    def test_generate_read_batches_w_sampled_split_points(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+
+        with mock.patch.object(
+                batch_snapshot, 'sample_split_points',
+                return_value=[[u'h'], [u'p']]) as sample:
+            batches = batch_snapshot.generate_read_batches(
+                self.TABLE, self.COLUMNS, key_columns=['email'],
+                partitions=3)
+
+        sample.assert_called_once_with(
+            self.TABLE, ['email'], 3, index='', descending_columns=())
+        ranges = [batch['read']['keyset'].ranges[0] for batch in batches]
+        self.assertEqual(
+            [(r.start_closed, r.end_open, r.end_closed) for r in ranges],
+            [([], [u'h'], None), ([u'h'], [u'p'], None), ([u'p'], None, [])])
+
+    def test_generate_read_batches_w_descending_columns(self):
+        snapshot = mock.Mock(spec=['execute_sql'])
+        snapshot.execute_sql.return_value = iter([
+            [u'a', 9], [u'a', 2], [u'b', 7], [u'b', 5],
+        ])
+        batch_snapshot = self._make_one_w_snapshot(snapshot)
+
+        batches = batch_snapshot.generate_read_batches(
+            self.TABLE, self.COLUMNS, key_columns=['email', 'version'],
+            partitions=2, descending_columns=['version'])
+
+        sql, = snapshot.execute_sql.call_args[0]
+        self.assertIn('`version` DESC', sql)
+        ranges = [batch['read']['keyset'].ranges[0] for batch in batches]
+        self.assertEqual(
+            [(r.start_closed, r.end_open, r.end_closed) for r in ranges],
+            [([], [u'b', 7], None), ([u'b', 7], None, [])])
+
+    def test_generate_read_batches_w_partitions_wo_key_columns(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+
+        with self.assertRaises(ValueError):
+            batch_snapshot.generate_read_batches(
+                self.TABLE, self.COLUMNS, partitions=3)
+
+    def test_generate_read_batches_w_keyset_and_key_ranges(self):
+        from google.cloud.spanner_v1.keyset import KeyRange
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+
+        with self.assertRaises(ValueError):
+            batch_snapshot.generate_read_batches(
+                self.TABLE, self.COLUMNS, keyset=KeySet(all_=True),
+                key_ranges=[KeyRange(start_closed=[], end_closed=[])])
+
+    def test_generate_query_batches_single(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+
+        batches = batch_snapshot.generate_query_batches('SELECT 1')
+
+        self.assertEqual(batches, [{
+            'query': {'sql': 'SELECT 1', 'params': None, 'param_types': None},
+        }])
+
+    def test_generate_query_batches_w_partition_params(self):
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, STRING
+
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+        param_types = {
+            'start': Type(code=STRING),
+            'end': Type(code=STRING),
+            'country': Type(code=STRING),
+        }
+
+        batches = batch_snapshot.generate_query_batches(
+            self.SQL, params={'country': u'US'}, param_types=param_types,
+            partition_params=[
+                {'start': u'a', 'end': u'm'},
+                {'start': u'm', 'end': u'z'},
+            ])
+
+        self.assertEqual(
+            [batch['query']['params'] for batch in batches], [
+                {'country': u'US', 'start': u'a', 'end': u'm'},
+                {'country': u'US', 'start': u'm', 'end': u'z'},
+            ])
+        for batch in batches:
+            self.assertEqual(batch['query']['sql'], self.SQL)
+            self.assertIs(batch['query']['param_types'], param_types)
+
+    def test_process_read_batch(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        snapshot = mock.Mock(spec=['read'])
+        snapshot.read.return_value = iter([[u'a', 1], [u'b', 2]])
+        batch_snapshot = self._make_one_w_snapshot(snapshot)
+        keyset = KeySet(all_=True)
+        batch = {
+            'read': {
+                'table': self.TABLE,
+                'columns': self.COLUMNS,
+                'keyset': keyset,
+                'index': '',
+            },
+        }
+
+        rows = list(batch_snapshot.process(batch))
+
+        self.assertEqual(rows, [[u'a', 1], [u'b', 2]])
+        snapshot.read.assert_called_once_with(
+            table=self.TABLE, columns=self.COLUMNS, keyset=keyset, index='')
+        pool = batch_snapshot._database._pool
+        self.assertEqual(len(pool._returned), 1)
+
+    def test_process_query_batch(self):
+        snapshot = mock.Mock(spec=['execute_sql'])
+        snapshot.execute_sql.return_value = iter([[1]])
+        batch_snapshot = self._make_one_w_snapshot(snapshot)
+        batch = {
+            'query': {'sql': 'SELECT 1', 'params': None, 'param_types': None},
+        }
+
+        rows = list(batch_snapshot.process(batch))
+
+        self.assertEqual(rows, [[1]])
+        snapshot.execute_sql.assert_called_once_with(
+            sql='SELECT 1', params=None, param_types=None)
+
+    def test_process_invalid_batch(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+
+        with self.assertRaises(ValueError):
+            list(batch_snapshot.process({}))
+
+    @staticmethod
+    def _make_query_batches(count):
+        return [{
+            'query': {'sql': str(index), 'params': None, 'param_types': None},
+        } for index in range(count)]
+
+    def _make_one_w_rows_by_sql(self, rows_by_sql):
+        def execute_sql(sql, params, param_types):
+            rows = rows_by_sql[sql]
+            if isinstance(rows, Exception):
+                raise rows
+            return iter(rows)
+
+        snapshot = mock.Mock(spec=['execute_sql'])
+        snapshot.execute_sql.side_effect = execute_sql
+        return self._make_one_w_snapshot(snapshot)
+
+    def test_process_batches_ordered(self):
+        from google.cloud.spanner_v1 import database as MUT
+
+        rows_by_sql = {
+            '0': [[index] for index in range(250)],
+            '1': [],
+            '2': [[index] for index in range(250, 260)],
+        }
+        batch_snapshot = self._make_one_w_rows_by_sql(rows_by_sql)
+
+        with mock.patch.object(MUT, '_CHUNKS_PER_BATCH', 1):
+            rows = list(batch_snapshot.process_batches(
+                self._make_query_batches(3), max_workers=2, ordered=True))
+
+        self.assertEqual(rows, [[index] for index in range(260)])
+        pool = batch_snapshot._database._pool
+        self.assertEqual(len(pool._returned), 3)
+
+    def test_process_batches_unordered(self):
+        rows_by_sql = {
+            str(batch): [[batch, index] for index in range(150)]
+            for batch in range(4)
+        }
+        batch_snapshot = self._make_one_w_rows_by_sql(rows_by_sql)
+
+        rows = list(batch_snapshot.process_batches(
+            self._make_query_batches(4), max_workers=3))
+
+        self.assertEqual(
+            sorted(rows),
+            [[batch, index] for batch in range(4) for index in range(150)])
+
+    def test_process_batches_empty(self):
+        batch_snapshot = self._make_one_w_snapshot(mock.Mock(spec=[]))
+
+        self.assertEqual(list(batch_snapshot.process_batches([])), [])
+
+    def test_process_batches_w_error(self):
+        class Testing(Exception):
+            pass
+
+        rows_by_sql = {'0': [[0]], '1': Testing()}
+        batch_snapshot = self._make_one_w_rows_by_sql(rows_by_sql)
+
+        with self.assertRaises(Testing):
+            list(batch_snapshot.process_batches(
+                self._make_query_batches(2), ordered=True))
+
+    def test_process_batches_closed_early(self):
+        import time
+        from google.cloud.spanner_v1 import database as MUT
+
+        rows_by_sql = {
+            str(batch): [[batch, index] for index in range(1000)]
+            for batch in range(2)
+        }
+        batch_snapshot = self._make_one_w_rows_by_sql(rows_by_sql)
+        pool = batch_snapshot._database._pool
+
+        with mock.patch.object(MUT, '_PUT_POLL_INTERVAL', 0.01):
+            rows = batch_snapshot.process_batches(
+                self._make_query_batches(2), ordered=True)
+            self.assertEqual(next(rows), [0, 0])
+            rows.close()
+            deadline = time.time() + 5
+            with pool._condition:
+                while len(pool._returned) < 2 and time.time() < deadline:
+                    pool._condition.wait(0.1)
+
+        self.assertEqual(len(pool._returned), 2)
+
+
+class TestMutationWriter(_BaseTest):
+
+    TABLE = 'citizens'
+    COLUMNS = ['email', 'first_name', 'age']
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.database import MutationWriter
+
+        return MutationWriter
+
+    def _make_database(self, side_effect=None):
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+        from google.cloud.spanner_v1.proto.spanner_pb2 import CommitResponse
+
+        database = _Database(self.DATABASE_NAME)
+        database._pool = _SessionPerGetPool(database)
+        api = database.spanner_api = mock.Mock(spec=['commit'])
+        response = CommitResponse(
+            commit_timestamp=_datetime_to_pb_timestamp(
+                TestBatchSnapshot._make_timestamp()))
+        if side_effect is None:
+            api.commit.return_value = response
+        else:
+            api.commit.side_effect = side_effect(response)
+        return database
+
+    @staticmethod
+    def _committed(database):
+        calls = database.spanner_api.commit.call_args_list
+        return [call[0][1] for call in calls]
+
+    @staticmethod
+    def _rows(count):
+        return [[u'%d@example.com' % (index,), u'Phred', index]
+                for index in range(count)]
+
+    def test_ctor_invalid_max_commits(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self._make_database(), max_commits=0)
+
+    def test_insert_w_column_types(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import INT64, STRING
+
+        database = self._make_database()
+        rows = self._rows(2)
+        column_types = [Type(code=STRING), Type(code=STRING), Type(code=INT64)]
+
+        with self._make_one(database) as writer:
+            writer.insert(self.TABLE, self.COLUMNS, rows, column_types)
+
+        (mutations,) = self._committed(database)
+        (mutation,) = mutations
+        self.assertEqual(
+            list(mutation.insert.values), _make_list_value_pbs(rows))
+
+    def test_insert_splits_by_mutation_count(self):
+        database = self._make_database()
+        rows = self._rows(5)
+
+        with self._make_one(database, max_mutations=6) as writer:
+            writer.insert(self.TABLE, self.COLUMNS, rows)
+
+        committed = self._committed(database)
+        self.assertEqual(len(committed), 3)
+        written = []
+        for mutations in committed:
+            (mutation,) = mutations
+            self.assertEqual(mutation.insert.table, self.TABLE)
+            self.assertEqual(list(mutation.insert.columns), self.COLUMNS)
+            self.assertLessEqual(len(mutation.insert.values), 2)
+            written.extend(mutation.insert.values)
+        self.assertEqual(
+            sorted(value.values[2].string_value for value in written),
+            [str(index) for index in range(5)])
+        self.assertEqual(writer.commit_count, 3)
+        self.assertEqual(len(database._pool._returned), 3)
+
+    def test_write_splits_by_bytes(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        database = self._make_database()
+        rows = self._rows(4)
+        row_bytes = _make_list_value_pb(rows[0]).ByteSize()
+        overhead = len(self.TABLE) + sum(map(len, self.COLUMNS))
+
+        with self._make_one(
+                database, max_bytes=overhead + 2 * row_bytes) as writer:
+            writer.insert_or_update(self.TABLE, self.COLUMNS, rows)
+
+        committed = self._committed(database)
+        self.assertEqual(
+            sorted(len(mutations[0].insert_or_update.values)
+                   for mutations in committed), [2, 2])
+
+    def test_write_row_too_large(self):
+        database = self._make_database()
+
+        with self._make_one(database, max_mutations=2) as writer:
+            with self.assertRaises(ValueError):
+                writer.insert(self.TABLE, self.COLUMNS, self._rows(1))
+
+        database.spanner_api.commit.assert_not_called()
+
+    def test_write_row_too_large_among_valid_rows(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        database = self._make_database()
+        rows = self._rows(3)
+        row_bytes = _make_list_value_pb(rows[0]).ByteSize()
+        overhead = len(self.TABLE) + sum(map(len, self.COLUMNS))
+        oversized = [u'big@example.com', u'P' * (2 * row_bytes), 3]
+
+        with self._make_one(
+                database, max_bytes=overhead + 2 * row_bytes) as writer:
+            with self.assertRaises(ValueError):
+                writer.insert(
+                    self.TABLE, self.COLUMNS, rows[:2] + [oversized])
+            # None of the rows was added, nor counted as pending.
+            self.assertEqual(writer._pending_count, 0)
+            self.assertEqual(writer._pending_bytes, 0)
+            writer.insert(self.TABLE, self.COLUMNS, rows[2:])
+
+        (mutations,) = self._committed(database)
+        (mutation,) = mutations
+        self.assertEqual(
+            list(mutation.insert.values), [_make_list_value_pb(rows[2])])
+
+    def test_mixed_mutations_single_commit(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        database = self._make_database()
+        keyset = KeySet(keys=[[u'0@example.com'], [u'1@example.com']])
+
+        with self._make_one(database) as writer:
+            writer.update(self.TABLE, self.COLUMNS, self._rows(1))
+            writer.replace(self.TABLE, self.COLUMNS, self._rows(1))
+            writer.delete(self.TABLE, keyset)
+
+        (mutations,) = self._committed(database)
+        self.assertEqual(
+            [mutation.WhichOneof('operation') for mutation in mutations],
+            ['update', 'replace', 'delete'])
+        self.assertEqual(mutations[2].delete.key_set, keyset.to_pb())
+
+    def test_delete_counts_keys(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        database = self._make_database()
+
+        with self._make_one(database, max_mutations=3) as writer:
+            writer.insert(self.TABLE, self.COLUMNS, self._rows(1))
+            writer.delete(self.TABLE, KeySet(keys=[[u'a'], [u'b']]))
+
+        self.assertEqual(
+            [len(mutations) for mutations in self._committed(database)],
+            [1, 1])
+
+    def test_commit_uses_single_use_read_write_transaction(self):
+        database = self._make_database()
+
+        with self._make_one(database) as writer:
+            writer.insert(self.TABLE, self.COLUMNS, self._rows(1))
+
+        call = database.spanner_api.commit.call_args
+        self.assertEqual(call[0][0], database._pool._returned[0].name)
+        self.assertTrue(
+            call[1]['single_use_transaction'].HasField('read_write'))
+
+    def test_flush_without_mutations(self):
+        database = self._make_database()
+        writer = self._make_one(database)
+
+        writer.flush()
+        writer.close()
+
+        database.spanner_api.commit.assert_not_called()
+
+    def test_commit_retried_when_aborted(self):
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1 import database as MUT
+
+        def side_effect(response):
+            return [Aborted('conflict'), Aborted('conflict'), response]
+
+        database = self._make_database(side_effect)
+
+        with mock.patch.object(MUT.time, 'sleep') as sleep:
+            with self._make_one(database) as writer:
+                writer.insert(self.TABLE, self.COLUMNS, self._rows(2))
+
+        self.assertEqual(database.spanner_api.commit.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(writer.retry_count, 2)
+        self.assertEqual(writer.commit_count, 1)
+        self.assertEqual(len(database._pool._returned), 1)
+
+    def test_commit_aborted_past_deadline(self):
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1 import database as MUT
+
+        def side_effect(response):
+            return Aborted('conflict')
+
+        database = self._make_database(side_effect)
+        writer = self._make_one(database, timeout_secs=0)
+        writer.insert(self.TABLE, self.COLUMNS, self._rows(2))
+
+        with mock.patch.object(MUT.time, 'sleep') as sleep:
+            with self.assertRaises(Aborted):
+                writer.close()
+
+        sleep.assert_not_called()
+        self.assertEqual(writer.commit_count, 0)
+
+    def test_commit_error_raised_on_next_write(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        def side_effect(response):
+            return [InvalidArgument('bad'), response]
+
+        database = self._make_database(side_effect)
+        writer = self._make_one(database, max_mutations=3, max_commits=1)
+        writer.insert(self.TABLE, self.COLUMNS, self._rows(2))
+
+        with self.assertRaises(InvalidArgument):
+            writer.flush()
+        with self.assertRaises(InvalidArgument):
+            writer.insert(self.TABLE, self.COLUMNS, self._rows(1))
+
+    def test_context_mgr_failure_discards_pending(self):
+        database = self._make_database()
+
+        class Testing(Exception):
+            pass
+
+        with self.assertRaises(Testing):
+            with self._make_one(database) as writer:
+                writer.insert(self.TABLE, self.COLUMNS, self._rows(2))
+                raise Testing()
+
+        database.spanner_api.commit.assert_not_called()
+
+
+class Test_abort_retry_delay(unittest.TestCase):
+
+    def _call_fut(self, exc, attempt):
+        from google.cloud.spanner_v1.database import _abort_retry_delay
+
+        return _abort_retry_delay(exc, attempt)
+
+    def test_not_aborted(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        self.assertIsNone(self._call_fut(InvalidArgument('bad'), 0))
+
+    def test_aborted_backoff(self):
+        from google.api_core.exceptions import Aborted
+
+        with mock.patch('random.random', return_value=1.0):
+            self.assertEqual(self._call_fut(Aborted('conflict'), 0), 0.1)
+            self.assertEqual(self._call_fut(Aborted('conflict'), 3), 0.8)
+            self.assertEqual(self._call_fut(Aborted('conflict'), 20), 32.0)
+        with mock.patch('random.random', return_value=0.0):
+            self.assertEqual(self._call_fut(Aborted('conflict'), 3), 0.4)
+
+    def test_gax_aborted_w_retry_delay(self):
+        from google.gax.errors import GaxError
+        from grpc import StatusCode
+        from google.cloud.spanner_v1 import database as MUT
+
+        cause = object()
+        exc = GaxError('conflict', cause)
+
+        with mock.patch.object(
+                MUT, 'exc_to_code', return_value=StatusCode.ABORTED):
+            with mock.patch.object(
+                    MUT, '_get_retry_delay', return_value=1.5) as get_delay:
+                self.assertEqual(self._call_fut(exc, 0), 1.5)
+
+        get_delay.assert_called_once_with(cause)
+
+    def test_gax_other_error(self):
+        from google.gax.errors import GaxError
+        from grpc import StatusCode
+        from google.cloud.spanner_v1 import database as MUT
+
+        exc = GaxError('oops', object())
+
+        with mock.patch.object(
+                MUT, 'exc_to_code', return_value=StatusCode.UNAVAILABLE):
+            self.assertIsNone(self._call_fut(exc, 0))
+
+
+class Test_split_points_to_key_ranges(unittest.TestCase):
+
+    def _call_fut(self, points):
+        from google.cloud.spanner_v1.database import (
+            _split_points_to_key_ranges)
+
+        return _split_points_to_key_ranges(points)
+
+    def test_wo_points(self):
+        (key_range,) = self._call_fut([])
+        self.assertEqual(key_range.start_closed, [])
+        self.assertEqual(key_range.end_closed, [])
+
+    def test_w_points(self):
+        ranges = self._call_fut([(u'h', 1), (u'p', 2)])
+        self.assertEqual(
+            [(r.start_closed, r.end_open, r.end_closed) for r in ranges],
+            [([], [u'h', 1], None),
+             ([u'h', 1], [u'p', 2], None),
+             ([u'p', 2], None, [])])
+
+
 class _Client(object):
 
     def __init__(self, project=TestDatabase.PROJECT_ID):
@@ -907,10 +1718,14 @@ class _Database(object):
 
 class _Pool(object):
     _bound = None
+    _closed = False
 
     def bind(self, database):
         self._bound = database
 
+    def close(self):
+        self._closed = True
+
     def get(self):
         session, self._session = self._session, None
         return session
@@ -919,6 +1734,29 @@ class _Pool(object):
         self._session = session
 
 
+class _SessionPerGetPool(object):
+
+    def __init__(self, database):
+        import threading
+
+        self._database = database
+        self._condition = threading.Condition()
+        self._created = 0
+        self._returned = []
+
+    def get(self):
+        with self._condition:
+            self._created += 1
+            return _Session(
+                self._database, name='%s/sessions/%d' % (
+                    self._database.name, self._created))
+
+    def put(self, session):
+        with self._condition:
+            self._returned.append(session)
+            self._condition.notify_all()
+
+
 class _Session(object):
 
     _rows = ()
@@ -16,6 +16,8 @@
 from functools import total_ordering
 import unittest
 
+import mock
+
 
 class TestAbstractSessionPool(unittest.TestCase):
 
@@ -53,6 +55,10 @@ class TestAbstractSessionPool(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             pool.clear()
 
+    def test_close_noop(self):
+        pool = self._make_one()
+        pool.close()  # no raise
+
     def test_session_wo_kwargs(self):
         from google.cloud.spanner_v1.pool import SessionCheckout
 
@@ -339,16 +345,59 @@ class TestPingingPool(unittest.TestCase):
         self.assertEqual(pool.size, 10)
         self.assertEqual(pool.default_timeout, 10)
         self.assertEqual(pool._delta.seconds, 3000)
+        self.assertEqual(pool.refresh_interval, 60)
+        self.assertIsNone(pool._budget._max_rpcs)
+        self.assertIsNone(pool._scheduler)
         self.assertTrue(pool._sessions.empty())
 
     def test_ctor_explicit(self):
-        pool = self._make_one(size=4, default_timeout=30, ping_interval=1800)
+        pool = self._make_one(size=4, default_timeout=30, ping_interval=1800,
+                              refresh_interval=None, max_refresh_rpcs=5)
         self.assertIsNone(pool._database)
         self.assertEqual(pool.size, 4)
         self.assertEqual(pool.default_timeout, 30)
         self.assertEqual(pool._delta.seconds, 1800)
+        self.assertIsNone(pool.refresh_interval)
+        self.assertEqual(pool._budget._max_rpcs, 5)
         self.assertTrue(pool._sessions.empty())
 
+    def test_bind_starts_keepalive_thread(self):
+        pool = self._make_one(size=1, refresh_interval=3600)
+        database = _Database('name')
+        database._sessions.append(_Session(database))
+
+        pool.bind(database)
+
+        thread = pool._scheduler.thread
+        self.assertTrue(thread.daemon)
+        self.assertTrue(thread.is_alive())
+        pool.close()
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(pool._scheduler)
+
+    def test_bind_wo_refresh_interval(self):
+        pool = self._make_one(size=1, refresh_interval=None)
+        database = _Database('name')
+        database._sessions.append(_Session(database))
+
+        pool.bind(database)
+
+        self.assertIsNone(pool._scheduler)
+        pool.close()  # no raise
+
+    def test_clear_stops_keepalive_thread(self):
+        pool = self._make_one(size=1, refresh_interval=3600)
+        database = _Database('name')
+        session = _Session(database)
+        database._sessions.append(session)
+        pool.bind(database)
+        thread = pool._scheduler.thread
+
+        pool.clear()
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(session._deleted)
+
     def test_bind(self):
         pool = self._make_one()
         database = _Database('name')
@@ -548,6 +597,26 @@ class TestPingingPool(unittest.TestCase):
         self.assertTrue(SESSIONS[0]._exists_checked)
         self.assertTrue(SESSIONS[1]._created)
 
+    def test__keepalive_within_budget(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(
+            size=3, refresh_interval=None, max_refresh_rpcs=2)
+        database = _Database('name')
+        SESSIONS = [_Session(database) for _ in range(3)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+        with _Monkey(MUT, _NOW=lambda: later):
+            pool._keepalive()
+
+        checked = [session._exists_checked for session in SESSIONS]
+        self.assertEqual(sorted(checked), [False, True, True])
+        self.assertTrue(pool._sessions.full())
+
 
 class TestTransactionPingingPool(unittest.TestCase):
 
@@ -688,6 +757,81 @@ class TestTransactionPingingPool(unittest.TestCase):
 
         self.assertFalse(pending.empty())
 
+    def test_put_wakes_keepalive_thread(self):
+        pool = self._make_one(size=1)
+        pool._sessions = _Queue()
+        scheduler = pool._scheduler = _Scheduler()
+        database = _Database('name')
+        session = _Session(database)
+
+        pool.put(session)
+
+        self.assertTrue(scheduler._woken)
+        self.assertEqual(pool._pending_sessions.qsize(), 1)
+        self.assertFalse(session._transaction._begun)
+
+    def test_put_begins_transaction_in_background(self):
+        import time
+
+        pool = self._make_one(size=1, refresh_interval=3600)
+        database = _Database('name')
+        session = _Session(database)
+        database._sessions.append(session)
+        pool.bind(database)
+        checked_out = pool.get()
+        checked_out._transaction._committed = True
+
+        pool.put(checked_out)
+
+        for _ in range(100):
+            if checked_out._transaction._begun:
+                break
+            time.sleep(0.01)
+        pool.close()
+        self.assertTrue(checked_out._transaction._begun)
+        self.assertTrue(pool._sessions.full())
+
+    def test__keepalive_within_budget(self):
+        pool = self._make_one(
+            size=3, refresh_interval=None, max_refresh_rpcs=2)
+        pool._sessions = _Queue()
+        pool._sessions._size = 3
+        database = _Database('name')
+        TRANSACTIONS = [_Transaction() for _ in range(3)]
+        pool._pending_sessions = _Queue(*[
+            _Session(database, transaction=txn) for txn in TRANSACTIONS])
+
+        pool._keepalive()
+
+        begun = [txn._begun for txn in TRANSACTIONS]
+        self.assertEqual(sorted(begun), [False, True, True])
+        # The session left over is available, without a transaction begun.
+        self.assertEqual(len(pool._pending_sessions._items), 0)
+        self.assertEqual(len(pool._sessions._items), 3)
+
+    def test_put_budget_spent_session_available(self):
+        import time
+
+        pool = self._make_one(
+            size=1, refresh_interval=3600, max_refresh_rpcs=1)
+        database = _Database('name')
+        session = _Session(database)
+        database._sessions.append(session)
+        pool.bind(database)
+
+        for _ in range(2):
+            checked_out = pool.get(timeout=1)
+            checked_out._transaction._committed = True
+            pool.put(checked_out)
+            for _ in range(100):
+                if pool._sessions.full():
+                    break
+                time.sleep(0.01)
+
+        self.assertIs(pool.get(timeout=1), session)
+        pool.close()
+        self.assertFalse(session._transaction._begun)
+
     def test_begin_pending_transactions_empty(self):
         pool = self._make_one(size=1)
         pool.begin_pending_transactions()  # no raise
@@ -712,6 +856,309 @@ class TestTransactionPingingPool(unittest.TestCase):
         self.assertTrue(pending.empty())
 
 
+class TestHealthTrackedPool(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import HealthTrackedPool
+
+        return HealthTrackedPool
+
+    def _make_one(self, *args, **kwargs):
+        kwargs.setdefault('refresh_interval', None)
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _make_bound(self, sessions, **kwargs):
+        pool = self._make_one(**kwargs)
+        database = _Database('name')
+        database._sessions.extend(sessions)
+        pool.bind(database)
+        return pool, database
+
+    def test_ctor_defaults(self):
+        pool = self._getTargetClass()()
+        self.assertIsNone(pool._database)
+        self.assertEqual(pool.min_size, 10)
+        self.assertEqual(pool.max_size, 100)
+        self.assertEqual(pool.default_timeout, 10)
+        self.assertEqual(pool.refresh_interval, 60)
+        self.assertEqual(pool._validate_after.seconds, 3000)
+        self.assertEqual(pool._idle_timeout.seconds, 600)
+        self.assertEqual(pool.metrics['size'], 0)
+
+    def test_ctor_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            self._make_one(min_size=-1)
+        with self.assertRaises(ValueError):
+            self._make_one(min_size=0, max_size=0)
+        with self.assertRaises(ValueError):
+            self._make_one(min_size=5, max_size=4)
+
+    def test_bind(self):
+        database = _Database('name')
+        sessions = [_Session(database) for _ in range(4)]
+        pool, _ = self._make_bound(list(sessions), min_size=4)
+
+        for session in sessions:
+            self.assertTrue(session._created)
+        metrics = pool.metrics
+        self.assertEqual(metrics['size'], 4)
+        self.assertEqual(metrics['idle'], 4)
+        self.assertEqual(metrics['created'], 4)
+        self.assertIsNone(pool._scheduler)
+
+    def test_bind_starts_refresh_thread(self):
+        pool = self._make_one(min_size=0, refresh_interval=3600)
+        pool.bind(_Database('name'))
+
+        thread = pool._scheduler.thread
+        self.assertTrue(thread.daemon)
+        self.assertTrue(thread.is_alive())
+        pool.close()
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(pool._scheduler)
+
+    def test_get_hit_no_validation(self):
+        database = _Database('name')
+        session = _Session(database)
+        pool, _ = self._make_bound([session], min_size=1)
+
+        self.assertIs(pool.get(), session)
+        self.assertFalse(session._exists_checked)
+        metrics = pool.metrics
+        self.assertEqual(metrics['checkouts'], 1)
+        self.assertEqual(metrics['in_use'], 1)
+        self.assertEqual(metrics['validated'], 0)
+
+    def test_get_validates_idle_session(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        database = _Database('name')
+        expired = _Session(database, exists=False)
+        replacement = _Session(database)
+        database._sessions.append(replacement)
+        pool = self._make_one(min_size=1)
+        database._sessions.append(expired)
+        long_ago = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=4000)
+        with _Monkey(MUT, _NOW=lambda: long_ago):
+            pool.bind(database)
+
+        session = pool.get()
+
+        self.assertIs(session, replacement)
+        self.assertTrue(expired._exists_checked)
+        self.assertTrue(replacement._created)
+        self.assertEqual(pool.metrics['validated'], 1)
+        self.assertEqual(pool.metrics['size'], 1)
+
+    def test_get_grows_up_to_max_size(self):
+        from six.moves.queue import Empty
+
+        database = _Database('name')
+        sessions = [_Session(database) for _ in range(2)]
+        pool, _ = self._make_bound(list(sessions), min_size=0, max_size=2)
+
+        first = pool.get()
+        second = pool.get()
+        self.assertEqual(set([first, second]), set(sessions))
+        self.assertEqual(pool.metrics['created'], 2)
+        with self.assertRaises(Empty):
+            pool.get(timeout=0.01)
+
+        pool.put(first)
+        self.assertIs(pool.get(), first)
+
+    def test_get_blocks_until_put(self):
+        import threading
+
+        database = _Database('name')
+        session = _Session(database)
+        pool, _ = self._make_bound([session], min_size=1, max_size=1)
+        pool.get()
+
+        timer = threading.Timer(0.05, pool.put, (session,))
+        timer.start()
+        self.assertIs(pool.get(timeout=5), session)
+        timer.join()
+        self.assertGreater(pool.metrics['wait_time_max'], 0)
+
+    def test_get_create_fails(self):
+        pool, _ = self._make_bound([], min_size=0, max_size=1)
+
+        with self.assertRaises(IndexError):  # No more sessions to create.
+            pool.get()
+        self.assertEqual(pool.metrics['size'], 0)
+        self.assertEqual(pool.metrics['in_use'], 0)
+
+    def test_put_not_checked_out(self):
+        from six.moves.queue import Full
+
+        pool = self._make_one(min_size=0)
+        pool.bind(_Database('name'))
+        with self.assertRaises(Full):
+            pool.put(_Session(pool._database))
+
+    def test_ping_shrinks_and_refreshes(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        database = _Database('name')
+        sessions = [_Session(database) for _ in range(3)]
+        pool, _ = self._make_bound(
+            list(sessions), min_size=0, max_size=3, validate_after=3000,
+            idle_timeout=600)
+        pool.min_size = 2
+        checked_out = [pool.get() for _ in range(3)]
+
+        now = datetime.datetime.utcnow()
+        old, stale, fresh = checked_out
+        with _Monkey(MUT, _NOW=lambda: now - datetime.timedelta(
+                seconds=4000)):
+            pool.put(old)
+            pool.put(stale)
+        pool.put(fresh)
+
+        with _Monkey(MUT, _NOW=lambda: now):
+            pool.ping()
+
+        # One session over min_size is deleted, the other one refreshed.
+        self.assertTrue(old._deleted)
+        self.assertFalse(stale._deleted)
+        self.assertTrue(stale._exists_checked)
+        self.assertFalse(fresh._exists_checked)
+        metrics = pool.metrics
+        self.assertEqual(metrics['size'], 2)
+        self.assertEqual(metrics['idle'], 2)
+        self.assertEqual(metrics['deleted'], 1)
+        self.assertEqual(metrics['refreshed'], 1)
+
+    def test_ping_tops_up_to_min_size(self):
+        pool, _ = self._make_bound([], min_size=0)
+        pool.min_size = 2
+        database = pool._database
+        sessions = [_Session(database) for _ in range(2)]
+        database._sessions.extend(sessions)
+
+        pool.ping()
+
+        self.assertEqual(pool.metrics['size'], 2)
+        self.assertEqual(pool.metrics['idle'], 2)
+        for session in sessions:
+            self.assertTrue(session._created)
+
+    def test_clear(self):
+        database = _Database('name')
+        sessions = [_Session(database) for _ in range(2)]
+        pool, _ = self._make_bound(list(sessions), min_size=2)
+
+        pool.clear()
+
+        for session in sessions:
+            self.assertTrue(session._deleted)
+        self.assertEqual(pool.metrics['size'], 0)
+
+
+class Test_BackgroundScheduler(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import _BackgroundScheduler
+
+        return _BackgroundScheduler
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    @staticmethod
+    def _wait_for(predicate):
+        import time
+
+        for _ in range(100):
+            if predicate():
+                return
+            time.sleep(0.01)
+
+    def test_wake_runs_work(self):
+        calls = []
+        scheduler = self._make_one('name', lambda: calls.append(1), 3600)
+        scheduler.start()
+
+        scheduler.wake()
+        self._wait_for(lambda: calls)
+        scheduler.stop()
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(scheduler.thread.name, 'name')
+        self.assertFalse(scheduler.thread.is_alive())
+
+    def test_runs_every_interval_despite_errors(self):
+        calls = []
+
+        def work():
+            calls.append(1)
+            raise RuntimeError('testing')
+
+        scheduler = self._make_one('name', work, 0.001)
+        scheduler.start()
+
+        self._wait_for(lambda: len(calls) >= 2)
+        scheduler.stop()
+
+        self.assertGreaterEqual(len(calls), 2)
+        self.assertFalse(scheduler.thread.is_alive())
+
+    def test_stop_before_work(self):
+        calls = []
+        scheduler = self._make_one('name', lambda: calls.append(1), 3600)
+        scheduler.start()
+
+        scheduler.stop()
+
+        self.assertEqual(calls, [])
+        self.assertFalse(scheduler.thread.is_alive())
+
+
+class Test_RpcBudget(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import _RpcBudget
+
+        return _RpcBudget
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_unlimited(self):
+        budget = self._make_one(None, 60)
+        for _ in range(100):
+            self.assertTrue(budget.acquire())
+
+    def test_limited_per_interval(self):
+        budget = self._make_one(2, 60)
+
+        with mock.patch('time.time', return_value=1000.0):
+            self.assertTrue(budget.acquire())
+            self.assertTrue(budget.acquire())
+            self.assertFalse(budget.acquire())
+
+        with mock.patch('time.time', return_value=1059.0):
+            self.assertFalse(budget.acquire())
+
+        with mock.patch('time.time', return_value=1060.0):
+            self.assertTrue(budget.acquire())
+
+    def test_limited_wo_interval(self):
+        budget = self._make_one(1, None)
+
+        with mock.patch('time.time', return_value=1000.0):
+            self.assertTrue(budget.acquire())
+
+        with mock.patch('time.time', return_value=10 ** 6):
+            self.assertFalse(budget.acquire())
+
+
 class TestSessionCheckout(unittest.TestCase):
 
     def _getTargetClass(self):
@@ -817,6 +1264,14 @@ class _Session(object):
         return txn
 
 
+class _Scheduler(object):
+
+    _woken = False
+
+    def wake(self):
+        self._woken = True
+
+
 class _Database(object):
 
     def __init__(self, name):
@@ -33,17 +33,76 @@ SELECT image_name FROM images WHERE @bytes IN image_data"""
 PARAMS_WITH_BYTES = {'bytes': b'DEADBEEF'}
 
 
+class Test_is_restartable(unittest.TestCase):
+
+    def _call_fut(self, exc):
+        from google.cloud.spanner_v1.snapshot import _is_restartable
+
+        return _is_restartable(exc)
+
+    def test_service_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        self.assertTrue(self._call_fut(ServiceUnavailable('testing')))
+
+    def test_internal_server_error_w_rst_stream(self):
+        from google.api_core.exceptions import InternalServerError
+
+        exc = InternalServerError(
+            'Received RST_STREAM with error code 2')
+        self.assertTrue(self._call_fut(exc))
+
+    def test_internal_server_error_w_unexpected_eos(self):
+        from google.api_core.exceptions import InternalServerError
+
+        exc = InternalServerError(
+            'Received unexpected EOS on DATA frame from server')
+        self.assertTrue(self._call_fut(exc))
+
+    def test_other_internal_server_error(self):
+        from google.api_core.exceptions import InternalServerError
+
+        self.assertFalse(self._call_fut(InternalServerError('testing')))
+
+    def test_other_error(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        self.assertFalse(self._call_fut(InvalidArgument('testing')))
+
+
+class TestStreamRetry(unittest.TestCase):
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.snapshot import _is_restartable
+        from google.cloud.spanner_v1.snapshot import StreamRetry
+
+        retry = StreamRetry()
+        self.assertIs(retry.predicate, _is_restartable)
+        self.assertEqual(retry.initial, 0.1)
+        self.assertEqual(retry.maximum, 32.0)
+        self.assertEqual(retry.multiplier, 2.0)
+        self.assertEqual(retry.deadline, 120.0)
+        self.assertEqual(retry.max_buffered, 128)
+
+
 class Test_restart_on_unavailable(unittest.TestCase):
 
-    def _call_fut(self, restart):
+    def _call_fut(self, restart, retry=None, on_restart=None):
         from google.cloud.spanner_v1.snapshot import _restart_on_unavailable
 
-        return _restart_on_unavailable(restart)
+        return _restart_on_unavailable(restart, retry, on_restart)
 
     def _make_item(self, value, resume_token=''):
         return mock.Mock(
             value=value, resume_token=resume_token,
-            spec=['value', 'resume_token'])
+            spec=['value', 'resume_token', 'ByteSize'],
+            **{'ByteSize.return_value': 10})
+
+    @staticmethod
+    def _make_retry(**kw):
+        from google.cloud.spanner_v1.snapshot import StreamRetry
+
+        return StreamRetry(**kw)
 
     def test_iteration_w_empty_raw(self):
         ITEMS = ()
@@ -111,6 +170,168 @@ class Test_restart_on_unavailable(unittest.TestCase):
             restart.mock_calls,
             [mock.call(), mock.call(resume_token='DEADBEEF')])
 
+    def test_iteration_w_raw_raising_unavailable_records_restart(self):
+        from google.cloud.spanner_v1 import snapshot as MUT
+
+        FIRST = (
+            self._make_item(0, resume_token='DEADBEEF'),
+            self._make_item(1),
+            self._make_item(2),
+        )
+        LAST = (
+            self._make_item(1),
+            self._make_item(2),
+        )
+        before = _MockIterator(*FIRST, fail_after=True)
+        after = _MockIterator(*LAST)
+        restart = mock.Mock(spec=[], side_effect=[before, after])
+        on_restart = mock.Mock(spec=[])
+        resumable = self._call_fut(
+            restart, self._make_retry(initial=1.0), on_restart)
+
+        with mock.patch.object(MUT.time, 'sleep') as sleep:
+            self.assertEqual(list(resumable), [FIRST[0]] + list(LAST))
+
+        on_restart.assert_called_once_with(20)
+        sleep.assert_called_once()
+        self.assertLessEqual(sleep.call_args[0][0], 2.0)
+
+    def test_iteration_w_full_buffer_delivers_early(self):
+        ITEMS = tuple(self._make_item(index) for index in range(5))
+        raw = _MockIterator(*ITEMS)
+        restart = mock.Mock(spec=[], return_value=raw)
+        resumable = self._call_fut(restart, self._make_retry(max_buffered=2))
+
+        self.assertIs(next(resumable), ITEMS[0])
+        self.assertIs(next(resumable), ITEMS[1])
+        self.assertEqual(list(raw._iter_values), list(ITEMS[2:]))
+
+    def test_iteration_w_full_buffer_then_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        ITEMS = (
+            self._make_item(0, resume_token='DEADBEEF'),
+            self._make_item(1),
+            self._make_item(2),
+            self._make_item(3),
+        )
+        before = _MockIterator(*ITEMS, fail_after=True)
+        restart = mock.Mock(spec=[], return_value=before)
+        resumable = self._call_fut(restart, self._make_retry(max_buffered=2))
+
+        found = []
+        with self.assertRaises(ServiceUnavailable):
+            for item in resumable:
+                found.append(item)
+
+        self.assertEqual(found, list(ITEMS))
+        restart.assert_called_once_with()
+
+    def test_iteration_w_full_buffer_then_token_then_unavailable(self):
+        from google.cloud.spanner_v1 import snapshot as MUT
+
+        FIRST = (
+            self._make_item(0),
+            self._make_item(1),
+            self._make_item(2, resume_token='DEADBEEF'),
+            self._make_item(3),
+        )
+        LAST = (
+            self._make_item(3),
+        )
+        before = _MockIterator(*FIRST, fail_after=True)
+        after = _MockIterator(*LAST)
+        restart = mock.Mock(spec=[], side_effect=[before, after])
+        resumable = self._call_fut(restart, self._make_retry(max_buffered=2))
+
+        with mock.patch.object(MUT.time, 'sleep'):
+            self.assertEqual(list(resumable), list(FIRST[:3] + LAST))
+
+        self.assertEqual(
+            restart.mock_calls,
+            [mock.call(), mock.call(resume_token='DEADBEEF')])
+
+    def test_iteration_w_raw_raising_rst_stream(self):
+        from google.api_core.exceptions import InternalServerError
+        from google.cloud.spanner_v1 import snapshot as MUT
+
+        FIRST = (
+            self._make_item(0, resume_token='DEADBEEF'),
+        )
+        LAST = (
+            self._make_item(1),
+        )
+        before = _MockIterator(
+            *FIRST, fail_after=True,
+            error=InternalServerError('Received RST_STREAM'))
+        after = _MockIterator(*LAST)
+        restart = mock.Mock(spec=[], side_effect=[before, after])
+        resumable = self._call_fut(restart)
+
+        with mock.patch.object(MUT.time, 'sleep'):
+            self.assertEqual(list(resumable), list(FIRST + LAST))
+
+    def test_iteration_w_raw_raising_non_retryable(self):
+        from google.api_core.exceptions import InternalServerError
+
+        before = _MockIterator(
+            self._make_item(0, resume_token='DEADBEEF'), fail_after=True,
+            error=InternalServerError('testing'))
+        restart = mock.Mock(spec=[], return_value=before)
+        resumable = self._call_fut(restart)
+
+        with self.assertRaises(InternalServerError):
+            list(resumable)
+
+        restart.assert_called_once_with()
+
+    def test_iteration_w_raw_raising_unavailable_past_deadline(self):
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.cloud.spanner_v1 import snapshot as MUT
+
+        failing = [
+            _MockIterator(fail_after=True)
+            for _ in range(10)
+        ]
+        restart = mock.Mock(spec=[], side_effect=failing)
+        retry = self._make_retry(initial=1.0, maximum=1.0, deadline=3.0)
+        resumable = self._call_fut(restart, retry)
+        clock = [1000.0]
+
+        def sleep(delay):
+            clock[0] += delay
+
+        with mock.patch.object(MUT.time, 'time', lambda: clock[0]):
+            with mock.patch.object(MUT.time, 'sleep', side_effect=sleep):
+                with mock.patch.object(
+                        MUT, 'exponential_sleep_generator',
+                        return_value=iter([1.0] * 10)):
+                    with self.assertRaises(ServiceUnavailable):
+                        list(resumable)
+
+        self.assertEqual(restart.call_count, 4)
+
+
+class Test_make_param_value_pb(unittest.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1.snapshot import _make_param_value_pb
+
+        return _make_param_value_pb(*args, **kw)
+
+    def test_wo_param_type(self):
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        self.assertEqual(self._callFUT(42, None), _make_value_pb(42))
+        self.assertEqual(self._callFUT(42, 'INT64'), _make_value_pb(42))
+
+    def test_w_param_type(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, FLOAT64
+
+        self.assertEqual(
+            self._callFUT(42, Type(code=FLOAT64)), Value(number_value=42.0))
+
 
 class Test_SnapshotBase(unittest.TestCase):
 
@@ -162,6 +383,41 @@ class Test_SnapshotBase(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             base._make_txn_selector()
 
+    def test__record_restart(self):
+        base = self._make_one(_Session())
+        self.assertEqual(base.retry_count, 0)
+        self.assertEqual(base.bytes_refetched, 0)
+
+        base._record_restart(100)
+        base._record_restart(0)
+
+        self.assertEqual(base.retry_count, 2)
+        self.assertEqual(base.bytes_refetched, 100)
+
+    def _stream_retry_helper(self, method, *args):
+        from google.cloud.spanner_v1 import snapshot as MUT
+        from google.cloud.spanner_v1.snapshot import StreamRetry
+
+        database = _Database()
+        database.spanner_api = _FauxSpannerAPI()
+        derived = self._makeDerived(_Session(database))
+        retry = StreamRetry(max_buffered=1)
+
+        with mock.patch.object(MUT, '_restart_on_unavailable') as restart:
+            getattr(derived, method)(*args, stream_retry=retry)
+
+        restart.assert_called_once_with(
+            mock.ANY, retry, derived._record_restart)
+
+    def test_read_w_stream_retry(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        self._stream_retry_helper(
+            'read', TABLE_NAME, COLUMNS, KeySet(all_=True))
+
+    def test_execute_sql_w_stream_retry(self):
+        self._stream_retry_helper('execute_sql', SQL_QUERY)
+
     def test_read_grpc_error(self):
         from google.cloud.spanner_v1.proto.transaction_pb2 import (
             TransactionSelector)
@@ -193,7 +449,7 @@ class Test_SnapshotBase(unittest.TestCase):
         self.assertEqual(options.kwargs['metadata'],
                          [('google-cloud-resource-prefix', database.name)])
 
-    def _read_helper(self, multi_use, first=True, count=0):
+    def _read_helper(self, multi_use, first=True, count=0, lazy=False):
         from google.protobuf.struct_pb2 import Struct
         from google.cloud.spanner_v1.proto.result_set_pb2 import (
             PartialResultSet, ResultSetMetadata, ResultSetStats)
@@ -243,7 +499,7 @@ class Test_SnapshotBase(unittest.TestCase):
 
         result_set = derived.read(
             TABLE_NAME, COLUMNS, KEYSET,
-            index=INDEX, limit=LIMIT)
+            index=INDEX, limit=LIMIT, lazy=lazy)
 
         self.assertEqual(derived._read_request_count, count + 1)
 
@@ -252,6 +508,7 @@ class Test_SnapshotBase(unittest.TestCase):
         else:
             self.assertIsNone(result_set._source)
 
+        self.assertIs(result_set._lazy, lazy)
         self.assertEqual(list(result_set), VALUES)
         self.assertEqual(result_set.metadata, metadata_pb)
         self.assertEqual(result_set.stats, stats_pb)
@@ -297,6 +554,9 @@ class Test_SnapshotBase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._read_helper(multi_use=True, first=True, count=1)
 
+    def test_read_w_lazy(self):
+        self._read_helper(multi_use=False, lazy=True)
+
     def test_execute_sql_grpc_error(self):
         from google.cloud.spanner_v1.proto.transaction_pb2 import (
             TransactionSelector)
@@ -333,7 +593,8 @@ class Test_SnapshotBase(unittest.TestCase):
         with self.assertRaises(ValueError):
             derived.execute_sql(SQL_QUERY_WITH_PARAM, PARAMS)
 
-    def _execute_sql_helper(self, multi_use, first=True, count=0):
+    def _execute_sql_helper(
+            self, multi_use, first=True, count=0, lazy=False):
         from google.protobuf.struct_pb2 import Struct
         from google.cloud.spanner_v1.proto.result_set_pb2 import (
             PartialResultSet, ResultSetMetadata, ResultSetStats)
@@ -381,7 +642,7 @@ class Test_SnapshotBase(unittest.TestCase):
 
         result_set = derived.execute_sql(
             SQL_QUERY_WITH_PARAM, PARAMS, PARAM_TYPES,
-            query_mode=MODE)
+            query_mode=MODE, lazy=lazy)
 
         self.assertEqual(derived._read_request_count, count + 1)
 
@@ -390,6 +651,7 @@ class Test_SnapshotBase(unittest.TestCase):
         else:
             self.assertIsNone(result_set._source)
 
+        self.assertIs(result_set._lazy, lazy)
         self.assertEqual(list(result_set), VALUES)
         self.assertEqual(result_set.metadata, metadata_pb)
         self.assertEqual(result_set.stats, stats_pb)
@@ -436,6 +698,9 @@ class Test_SnapshotBase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._execute_sql_helper(multi_use=True, first=True, count=1)
 
+    def test_execute_sql_w_lazy(self):
+        self._execute_sql_helper(multi_use=False, lazy=True)
+
 
 class TestSnapshot(unittest.TestCase):
 
@@ -819,6 +1084,7 @@ class _MockIterator(object):
     def __init__(self, *values, **kw):
         self._iter_values = iter(values)
         self._fail_after = kw.pop('fail_after', False)
+        self._error = kw.pop('error', None)
 
     def __iter__(self):
         return self
@@ -830,6 +1096,8 @@ class _MockIterator(object):
             return next(self._iter_values)
         except StopIteration:
             if self._fail_after:
+                if self._error is not None:
+                    raise self._error
                 raise ServiceUnavailable('testing')
             raise
 
@@ -17,6 +17,16 @@ import unittest
 
 import mock
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class TestStreamedResultSet(unittest.TestCase):
 
@@ -616,6 +626,46 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(list(streamed), [VALUES[0:3], VALUES[3:6]])
         self.assertEqual(streamed._current_row, VALUES[6:])
 
+    def test_merge_values_reuses_decoders(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        FIELDS = [
+            self._make_scalar_field('full_name', 'STRING'),
+            self._make_scalar_field('age', 'INT64'),
+        ]
+        streamed._metadata = self._make_result_set_metadata(FIELDS)
+        streamed._merge_values([self._make_value(u'Phred Phlyntstone')])
+        decoders = streamed._decoders
+        self.assertEqual(len(decoders), 2)
+        streamed._merge_values([self._make_value(42)])
+        self.assertIs(streamed._decoders, decoders)
+        self.assertEqual(list(streamed), [[u'Phred Phlyntstone', 42]])
+
+    def test_merge_values_lazy(self):
+        from google.cloud.spanner_v1.streamed import _LazyRow
+
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator, lazy=True)
+        FIELDS = [
+            self._make_scalar_field('full_name', 'STRING'),
+            self._make_scalar_field('age', 'INT64'),
+            self._make_scalar_field('married', 'BOOL'),
+        ]
+        streamed._metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [
+            u'Phred Phlyntstone', 42, True,
+            u'Bharney Rhubble', 39, True,
+            u'Wylma Phlyntstone',
+        ]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        streamed._merge_values(VALUES)
+        self.assertEqual(streamed._current_row, VALUES[6:])
+        rows = list(streamed)
+        self.assertEqual(len(rows), 2)
+        for row in rows:
+            self.assertIsInstance(row, _LazyRow)
+        self.assertEqual(rows, [BARE[0:3], BARE[3:6]])
+
     def test_one_or_none_no_value(self):
         streamed = self._make_one(_MockCancellableIterator())
         with mock.patch.object(streamed, '_consume_next') as consume_next:
@@ -857,6 +907,211 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def _make_columnar_stream(self):
+        FIELDS = [
+            self._make_scalar_field('full_name', 'STRING'),
+            self._make_scalar_field('age', 'INT64'),
+            self._make_scalar_field('married', 'BOOL'),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [
+            u'Phred Phlyntstone', 42, True,
+            u'Bharney Rhubble', 39, None,
+            u'Wylma Phlyntstone', None, True,
+        ]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        # Split 'Bharney Rhubble' across the first two responses.
+        chunked = [self._make_value(u'Bharney '), self._make_value(u'Rhubble')]
+        result_set1 = self._make_partial_result_set(
+            VALUES[:3] + chunked[:1], metadata=metadata, chunked_value=True)
+        result_set2 = self._make_partial_result_set(
+            chunked[1:] + VALUES[4:7])
+        result_set3 = self._make_partial_result_set(VALUES[7:])
+        iterator = _MockCancellableIterator(
+            result_set1, result_set2, result_set3)
+        return self._make_one(iterator)
+
+    def test__iter_column_batches_single_batch(self):
+        streamed = self._make_columnar_stream()
+
+        batches = list(streamed._iter_column_batches())
+
+        self.assertEqual(len(batches), 1)
+        names, ages, married = batches[0]
+        self.assertEqual(names.to_list(), [
+            u'Phred Phlyntstone', u'Bharney Rhubble', u'Wylma Phlyntstone'])
+        self.assertEqual(ages.to_list(), [42, 39, None])
+        self.assertEqual(married.to_list(bool), [True, None, True])
+        self.assertEqual(streamed._rows, [])
+        self.assertIsNone(streamed._pending_chunk)
+
+    def test__iter_column_batches_w_rows_per_batch(self):
+        streamed = self._make_columnar_stream()
+
+        batches = list(streamed._iter_column_batches(rows_per_batch=2))
+
+        self.assertEqual(
+            [[column.to_list() for column in batch] for batch in batches], [
+                [[u'Phred Phlyntstone', u'Bharney Rhubble'],
+                 [42, 39],
+                 [1, None]],
+                [[u'Wylma Phlyntstone'], [None], [1]],
+            ])
+
+    def test__iter_column_batches_w_exact_batches(self):
+        streamed = self._make_columnar_stream()
+
+        batches = list(streamed._iter_column_batches(rows_per_batch=1))
+
+        self.assertEqual([len(batch[0]) for batch in batches], [1, 1, 1])
+
+    def test__iter_column_batches_wo_rows(self):
+        FIELDS = [self._make_scalar_field('age', 'INT64')]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_set = self._make_partial_result_set([], metadata=metadata)
+        streamed = self._make_one(_MockCancellableIterator(result_set))
+
+        (batch,) = list(streamed._iter_column_batches(rows_per_batch=2))
+
+        (ages,) = batch
+        self.assertEqual(ages.to_list(), [])
+
+    def test__iter_column_batches_wo_responses(self):
+        streamed = self._make_one(_MockCancellableIterator())
+
+        self.assertEqual(list(streamed._iter_column_batches()), [])
+
+    def test__iter_column_batches_w_invalid_rows_per_batch(self):
+        streamed = self._make_columnar_stream()
+
+        with self.assertRaises(ValueError):
+            list(streamed._iter_column_batches(rows_per_batch=0))
+
+    def test__iter_column_batches_after_iteration_started(self):
+        streamed = self._make_columnar_stream()
+        next(iter(streamed))
+
+        with self.assertRaises(RuntimeError):
+            list(streamed._iter_column_batches())
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        streamed = self._make_columnar_stream()
+
+        frame = streamed.to_dataframe()
+
+        self.assertIsInstance(frame, pandas.DataFrame)
+        self.assertEqual(
+            list(frame.columns), ['full_name', 'age', 'married'])
+        self.assertEqual(list(frame['full_name']), [
+            u'Phred Phlyntstone', u'Bharney Rhubble', u'Wylma Phlyntstone'])
+        self.assertEqual(list(frame['age']), [42, 39, None])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_typed_columns(self):
+        FIELDS = [
+            self._make_scalar_field('id', 'INT64'),
+            self._make_scalar_field('score', 'FLOAT64'),
+            self._make_scalar_field('seen', 'TIMESTAMP'),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        VALUES = [
+            self._make_value(u'1'),
+            self._make_value(1.5),
+            self._make_value(u'2017-01-02T03:04:05.123456789Z'),
+            self._make_value(u'2'),
+            self._make_value(None),
+            self._make_value(None),
+        ]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        streamed = self._make_one(_MockCancellableIterator(result_set))
+
+        frame = streamed.to_dataframe()
+
+        self.assertEqual(str(frame['id'].dtype), 'int64')
+        self.assertEqual(str(frame['score'].dtype), 'float64')
+        self.assertEqual(frame['seen'][0].value, 1483326245123456789)
+        self.assertTrue(pandas.isnull(frame['seen'][1]))
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow(self):
+        streamed = self._make_columnar_stream()
+
+        table = streamed.to_arrow()
+
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(
+            table.schema.names, ['full_name', 'age', 'married'])
+        self.assertEqual(table.schema.field('age').type, pyarrow.int64())
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_batches(self):
+        streamed = self._make_columnar_stream()
+
+        batches = list(streamed.to_arrow_batches(rows_per_batch=2))
+
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertEqual(
+            batches[1].column(0).to_pylist(), [u'Wylma Phlyntstone'])
+
+
+class Test_LazyRow(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.streamed import _LazyRow
+
+        return _LazyRow
+
+    def _make_one(self, values, decoders=None):
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        if decoders is None:
+            decoders = [mock.Mock(side_effect=lambda value_pb: value_pb)
+                        for _ in values]
+        value_pbs = [_make_value_pb(value) for value in values]
+        return self._getTargetClass()(value_pbs, decoders), decoders
+
+    def test_getitem_decodes_once(self):
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        row, decoders = self._make_one([u'phred', 32])
+        self.assertEqual(len(row), 2)
+        self.assertEqual(row[1], _make_value_pb(32))
+        self.assertEqual(row[-1], _make_value_pb(32))
+        decoders[0].assert_not_called()
+        decoders[1].assert_called_once_with(_make_value_pb(32))
+
+    def test_getitem_slice(self):
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        row, decoders = self._make_one([u'phred', 32, True])
+        self.assertEqual(
+            row[1:], [_make_value_pb(32), _make_value_pb(True)])
+        decoders[0].assert_not_called()
+
+    def test_getitem_out_of_range(self):
+        row, _ = self._make_one([u'phred'])
+        with self.assertRaises(IndexError):
+            row[1]
+
+    def test_eq_ne_and_repr(self):
+        from google.cloud.spanner_v1._helpers import _make_row_decoders
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, StructType
+        from google.cloud.spanner_v1.proto.type_pb2 import STRING, INT64
+
+        decoders = _make_row_decoders(StructType(fields=[
+            StructType.Field(name='name', type=Type(code=STRING)),
+            StructType.Field(name='age', type=Type(code=INT64)),
+        ]))
+        row, _ = self._make_one([u'phred', 32], decoders)
+        other, _ = self._make_one([u'phred', 32], decoders)
+        self.assertEqual(row, [u'phred', 32])
+        self.assertEqual(row, other)
+        self.assertNotEqual(row, [u'phred', 33])
+        self.assertNotEqual(row, (u'phred', 32))
+        self.assertEqual(repr(row), repr([u'phred', 32]))
+
 
 class _MockCancellableIterator(object):
 